@@ -0,0 +1,25 @@
+from agno.agent import AgentKnowledge
+from agno.embedder.cached import CachedEmbedder
+from agno.embedder.openai import OpenAIEmbedder
+from agno.vectordb.pgvector import PgVector
+
+embedder = CachedEmbedder(embedder=OpenAIEmbedder(), db_file="tmp/embedding_cache.db")
+
+# The second call is served from the local cache
+embeddings = embedder.get_embedding("The quick brown fox jumps over the lazy dog.")
+embeddings = embedder.get_embedding("The quick brown fox jumps over the lazy dog.")
+
+# Print the embeddings, their dimensions and the cache statistics
+print(f"Embeddings: {embeddings[:5]}")
+print(f"Dimensions: {len(embeddings)}")
+print(f"Cache: {embedder.cache_info()}")
+
+# Example usage:
+knowledge_base = AgentKnowledge(
+    vector_db=PgVector(
+        db_url="postgresql+psycopg://ai:ai@localhost:5532/ai",
+        table_name="cached_openai_embeddings",
+        embedder=embedder,
+    ),
+    num_documents=2,
+)
@@ -0,0 +1,98 @@
+"""Run `pip install agno memory_profiler` to install dependencies.
+
+Compares the chunking strategies with the implementation they replaced, which cleaned text with six regex
+passes and searched chunk boundaries by walking back one character at a time, on multi-MB documents.
+"""
+
+import random
+import re
+from typing import List
+
+from agno.document import Document
+from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.chunking.recursive import RecursiveChunking
+from agno.eval.perf import PerfEval
+
+document_sizes_mb = [1, 4, 16]
+chunk_size = 1_000
+words = ["lorem", "ipsum", "dolor", "sit", "amet.", "consectetur", "adipiscing\n\n", "elit,", "sed\tdo"]
+
+
+def make_document(size_mb: int) -> Document:
+    rng = random.Random(size_mb)
+    content = " ".join(rng.choices(words, k=size_mb * 150_000))
+    return Document(content=content, id=f"doc_{size_mb}mb", meta_data={"source": "bench"})
+
+
+def legacy_clean_text(text: str) -> str:
+    cleaned_text = re.sub(r"\n+", "\n", text)
+    cleaned_text = re.sub(r"\s+", " ", cleaned_text)
+    cleaned_text = re.sub(r"\t+", "\t", cleaned_text)
+    cleaned_text = re.sub(r"\r+", "\r", cleaned_text)
+    cleaned_text = re.sub(r"\f+", "\f", cleaned_text)
+    cleaned_text = re.sub(r"\v+", "\v", cleaned_text)
+    return cleaned_text
+
+
+def legacy_fixed_chunk(document: Document) -> List[Document]:
+    content = legacy_clean_text(document.content)
+    chunks: List[Document] = []
+    chunk_number = 1
+    start = 0
+    while start < len(content):
+        end = min(start + chunk_size, len(content))
+        if end < len(content):
+            while end > start and content[end] not in [" ", "\n", "\r", "\t"]:
+                end -= 1
+        if end == start:
+            end = start + chunk_size
+        chunk = content[start:end]
+        meta_data = document.meta_data.copy()
+        meta_data["chunk"] = chunk_number
+        meta_data["chunk_size"] = len(chunk)
+        chunks.append(Document(id=f"{document.id}_{chunk_number}", meta_data=meta_data, content=chunk))
+        chunk_number += 1
+        start = end
+    return chunks
+
+
+def legacy_recursive_chunk(document: Document) -> List[Document]:
+    content = legacy_clean_text(document.content)
+    chunks: List[Document] = []
+    chunk_number = 1
+    start = 0
+    while start < len(content):
+        end = min(start + chunk_size, len(content))
+        if end < len(content):
+            for sep in ["\n", "."]:
+                last_sep = content[start:end].rfind(sep)
+                if last_sep != -1:
+                    end = start + last_sep + 1
+                    break
+        chunk = content[start:end]
+        meta_data = document.meta_data.copy()
+        meta_data["chunk"] = chunk_number
+        meta_data["chunk_size"] = len(chunk)
+        chunks.append(Document(id=f"{document.id}_{chunk_number}", meta_data=meta_data, content=chunk))
+        chunk_number += 1
+        start = max(start, end)
+    return chunks
+
+
+if __name__ == "__main__":
+    for size_mb in document_sizes_mb:
+        document = make_document(size_mb)
+        strategies = {
+            "legacy fixed": legacy_fixed_chunk,
+            "fixed": FixedSizeChunking(chunk_size=chunk_size).chunk,
+            "legacy recursive": legacy_recursive_chunk,
+            "recursive": RecursiveChunking(chunk_size=chunk_size).chunk,
+        }
+        for name, chunk in strategies.items():
+            PerfEval(
+                name=f"{name} chunking ({size_mb} MB)",
+                func=lambda chunk=chunk: chunk(document),  # type: ignore
+                measure_memory=False,
+                warmup_runs=1,
+                num_iterations=5,
+            ).run(print_summary=True)
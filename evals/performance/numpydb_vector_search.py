@@ -0,0 +1,102 @@
+"""Run `pip install agno numpy lancedb tantivy chromadb memory_profiler` to install dependencies.
+
+Compares the search latency of the in-process NumpyDb, exact and with an IVF/PQ index, with LanceDb and
+ChromaDb on the same documents. Backends that are not installed are skipped.
+"""
+
+import random
+from dataclasses import dataclass
+from hashlib import md5
+from typing import Callable, Dict, List, Optional, Tuple
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+from agno.eval.perf import PerfEval
+from agno.vectordb.base import VectorDb
+from agno.vectordb.numpydb import NumpyDb
+
+path = "tmp/vector_search_bench"
+collection_sizes = [10_000, 100_000]
+queries = [f"query {i}" for i in range(20)]
+
+
+@dataclass
+class HashEmbedder(Embedder):
+    """Deterministic embeddings so the benchmark does not depend on an embedding provider"""
+
+    dimensions: int = 256
+
+    def get_embedding(self, text: str) -> List[float]:
+        rng = random.Random(md5(text.encode()).hexdigest())
+        return [rng.uniform(-1, 1) for _ in range(self.dimensions)]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+def get_backends(num_documents: int) -> Dict[str, Callable[[], VectorDb]]:
+    embedder = HashEmbedder()
+    backends: Dict[str, Callable[[], VectorDb]] = {
+        "numpydb": lambda: NumpyDb(collection=f"exact_{num_documents}", path=path, embedder=embedder),
+        "numpydb float16": lambda: NumpyDb(
+            collection=f"float16_{num_documents}", path=path, embedder=embedder, dtype="float16"
+        ),
+        "numpydb ivf/pq": lambda: NumpyDb(
+            collection=f"ivfpq_{num_documents}",
+            path=path,
+            embedder=embedder,
+            ivf_lists=256,
+            ivf_probes=16,
+            pq_subvectors=32,
+        ),
+    }
+    try:
+        from agno.vectordb.lancedb import LanceDb
+
+        backends["lancedb"] = lambda: LanceDb(
+            uri=f"{path}/lancedb", table_name=f"bench_{num_documents}", embedder=embedder
+        )
+    except ImportError:
+        print("lancedb not installed, skipping")
+    try:
+        from agno.vectordb.chroma import ChromaDb
+
+        backends["chromadb"] = lambda: ChromaDb(
+            collection=f"bench_{num_documents}", embedder=embedder, path=f"{path}/chromadb", persistent_client=True
+        )
+    except ImportError:
+        print("chromadb not installed, skipping")
+    return backends
+
+
+def load(vector_db: VectorDb, num_documents: int) -> VectorDb:
+    if not vector_db.exists() or vector_db.get_count() != num_documents:  # type: ignore
+        vector_db.drop()
+        vector_db.create()
+        documents = [Document(content=f"document {i}") for i in range(num_documents)]
+        for i in range(0, num_documents, 1_000):
+            vector_db.insert(documents[i : i + 1_000])
+        vector_db.optimize()
+    return vector_db
+
+
+def search_with(vector_db: VectorDb):
+    query_iterator = iter(queries * 1_000)
+
+    def search():
+        return vector_db.search(next(query_iterator), limit=10)
+
+    return search
+
+
+if __name__ == "__main__":
+    for num_documents in collection_sizes:
+        for name, get_vector_db in get_backends(num_documents).items():
+            vector_db = load(get_vector_db(), num_documents)
+            PerfEval(
+                name=f"{name} search ({num_documents} documents)",
+                func=search_with(vector_db),
+                measure_memory=False,
+                warmup_runs=3,
+                num_iterations=20,
+            ).run(print_summary=True)
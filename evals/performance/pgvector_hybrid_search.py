@@ -0,0 +1,78 @@
+"""Run `pip install agno sqlalchemy psycopg pgvector memory_profiler` to install dependencies.
+
+Compares the latency of PgVector hybrid search scoring the whole table with hybrid search fusing candidates
+from the vector and full-text indexes, for growing table sizes. Requires a running pgvector database:
+
+docker run -d -e POSTGRES_DB=ai -e POSTGRES_USER=ai -e POSTGRES_PASSWORD=ai -p 5532:5432 agnohq/pgvector:16
+"""
+
+import random
+from dataclasses import dataclass
+from hashlib import md5
+from typing import Dict, List, Optional, Tuple
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+from agno.eval.perf import PerfEval
+from agno.vectordb.pgvector import HybridFusion, PgVector, SearchType
+
+db_url = "postgresql+psycopg://ai:ai@localhost:5532/ai"
+table_sizes = [1_000, 10_000, 100_000]
+words = [f"word{i}" for i in range(5_000)]
+queries = [" ".join(random.Random(i).sample(words, 3)) for i in range(20)]
+
+
+@dataclass
+class HashEmbedder(Embedder):
+    """Deterministic embeddings so the benchmark does not depend on an embedding provider"""
+
+    dimensions: int = 256
+
+    def get_embedding(self, text: str) -> List[float]:
+        rng = random.Random(md5(text.encode()).hexdigest())
+        return [rng.uniform(-1, 1) for _ in range(self.dimensions)]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+def load_table(num_documents: int) -> PgVector:
+    vector_db = PgVector(
+        table_name=f"hybrid_search_bench_{num_documents}",
+        db_url=db_url,
+        embedder=HashEmbedder(),
+        search_type=SearchType.hybrid,
+        schema_version=2,
+    )
+    if not vector_db.exists() or vector_db.get_count() != num_documents:
+        vector_db.drop()
+        vector_db.create()
+        rng = random.Random(num_documents)
+        documents = [Document(content=" ".join(rng.choices(words, k=50))) for _ in range(num_documents)]
+        vector_db.insert(documents, batch_size=1_000)
+        vector_db.optimize()
+    return vector_db
+
+
+def search_with(vector_db: PgVector):
+    query_iterator = iter(queries * 1_000)
+
+    def search():
+        return vector_db.search(next(query_iterator), limit=10)
+
+    return search
+
+
+if __name__ == "__main__":
+    for num_documents in table_sizes:
+        vector_db = load_table(num_documents)
+        for hybrid_fusion in [None, HybridFusion.rrf, HybridFusion.weighted]:
+            vector_db.hybrid_fusion = hybrid_fusion
+            mode = hybrid_fusion.value if hybrid_fusion is not None else "full_scan"
+            PerfEval(
+                name=f"hybrid search {mode} ({num_documents} rows)",
+                func=search_with(vector_db),
+                measure_memory=False,
+                warmup_runs=3,
+                num_iterations=20,
+            ).run(print_summary=True)
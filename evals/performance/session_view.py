@@ -0,0 +1,49 @@
+"""Run `pip install agno openai sqlalchemy memory_profiler` to install dependencies."""
+
+from typing import Literal
+
+from agno.agent import Agent
+from agno.eval.perf import PerfEval
+from agno.models.openai import OpenAIChat
+from agno.storage.agent.sqlite import SqliteAgentStorage
+from agno.tools.calculator import CalculatorTools
+
+
+def get_weather(city: Literal["nyc", "sf"]):
+    """Use this to get weather information."""
+    if city == "nyc":
+        return "It might be cloudy in nyc"
+    elif city == "sf":
+        return "It's always sunny in sf"
+    else:
+        raise AssertionError("Unknown city")
+
+
+agent = Agent(
+    model=OpenAIChat(id="gpt-4o"),
+    tools=[get_weather, CalculatorTools(add=True, subtract=True, multiply=True, divide=True)],
+    storage=SqliteAgentStorage(table_name="agent_sessions", db_file="tmp/agent_storage.db"),
+    instructions=["Be concise, reply with one sentence."],
+    add_history_to_messages=True,
+)
+
+
+# Both copies prepare the model the same way a playground request does before running
+def deep_copy_agent():
+    new_agent = agent.deep_copy(update={"session_id": "session"})
+    new_agent.update_model()
+    return new_agent
+
+
+def session_view_agent():
+    new_agent = agent.session_view(session_id="session")
+    new_agent.update_model()
+    return new_agent
+
+
+deep_copy_perf = PerfEval(func=deep_copy_agent, num_iterations=1000)
+session_view_perf = PerfEval(func=session_view_agent, num_iterations=1000)
+
+if __name__ == "__main__":
+    deep_copy_perf.run(print_results=True)
+    session_view_perf.run(print_results=True)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 from collections import ChainMap, defaultdict, deque
 from dataclasses import dataclass
+from inspect import iscoroutinefunction
 from os import getenv
 from textwrap import dedent
 from typing import (
@@ -27,6 +29,7 @@ from agno.exceptions import AgentRunException, StopAgentRun
 from agno.knowledge.agent import AgentKnowledge
 from agno.media import Audio, AudioArtifact, Image, ImageArtifact, Video, VideoArtifact
 from agno.memory.agent import AgentMemory, AgentRun
+from agno.memory.background import get_memory_update_queue
 from agno.models.base import Model
 from agno.models.message import Message, MessageReferences
 from agno.models.response import ModelResponse, ModelResponseEvent
@@ -81,6 +84,8 @@ class Agent:
     add_history_to_messages: bool = False
     # Number of historical responses to add to the messages.
     num_history_responses: int = 3
+    # Update user memories and session summaries in a background queue after the response is returned
+    background_memory_updates: bool = False
 
     # --- Agent Knowledge ---
     knowledge: Optional[AgentKnowledge] = None
@@ -93,6 +98,8 @@ class Agent:
     #     ...
     retriever: Optional[Callable[..., Optional[List[Dict]]]] = None
     references_format: Literal["json", "yaml"] = "json"
+    # Load the knowledge embedder model when the Agent is created instead of on the first search
+    warm_up_embedder: bool = False
 
     # --- Agent Storage ---
     storage: Optional[AgentStorage] = None
@@ -108,6 +115,9 @@ class Agent:
     show_tool_calls: bool = False
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # Maximum number of tool calls run concurrently when the Agent runs synchronously.
+    # None or 1 runs the tool calls one at a time.
+    tool_call_concurrency: Optional[int] = None
     # Controls which (if any) tool is called by the model.
     # "none" means the model will not call a tool and instead generates a message.
     # "auto" means the model can pick between generating a message or calling a tool.
@@ -260,15 +270,18 @@ class Agent:
         memory: Optional[AgentMemory] = None,
         add_history_to_messages: bool = False,
         num_history_responses: int = 3,
+        background_memory_updates: bool = False,
         knowledge: Optional[AgentKnowledge] = None,
         add_references: bool = False,
         retriever: Optional[Callable[..., Optional[List[Dict]]]] = None,
         references_format: Literal["json", "yaml"] = "json",
+        warm_up_embedder: bool = False,
         storage: Optional[AgentStorage] = None,
         extra_data: Optional[Dict[str, Any]] = None,
         tools: Optional[List[Union[Toolkit, Callable, Function, Dict]]] = None,
         show_tool_calls: bool = False,
         tool_call_limit: Optional[int] = None,
+        tool_call_concurrency: Optional[int] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         reasoning: bool = False,
         reasoning_model: Optional[Model] = None,
@@ -332,11 +345,13 @@ class Agent:
         self.memory = memory
         self.add_history_to_messages = add_history_to_messages
         self.num_history_responses = num_history_responses
+        self.background_memory_updates = background_memory_updates
 
         self.knowledge = knowledge
         self.add_references = add_references
         self.retriever = retriever
         self.references_format = references_format
+        self.warm_up_embedder = warm_up_embedder
 
         self.storage = storage
         self.extra_data = extra_data
@@ -344,6 +359,7 @@ class Agent:
         self.tools = tools
         self.show_tool_calls = show_tool_calls
         self.tool_call_limit = tool_call_limit
+        self.tool_call_concurrency = tool_call_concurrency
         self.tool_choice = tool_choice
 
         self.reasoning = reasoning
@@ -409,6 +425,20 @@ class Agent:
         self.agent_session = None
         self._formatter = None
 
+        if self.warm_up_embedder:
+            self.warm_up_knowledge_embedder()
+
+    def warm_up_knowledge_embedder(self) -> None:
+        """Load the embedding model of the knowledge base, models are shared across Agent copies"""
+        if self.knowledge is None or self.knowledge.vector_db is None:
+            return
+        embedder = getattr(self.knowledge.vector_db, "embedder", None)
+        if embedder is not None:
+            try:
+                embedder.warm_up()
+            except Exception as e:
+                logger.warning(f"Failed to warm up embedder: {e}")
+
     def set_agent_id(self) -> str:
         if self.agent_id is None:
             self.agent_id = str(uuid4())
@@ -503,6 +533,9 @@ class Agent:
             self.resolve_run_context()
 
         # 3. Read existing session from storage
+        # Wait for background memory updates from the previous run of this session
+        if self.background_memory_updates:
+            get_memory_update_queue().wait_for_session(self)
         self.read_from_storage()
 
         # 4. Prepare run messages
@@ -658,13 +691,18 @@ class Agent:
         # Create an AgentRun object to add to memory
         agent_run = AgentRun(response=self.run_response)
         agent_run.message = run_messages.user_message
+        # Inputs for user memories, collected when memory updates run in the background
+        memory_inputs: List[str] = []
         # Update the memories with the user message if needed
         if (
             self.memory.create_user_memories
             and self.memory.update_user_memories_after_run
             and run_messages.user_message is not None
         ):
-            self.memory.update_memory(input=run_messages.user_message.get_content_string())
+            if self.background_memory_updates:
+                memory_inputs.append(run_messages.user_message.get_content_string())
+            else:
+                self.memory.update_memory(input=run_messages.user_message.get_content_string())
         if messages is not None and len(messages) > 0:
             for _im in messages:
                 # Parse the message and convert to a Message object if possible
@@ -686,17 +724,24 @@ class Agent:
                         agent_run.messages = []
                     agent_run.messages.append(mp)
                     if self.memory.create_user_memories and self.memory.update_user_memories_after_run:
-                        self.memory.update_memory(input=mp.get_content_string())
+                        if self.background_memory_updates:
+                            memory_inputs.append(mp.get_content_string())
+                        else:
+                            self.memory.update_memory(input=mp.get_content_string())
                 else:
                     logger.warning("Unable to add message to memory")
         # Add AgentRun to memory
         self.memory.add_run(agent_run)
         # Update the session summary if needed
-        if self.memory.create_session_summary and self.memory.update_session_summary_after_run:
+        update_summary = self.memory.create_session_summary and self.memory.update_session_summary_after_run
+        if update_summary and not self.background_memory_updates:
             self.memory.update_summary()
 
         # 10. Save session to storage
         self.write_to_storage()
+        # Queue memory updates to run after the response is returned, storage is updated again once they finish
+        if self.background_memory_updates:
+            get_memory_update_queue().submit(self, inputs=memory_inputs, update_summary=update_summary)
 
         # 11. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=message)
@@ -926,17 +971,30 @@ class Agent:
         logger.debug(f"*********** Async Agent Run Start: {self.run_response.run_id} ***********")
 
         # 2. Update the Model and resolve context
-        self.update_model()
+        self.update_model(async_mode=True)
         self.run_response.model = self.model.id if self.model is not None else None
         if self.context is not None and self.resolve_context:
             self.resolve_run_context()
 
         # 3. Read existing session from storage
-        self.read_from_storage()
+        # Wait for background memory updates from the previous run of this session
+        if self.background_memory_updates:
+            await asyncio.to_thread(get_memory_update_queue().wait_for_session, self)
+        await self.aread_from_storage()
 
         # 4. Prepare run messages
+        # Search the knowledge base for references before building the messages, without blocking the event loop
+        references: Optional[MessageReferences] = None
+        if message is None or isinstance(message, str) or isinstance(message, list):
+            references = await self.aget_references_from_knowledge(message=message, **kwargs)
         run_messages: RunMessages = self.get_run_messages(
-            message=message, audio=audio, images=images, videos=videos, messages=messages, **kwargs
+            message=message,
+            audio=audio,
+            images=images,
+            videos=videos,
+            messages=messages,
+            references=references,
+            **kwargs,
         )
         self.run_messages = run_messages
 
@@ -1086,13 +1144,18 @@ class Agent:
         # Create an AgentRun object to add to memory
         agent_run = AgentRun(response=self.run_response)
         agent_run.message = run_messages.user_message
+        # Inputs for user memories, collected when memory updates run in the background
+        memory_inputs: List[str] = []
         # Update the memories with the user message if needed
         if (
             self.memory.create_user_memories
             and self.memory.update_user_memories_after_run
             and run_messages.user_message is not None
         ):
-            await self.memory.aupdate_memory(input=run_messages.user_message.get_content_string())
+            if self.background_memory_updates:
+                memory_inputs.append(run_messages.user_message.get_content_string())
+            else:
+                await self.memory.aupdate_memory(input=run_messages.user_message.get_content_string())
         if messages is not None and len(messages) > 0:
             for _im in messages:
                 # Parse the message and convert to a Message object if possible
@@ -1114,17 +1177,24 @@ class Agent:
                         agent_run.messages = []
                     agent_run.messages.append(mp)
                     if self.memory.create_user_memories and self.memory.update_user_memories_after_run:
-                        await self.memory.aupdate_memory(input=mp.get_content_string())
+                        if self.background_memory_updates:
+                            memory_inputs.append(mp.get_content_string())
+                        else:
+                            await self.memory.aupdate_memory(input=mp.get_content_string())
                 else:
                     logger.warning("Unable to add message to memory")
         # Add AgentRun to memory
         self.memory.add_run(agent_run)
         # Update the session summary if needed
-        if self.memory.create_session_summary and self.memory.update_session_summary_after_run:
+        update_summary = self.memory.create_session_summary and self.memory.update_session_summary_after_run
+        if update_summary and not self.background_memory_updates:
             await self.memory.aupdate_summary()
 
         # 10. Save session to storage
-        self.write_to_storage()
+        await self.awrite_to_storage()
+        # Queue memory updates to run after the response is returned, storage is updated again once they finish
+        if self.background_memory_updates:
+            await get_memory_update_queue().asubmit(self, inputs=memory_inputs, update_summary=update_summary)
 
         # 11. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=message)
@@ -1308,7 +1378,7 @@ class Agent:
             rr.created_at = created_at
         return rr
 
-    def get_tools(self) -> Optional[List[Union[Toolkit, Callable, Dict, Function]]]:
+    def get_tools(self, async_mode: bool = False) -> Optional[List[Union[Toolkit, Callable, Dict, Function]]]:
         self.memory = cast(AgentMemory, self.memory)
         tools: List[Union[Toolkit, Callable, Dict, Function]] = []
 
@@ -1328,7 +1398,11 @@ class Agent:
         # Add tools for accessing knowledge
         if self.knowledge is not None:
             if self.search_knowledge:
-                tools.append(self.search_knowledge_base)
+                # Async runs get the same tool, searching the knowledge base without blocking the event loop
+                if async_mode:
+                    tools.append(Function(name="search_knowledge_base", entrypoint=self.asearch_knowledge_base))
+                else:
+                    tools.append(self.search_knowledge_base)
             if self.update_knowledge:
                 tools.append(self.add_to_knowledge)
 
@@ -1339,7 +1413,7 @@ class Agent:
 
         return tools
 
-    def update_model(self) -> None:
+    def update_model(self, async_mode: bool = False) -> None:
         # Use the default Model (OpenAIChat) if no model is provided
         if self.model is None:
             try:
@@ -1362,8 +1436,15 @@ class Agent:
             else:
                 self.model.response_format = {"type": "json_object"}
 
+        # A Model keeps the first knowledge search tool it is given, switch it to the variant for this run
+        if self.knowledge is not None and self.search_knowledge and self.model._functions is not None:
+            search_function = self.model._functions.get("search_knowledge_base")
+            if search_function is not None and iscoroutinefunction(search_function.entrypoint) != async_mode:
+                search_function.entrypoint = self.asearch_knowledge_base if async_mode else self.search_knowledge_base
+                search_function.process_entrypoint()
+
         # Add tools to the Model
-        agent_tools = self.get_tools()
+        agent_tools = self.get_tools(async_mode=async_mode)
         if agent_tools is not None:
             for tool in agent_tools:
                 if (
@@ -1387,6 +1468,10 @@ class Agent:
         if self.tool_call_limit is not None:
             self.model.tool_call_limit = self.tool_call_limit
 
+        # Set tool_call_concurrency if set on the agent
+        if self.tool_call_concurrency is not None:
+            self.model.tool_call_concurrency = self.tool_call_concurrency
+
         # Add session_id to the Model
         if self.session_id is not None:
             self.model.session_id = self.session_id
@@ -1463,6 +1548,7 @@ class Agent:
             agent_data=self.get_agent_data(),
             session_data=self.get_session_data(),
             extra_data=self.extra_data,
+            created_at=self.agent_session.created_at if self.agent_session is not None else None,
         )
 
     def load_agent_session(self, session: AgentSession):
@@ -1562,6 +1648,7 @@ class Agent:
                 if "runs" in session.memory:
                     try:
                         self.memory.runs = [AgentRun(**m) for m in session.memory["runs"]]
+                        self.memory.runs_offset = session.memory.get("runs_offset", 0)
                     except Exception as e:
                         logger.warning(f"Failed to load runs from memory: {e}")
                 if "messages" in session.memory:
@@ -1590,12 +1677,37 @@ class Agent:
             Optional[AgentSession]: The loaded AgentSession or None if not found.
         """
         if self.storage is not None and self.session_id is not None:
-            self.agent_session = self.storage.read(session_id=self.session_id)
+            self.agent_session = self.storage.read_last_runs(
+                session_id=self.session_id, num_runs=self.get_num_runs_to_load()
+            )
+            if self.agent_session is not None:
+                self.load_agent_session(session=self.agent_session)
+            self.load_user_memories()
+        return self.agent_session
+
+    async def aread_from_storage(self) -> Optional[AgentSession]:
+        """Load the AgentSession from storage without blocking the event loop
+
+        Returns:
+            Optional[AgentSession]: The loaded AgentSession or None if not found.
+        """
+        if self.storage is not None and self.session_id is not None:
+            self.agent_session = await self.storage.aread_last_runs(
+                session_id=self.session_id, num_runs=self.get_num_runs_to_load()
+            )
             if self.agent_session is not None:
                 self.load_agent_session(session=self.agent_session)
             self.load_user_memories()
         return self.agent_session
 
+    def get_num_runs_to_load(self) -> Optional[int]:
+        """Returns the number of past runs needed from storage, or None if every run is needed"""
+        if self.read_chat_history or (self.memory is not None and self.memory.create_session_summary):
+            return None
+        if self.add_history_to_messages:
+            return self.num_history_responses
+        return 0
+
     def write_to_storage(self) -> Optional[AgentSession]:
         """Save the AgentSession to storage
 
@@ -1606,13 +1718,23 @@ class Agent:
             self.agent_session = self.storage.upsert(session=self.get_agent_session())
         return self.agent_session
 
+    async def awrite_to_storage(self) -> Optional[AgentSession]:
+        """Save the AgentSession to storage without blocking the event loop
+
+        Returns:
+            Optional[AgentSession]: The saved AgentSession or None if not saved.
+        """
+        if self.storage is not None:
+            self.agent_session = await self.storage.aupsert(session=self.get_agent_session())
+        return self.agent_session
+
     def add_introduction(self, introduction: str) -> None:
         """Add an introduction to the chat history"""
 
         self.memory = cast(AgentMemory, self.memory)
         if introduction is not None:
             # Add an introduction as the first response from the Agent
-            if len(self.memory.runs) == 0:
+            if len(self.memory.runs) == 0 and self.memory.runs_offset == 0:
                 self.memory.add_run(
                     AgentRun(
                         response=RunResponse(
@@ -1946,6 +2068,7 @@ class Agent:
         audio: Optional[Sequence[Audio]] = None,
         images: Optional[Sequence[Image]] = None,
         videos: Optional[Sequence[Video]] = None,
+        references: Optional[MessageReferences] = None,
         **kwargs: Any,
     ) -> Optional[Message]:
         """Return the user message for the Agent.
@@ -1953,34 +2076,15 @@ class Agent:
         1. If the user_message is provided, use that.
         2. If create_default_user_message is False or if the message is a list, return the message as is.
         3. Build the default user message for the Agent
+
+        References already retrieved for the message, e.g. by an async run, are passed as `references`.
         """
         # Get references from the knowledge base to use in the user message
-        references = None
-        self.run_response = cast(RunResponse, self.run_response)
-        if self.add_references and message:
-            message_str: str
-            if isinstance(message, str):
-                message_str = message
-            elif callable(message):
-                message_str = message(agent=self)
-            else:
-                raise Exception("message must be a string or a callable when add_references is True")
-
-            retrieval_timer = Timer()
-            retrieval_timer.start()
-            docs_from_knowledge = self.get_relevant_docs_from_knowledge(query=message_str, **kwargs)
-            if docs_from_knowledge is not None:
-                references = MessageReferences(
-                    query=message_str, references=docs_from_knowledge, time=round(retrieval_timer.elapsed, 4)
-                )
-                # Add the references to the run_response
-                if self.run_response.extra_data is None:
-                    self.run_response.extra_data = RunResponseExtraData()
-                if self.run_response.extra_data.references is None:
-                    self.run_response.extra_data.references = []
-                self.run_response.extra_data.references.append(references)
-            retrieval_timer.stop()
-            logger.debug(f"Time to get references: {retrieval_timer.elapsed:.4f}s")
+        if references is None:
+            references = self.get_references_from_knowledge(message=message, **kwargs)
+        # A search without results adds no references
+        if references is not None and references.references is None:
+            references = None
 
         # 1. If the user_message is provided, use that.
         if self.user_message is not None:
@@ -2056,6 +2160,7 @@ class Agent:
         images: Optional[Sequence[Image]] = None,
         videos: Optional[Sequence[Video]] = None,
         messages: Optional[Sequence[Union[Dict, Message]]] = None,
+        references: Optional[MessageReferences] = None,
         **kwargs: Any,
     ) -> RunMessages:
         """This function returns a RunMessages object with the following attributes:
@@ -2142,7 +2247,9 @@ class Agent:
         user_message: Optional[Message] = None
         # 4.1 Build user message if message is None, str or list
         if message is None or isinstance(message, str) or isinstance(message, list):
-            user_message = self.get_user_message(message=message, audio=audio, images=images, videos=videos, **kwargs)
+            user_message = self.get_user_message(
+                message=message, audio=audio, images=images, videos=videos, references=references, **kwargs
+            )
         # 4.2 If message is provided as a Message, use it directly
         elif isinstance(message, Message):
             user_message = message
@@ -2260,6 +2367,105 @@ class Agent:
             # If copy fails, return as is
             return field_value
 
+    def clone_for_request(self, *, update: Optional[Dict[str, Any]] = None) -> Agent:
+        """Create a cheap copy of this Agent for serving a single request, optionally updating fields.
+
+        Unlike `deep_copy`, immutable configuration and heavy shared resources (knowledge, storage, model clients
+        and toolkits) are shared with this Agent. Only per-run state is fresh: the model's functions and metrics,
+        the memory's runs, messages and helpers, the session state and the tool definitions. The reasoning agent and team
+        members are cloned the same way, so concurrent requests never share their run state.
+
+        Args:
+            update (Optional[Dict[str, Any]]): Optional dictionary of fields for the new Agent.
+
+        Returns:
+            Agent: A new Agent instance.
+        """
+        from copy import copy, deepcopy
+        from dataclasses import fields
+
+        # Run info is private to each copy and is not accepted by __init__
+        excluded_fields = [
+            "agent_session",
+            "session_name",
+            "memory",
+            "run_id",
+            "run_input",
+            "run_messages",
+            "run_response",
+            "images",
+            "videos",
+            "audio",
+            "_formatter",
+        ]
+        fields_for_new_agent: Dict[str, Any] = {}
+        for f in fields(self):
+            if f.name in excluded_fields:
+                continue
+            field_value = getattr(self, f.name)
+            if field_value is None:
+                continue
+            if f.name in ("model", "reasoning_model"):
+                # Share the client, but not the tools and metrics added during a run
+                model_copy = copy(field_value)
+                model_copy.clear()
+                model_copy.tools = None
+                fields_for_new_agent[f.name] = model_copy
+            elif f.name == "reasoning_agent":
+                fields_for_new_agent[f.name] = field_value.clone_for_request()
+            elif f.name == "team":
+                # Members are run by this Agent, so each request needs members with their own run state
+                fields_for_new_agent[f.name] = [member.clone_for_request() for member in field_value]
+            elif f.name == "tools":
+                fields_for_new_agent[f.name] = [self._copy_tool_for_request(tool) for tool in field_value]
+            elif f.name in ("session_state", "extra_data", "team_data"):
+                fields_for_new_agent[f.name] = deepcopy(field_value)
+            elif isinstance(field_value, (list, dict, set)):
+                fields_for_new_agent[f.name] = copy(field_value)
+            else:
+                fields_for_new_agent[f.name] = field_value
+
+        if self.memory is not None:
+            fields_for_new_agent["memory"] = self.memory.clone_for_request()
+
+        if update:
+            fields_for_new_agent.update(update)
+        new_agent = self.__class__(**fields_for_new_agent)
+        logger.debug(f"Cloned {self.__class__.__name__} for request")
+        return new_agent
+
+    def session_view(self, session_id: Optional[str] = None, user_id: Optional[str] = None) -> Agent:
+        """Create a view of this Agent for serving one request in a session.
+
+        The view shares configuration and clients with this Agent and keeps its own run state (memory,
+        run response and session state), which is loaded from storage for `session_id` on the first run.
+        A new session is started if `session_id` is None.
+
+        Args:
+            session_id (Optional[str]): The session to continue.
+            user_id (Optional[str]): The user making the request, defaults to this Agent's user_id.
+
+        Returns:
+            Agent: A new Agent instance.
+        """
+        update: Dict[str, Any] = {"session_id": session_id}
+        if user_id is not None:
+            update["user_id"] = user_id
+        return self.clone_for_request(update=update)
+
+    @staticmethod
+    def _copy_tool_for_request(tool: Any) -> Any:
+        """Copy the Function objects of a tool, which hold a reference to the Agent running them"""
+        from copy import copy
+
+        if isinstance(tool, Function):
+            return tool.model_copy()
+        if isinstance(tool, Toolkit):
+            toolkit_copy = copy(tool)
+            toolkit_copy.functions = {name: func.model_copy() for name, func in tool.functions.items()}
+            return toolkit_copy
+        return tool
+
     def get_transfer_function(self, member_agent: Agent, index: int) -> Function:
         def _transfer_task_to_agent(
             task_description: str, expected_output: str, additional_information: Optional[str] = None
@@ -2389,6 +2595,81 @@ class Agent:
             return None
         return [doc.to_dict() for doc in relevant_docs]
 
+    async def aget_relevant_docs_from_knowledge(
+        self, query: str, num_documents: Optional[int] = None, **kwargs
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Return a list of references from the knowledge base without blocking the event loop"""
+        from agno.document import Document
+
+        if self.retriever is not None:
+            retriever_kwargs = {"agent": self, "query": query, "num_documents": num_documents, **kwargs}
+            if iscoroutinefunction(self.retriever):
+                return await self.retriever(**retriever_kwargs)
+            return await asyncio.to_thread(self.retriever, **retriever_kwargs)
+
+        if self.knowledge is None:
+            return None
+
+        relevant_docs: List[Document] = await self.knowledge.asearch(query=query, num_documents=num_documents, **kwargs)
+        if len(relevant_docs) == 0:
+            return None
+        return [doc.to_dict() for doc in relevant_docs]
+
+    def get_references_query(self, message: Optional[Union[str, List]]) -> Optional[str]:
+        """Return the query used to search the knowledge base for references to add to the user message"""
+        if not self.add_references or not message:
+            return None
+        if isinstance(message, str):
+            return message
+        elif callable(message):
+            return message(agent=self)
+        raise Exception("message must be a string or a callable when add_references is True")
+
+    def get_references_from_knowledge(
+        self, message: Optional[Union[str, List]], **kwargs
+    ) -> Optional[MessageReferences]:
+        """Search the knowledge base for references to add to the user message"""
+        query = self.get_references_query(message)
+        if query is None:
+            return None
+
+        retrieval_timer = Timer()
+        retrieval_timer.start()
+        docs_from_knowledge = self.get_relevant_docs_from_knowledge(query=query, **kwargs)
+        return self.add_references_to_run_response(query, docs_from_knowledge, retrieval_timer)
+
+    async def aget_references_from_knowledge(
+        self, message: Optional[Union[str, List]], **kwargs
+    ) -> Optional[MessageReferences]:
+        """Search the knowledge base for references to add to the user message without blocking the event loop"""
+        query = self.get_references_query(message)
+        if query is None:
+            return None
+
+        retrieval_timer = Timer()
+        retrieval_timer.start()
+        docs_from_knowledge = await self.aget_relevant_docs_from_knowledge(query=query, **kwargs)
+        return self.add_references_to_run_response(query, docs_from_knowledge, retrieval_timer)
+
+    def add_references_to_run_response(
+        self, query: str, docs_from_knowledge: Optional[List[Dict[str, Any]]], retrieval_timer: Timer
+    ) -> MessageReferences:
+        """Record the references found for a query on the run_response"""
+        self.run_response = cast(RunResponse, self.run_response)
+        references = MessageReferences(
+            query=query, references=docs_from_knowledge, time=round(retrieval_timer.elapsed, 4)
+        )
+        if docs_from_knowledge is not None:
+            # Add the references to the run_response
+            if self.run_response.extra_data is None:
+                self.run_response.extra_data = RunResponseExtraData()
+            if self.run_response.extra_data.references is None:
+                self.run_response.extra_data.references = []
+            self.run_response.extra_data.references.append(references)
+        retrieval_timer.stop()
+        logger.debug(f"Time to get references: {retrieval_timer.elapsed:.4f}s")
+        return references
+
     def convert_documents_to_string(self, docs: List[Dict[str, Any]]) -> str:
         if docs is None or len(docs) == 0:
             return ""
@@ -3005,22 +3286,30 @@ class Agent:
         """
 
         # Get the relevant documents from the knowledge base
-        self.run_response = cast(RunResponse, self.run_response)
         retrieval_timer = Timer()
         retrieval_timer.start()
         docs_from_knowledge = self.get_relevant_docs_from_knowledge(query=query)
-        if docs_from_knowledge is not None:
-            references = MessageReferences(
-                query=query, references=docs_from_knowledge, time=round(retrieval_timer.elapsed, 4)
-            )
-            # Add the references to the run_response
-            if self.run_response.extra_data is None:
-                self.run_response.extra_data = RunResponseExtraData()
-            if self.run_response.extra_data.references is None:
-                self.run_response.extra_data.references = []
-            self.run_response.extra_data.references.append(references)
-        retrieval_timer.stop()
-        logger.debug(f"Time to get references: {retrieval_timer.elapsed:.4f}s")
+        self.add_references_to_run_response(query, docs_from_knowledge, retrieval_timer)
+
+        if docs_from_knowledge is None:
+            return "No documents found"
+        return self.convert_documents_to_string(docs_from_knowledge)
+
+    async def asearch_knowledge_base(self, query: str) -> str:
+        """Use this function to search the knowledge base for information about a query.
+
+        Args:
+            query: The query to search for.
+
+        Returns:
+            str: A string containing the response from the knowledge base.
+        """
+
+        # Get the relevant documents from the knowledge base
+        retrieval_timer = Timer()
+        retrieval_timer.start()
+        docs_from_knowledge = await self.aget_relevant_docs_from_knowledge(query=query)
+        self.add_references_to_run_response(query, docs_from_knowledge, retrieval_timer)
 
         if docs_from_knowledge is None:
             return "No documents found"
@@ -26,6 +26,19 @@ class Document:
 
         self.embedding, self.usage = _embedder.get_embedding_and_usage(self.content)
 
+    @staticmethod
+    def embed_batch(documents: List["Document"], embedder: Embedder) -> None:
+        """Embed documents in batches, skipping documents that already have an embedding"""
+        pending = [document for document in documents if document.embedding is None]
+        if len(pending) == 0:
+            return
+
+        embeddings, usage = embedder.get_embeddings_batch([document.content for document in pending])
+        for document, embedding in zip(pending, embeddings):
+            document.embedding = embedding
+            # Usage is reported per request, so it is only attributable to a document embedded on its own
+            document.usage = usage if len(pending) == 1 else None
+
     def to_dict(self) -> Dict[str, Any]:
         """Returns a dictionary representation of the document"""
         fields = {"name", "meta_data", "content"}
@@ -1,7 +1,7 @@
-from typing import List
+from typing import Iterator, List
 
 from agno.document.base import Document
-from agno.document.chunking.strategy import ChunkingStrategy
+from agno.document.chunking.strategy import ChunkingStrategy, Span
 
 
 class FixedSizeChunking(ChunkingStrategy):
@@ -17,43 +17,28 @@ class FixedSizeChunking(ChunkingStrategy):
 
     def chunk(self, document: Document) -> List[Document]:
         """Split document into fixed-size chunks with optional overlap"""
+        return list(self.iter_chunk(document))
+
+    def iter_chunk(self, document: Document) -> Iterator[Document]:
         content = self.clean_text(document.content)
+        return self.span_documents(document, content, self.spans(content))
+
+    def spans(self, content: str) -> Iterator[Span]:
+        """Yield the (start, end) offsets of the chunks of a cleaned text"""
         content_length = len(content)
-        chunked_documents: List[Document] = []
-        chunk_number = 1
-        chunk_meta_data = document.meta_data
 
         start = 0
         while start < content_length:
             end = min(start + self.chunk_size, content_length)
 
-            # Ensure we're not splitting a word in half
+            # Ensure we're not splitting a word in half, by ending the chunk at its last whitespace
             if end < content_length:
-                while end > start and content[end] not in [" ", "\n", "\r", "\t"]:
-                    end -= 1
+                end = max(content.rfind(separator, start + 1, end + 1) for separator in (" ", "\n", "\r", "\t"))
 
             # If the entire chunk is a word, then just split it at chunk_size
-            if end == start:
+            if end <= start:
                 end = start + self.chunk_size
 
-            chunk = content[start:end]
-            meta_data = chunk_meta_data.copy()
-            meta_data["chunk"] = chunk_number
-            chunk_id = None
-            if document.id:
-                chunk_id = f"{document.id}_{chunk_number}"
-            elif document.name:
-                chunk_id = f"{document.name}_{chunk_number}"
-            meta_data["chunk_size"] = len(chunk)
-            chunked_documents.append(
-                Document(
-                    id=chunk_id,
-                    name=document.name,
-                    meta_data=meta_data,
-                    content=chunk,
-                )
-            )
-            chunk_number += 1
-            start = end - self.overlap
-
-        return chunked_documents
+            yield start, min(end, content_length)
+            # Overlap with the previous chunk, but always move forward or a chunk ending on an early whitespace repeats forever
+            start = end - self.overlap if end - self.overlap > start else end
@@ -0,0 +1,90 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from agno.document.base import Document
+from agno.document.chunking.strategy import ChunkingStrategy
+from agno.utils.log import logger
+
+# What is shipped to the worker processes for a document: content, id, name and meta data
+_Payload = Tuple[str, Optional[str], Optional[str], Dict[str, Any]]
+# What is shipped back for a chunk: its payload and the embedding set by the strategy, if any
+_ChunkPayload = Tuple[str, Optional[str], Optional[str], Dict[str, Any], Optional[List[float]]]
+
+# Chunking strategy of the current worker process, set once when the worker starts
+_worker_strategy: Optional[ChunkingStrategy] = None
+
+
+def _init_worker(strategy: ChunkingStrategy) -> None:
+    global _worker_strategy
+    _worker_strategy = strategy
+
+
+def _chunk_payload(payload: _Payload) -> List[_ChunkPayload]:
+    assert _worker_strategy is not None
+    content, id, name, meta_data = payload
+    chunks = _worker_strategy.chunk(Document(content=content, id=id, name=name, meta_data=meta_data))
+    return [(chunk.content, chunk.id, chunk.name, chunk.meta_data, chunk.embedding) for chunk in chunks]
+
+
+class ParallelChunker(ChunkingStrategy):
+    """Chunking strategy that chunks documents with another strategy in a pool of worker processes.
+
+    Only the content, id, name and meta data of documents are sent to the workers, chunks also bring back the
+    embedding set by the wrapped strategy, e.g. the pooled embeddings of semantic chunks. Chunks are
+    returned in the order of the documents. Batches totalling less than `min_parallel_chars` characters are chunked
+    in the calling process, where sending them to the workers would cost more than it saves. A single document is
+    always chunked in the calling process. The wrapped strategy must be picklable, it is sent once to each worker.
+    """
+
+    def __init__(
+        self, strategy: ChunkingStrategy, max_workers: Optional[int] = None, min_parallel_chars: int = 2_000_000
+    ):
+        self.strategy = strategy
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_parallel_chars = min_parallel_chars
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=_init_worker, initargs=(self.strategy,)
+            )
+        return self._executor
+
+    def chunk(self, document: Document) -> List[Document]:
+        return self.strategy.chunk(document)
+
+    def clean_text(self, text: str) -> str:
+        return self.strategy.clean_text(text)
+
+    def chunk_batch(self, documents: List[Document]) -> List[Document]:
+        """Split documents into chunks in the worker processes, keeping the order of the documents"""
+        total_chars = sum(len(document.content) for document in documents)
+        if len(documents) < 2 or self.max_workers < 2 or total_chars < self.min_parallel_chars:
+            return self.strategy.chunk_batch(documents)
+
+        logger.debug(f"Chunking {len(documents)} documents ({total_chars} characters) in {self.max_workers} processes")
+        payloads = [(document.content, document.id, document.name, document.meta_data) for document in documents]
+        # Send documents in a few tasks per worker, so small documents do not each pay for a round trip
+        chunksize = max(1, len(payloads) // (self.max_workers * 4))
+        chunked_documents: List[Document] = []
+        for chunks in self.executor.map(_chunk_payload, payloads, chunksize=chunksize):
+            chunked_documents.extend(
+                Document(content=content, id=id, name=name, meta_data=meta_data, embedding=embedding)
+                for content, id, name, meta_data, embedding in chunks
+            )
+        return chunked_documents
+
+    def close(self) -> None:
+        """Shut down the worker processes, they are started again on the next parallel batch"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The pool is not picklable, a copy of the chunker in another process starts its own
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
@@ -1,7 +1,7 @@
-from typing import List
+from typing import Iterator, List
 
 from agno.document.base import Document
-from agno.document.chunking.strategy import ChunkingStrategy
+from agno.document.chunking.strategy import ChunkingStrategy, Span
 
 
 class RecursiveChunking(ChunkingStrategy):
@@ -17,35 +17,30 @@ class RecursiveChunking(ChunkingStrategy):
 
     def chunk(self, document: Document) -> List[Document]:
         """Recursively chunk text by finding natural break points"""
+        return list(self.iter_chunk(document))
+
+    def iter_chunk(self, document: Document) -> Iterator[Document]:
         if len(document.content) <= self.chunk_size:
-            return [document]
+            return iter([document])
 
-        chunks: List[Document] = []
-        start = 0
-        chunk_meta_data = document.meta_data
-        chunk_number = 1
         content = self.clean_text(document.content)
+        return self.span_documents(document, content, self.spans(content), name_ids=False)
+
+    def spans(self, content: str) -> Iterator[Span]:
+        """Yield the (start, end) offsets of the chunks of a cleaned text"""
+        content_length = len(content)
 
-        while start < len(content):
-            end = min(start + self.chunk_size, len(content))
+        start = 0
+        while start < content_length:
+            end = min(start + self.chunk_size, content_length)
 
-            if end < len(content):
+            if end < content_length:
                 for sep in ["\n", "."]:
-                    last_sep = content[start:end].rfind(sep)
+                    last_sep = content.rfind(sep, start, end)
                     if last_sep != -1:
-                        end = start + last_sep + 1
+                        end = last_sep + 1
                         break
 
-            chunk = content[start:end]
-            meta_data = chunk_meta_data.copy()
-            meta_data["chunk"] = chunk_number
-            chunk_id = None
-            if document.id:
-                chunk_id = f"{document.id}_{chunk_number}"
-            chunk_number += 1
-            meta_data["chunk_size"] = len(chunk)
-            chunks.append(Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk))
-
-            start = max(start, end - self.overlap)
-
-        return chunks
+            yield start, end
+            # Overlap with the previous chunk, but always move forward or a chunk ending on an early break repeats forever
+            start = end - self.overlap if end - self.overlap > start else end
@@ -1,35 +1,65 @@
-from typing import List, Optional
+import math
+import re
+from operator import mul
+from typing import Any, List, Optional
 
 from agno.document.base import Document
-from agno.document.chunking.strategy import ChunkingStrategy
+from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.chunking.strategy import ChunkingStrategy, Span
 from agno.embedder.base import Embedder
-from agno.embedder.openai import OpenAIEmbedder
 
-try:
-    from chonkie import SemanticChunker
-except ImportError:
-    raise ImportError("`chonkie` is required for semantic chunking, please install using `pip install chonkie`")
+# End of a sentence, with the whitespace after it
+_SENTENCE_END = re.compile(r"[.!?]+\s+")
 
 
 class SemanticChunking(ChunkingStrategy):
-    """Chunking strategy that splits text into semantic chunks using chonkie"""
+    """Chunking strategy that splits text into semantic chunks, where the similarity of consecutive sentences drops.
+
+    By default sentences are embedded by chonkie, with the embedding model named by the embedder id. With
+    `embed_sentences`, they are embedded in batches by the embedder itself, the embedder of the vector db when used
+    by a knowledge base, and with `pool_embeddings` each chunk gets the length weighted mean of the embeddings of
+    its sentences, so the vector db does not embed the chunks again. A knowledge base turns pooling off when the
+    embedder is not the embedder of its vector db.
+    """
 
     def __init__(
-        self, embedder: Optional[Embedder] = None, chunk_size: int = 5000, similarity_threshold: Optional[float] = 0.5
+        self,
+        embedder: Optional[Embedder] = None,
+        chunk_size: int = 5000,
+        similarity_threshold: Optional[float] = 0.5,
+        embed_sentences: bool = False,
+        pool_embeddings: bool = True,
     ):
-        self.embedder = embedder or OpenAIEmbedder(id="text-embedding-3-small")  # type: ignore
+        self.embedder = embedder
         self.chunk_size = chunk_size
         self.similarity_threshold = similarity_threshold
-        self.chunker = SemanticChunker(
-            embedding_model=self.embedder.id,  # type: ignore
-            chunk_size=self.chunk_size,
-            threshold=self.similarity_threshold,
-        )
+        self.embed_sentences = embed_sentences
+        self.pool_embeddings = pool_embeddings
+        self._chunker: Any = None
+
+    @property
+    def chunker(self) -> Any:
+        if self._chunker is None:
+            try:
+                from chonkie import SemanticChunker
+            except ImportError:
+                raise ImportError(
+                    "`chonkie` is required for semantic chunking, please install using `pip install chonkie`"
+                )
+
+            self._chunker = SemanticChunker(
+                embedding_model=getattr(self.embedder, "id", "text-embedding-3-small"),
+                chunk_size=self.chunk_size,
+                threshold=self.similarity_threshold,
+            )
+        return self._chunker
 
     def chunk(self, document: Document) -> List[Document]:
-        """Split document into semantic chunks using chokie"""
+        """Split document into semantic chunks using chokie, or the embedder with `embed_sentences`"""
         if not document.content:
             return [document]
+        if self.embed_sentences:
+            return self._chunk_with_embedder(document)
 
         # Use chonkie to split into semantic chunks
         chunks = self.chunker.chunk(self.clean_text(document.content))
@@ -45,3 +75,72 @@ class SemanticChunking(ChunkingStrategy):
             chunked_documents.append(Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk.text))
 
         return chunked_documents
+
+    def sentence_spans(self, content: str) -> List[Span]:
+        """Split a cleaned text into sentences, themselves split at whitespace when longer than `chunk_size`"""
+        spans: List[Span] = []
+        start = 0
+        for match in _SENTENCE_END.finditer(content):
+            spans.append((start, match.end()))
+            start = match.end()
+        if start < len(content):
+            spans.append((start, len(content)))
+
+        splitter = FixedSizeChunking(chunk_size=self.chunk_size)
+        sentence_spans: List[Span] = []
+        for start, end in spans:
+            if end - start <= self.chunk_size:
+                sentence_spans.append((start, end))
+            else:
+                sentence_spans.extend((start + s, start + e) for s, e in splitter.spans(content[start:end]))
+        return sentence_spans
+
+    def _chunk_with_embedder(self, document: Document) -> List[Document]:
+        if self.embedder is None:
+            raise ValueError("No embedder provided")
+
+        content = self.clean_text(document.content)
+        sentences = self.sentence_spans(content)
+        embeddings, _ = self.embedder.get_embeddings_batch([content[start:end] for start, end in sentences])
+        embeddings = [_normalize(embedding) for embedding in embeddings]
+
+        # Start a new chunk where consecutive sentences are not similar enough, or the chunk would be too long
+        groups: List[List[int]] = [[0]]
+        for i in range(1, len(sentences)):
+            chunk_start = sentences[groups[-1][0]][0]
+            similarity = sum(map(mul, embeddings[i - 1], embeddings[i]))
+            if sentences[i][1] - chunk_start > self.chunk_size or (
+                self.similarity_threshold is not None and similarity < self.similarity_threshold
+            ):
+                groups.append([i])
+            else:
+                groups[-1].append(i)
+
+        spans = [(sentences[group[0]][0], sentences[group[-1]][1]) for group in groups]
+        chunked_documents = list(self.span_documents(document, content, spans, name_ids=False))
+        if self.pool_embeddings:
+            for chunked_document, group in zip(chunked_documents, groups):
+                chunked_document.embedding = _pool(
+                    [embeddings[i] for i in group], [sentences[i][1] - sentences[i][0] for i in group]
+                )
+        return chunked_documents
+
+    def __getstate__(self):
+        # The chonkie chunker holds a model client, a copy of the strategy in another process creates its own
+        state = self.__dict__.copy()
+        state["_chunker"] = None
+        return state
+
+
+def _normalize(embedding: List[float]) -> List[float]:
+    norm = math.sqrt(sum(map(mul, embedding, embedding)))
+    return [value / norm for value in embedding] if norm > 0 else list(embedding)
+
+
+def _pool(embeddings: List[List[float]], weights: List[int]) -> List[float]:
+    """Mean of the embeddings weighted by the length of their text, normalized to unit length"""
+    pooled = [0.0] * len(embeddings[0])
+    for embedding, weight in zip(embeddings, weights):
+        for i, value in enumerate(embedding):
+            pooled[i] += weight * value
+    return _normalize(pooled)
@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from agno.document.base import Document
 
+# A chunk as the (start, end) offsets of its text in the cleaned content of a document
+Span = Tuple[int, int]
+
 
 class ChunkingStrategy(ABC):
     """Base class for chunking strategies"""
@@ -11,21 +14,48 @@ class ChunkingStrategy(ABC):
     def chunk(self, document: Document) -> List[Document]:
         raise NotImplementedError
 
-    def clean_text(self, text: str) -> str:
-        """Clean the text by replacing multiple newlines with a single newline"""
-        import re
-
-        # Replace multiple newlines with a single newline
-        cleaned_text = re.sub(r"\n+", "\n", text)
-        # Replace multiple spaces with a single space
-        cleaned_text = re.sub(r"\s+", " ", cleaned_text)
-        # Replace multiple tabs with a single tab
-        cleaned_text = re.sub(r"\t+", "\t", cleaned_text)
-        # Replace multiple carriage returns with a single carriage return
-        cleaned_text = re.sub(r"\r+", "\r", cleaned_text)
-        # Replace multiple form feeds with a single form feed
-        cleaned_text = re.sub(r"\f+", "\f", cleaned_text)
-        # Replace multiple vertical tabs with a single vertical tab
-        cleaned_text = re.sub(r"\v+", "\v", cleaned_text)
+    def iter_chunk(self, document: Document) -> Iterator[Document]:
+        """Yield the chunks of a document one at a time, strategies computing spans build each chunk when it is reached"""
+        yield from self.chunk(document)
 
+    def chunk_batch(self, documents: List[Document]) -> List[Document]:
+        """Split documents into chunks, keeping the order of the documents"""
+        chunked_documents: List[Document] = []
+        for document in documents:
+            chunked_documents.extend(self.chunk(document))
+        return chunked_documents
+
+    def clean_text(self, text: str) -> str:
+        """Clean the text by replacing every run of whitespace, newlines included, with a single space"""
+        # A single pass equivalent to re.sub(r"\s+", " ", text), str.split splits on the same whitespace characters
+        cleaned_text = " ".join(text.split())
+        if text[:1].isspace():
+            cleaned_text = " " + cleaned_text
+        if text[-1:].isspace() and cleaned_text != " ":
+            cleaned_text += " "
         return cleaned_text
+
+    @staticmethod
+    def span_documents(
+        document: Document, content: str, spans: Iterable[Span], name_ids: bool = True
+    ) -> Iterator[Document]:
+        """Build the chunk documents of the spans of a document, slicing the content of each chunk as it is yielded
+
+        Args:
+            document (Document): The document being chunked.
+            content (str): The cleaned content of the document the spans are offsets of.
+            spans (Iterable[Span]): The (start, end) offsets of the chunks.
+            name_ids (bool): If True, chunks of a document without id get ids from its name. Defaults to True.
+
+        Returns:
+            Iterator[Document]: The chunk documents.
+        """
+        id_prefix: Optional[str] = document.id or (document.name if name_ids else None)
+        for chunk_number, (start, end) in enumerate(spans, start=1):
+            chunk = content[start:end]
+            yield Document(
+                id=f"{id_prefix}_{chunk_number}" if id_prefix else None,
+                name=document.name,
+                meta_data={**document.meta_data, "chunk": chunk_number, "chunk_size": len(chunk)},
+                content=chunk,
+            )
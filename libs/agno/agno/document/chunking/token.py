@@ -0,0 +1,49 @@
+from typing import Iterator, List
+
+from agno.document.base import Document
+from agno.document.chunking.strategy import ChunkingStrategy, Span
+from agno.utils.token_counter import TokenEncoder, get_encoder
+
+
+class TokenChunking(ChunkingStrategy):
+    """Chunking strategy that splits text into chunks of `chunk_size` tokens, with an overlap in tokens.
+
+    The document is tokenized once and chunks are cut at token boundaries, so they never exceed the token limit of
+    the embedding model. Tokenizers are loaded once per process, from tiktoken for OpenAI models and encodings, or
+    from Hugging Face tokenizers for hub models ("org/model").
+    """
+
+    def __init__(self, chunk_size: int = 1000, overlap: int = 0, model: str = "text-embedding-3-small"):
+        # overlap must be less than chunk size
+        if overlap >= chunk_size:
+            raise ValueError(f"Invalid parameters: overlap ({overlap}) must be less than chunk size ({chunk_size}).")
+
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        # Only the model is kept, the tokenizer comes from the registry of the process chunking the document
+        self.model = model
+
+    @property
+    def encoder(self) -> TokenEncoder:
+        return get_encoder(self.model)
+
+    def chunk(self, document: Document) -> List[Document]:
+        """Split document into chunks of at most `chunk_size` tokens"""
+        return list(self.iter_chunk(document))
+
+    def iter_chunk(self, document: Document) -> Iterator[Document]:
+        content = self.clean_text(document.content)
+        return self.span_documents(document, content, self.spans(content))
+
+    def spans(self, content: str) -> Iterator[Span]:
+        """Yield the (start, end) offsets of the chunks of a cleaned text"""
+        offsets = self.encoder.token_offsets(content)
+        num_tokens = len(offsets)
+
+        start = 0
+        while start < num_tokens:
+            end = min(start + self.chunk_size, num_tokens)
+            yield offsets[start], offsets[end] if end < num_tokens else len(content)
+            if end == num_tokens:
+                break
+            start = end - self.overlap
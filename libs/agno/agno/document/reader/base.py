@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Any, List
+from typing import Any, Iterator, List
 
 from agno.document.base import Document
 from agno.document.chunking.fixed import FixedSizeChunking
@@ -14,9 +14,30 @@ class Reader:
     chunk_size: int = 3000
     separators: List[str] = field(default_factory=lambda: ["\n", "\n\n", "\r", "\r\n", "\n\r", "\t", " ", "  "])
     chunking_strategy: ChunkingStrategy = field(default_factory=FixedSizeChunking)
+    # Number of documents (pages for PDFs) read before a batch is chunked and loaded to a knowledge base
+    read_batch_size: int = 100
 
     def read(self, obj: Any) -> List[Document]:
         raise NotImplementedError
 
+    def iter_read(self, obj: Any) -> Iterator[Document]:
+        """Yields documents as they are read, readers of large sources override it to avoid building the full list"""
+        yield from self.read(obj)
+
+    def iter_read_batches(self, obj: Any) -> Iterator[List[Document]]:
+        """Yields the documents of `iter_read` in lists of `read_batch_size` documents"""
+        batch: List[Document] = []
+        for document in self.iter_read(obj):
+            batch.append(document)
+            if len(batch) >= self.read_batch_size:
+                yield batch
+                batch = []
+        if len(batch) > 0:
+            yield batch
+
     def chunk_document(self, document: Document) -> List[Document]:
         return self.chunking_strategy.chunk(document)
+
+    def chunk_documents(self, documents: List[Document]) -> List[Document]:
+        """Chunk several documents at once, so a parallel chunking strategy can spread them over processes"""
+        return self.chunking_strategy.chunk_batch(documents)
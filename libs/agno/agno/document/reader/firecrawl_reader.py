@@ -74,11 +74,10 @@ class FirecrawlReader(Reader):
             content = result.get("markdown", "")
 
             if content:  # Only create document if content exists
-                if self.chunk:
-                    documents.extend(self.chunk_document(Document(name=url, id=url, content=content)))
-                else:
-                    documents.append(Document(name=url, id=url, content=content))
+                documents.append(Document(name=url, id=url, content=content))
 
+        if self.chunk:
+            return self.chunk_documents(documents)
         return documents
 
     def read(self, url: str) -> List[Document]:
@@ -1,5 +1,13 @@
+import json
+import sqlite3
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from hashlib import md5
+from importlib.util import find_spec
+from io import BytesIO
 from pathlib import Path
-from typing import IO, Any, List, Union
+from typing import IO, Any, Deque, Dict, Iterator, List, Optional, Tuple, Union
 
 from agno.document.base import Document
 from agno.document.reader.base import Reader
@@ -10,210 +18,320 @@ try:
 except ImportError:
     raise ImportError("`pypdf` not installed. Please install it via `pip install pypdf`.")
 
+# SQLite limits the number of bound parameters per statement, so bulk lookups are chunked
+_SQLITE_MAX_PARAMS = 500
 
-class PDFReader(Reader):
-    """Reader for PDF files"""
+# RapidOCR engine of the current process, created once and reused for every image
+_ocr_engine: Any = None
 
-    def read(self, pdf: Union[str, Path, IO[Any]]) -> List[Document]:
-        doc_name = ""
-        try:
-            if isinstance(pdf, str):
-                doc_name = pdf.split("/")[-1].split(".")[0].replace(" ", "_")
-            else:
-                doc_name = pdf.name.split(".")[0]
-        except Exception:
-            doc_name = "pdf"
 
-        logger.info(f"Reading: {doc_name}")
-        doc_reader = DocumentReader(pdf)
-
-        documents = [
-            Document(
-                name=doc_name,
-                id=f"{doc_name}_{page_number}",
-                meta_data={"page": page_number},
-                content=page.extract_text(),
+def _get_ocr_engine() -> Any:
+    global _ocr_engine
+
+    if _ocr_engine is None:
+        try:
+            import rapidocr_onnxruntime as rapidocr
+        except ImportError:
+            raise ImportError(
+                "`rapidocr_onnxruntime` not installed. Please install it via `pip install rapidocr_onnxruntime`."
             )
-            for page_number, page in enumerate(doc_reader.pages, start=1)
-        ]
-        if self.chunk:
-            chunked_documents = []
-            for document in documents:
-                chunked_documents.extend(self.chunk_document(document))
-            return chunked_documents
-        return documents
+        _ocr_engine = rapidocr.RapidOCR()
+    return _ocr_engine
 
 
-class PDFUrlReader(Reader):
-    """Reader for PDF files from URL"""
+def _ocr_image(image_data: bytes) -> List[str]:
+    """Returns the lines of text recognized in an image"""
+    ocr_result, elapse = _get_ocr_engine()(image_data)
+    if not ocr_result:
+        return []
+    return [item[1] for item in ocr_result]
 
-    def read(self, url: str) -> List[Document]:
-        if not url:
-            raise ValueError("No url provided")
 
-        from io import BytesIO
+def _pdf_name(pdf: Union[str, Path, IO[Any]]) -> str:
+    try:
+        if isinstance(pdf, str):
+            return pdf.split("/")[-1].split(".")[0].replace(" ", "_")
+        return pdf.name.split(".")[0]
+    except Exception:
+        return "pdf"
 
-        try:
-            import httpx
-        except ImportError:
-            raise ImportError("`httpx` not installed. Please install it via `pip install httpx`.")
 
-        logger.info(f"Reading: {url}")
-        response = httpx.get(url)
+def _fetch_pdf(url: str) -> Tuple[str, BytesIO]:
+    """Download a PDF, returns its name and contents"""
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError("`httpx` not installed. Please install it via `pip install httpx`.")
 
-        try:
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-            raise
-
-        doc_name = url.split("/")[-1].split(".")[0].replace("/", "_").replace(" ", "_")
-        doc_reader = DocumentReader(BytesIO(response.content))
-
-        documents = [
-            Document(
-                name=doc_name,
-                id=f"{doc_name}_{page_number}",
-                meta_data={"page": page_number},
-                content=page.extract_text(),
-            )
-            for page_number, page in enumerate(doc_reader.pages, start=1)
-        ]
-        if self.chunk:
-            chunked_documents = []
-            for document in documents:
-                chunked_documents.extend(self.chunk_document(document))
-            return chunked_documents
-        return documents
+    logger.info(f"Reading: {url}")
+    response = httpx.get(url)
 
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        logger.error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
+        raise
 
-class PDFImageReader(Reader):
-    """Reader for PDF files with text and images extraction"""
+    doc_name = url.split("/")[-1].split(".")[0].replace("/", "_").replace(" ", "_")
+    return doc_name, BytesIO(response.content)
 
-    def read(self, pdf: Union[str, Path, IO[Any]]) -> List[Document]:
-        if not pdf:
-            raise ValueError("No pdf provided")
 
-        try:
-            import rapidocr_onnxruntime as rapidocr
-        except ImportError:
-            raise ImportError(
-                "`rapidocr_onnxruntime` not installed. Please install it via `pip install rapidocr_onnxruntime`."
-            )
-
-        doc_name = ""
-        try:
-            if isinstance(pdf, str):
-                doc_name = pdf.split("/")[-1].split(".")[0].replace(" ", "_")
-            else:
-                doc_name = pdf.name.split(".")[0]
-        except Exception:
-            doc_name = "pdf"
+def _page_documents(
+    reader: Reader, doc_name: str, page_number: int, content: str, chunk: bool = True
+) -> Iterator[Document]:
+    """Yields the document of a page, or its chunks if the reader chunks documents"""
+    document = Document(name=doc_name, id=f"{doc_name}_{page_number}", meta_data={"page": page_number}, content=content)
+    if chunk and reader.chunk:
+        yield from reader.chunk_document(document)
+    else:
+        yield document
 
-        logger.info(f"Reading: {doc_name}")
-        doc_reader = DocumentReader(pdf)
 
-        # Initialize RapidOCR
-        ocr = rapidocr.RapidOCR()
+def _text_pages(reader: Reader, doc_name: str, doc_reader: DocumentReader, chunk: bool = True) -> Iterator[Document]:
+    for page_number, page in enumerate(doc_reader.pages, start=1):
+        yield from _page_documents(reader, doc_name, page_number, page.extract_text(), chunk=chunk)
 
-        documents = []
-        for page_number, page in enumerate(doc_reader.pages, start=1):
-            page_text = page.extract_text() or ""
-            images_text_list: List = []
 
-            for image_object in page.images:
-                image_data = image_object.data
+def _chunked_batches(reader: Reader, pages: Iterator[Document]) -> Iterator[List[Document]]:
+    """Yields the chunks of `read_batch_size` pages at a time.
+    The pages of a batch are chunked together, so a parallel chunking strategy can spread them over processes.
+    """
+    batch: List[Document] = []
+    for page in pages:
+        batch.append(page)
+        if len(batch) >= reader.read_batch_size:
+            yield reader.chunk_documents(batch)
+            batch = []
+    if len(batch) > 0:
+        yield reader.chunk_documents(batch)
 
-                # Perform OCR on the image
-                ocr_result, elapse = ocr(image_data)
 
-                # Extract text from OCR result
-                if ocr_result:
-                    images_text_list += [item[1] for item in ocr_result]
+class PDFReader(Reader):
+    """Reader for PDF files"""
 
-            images_text: str = "\n".join(images_text_list)
-            content = page_text + "\n" + images_text
+    def read(self, pdf: Union[str, Path, IO[Any]]) -> List[Document]:
+        return [document for batch in self.iter_read_batches(pdf) for document in batch]
 
-            documents.append(
-                Document(
-                    name=doc_name,
-                    id=f"{doc_name}_{page_number}",
-                    meta_data={"page": page_number},
-                    content=content,
-                )
-            )
+    def iter_read_batches(self, pdf: Union[str, Path, IO[Any]]) -> Iterator[List[Document]]:
+        """Yields the documents of a PDF in batches of `read_batch_size` pages"""
+        if not self.chunk:
+            yield from super().iter_read_batches(pdf)
+            return
 
-        if self.chunk:
-            chunked_documents = []
-            for document in documents:
-                chunked_documents.extend(self.chunk_document(document))
-            return chunked_documents
+        doc_name = _pdf_name(pdf)
+        logger.info(f"Reading: {doc_name}")
+        yield from _chunked_batches(self, _text_pages(self, doc_name, DocumentReader(pdf), chunk=False))
 
-        return documents
+    def iter_read(self, pdf: Union[str, Path, IO[Any]]) -> Iterator[Document]:
+        """Yields the documents of a PDF page by page, without holding the whole PDF in memory"""
+        doc_name = _pdf_name(pdf)
+        logger.info(f"Reading: {doc_name}")
+        yield from _text_pages(self, doc_name, DocumentReader(pdf))
 
 
-class PDFUrlImageReader(Reader):
-    """Reader for PDF files from URL with text and images extraction"""
+class PDFUrlReader(Reader):
+    """Reader for PDF files from URL"""
 
     def read(self, url: str) -> List[Document]:
+        return [document for batch in self.iter_read_batches(url) for document in batch]
+
+    def iter_read_batches(self, url: str) -> Iterator[List[Document]]:
+        """Yields the documents of a PDF in batches of `read_batch_size` pages, after downloading it"""
+        if not self.chunk:
+            yield from super().iter_read_batches(url)
+            return
         if not url:
             raise ValueError("No url provided")
 
-        from io import BytesIO
+        doc_name, contents = _fetch_pdf(url)
+        yield from _chunked_batches(self, _text_pages(self, doc_name, DocumentReader(contents), chunk=False))
 
-        try:
-            import httpx
-            import rapidocr_onnxruntime as rapidocr
-        except ImportError:
-            raise ImportError(
-                "`httpx`, `rapidocr_onnxruntime` not installed. Please install it via `pip install httpx rapidocr_onnxruntime`."
+    def iter_read(self, url: str) -> Iterator[Document]:
+        """Yields the documents of a PDF page by page, after downloading it"""
+        if not url:
+            raise ValueError("No url provided")
+
+        doc_name, contents = _fetch_pdf(url)
+        yield from _text_pages(self, doc_name, DocumentReader(contents))
+
+
+class OCRCache:
+    """OCR results keyed on the md5 of the image data, kept in a local SQLite file.
+
+    A connection is opened per PDF, so the cache can be shared by readers in several processes.
+    """
+
+    def __init__(self, db_file: Union[str, Path]):
+        db_path = Path(db_file).resolve()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(db_path))
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS ocr_cache (hash TEXT PRIMARY KEY, lines TEXT NOT NULL)"
             )
 
-        # Read the PDF from the URL
-        logger.info(f"Reading: {url}")
-        response = httpx.get(url)
+    def get_many(self, hashes: List[str]) -> Dict[str, List[str]]:
+        found: Dict[str, List[str]] = {}
+        for i in range(0, len(hashes), _SQLITE_MAX_PARAMS):
+            batch = hashes[i : i + _SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            for image_hash, lines in self._connection.execute(
+                f"SELECT hash, lines FROM ocr_cache WHERE hash IN ({placeholders})", batch
+            ):
+                found[image_hash] = json.loads(lines)
+        return found
+
+    def set_many(self, results: Dict[str, List[str]]) -> None:
+        if len(results) == 0:
+            return
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO ocr_cache (hash, lines) VALUES (?, ?)",
+                [(image_hash, json.dumps(lines)) for image_hash, lines in results.items()],
+            )
 
-        doc_name = url.split("/")[-1].split(".")[0].replace(" ", "_")
-        doc_reader = DocumentReader(BytesIO(response.content))
+    def close(self) -> None:
+        self._connection.close()
+
+
+@dataclass
+class _PDFImageReaderBase(Reader):
+    """Extracts the text of PDF pages and of their images with OCR, yielding pages as they are ready.
+
+    With `ocr_workers`, images are recognized in a pool of worker processes, each loading RapidOCR once.
+    Pages are extracted ahead of OCR, up to `ocr_read_ahead` pages, so the workers stay busy while
+    the images waiting for OCR are bounded. With `ocr_cache_file`, OCR results are cached by image content
+    and images seen before, in this PDF or an earlier one, are not recognized again.
+    """
+
+    # Number of OCR worker processes, None to run OCR in the calling process
+    ocr_workers: Optional[int] = None
+    # Maximum number of pages extracted while waiting for the OCR of an earlier page
+    ocr_read_ahead: int = 16
+    # SQLite file caching the OCR results of each image
+    ocr_cache_file: Optional[Union[str, Path]] = None
+
+    _executor: Optional[ProcessPoolExecutor] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.ocr_workers is not None and self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.ocr_workers, initializer=_get_ocr_engine)
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the OCR worker processes, they are started again on the next read"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The pool is not picklable, a copy of the reader in another process starts its own
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
+    def _ocr_pages(self, doc_name: str, doc_reader: DocumentReader) -> Iterator[Document]:
+        if self.ocr_workers is None:
+            _get_ocr_engine()
+        elif find_spec("rapidocr_onnxruntime") is None:
+            # Fail before reading the PDF, the workers would only fail on their first image
+            raise ImportError(
+                "`rapidocr_onnxruntime` not installed. Please install it via `pip install rapidocr_onnxruntime`."
+            )
 
-        # Initialize RapidOCR
-        ocr = rapidocr.RapidOCR()
+        cache = OCRCache(self.ocr_cache_file) if self.ocr_cache_file is not None else None
+        # Pages waiting for the OCR of their images, in page order
+        pending: Deque[Tuple[int, str, List[Tuple[str, Union[Future, List[str]]]]]] = deque()
+        # Images recognized in this PDF, so repeated images (logos, headers) are recognized once
+        recognized: Dict[str, Union[Future, List[str]]] = {}
+        num_cached = num_recognized = 0
+        try:
+            for page_number, page in enumerate(doc_reader.pages, start=1):
+                page_text = page.extract_text() or ""
+                images = [(md5(image.data).hexdigest(), image.data) for image in page.images]
+                cached = cache.get_many([image_hash for image_hash, _ in images]) if cache is not None else {}
+                ocr_results: List[Tuple[str, Union[Future, List[str]]]] = []
+                for image_hash, image_data in images:
+                    if image_hash in cached:
+                        ocr_results.append((image_hash, cached[image_hash]))
+                        num_cached += 1
+                    elif image_hash in recognized:
+                        ocr_results.append((image_hash, recognized[image_hash]))
+                    else:
+                        if self.executor is not None:
+                            recognized[image_hash] = self.executor.submit(_ocr_image, image_data)
+                        else:
+                            recognized[image_hash] = _ocr_image(image_data)
+                        ocr_results.append((image_hash, recognized[image_hash]))
+                        num_recognized += 1
+                pending.append((page_number, page_text, ocr_results))
+
+                while len(pending) > self.ocr_read_ahead or (len(pending) > 0 and self._is_ready(pending[0][2])):
+                    yield from self._finish_page(doc_name, cache, *pending.popleft())
+            while len(pending) > 0:
+                yield from self._finish_page(doc_name, cache, *pending.popleft())
+        finally:
+            for _, _, ocr_results in pending:
+                for _, result in ocr_results:
+                    if isinstance(result, Future):
+                        result.cancel()
+            if cache is not None:
+                cache.close()
+        logger.debug(f"OCR of {doc_name}: {num_recognized} images recognized, {num_cached} from the cache")
+
+    @staticmethod
+    def _is_ready(ocr_results: List[Tuple[str, Union[Future, List[str]]]]) -> bool:
+        return all(not isinstance(result, Future) or result.done() for _, result in ocr_results)
+
+    def _finish_page(
+        self,
+        doc_name: str,
+        cache: Optional[OCRCache],
+        page_number: int,
+        page_text: str,
+        ocr_results: List[Tuple[str, Union[Future, List[str]]]],
+    ) -> Iterator[Document]:
+        images_text_list: List[str] = []
+        new_results: Dict[str, List[str]] = {}
+        for image_hash, result in ocr_results:
+            lines = result.result() if isinstance(result, Future) else result
+            if isinstance(result, Future) or cache is not None:
+                new_results[image_hash] = lines
+            images_text_list += lines
+        if cache is not None:
+            cache.set_many(new_results)
+
+        images_text = "\n".join(images_text_list)
+        yield from _page_documents(self, doc_name, page_number, page_text + "\n" + images_text)
+
+
+class PDFImageReader(_PDFImageReaderBase):
+    """Reader for PDF files with text and images extraction"""
 
-        # Process each page of the PDF
-        documents = []
-        for page_number, page in enumerate(doc_reader.pages, start=1):
-            page_text = page.extract_text() or ""
-            images_text_list = []
+    def read(self, pdf: Union[str, Path, IO[Any]]) -> List[Document]:
+        return list(self.iter_read(pdf))
 
-            # Extract and process images
-            for image_object in page.images:
-                image_data = image_object.data
+    def iter_read(self, pdf: Union[str, Path, IO[Any]]) -> Iterator[Document]:
+        """Yields the documents of a PDF page by page, as the OCR of the images of each page completes"""
+        if not pdf:
+            raise ValueError("No pdf provided")
 
-                # Perform OCR on the image
-                ocr_result, elapse = ocr(image_data)
+        doc_name = _pdf_name(pdf)
+        logger.info(f"Reading: {doc_name}")
+        yield from self._ocr_pages(doc_name, DocumentReader(pdf))
 
-                # Extract text from OCR result
-                if ocr_result:
-                    images_text_list += [item[1] for item in ocr_result]
 
-            images_text = "\n".join(images_text_list)
-            content = page_text + "\n" + images_text
+class PDFUrlImageReader(_PDFImageReaderBase):
+    """Reader for PDF files from URL with text and images extraction"""
 
-            # Append the document
-            documents.append(
-                Document(
-                    name=doc_name,
-                    id=f"{doc_name}_{page_number}",
-                    meta_data={"page": page_number},
-                    content=content,
-                )
-            )
+    def read(self, url: str) -> List[Document]:
+        return list(self.iter_read(url))
 
-        # Optionally chunk documents
-        if self.chunk:
-            chunked_documents = []
-            for document in documents:
-                chunked_documents.extend(self.chunk_document(document))
-            return chunked_documents
+    def iter_read(self, url: str) -> Iterator[Document]:
+        """Yields the documents of a PDF page by page after downloading it, as the OCR of each page completes"""
+        if not url:
+            raise ValueError("No url provided")
 
-        return documents
+        doc_name, contents = _fetch_pdf(url)
+        yield from self._ocr_pages(doc_name, DocumentReader(contents))
@@ -38,10 +38,7 @@ class S3TextReader(Reader):
                 )
             ]
             if self.chunk:
-                chunked_documents = []
-                for document in documents:
-                    chunked_documents.extend(self.chunk_document(document))
-                return chunked_documents
+                return self.chunk_documents(documents)
 
             logger.debug(f"Deleting: {temporary_file}")
             temporary_file.unlink()
@@ -1,7 +1,10 @@
+import asyncio
 import random
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Tuple
+from importlib.util import find_spec
+from typing import AsyncIterator, Deque, Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
 
 from agno.document.base import Document
@@ -18,6 +21,43 @@ try:
 except ImportError:
     raise ImportError("`httpx` not installed. Please install it via `pip install httpx`.")
 
+# lxml parses pages several times faster than the html.parser shipped with Python
+_HTML_PARSER = "lxml" if find_spec("lxml") is not None else "html.parser"
+
+
+@dataclass
+class _CachedPage:
+    """Validators of a crawled page with what was extracted from it, reused when the server answers 304"""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content: str
+    links: List[str]
+
+
+class _HostLimiter:
+    """Limits the concurrent requests to a host, and spaces them to at most `requests_per_second`"""
+
+    def __init__(self, max_concurrency: int, requests_per_second: Optional[float]):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._interval = 1 / requests_per_second if requests_per_second else 0.0
+        self._next_request_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "_HostLimiter":
+        await self._semaphore.acquire()
+        if self._interval > 0:
+            async with self._lock:
+                now = asyncio.get_running_loop().time()
+                wait = self._next_request_at - now
+                self._next_request_at = max(now, self._next_request_at) + self._interval
+            if wait > 0:
+                await asyncio.sleep(wait)
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self._semaphore.release()
+
 
 @dataclass
 class WebsiteReader(Reader):
@@ -26,8 +66,22 @@ class WebsiteReader(Reader):
     max_depth: int = 3
     max_links: int = 10
 
+    # Crawl with concurrent async requests, see `acrawl`
+    async_crawl: bool = False
+    # Maximum number of concurrent requests of an async crawl
+    max_concurrency: int = 10
+    # Maximum number of concurrent requests to the same host
+    max_concurrency_per_host: int = 2
+    # Maximum rate of requests to the same host, None for no limit
+    requests_per_second_per_host: Optional[float] = 2.0
+    # Seconds before a request times out
+    timeout: float = 10
+
     _visited: Set[str] = field(default_factory=set)
-    _urls_to_crawl: List[Tuple[str, int]] = field(default_factory=list)
+    _urls_to_crawl: Deque[Tuple[str, int]] = field(default_factory=deque)
+    _queued: Set[str] = field(default_factory=set)
+    # Pages fetched by async crawls, revalidated with conditional requests when crawled again
+    _http_cache: Dict[str, _CachedPage] = field(default_factory=dict)
 
     def delay(self, min_seconds=1, max_seconds=3):
         """
@@ -70,6 +124,37 @@ class WebsiteReader(Reader):
 
         return ""
 
+    def _extract_links(self, soup: BeautifulSoup, url: str, primary_domain: str) -> List[str]:
+        """
+        Extracts the links of a page to crawl, on the primary domain and not to files.
+
+        :param soup: The BeautifulSoup object of the page.
+        :param url: The URL of the page, to resolve relative links.
+        :param primary_domain: The primary domain of the crawl.
+        :return: The absolute URLs of the links.
+        """
+        links = []
+        for link in soup.find_all("a", href=True):
+            full_url = urljoin(url, str(link["href"]))
+            parsed_url = urlparse(full_url)
+            if parsed_url.netloc.endswith(primary_domain) and not any(
+                parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
+            ):
+                links.append(full_url)
+        return links
+
+    def _parse_page(self, url: str, html: bytes, primary_domain: str) -> Tuple[str, List[str]]:
+        """
+        Parses a page and returns its main content and links.
+
+        :param url: The URL of the page.
+        :param html: The HTML of the page.
+        :param primary_domain: The primary domain of the crawl.
+        :return: The main content and the links of the page.
+        """
+        soup = BeautifulSoup(html, _HTML_PARSER)
+        return self._extract_main_content(soup), self._extract_links(soup, url, primary_domain)
+
     def crawl(self, url: str, starting_depth: int = 1) -> Dict[str, str]:
         """
         Crawls a website and returns a dictionary of URLs and their corresponding content.
@@ -93,53 +178,157 @@ class WebsiteReader(Reader):
         primary_domain = self._get_primary_domain(url)
         # Add starting URL with its depth to the global list
         self._urls_to_crawl.append((url, starting_depth))
-        while self._urls_to_crawl:
-            # Unpack URL and depth from the global list
-            current_url, current_depth = self._urls_to_crawl.pop(0)
-
-            # Skip if
-            # - URL is already visited
-            # - does not end with the primary domain,
-            # - exceeds max depth
-            # - exceeds max links
-            if (
-                current_url in self._visited
-                or not urlparse(current_url).netloc.endswith(primary_domain)
-                or current_depth > self.max_depth
-                or num_links >= self.max_links
-            ):
-                continue
+        self._queued.add(url)
+        with httpx.Client(timeout=10) as client:
+            while self._urls_to_crawl:
+                # Unpack URL and depth from the global list
+                current_url, current_depth = self._urls_to_crawl.popleft()
+                self._queued.discard(current_url)
 
-            self._visited.add(current_url)
-            self.delay()
+                # Skip if
+                # - URL is already visited
+                # - does not end with the primary domain,
+                # - exceeds max depth
+                # - exceeds max links
+                if (
+                    current_url in self._visited
+                    or not urlparse(current_url).netloc.endswith(primary_domain)
+                    or current_depth > self.max_depth
+                    or num_links >= self.max_links
+                ):
+                    continue
 
-            try:
-                logger.debug(f"Crawling: {current_url}")
-                response = httpx.get(current_url, timeout=10)
-                soup = BeautifulSoup(response.content, "html.parser")
-
-                # Extract main content
-                main_content = self._extract_main_content(soup)
-                if main_content:
-                    crawler_result[current_url] = main_content
-                    num_links += 1
-
-                # Add found URLs to the global list, with incremented depth
-                for link in soup.find_all("a", href=True):
-                    full_url = urljoin(current_url, link["href"])
-                    parsed_url = urlparse(full_url)
-                    if parsed_url.netloc.endswith(primary_domain) and not any(
-                        parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
-                    ):
-                        if full_url not in self._visited and (full_url, current_depth + 1) not in self._urls_to_crawl:
+                self._visited.add(current_url)
+                self.delay()
+
+                try:
+                    logger.debug(f"Crawling: {current_url}")
+                    response = client.get(current_url)
+
+                    # Extract main content
+                    main_content, links = self._parse_page(current_url, response.content, primary_domain)
+                    if main_content:
+                        crawler_result[current_url] = main_content
+                        num_links += 1
+
+                    # Add found URLs to the global list, with incremented depth
+                    for full_url in links:
+                        if full_url not in self._visited and full_url not in self._queued:
                             self._urls_to_crawl.append((full_url, current_depth + 1))
+                            self._queued.add(full_url)
 
-            except Exception as e:
-                logger.debug(f"Failed to crawl: {current_url}: {e}")
-                pass
+                except Exception as e:
+                    logger.debug(f"Failed to crawl: {current_url}: {e}")
+                    pass
 
         return crawler_result
 
+    async def _afetch(
+        self, client: httpx.AsyncClient, limiter: _HostLimiter, url: str, primary_domain: str
+    ) -> Optional[Tuple[str, List[str]]]:
+        """
+        Fetches a page, revalidating the cached copy if it was crawled before, and returns its main content and links.
+
+        :param client: The client shared by the requests of the crawl.
+        :param limiter: The limiter of the host of the URL.
+        :param url: The URL of the page.
+        :param primary_domain: The primary domain of the crawl.
+        :return: The main content and the links of the page, or None if it could not be fetched.
+        """
+        cached = self._http_cache.get(url)
+        headers = {}
+        if cached is not None:
+            if cached.etag is not None:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified is not None:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        try:
+            async with limiter:
+                logger.debug(f"Crawling: {url}")
+                response = await client.get(url, headers=headers)
+        except httpx.HTTPError as e:
+            logger.debug(f"Failed to crawl: {url}: {e}")
+            return None
+
+        if response.status_code == 304 and cached is not None:
+            logger.debug(f"Not modified: {url}")
+            return cached.content, cached.links
+        if response.is_error:
+            logger.debug(f"Failed to crawl: {url}: HTTP {response.status_code}")
+            return None
+
+        # Parse in a thread so the event loop keeps sending requests
+        loop = asyncio.get_running_loop()
+        content, links = await loop.run_in_executor(None, self._parse_page, url, response.content, primary_domain)
+        etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+        if etag is not None or last_modified is not None:
+            self._http_cache[url] = _CachedPage(etag=etag, last_modified=last_modified, content=content, links=links)
+        return content, links
+
+    async def acrawl(self, url: str, starting_depth: int = 1) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Crawls a website with concurrent requests and yields the URL and main content of each page as it is fetched.
+
+        Requests share a pooled connection client, and are limited to `max_concurrency` in total and to
+        `max_concurrency_per_host` and `requests_per_second_per_host` per host. Pages crawled before by this
+        reader are revalidated with their ETag and Last-Modified headers, and not parsed again if unchanged.
+        Unlike `crawl`, the crawl state is not kept on the reader, so several websites can be crawled at once.
+
+        :param url: The starting URL to begin the crawl.
+        :param starting_depth: The starting depth level for the crawl. Defaults to 1.
+        :return: An async iterator of the URL and main content of each page.
+        """
+        primary_domain = self._get_primary_domain(url)
+        frontier: Deque[Tuple[str, int]] = deque([(url, starting_depth)])
+        # Every URL added to the frontier, so each page is fetched once
+        seen: Set[str] = {url}
+        limiters: Dict[str, _HostLimiter] = {}
+        in_flight: Dict["asyncio.Task[Optional[Tuple[str, List[str]]]]", Tuple[str, int]] = {}
+        num_links = 0
+
+        limits = httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency)
+        async with httpx.AsyncClient(limits=limits, timeout=self.timeout, follow_redirects=True) as client:
+            try:
+                while frontier or in_flight:
+                    # Pages without content do not count as links, so only start as many requests as links are missing
+                    while frontier and len(in_flight) < min(self.max_concurrency, self.max_links - num_links):
+                        current_url, current_depth = frontier.popleft()
+                        host = urlparse(current_url).netloc
+                        if host not in limiters:
+                            limiters[host] = _HostLimiter(
+                                self.max_concurrency_per_host, self.requests_per_second_per_host
+                            )
+                        task = asyncio.ensure_future(self._afetch(client, limiters[host], current_url, primary_domain))
+                        in_flight[task] = (current_url, current_depth)
+                    if not in_flight:
+                        break
+
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        current_url, current_depth = in_flight.pop(task)
+                        page = task.result()
+                        if page is None:
+                            continue
+                        main_content, links = page
+                        if main_content and num_links < self.max_links:
+                            num_links += 1
+                            yield current_url, main_content
+                        if current_depth < self.max_depth:
+                            for full_url in links:
+                                if full_url not in seen:
+                                    seen.add(full_url)
+                                    frontier.append((full_url, current_depth + 1))
+            finally:
+                for task in in_flight:
+                    task.cancel()
+
+    def _page_documents(self, url: str, crawled_url: str, crawled_content: str) -> List[Document]:
+        document = Document(name=url, id=str(crawled_url), meta_data={"url": str(crawled_url)}, content=crawled_content)
+        if self.chunk:
+            return self.chunk_document(document)
+        return [document]
+
     def read(self, url: str) -> List[Document]:
         """
         Reads a website and returns a list of documents.
@@ -150,26 +339,42 @@ class WebsiteReader(Reader):
         :param url: The URL of the website to read.
         :return: A list of documents.
         """
+        if self.async_crawl:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self.aread(url))
+            raise RuntimeError(
+                "WebsiteReader.read cannot crawl asynchronously inside a running event loop, use `await aread(url)`"
+            )
 
         logger.debug(f"Reading: {url}")
         crawler_result = self.crawl(url)
-        documents = []
-        for crawled_url, crawled_content in crawler_result.items():
-            if self.chunk:
-                documents.extend(
-                    self.chunk_document(
-                        Document(
-                            name=url, id=str(crawled_url), meta_data={"url": str(crawled_url)}, content=crawled_content
-                        )
-                    )
-                )
-            else:
-                documents.append(
-                    Document(
-                        name=url,
-                        id=str(crawled_url),
-                        meta_data={"url": str(crawled_url)},
-                        content=crawled_content,
-                    )
-                )
+        documents = [
+            Document(name=url, id=str(crawled_url), meta_data={"url": str(crawled_url)}, content=crawled_content)
+            for crawled_url, crawled_content in crawler_result.items()
+        ]
+        if self.chunk:
+            return self.chunk_documents(documents)
         return documents
+
+    async def aiter_read(self, url: str) -> AsyncIterator[Document]:
+        """
+        Crawls a website with `acrawl` and yields the documents of each page as soon as it is fetched.
+
+        :param url: The URL of the website to read.
+        :return: An async iterator of documents.
+        """
+        logger.debug(f"Reading: {url}")
+        async for crawled_url, crawled_content in self.acrawl(url):
+            for document in self._page_documents(url, crawled_url, crawled_content):
+                yield document
+
+    async def aread(self, url: str) -> List[Document]:
+        """
+        Reads a website with concurrent requests and returns a list of documents.
+
+        :param url: The URL of the website to read.
+        :return: A list of documents.
+        """
+        return [document async for document in self.aiter_read(url)]
@@ -1,5 +1,6 @@
+import asyncio
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
 @dataclass
@@ -7,9 +8,85 @@ class Embedder:
     """Base class for managing embedders"""
 
     dimensions: Optional[int] = 1536
+    # Maximum number of texts sent to the embedding provider in a single request
+    batch_size: int = 100
+    # Maximum number of (estimated) tokens sent to the embedding provider in a single request
+    batch_token_limit: Optional[int] = None
 
     def get_embedding(self, text: str) -> List[float]:
         raise NotImplementedError
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    async def aget_embedding(self, text: str) -> List[float]:
+        """Async variant of `get_embedding`. Embedders without an async client run the request in a worker thread."""
+        return await asyncio.to_thread(self.get_embedding, text)
+
+    async def aget_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return await asyncio.to_thread(self.get_embedding_and_usage, text)
+
+    def warm_up(self) -> None:
+        """Load any local model ahead of the first request. Remote embedders have nothing to load."""
+        pass
+
+    def get_embeddings_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        """Embed a list of texts, returning the embeddings in input order and the combined usage.
+
+        Subclasses with a native bulk endpoint override `_embed_batch`; the default embeds one text at a time.
+        """
+        embeddings: List[List[float]] = []
+        usage: Optional[Dict[str, Any]] = None
+        for batch in self.iter_batches(texts):
+            batch_embeddings, batch_usage = self._embed_batch(batch)
+            if len(batch_embeddings) != len(batch):
+                raise ValueError(f"Expected {len(batch)} embeddings from the embedder, got {len(batch_embeddings)}")
+            embeddings.extend(batch_embeddings)
+            usage = merge_usage(usage, batch_usage)
+        return embeddings, usage
+
+    def _embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        embeddings: List[List[float]] = []
+        usage: Optional[Dict[str, Any]] = None
+        for text in texts:
+            embedding, text_usage = self.get_embedding_and_usage(text)
+            embeddings.append(embedding)
+            usage = merge_usage(usage, text_usage)
+        return embeddings, usage
+
+    def iter_batches(self, texts: List[str]) -> Iterator[List[str]]:
+        """Split texts into batches bounded by `batch_size` and `batch_token_limit`"""
+        batch: List[str] = []
+        batch_tokens = 0
+        for text in texts:
+            text_tokens = estimate_tokens(text)
+            if batch and (
+                len(batch) >= self.batch_size
+                or (self.batch_token_limit is not None and batch_tokens + text_tokens > self.batch_token_limit)
+            ):
+                yield batch
+                batch = []
+                batch_tokens = 0
+            batch.append(text)
+            batch_tokens += text_tokens
+        if batch:
+            yield batch
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate used to bound request sizes (roughly 4 characters per token)"""
+    return len(text) // 4 + 1
+
+
+def merge_usage(usage: Optional[Dict[str, Any]], other: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Sum the numeric fields of two usage dictionaries"""
+    if other is None:
+        return usage
+    if usage is None:
+        return dict(other)
+    for key, value in other.items():
+        if isinstance(value, (int, float)) and isinstance(usage.get(key, 0), (int, float)):
+            usage[key] = usage.get(key, 0) + value
+        elif key not in usage:
+            usage[key] = value
+    return usage
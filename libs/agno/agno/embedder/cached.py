@@ -0,0 +1,188 @@
+import sqlite3
+import time
+from array import array
+from dataclasses import dataclass, field
+from hashlib import md5
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from agno.embedder.base import Embedder
+from agno.utils.log import logger
+
+# SQLite limits the number of bound parameters per statement, so bulk lookups are chunked
+_SQLITE_MAX_PARAMS = 500
+
+
+@dataclass
+class CachedEmbedder(Embedder):
+    """Content-addressed embedding cache in front of any Embedder.
+
+    Embeddings are keyed on (embedder id, dimensions, md5 of the cleaned content) and kept in a local SQLite
+    store with least-recently-used eviction once `max_entries` is exceeded. Use `db_file=None` for an in-memory cache.
+    """
+
+    embedder: Optional[Embedder] = None
+    db_file: Optional[Union[str, Path]] = None
+    table_name: str = "embedding_cache"
+    # Maximum number of embeddings kept in the cache, the least recently used are evicted first
+    max_entries: int = 100_000
+
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        if self.embedder is None:
+            raise ValueError("CachedEmbedder requires an embedder")
+        self.dimensions = self.embedder.dimensions
+        self.batch_size = self.embedder.batch_size
+        self.batch_token_limit = self.embedder.batch_token_limit
+
+        if self.db_file is not None:
+            db_path = Path(self.db_file).resolve()
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            database = str(db_path)
+        else:
+            database = ":memory:"
+        self._lock = Lock()
+        self._connection = sqlite3.connect(database, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} "
+                "(key TEXT PRIMARY KEY, embedding BLOB NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_last_used ON {self.table_name} (last_used)"
+            )
+
+    @property
+    def embedder_id(self) -> str:
+        return str(getattr(self.embedder, "id", None) or self.embedder.__class__.__name__)
+
+    def cache_key(self, text: str) -> str:
+        """Build the cache key for a text, using the same content hash as the vector db backends"""
+        content_hash = md5(text.replace("\x00", "\ufffd").encode()).hexdigest()
+        return f"{self.embedder_id}:{self.dimensions}:{content_hash}"
+
+    def get_cached(self, texts: List[str]) -> Dict[str, List[float]]:
+        """Bulk lookup of cached embeddings, returns a mapping from cache key to embedding"""
+        keys = list({self.cache_key(text) for text in texts})
+        found: Dict[str, List[float]] = {}
+        now = time.time()
+        with self._lock, self._connection:
+            for i in range(0, len(keys), _SQLITE_MAX_PARAMS):
+                batch_keys = keys[i : i + _SQLITE_MAX_PARAMS]
+                placeholders = ",".join("?" * len(batch_keys))
+                rows = self._connection.execute(
+                    f"SELECT key, embedding FROM {self.table_name} WHERE key IN ({placeholders})", batch_keys
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array("d", blob).tolist()
+                if rows:
+                    self._connection.execute(
+                        f"UPDATE {self.table_name} SET last_used = ? WHERE key IN ({placeholders})",
+                        [now, *batch_keys],
+                    )
+        return found
+
+    def set_cached(self, embeddings: Dict[str, List[float]]) -> None:
+        """Store embeddings by cache key and evict the least recently used entries over `max_entries`"""
+        if len(embeddings) == 0:
+            return
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, embedding, last_used) VALUES (?, ?, ?)",
+                [(key, array("d", embedding).tobytes(), now) for key, embedding in embeddings.items()],
+            )
+            count = self._connection.execute(f"SELECT COUNT(*) FROM {self.table_name}").fetchone()[0]
+            if count > self.max_entries:
+                logger.debug(f"Evicting {count - self.max_entries} embeddings from the cache")
+                self._connection.execute(
+                    f"DELETE FROM {self.table_name} WHERE key IN "
+                    f"(SELECT key FROM {self.table_name} ORDER BY last_used ASC LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+    def warm_up(self) -> None:
+        self.embedder.warm_up()  # type: ignore
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        key = self.cache_key(text)
+        cached = self.get_cached([text])
+        if key in cached:
+            self.hits += 1
+            return cached[key], None
+
+        self.misses += 1
+        embedding, usage = self.embedder.get_embedding_and_usage(text)  # type: ignore
+        if embedding:
+            self.set_cached({key: embedding})
+        return embedding, usage
+
+    async def aget_embedding(self, text: str) -> List[float]:
+        return (await self.aget_embedding_and_usage(text))[0]
+
+    async def aget_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        # The cache is a local SQLite lookup, only a miss waits on the wrapped embedder
+        key = self.cache_key(text)
+        cached = self.get_cached([text])
+        if key in cached:
+            self.hits += 1
+            return cached[key], None
+
+        self.misses += 1
+        embedding, usage = await self.embedder.aget_embedding_and_usage(text)  # type: ignore
+        if embedding:
+            self.set_cached({key: embedding})
+        return embedding, usage
+
+    def get_embeddings_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        """Embed texts, sending only the cache misses to the wrapped embedder"""
+        keys = [self.cache_key(text) for text in texts]
+        cached = self.get_cached(texts)
+
+        # Embed each missing text once, even when it appears several times in the input
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+        self.hits += len(texts) - sum(1 for key in keys if key not in cached)
+        self.misses += sum(1 for key in keys if key not in cached)
+
+        usage: Optional[Dict[str, Any]] = None
+        if len(missing) > 0:
+            embeddings, usage = self.embedder.get_embeddings_batch(list(missing.values()))  # type: ignore
+            new_embeddings = {key: embedding for key, embedding in zip(missing.keys(), embeddings) if embedding}
+            self.set_cached(new_embeddings)
+            cached.update(new_embeddings)
+
+        return [cached.get(key, []) for key in keys], usage
+
+    def cache_info(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the number of cached embeddings"""
+        with self._lock:
+            size = self._connection.execute(f"SELECT COUNT(*) FROM {self.table_name}").fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total > 0 else 0.0,
+            "size": size,
+            "max_entries": self.max_entries,
+        }
+
+    def clear(self) -> None:
+        """Remove every cached embedding and reset the counters"""
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table_name}")
+        self.hits = 0
+        self.misses = 0
+
+    def __deepcopy__(self, memo):
+        # The cache is shared by design, so copies of an agent or vector db keep using the same store
+        memo[id(self)] = self
+        return self
@@ -30,7 +30,9 @@ class CohereEmbedder(Embedder):
             client_params["api_key"] = self.api_key
         return CohereClient(**client_params)
 
-    def response(self, text: str) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
+    def response(
+        self, text: Union[str, List[str]]
+    ) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
         request_params: Dict[str, Any] = {}
 
         if self.id:
@@ -41,7 +43,8 @@ class CohereEmbedder(Embedder):
             request_params["embedding_types"] = self.embedding_types
         if self.request_params:
             request_params.update(self.request_params)
-        return self.client.embed(texts=[text], **request_params)
+        texts = text if isinstance(text, list) else [text]
+        return self.client.embed(texts=texts, **request_params)
 
     def get_embedding(self, text: str) -> List[float]:
         response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.response(text=text)
@@ -70,3 +73,17 @@ class CohereEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    def _embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict[str, Any]]]:
+        response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.response(text=texts)
+
+        embeddings: List[List[float]] = []
+        if isinstance(response, EmbeddingsFloatsEmbedResponse):
+            embeddings = response.embeddings
+        elif isinstance(response, EmbeddingsByTypeEmbedResponse):
+            embeddings = response.embeddings.float_ or []
+
+        usage = response.meta.billed_units if response.meta else None
+        if usage:
+            return embeddings, usage.model_dump()
+        return embeddings, None
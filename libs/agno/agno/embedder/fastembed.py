@@ -1,7 +1,8 @@
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Hashable, List, Optional, Tuple
 
 from agno.embedder.base import Embedder
+from agno.embedder.registry import get_model, get_model_lock
 from agno.utils.log import logger
 
 try:
@@ -17,14 +18,29 @@ class FastEmbedEmbedder(Embedder):
 
     id: str = "BAAI/bge-small-en-v1.5"
     dimensions: int = 384
+    # Number of threads used by the onnxruntime session. Uses the onnxruntime default when None
+    threads: Optional[int] = None
 
-    def get_embedding(self, text: str) -> List[float]:
-        model = TextEmbedding(model_name=self.id)
-        embeddings = model.embed(text)
-        embedding_list = list(embeddings)
+    @property
+    def _model_key(self) -> Hashable:
+        return ("fastembed", self.id, self.threads)
+
+    @property
+    def model(self) -> TextEmbedding:
+        """The model is loaded once per process and shared by every embedder using the same id and threads"""
+        return get_model(self._model_key, lambda: TextEmbedding(model_name=self.id, threads=self.threads))
+
+    def warm_up(self) -> None:
+        _ = self.model
 
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        model = self.model
+        with get_model_lock(self._model_key):
+            return [embedding.tolist() for embedding in model.embed(texts, batch_size=self.batch_size)]
+
+    def get_embedding(self, text: str) -> List[float]:
         try:
-            return embedding_list
+            return self._embed([text])[0]
         except Exception as e:
             logger.warning(e)
             return []
@@ -35,3 +51,6 @@ class FastEmbedEmbedder(Embedder):
         usage = None
 
         return embedding, usage
+
+    def _embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        return self._embed(texts), None
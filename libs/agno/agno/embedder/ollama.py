@@ -55,3 +55,16 @@ class OllamaEmbedder(Embedder):
         embedding = self.get_embedding(text=text)
         usage = None
         return embedding, usage
+
+    def _embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        kwargs: Dict[str, Any] = {}
+        if self.options is not None:
+            kwargs["options"] = self.options
+
+        # The `embed` endpoint accepts a list of inputs, unlike the legacy `embeddings` endpoint
+        response = self.client.embed(input=texts, model=self.id, **kwargs)  # type: ignore
+        embeddings = [list(embedding) for embedding in response.get("embeddings", [])]
+        usage = None
+        if response.get("prompt_eval_count") is not None:
+            usage = {"prompt_tokens": response.get("prompt_eval_count")}
+        return embeddings, usage
@@ -1,5 +1,7 @@
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Literal
 
@@ -7,6 +9,7 @@ from agno.embedder.base import Embedder
 from agno.utils.log import logger
 
 try:
+    from openai import AsyncOpenAI as AsyncOpenAIClient
     from openai import OpenAI as OpenAIClient
     from openai.types.create_embedding_response import CreateEmbeddingResponse
 except ImportError:
@@ -25,12 +28,12 @@ class OpenAIEmbedder(Embedder):
     request_params: Optional[Dict[str, Any]] = None
     client_params: Optional[Dict[str, Any]] = None
     openai_client: Optional[OpenAIClient] = None
+    async_openai_client: Optional[AsyncOpenAIClient] = None
 
-    @property
-    def client(self) -> OpenAIClient:
-        if self.openai_client:
-            return self.openai_client
+    # Async client created by the embedder, with a weak reference to the event loop its connection pool is bound to
+    _async_client: Optional[Tuple[Any, AsyncOpenAIClient]] = field(default=None, init=False, repr=False, compare=False)
 
+    def _get_client_params(self) -> Dict[str, Any]:
         _client_params: Dict[str, Any] = {}
         if self.api_key:
             _client_params["api_key"] = self.api_key
@@ -40,9 +43,28 @@ class OpenAIEmbedder(Embedder):
             _client_params["base_url"] = self.base_url
         if self.client_params:
             _client_params.update(self.client_params)
-        return OpenAIClient(**_client_params)
+        return _client_params
+
+    @property
+    def client(self) -> OpenAIClient:
+        if self.openai_client:
+            return self.openai_client
+        return OpenAIClient(**self._get_client_params())
+
+    @property
+    def async_client(self) -> AsyncOpenAIClient:
+        if self.async_openai_client:
+            return self.async_openai_client
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return AsyncOpenAIClient(**self._get_client_params())
+        # Reuse the client, and its connection pool, while requests run in the same event loop
+        if self._async_client is None or self._async_client[0]() is not loop:
+            self._async_client = (weakref.ref(loop), AsyncOpenAIClient(**self._get_client_params()))
+        return self._async_client[1]
 
-    def response(self, text: str) -> CreateEmbeddingResponse:
+    def _get_request_params(self, text: Union[str, List[str]]) -> Dict[str, Any]:
         _request_params: Dict[str, Any] = {
             "input": text,
             "model": self.id,
@@ -54,7 +76,13 @@ class OpenAIEmbedder(Embedder):
             _request_params["dimensions"] = self.dimensions
         if self.request_params:
             _request_params.update(self.request_params)
-        return self.client.embeddings.create(**_request_params)
+        return _request_params
+
+    def response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
+        return self.client.embeddings.create(**self._get_request_params(text))
+
+    async def aresponse(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
+        return await self.async_client.embeddings.create(**self._get_request_params(text))
 
     def get_embedding(self, text: str) -> List[float]:
         response: CreateEmbeddingResponse = self.response(text=text)
@@ -72,3 +100,30 @@ class OpenAIEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    async def aget_embedding(self, text: str) -> List[float]:
+        response: CreateEmbeddingResponse = await self.aresponse(text=text)
+        try:
+            return response.data[0].embedding
+        except Exception as e:
+            logger.warning(e)
+            return []
+
+    async def aget_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        response: CreateEmbeddingResponse = await self.aresponse(text=text)
+
+        embedding = response.data[0].embedding
+        usage = response.usage
+        if usage:
+            return embedding, usage.model_dump()
+        return embedding, None
+
+    def _embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        response: CreateEmbeddingResponse = self.response(text=texts)
+
+        # The API does not guarantee ordering, so sort the embeddings by their input index
+        embeddings = [data.embedding for data in sorted(response.data, key=lambda d: d.index)]
+        usage = response.usage
+        if usage:
+            return embeddings, usage.model_dump()
+        return embeddings, None
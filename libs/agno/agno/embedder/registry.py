@@ -0,0 +1,43 @@
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, TypeVar
+
+from agno.utils.log import logger
+
+T = TypeVar("T")
+
+# Models loaded in this process, shared by every embedder instance (including deep copies)
+_models: Dict[Hashable, Any] = {}
+# One lock per model, so concurrent callers do not run inference on the same model at the same time
+_model_locks: Dict[Hashable, Lock] = {}
+_registry_lock = Lock()
+
+
+def get_model(key: Hashable, loader: Callable[[], T]) -> T:
+    """Return the model registered under `key`, loading it with `loader` the first time it is requested"""
+    model = _models.get(key)
+    if model is not None:
+        return model
+
+    with _registry_lock:
+        model = _models.get(key)
+        if model is None:
+            logger.debug(f"Loading embedding model: {key}")
+            model = loader()
+            _models[key] = model
+            _model_locks[key] = Lock()
+    return model
+
+
+def get_model_lock(key: Hashable) -> Lock:
+    """Return the lock guarding the model registered under `key`"""
+    with _registry_lock:
+        if key not in _model_locks:
+            _model_locks[key] = Lock()
+        return _model_locks[key]
+
+
+def clear_models() -> None:
+    """Unload every registered model"""
+    with _registry_lock:
+        _models.clear()
+        _model_locks.clear()
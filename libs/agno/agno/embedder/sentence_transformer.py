@@ -1,8 +1,9 @@
 import platform
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Hashable, List, Optional, Tuple, Union
 
 from agno.embedder.base import Embedder
+from agno.embedder.registry import get_model, get_model_lock
 from agno.utils.log import logger
 
 try:
@@ -23,16 +24,40 @@ except ImportError:
 @dataclass
 class SentenceTransformerEmbedder(Embedder):
     id: str = "sentence-transformers/all-MiniLM-L6-v2"
+    # Device to run the model on, e.g. "cpu", "cuda" or "mps". Picked automatically when None
+    device: Optional[str] = None
     sentence_transformer_client: Optional[SentenceTransformer] = None
 
+    @property
+    def _model_key(self) -> Hashable:
+        if self.sentence_transformer_client is not None:
+            return ("sentence_transformers", id(self.sentence_transformer_client))
+        return ("sentence_transformers", self.id, self.device)
+
+    @property
+    def model(self) -> SentenceTransformer:
+        """The model is loaded once per process and shared by every embedder using the same id and device"""
+        if self.sentence_transformer_client is not None:
+            return self.sentence_transformer_client
+        return get_model(self._model_key, lambda: SentenceTransformer(model_name_or_path=self.id, device=self.device))
+
+    def warm_up(self) -> None:
+        _ = self.model
+
+    def _encode(self, texts: Union[str, List[str]]):
+        model = self.model
+        with get_model_lock(self._model_key):
+            return model.encode(texts, batch_size=self.batch_size)
+
     def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
-        model = SentenceTransformer(model_name_or_path=self.id)
-        embedding = model.encode(text)
         try:
-            return embedding  # type: ignore
+            return self._encode(text).tolist()
         except Exception as e:
             logger.warning(e)
             return []
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return self.get_embedding(text=text), None
+
+    def _embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        return [embedding.tolist() for embedding in self._encode(texts)], None
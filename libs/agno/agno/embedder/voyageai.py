@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from agno.embedder.base import Embedder
 from agno.utils.log import logger
@@ -39,9 +39,9 @@ class VoyageAIEmbedder(Embedder):
             _client_params.update(self.client_params)
         return Client(**_client_params)
 
-    def _response(self, text: str) -> EmbeddingsObject:
+    def _response(self, text: Union[str, List[str]]) -> EmbeddingsObject:
         _request_params: Dict[str, Any] = {
-            "texts": [text],
+            "texts": text if isinstance(text, list) else [text],
             "model": self.id,
         }
         if self.request_params:
@@ -62,3 +62,7 @@ class VoyageAIEmbedder(Embedder):
         embedding = response.embeddings[0]
         usage = {"total_tokens": response.total_tokens}
         return embedding, usage
+
+    def _embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        response: EmbeddingsObject = self._response(text=texts)
+        return response.embeddings, {"total_tokens": response.total_tokens}
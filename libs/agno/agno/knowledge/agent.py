@@ -1,14 +1,24 @@
-from typing import Any, Dict, Iterator, List, Optional
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Union
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 from agno.document import Document
 from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.chunking.parallel import ParallelChunker
+from agno.document.chunking.semantic import SemanticChunking
 from agno.document.chunking.strategy import ChunkingStrategy
 from agno.document.reader.base import Reader
+from agno.knowledge.cache import KnowledgeSearchCache
+from agno.knowledge.manifest import KnowledgeManifest
+from agno.knowledge.pipeline import DocumentSource, IngestionPipeline, read_document_batches
 from agno.utils.log import logger
 from agno.vectordb import VectorDb
 
+# Maximum number of content hashes remembered by a knowledge base, the hashes are looked up again once it is reached
+_MAX_KNOWN_HASHES = 100_000
+
 
 class AgentKnowledge(BaseModel):
     """Base class for Agent knowledge"""
@@ -23,11 +33,38 @@ class AgentKnowledge(BaseModel):
     optimize_on: Optional[int] = 1000
 
     chunking_strategy: ChunkingStrategy = Field(default_factory=FixedSizeChunking)
+    # Number of processes chunking the documents read from a source, None to chunk in the reading process
+    chunking_workers: Optional[int] = None
+    # Pipeline used by load(parallel=True), a pipeline with default settings is used if None
+    ingestion_pipeline: Optional[IngestionPipeline] = None
+    # File recording the fingerprint of each source file, used by load(sync=True) to only load the files that changed
+    manifest_file: Optional[Union[str, Path]] = None
+    # Cache of search results, invalidated when the vector db is written to
+    search_cache: Optional[KnowledgeSearchCache] = None
+
+    # Content hashes known to exist in the vector db, so documents loaded again are skipped without a query
+    _known_hashes: Set[str] = PrivateAttr(default_factory=set)
+    # Generation of the vector db the known hashes are valid for
+    _known_generation: Optional[int] = PrivateAttr(default=None)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     @model_validator(mode="after")
     def update_reader(self) -> "AgentKnowledge":
+        # Semantic chunks embedded with the embedder of the vector db are not embedded again when they are written
+        strategy = self.chunking_strategy
+        if isinstance(strategy, ParallelChunker):
+            strategy = strategy.strategy
+        if isinstance(strategy, SemanticChunking) and strategy.embed_sentences:
+            vector_db_embedder = getattr(self.vector_db, "embedder", None)
+            if strategy.embedder is None:
+                strategy.embedder = vector_db_embedder
+            elif strategy.embedder is not vector_db_embedder and strategy.pool_embeddings:
+                # Vectors of another model would be stored as they are, the vector db embeds the chunks instead
+                logger.debug("Not pooling semantic chunk embeddings, the chunking embedder is not the vector db's")
+                strategy.pool_embeddings = False
+        if self.chunking_workers is not None and not isinstance(self.chunking_strategy, ParallelChunker):
+            self.chunking_strategy = ParallelChunker(self.chunking_strategy, max_workers=self.chunking_workers)
         if self.reader is not None:
             self.reader.chunking_strategy = self.chunking_strategy
         return self
@@ -35,8 +72,32 @@ class AgentKnowledge(BaseModel):
     @property
     def document_lists(self) -> Iterator[List[Document]]:
         """Iterator that yields lists of documents in the knowledge base
-        Each object yielded by the iterator is a list of documents.
+        Each object yielded by the iterator is a list of documents, large sources are yielded in several lists.
         """
+        for read_documents in self.document_sources:
+            yield from read_document_batches(read_documents)
+
+    @property
+    def document_sources(self) -> Iterator[DocumentSource]:
+        """Iterator that yields a function for each source of the knowledge base, e.g. a file or a url
+        Each function reads and returns a list of documents, or yields batches of documents for large sources,
+        so sources can be read in parallel.
+        Knowledge bases that only implement `document_lists` read each list when it is yielded.
+        """
+        if type(self).document_lists is not AgentKnowledge.document_lists:
+            for document_list in self.document_lists:
+                yield partial(list, document_list)
+        else:
+            for file in self.source_files:
+                yield self.file_source(file)
+
+    @property
+    def source_files(self) -> Iterator[Path]:
+        """Iterator that yields the local files of the knowledge base, for knowledge bases read from files"""
+        raise NotImplementedError
+
+    def file_source(self, file: Path) -> DocumentSource:
+        """Returns a function reading the documents of one of the `source_files`, as a list or in batches"""
         raise NotImplementedError
 
     def search(
@@ -49,18 +110,175 @@ class AgentKnowledge(BaseModel):
                 return []
 
             _num_documents = num_documents or self.num_documents
+            if self.search_cache is not None:
+                key = self.search_cache.cache_key(self.vector_db, query, _num_documents, filters)
+                generation = self.search_cache.generation(self.vector_db)
+                cached = self.search_cache.get(key, generation)
+                if cached is not None:
+                    logger.debug(f"Using cached search results for query: {query}")
+                    return cached
+
+            logger.debug(f"Getting {_num_documents} relevant documents for query: {query}")
+            documents = self.vector_db.search(query=query, limit=_num_documents, filters=filters)
+            if self.search_cache is not None:
+                self.search_cache.set(self.vector_db, key, generation, documents)
+            return documents
+        except Exception as e:
+            logger.error(f"Error searching for documents: {e}")
+            return []
+
+    def search_many(
+        self,
+        queries: List[str],
+        num_documents: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        deduplicate: bool = True,
+    ) -> List[List[Document]]:
+        """Returns relevant documents for each query, embedding and searching the queries together when the
+        vector db supports it.
+
+        Args:
+            queries (List[str]): Queries to search for.
+            num_documents (Optional[int]): Number of documents to return for each query.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            deduplicate (bool): If True, a document is only returned for the first query that found it.
+
+        Returns:
+            List[List[Document]]: The documents of each query, in the order of the queries.
+        """
+        try:
+            if self.vector_db is None:
+                # Knowledge bases that search without a vector db search one query at a time
+                results = [self.search(query=query, num_documents=num_documents, filters=filters) for query in queries]
+            else:
+                _num_documents = num_documents or self.num_documents
+                results = self._search_many_cached(queries, _num_documents, filters)
+        except Exception as e:
+            logger.error(f"Error searching for documents: {e}")
+            return [[] for _ in queries]
+
+        if not deduplicate:
+            return results
+
+        seen: Set[str] = set()
+        unique_results: List[List[Document]] = []
+        for documents in results:
+            unique_documents: List[Document] = []
+            for document in documents:
+                key = self.vector_db.content_hash(document) if self.vector_db is not None else document.content
+                if key not in seen:
+                    seen.add(key)
+                    unique_documents.append(document)
+            unique_results.append(unique_documents)
+        return unique_results
+
+    def _search_many_cached(
+        self, queries: List[str], num_documents: int, filters: Optional[Dict[str, Any]]
+    ) -> List[List[Document]]:
+        """Search the queries missing from the search cache together, and cache their results"""
+        if self.vector_db is None:
+            return [[] for _ in queries]
+        if self.search_cache is None:
+            logger.debug(f"Getting {num_documents} relevant documents for {len(queries)} queries")
+            return self.vector_db.search_many(queries=queries, limit=num_documents, filters=filters)
+
+        keys = [self.search_cache.cache_key(self.vector_db, query, num_documents, filters) for query in queries]
+        generation = self.search_cache.generation(self.vector_db)
+        results: List[Optional[List[Document]]] = [self.search_cache.get(key, generation) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if len(missing) > 0:
+            logger.debug(f"Getting {num_documents} relevant documents for {len(missing)} queries")
+            found = self.vector_db.search_many(
+                queries=[queries[i] for i in missing], limit=num_documents, filters=filters
+            )
+            for i, documents in zip(missing, found):
+                self.search_cache.set(self.vector_db, keys[i], generation, documents)
+                results[i] = documents
+        return [result or [] for result in results]
+
+    async def asearch(
+        self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Returns relevant documents matching a query without blocking the event loop"""
+        try:
+            if self.vector_db is None:
+                logger.warning("No vector db provided")
+                return []
+
+            _num_documents = num_documents or self.num_documents
+            if self.search_cache is not None:
+                key = self.search_cache.cache_key(self.vector_db, query, _num_documents, filters)
+                generation = self.search_cache.generation(self.vector_db)
+                cached = self.search_cache.get(key, generation)
+                if cached is not None:
+                    logger.debug(f"Using cached search results for query: {query}")
+                    return cached
+
             logger.debug(f"Getting {_num_documents} relevant documents for query: {query}")
-            return self.vector_db.search(query=query, limit=_num_documents, filters=filters)
+            documents = await self.vector_db.asearch(query=query, limit=_num_documents, filters=filters)
+            if self.search_cache is not None:
+                self.search_cache.set(self.vector_db, key, generation, documents)
+            return documents
         except Exception as e:
             logger.error(f"Error searching for documents: {e}")
             return []
 
+    def filter_existing_documents(self, documents: List[Document]) -> List[Document]:
+        """Returns the documents that do not exist in the vector db, without duplicates.
+
+        Existence is checked with a single `existing_hashes` query per call. Vector dbs that do not support
+        bulk lookups fall back to `doc_exists` for each document.
+        """
+        if self.vector_db is None or len(documents) == 0:
+            return documents
+
+        self._check_known_hashes()
+        # Use a dict to drop duplicate contents while keeping the order of the documents
+        documents_by_hash: Dict[str, Document] = {}
+        for document in documents:
+            content_hash = self.vector_db.content_hash(document)
+            if content_hash not in documents_by_hash and content_hash not in self._known_hashes:
+                documents_by_hash[content_hash] = document
+        if len(documents_by_hash) == 0:
+            return []
+
+        try:
+            existing_hashes = self.vector_db.existing_hashes(list(documents_by_hash.keys()))
+        except NotImplementedError:
+            existing_hashes = {
+                content_hash
+                for content_hash, document in documents_by_hash.items()
+                if self.vector_db.doc_exists(document)
+            }
+        self._add_known_hashes(existing_hashes)
+        return [document for content_hash, document in documents_by_hash.items() if content_hash not in existing_hashes]
+
+    def add_known_documents(self, documents: List[Document]) -> None:
+        """Record documents written to the vector db, so they are skipped without a query when loaded again"""
+        if self.vector_db is not None:
+            self._add_known_hashes(self.vector_db.content_hash(document) for document in documents)
+            # The hashes stay valid after this write, only later writes to the vector db make them stale
+            self._known_generation = self.vector_db.generation
+
+    def _check_known_hashes(self) -> None:
+        """Forget the known hashes if the vector db was written to since they were recorded, e.g. deleted from"""
+        if self.vector_db is not None and self._known_generation != self.vector_db.generation:
+            self._known_hashes.clear()
+            self._known_generation = self.vector_db.generation
+
+    def _add_known_hashes(self, content_hashes: Iterable[str]) -> None:
+        self._known_hashes.update(content_hashes)
+        if len(self._known_hashes) > _MAX_KNOWN_HASHES:
+            self._known_hashes.clear()
+
     def load(
         self,
         recreate: bool = False,
         upsert: bool = False,
         skip_existing: bool = True,
         filters: Optional[Dict[str, Any]] = None,
+        parallel: bool = False,
+        sync: bool = False,
     ) -> None:
         """Load the knowledge base to the vector db
 
@@ -69,6 +287,9 @@ class AgentKnowledge(BaseModel):
             upsert (bool): If True, upserts documents to the vector db. Defaults to False.
             skip_existing (bool): If True, skips documents which already exist in the vector db when inserting. Defaults to True.
             filters (Optional[Dict[str, Any]]): Filters to add to each row that can be used to limit results during querying. Defaults to None.
+            parallel (bool): If True, reads, embeds and writes documents at the same time using the ingestion pipeline. Defaults to False.
+            sync (bool): If True, only loads the files that are new or changed since the last sync, and deletes the documents of removed files.
+                Requires a `manifest_file` and a knowledge base read from files. Defaults to False.
         """
 
         if self.vector_db is None:
@@ -78,31 +299,130 @@ class AgentKnowledge(BaseModel):
         if recreate:
             logger.info("Dropping collection")
             self.vector_db.drop()
+            self._known_hashes.clear()
 
         logger.info("Creating collection")
         self.vector_db.create()
 
         logger.info("Loading knowledge base")
-        num_documents = 0
-        for document_list in self.document_lists:
-            documents_to_load = document_list
-            # Upsert documents if upsert is True and vector db supports upsert
-            if upsert and self.vector_db.upsert_available():
-                self.vector_db.upsert(documents=documents_to_load, filters=filters)
-            # Insert documents
+        try:
+            if sync:
+                self._sync_files(
+                    recreate=recreate, upsert=upsert, skip_existing=skip_existing, filters=filters, parallel=parallel
+                )
+            elif parallel:
+                pipeline = self.ingestion_pipeline or IngestionPipeline()
+                pipeline.run(self, self.document_sources, upsert=upsert, skip_existing=skip_existing, filters=filters)
             else:
-                # Filter out documents which already exist in the vector db
-                if skip_existing:
-                    # Use set for O(1) lookups
-                    seen_content = set()
-                    documents_to_load = []
-                    for doc in document_list:
-                        if doc.content not in seen_content and not self.vector_db.doc_exists(doc):
-                            seen_content.add(doc.content)
-                            documents_to_load.append(doc)
-                self.vector_db.insert(documents=documents_to_load, filters=filters)
-            num_documents += len(documents_to_load)
-            logger.info(f"Added {len(documents_to_load)} documents to knowledge base")
+                for document_list in self.document_lists:
+                    self._load_document_list(document_list, upsert=upsert, skip_existing=skip_existing, filters=filters)
+        finally:
+            self.sync_search_cache()
+
+    def sync_search_cache(self) -> None:
+        """Invalidate the search results cached by other processes after writing to the vector db"""
+        if self.search_cache is not None and self.vector_db is not None:
+            self.search_cache.sync(self.vector_db)
+
+    def _load_document_list(
+        self,
+        document_list: List[Document],
+        upsert: bool = False,
+        skip_existing: bool = True,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Write a list of documents to the vector db, returns the number of documents written"""
+        if self.vector_db is None:
+            return 0
+
+        documents_to_load = document_list
+        # Upsert documents if upsert is True and vector db supports upsert
+        if upsert and self.vector_db.upsert_available():
+            self.vector_db.upsert(documents=documents_to_load, filters=filters)
+        # Insert documents
+        else:
+            # Filter out documents which already exist in the vector db
+            if skip_existing:
+                documents_to_load = self.filter_existing_documents(document_list)
+            self.vector_db.insert(documents=documents_to_load, filters=filters)
+        self.add_known_documents(documents_to_load)
+        logger.info(f"Added {len(documents_to_load)} documents to knowledge base")
+        return len(documents_to_load)
+
+    def _sync_files(
+        self,
+        recreate: bool = False,
+        upsert: bool = False,
+        skip_existing: bool = True,
+        filters: Optional[Dict[str, Any]] = None,
+        parallel: bool = False,
+    ) -> None:
+        """Load the source files that changed since the last sync and delete the documents of removed files"""
+        if self.vector_db is None:
+            return
+        if self.manifest_file is None:
+            raise ValueError("load(sync=True) requires a manifest_file")
+
+        manifest = KnowledgeManifest.load(self.manifest_file)
+        if recreate:
+            manifest.files.clear()
+
+        files = {KnowledgeManifest.key(file): file for file in self.source_files}
+        changed_files = {key: file for key, file in files.items() if not manifest.is_unchanged(file)}
+        removed_keys = [key for key in manifest.files if key not in files]
+        logger.info(
+            f"Syncing knowledge base: {len(changed_files)} new or modified files, {len(removed_keys)} removed files, "
+            f"{len(files) - len(changed_files)} unchanged files"
+        )
+
+        # Documents of removed and modified files, deleted unless they are still produced by a file
+        stale_hashes: Set[str] = set()
+        for key in list(changed_files.keys()) + removed_keys:
+            entry = manifest.remove(key)
+            if entry is not None:
+                stale_hashes.update(entry.content_hashes)
+
+        fingerprints = {key: KnowledgeManifest.fingerprint(file) for key, file in changed_files.items()}
+        sources = {key: self.file_source(file) for key, file in changed_files.items()}
+        if parallel:
+            keys_by_source = {id(source): key for key, source in sources.items()}
+
+            def record_hashes(source: DocumentSource, documents: List[Document]) -> None:
+                fingerprints[keys_by_source[id(source)]].content_hashes.extend(
+                    self.vector_db.content_hash(document)  # type: ignore
+                    for document in documents
+                )
+
+            pipeline = self.ingestion_pipeline or IngestionPipeline()
+            pipeline.run(
+                self,
+                sources.values(),
+                upsert=upsert,
+                skip_existing=skip_existing,
+                filters=filters,
+                on_read=record_hashes,
+            )
+        else:
+            for key, source in sources.items():
+                for document_list in read_document_batches(source):
+                    fingerprints[key].content_hashes.extend(
+                        self.vector_db.content_hash(document) for document in document_list
+                    )
+                    self._load_document_list(document_list, upsert=upsert, skip_existing=skip_existing, filters=filters)
+        manifest.files.update(fingerprints)
+
+        stale_hashes -= manifest.referenced_hashes()
+        if len(stale_hashes) > 0:
+            try:
+                self.vector_db.delete_hashes(list(stale_hashes))
+                logger.info(f"Deleted {len(stale_hashes)} documents of removed or modified files")
+            except NotImplementedError:
+                logger.warning(
+                    f"{self.vector_db.__class__.__name__} does not support deleting documents, "
+                    f"{len(stale_hashes)} documents of removed or modified files are kept"
+                )
+            self._known_hashes.difference_update(stale_hashes)
+        manifest.save()
 
     def load_documents(
         self,
@@ -131,19 +451,19 @@ class AgentKnowledge(BaseModel):
         # Upsert documents if upsert is True
         if upsert and self.vector_db.upsert_available():
             self.vector_db.upsert(documents=documents, filters=filters)
+            self.add_known_documents(documents)
+            self.sync_search_cache()
             logger.info(f"Loaded {len(documents)} documents to knowledge base")
             return
 
         # Filter out documents which already exist in the vector db
-        documents_to_load = (
-            [document for document in documents if not self.vector_db.doc_exists(document)]
-            if skip_existing
-            else documents
-        )
+        documents_to_load = self.filter_existing_documents(documents) if skip_existing else documents
 
         # Insert documents
         if len(documents_to_load) > 0:
             self.vector_db.insert(documents=documents_to_load, filters=filters)
+            self.add_known_documents(documents_to_load)
+            self.sync_search_cache()
             logger.info(f"Loaded {len(documents_to_load)} documents to knowledge base")
         else:
             logger.info("No new documents to load")
@@ -227,4 +547,8 @@ class AgentKnowledge(BaseModel):
             logger.warning("No vector db available")
             return True
 
-        return self.vector_db.delete()
+        self._known_hashes.clear()
+        try:
+            return self.vector_db.delete()
+        finally:
+            self.sync_search_cache()
@@ -0,0 +1,197 @@
+import json
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from hashlib import md5
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from agno.document import Document
+from agno.utils.log import logger
+from agno.vectordb.base import VectorDb
+
+# Attributes identifying the collection searched by a vector db, used to build its default namespace
+_NAMESPACE_ATTRIBUTES = ("schema", "table_name", "collection", "index_name", "path", "uri")
+
+
+@dataclass
+class KnowledgeSearchCache:
+    """Cache of knowledge base search results, keyed on (query, limit, filters, search type).
+
+    Entries expire after `ttl` seconds and the least recently used are evicted once `max_entries` is exceeded.
+    Every vector db has a generation, bumped when it is written to, and entries of an older generation are
+    never returned. With a `db_file`, entries and generations are kept in a local SQLite store shared by
+    every process using the same file. Writes made through the knowledge base invalidate the entries of other
+    processes immediately, other writes when the writing process next uses the cache.
+
+    Use `db_file=None` for an in-memory cache.
+    """
+
+    db_file: Optional[Union[str, Path]] = None
+    # Seconds a search result is cached for, None to keep results until they are invalidated or evicted
+    ttl: Optional[float] = 300
+    # Maximum number of search results kept in the cache, the least recently used are evicted first
+    max_entries: int = 1_000
+    # Identifies the vector db in the cache, derived from its class and collection if None
+    namespace: Optional[str] = None
+
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    invalidations: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        if self.db_file is not None:
+            db_path = Path(self.db_file).resolve()
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            database = str(db_path)
+        else:
+            database = ":memory:"
+        self._lock = Lock()
+        # Generation of each vector db object in this process when it was last synced with the store
+        self._seen_generations: Dict[Tuple[str, int], int] = {}
+        self._connection = sqlite3.connect(database, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache (key TEXT PRIMARY KEY, namespace TEXT NOT NULL, "
+                "generation INTEGER NOT NULL, documents TEXT NOT NULL, expires_at REAL, last_used REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_search_cache_last_used ON search_cache (last_used)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache_generations "
+                "(namespace TEXT PRIMARY KEY, generation INTEGER NOT NULL)"
+            )
+
+    def get_namespace(self, vector_db: VectorDb) -> str:
+        if self.namespace is not None:
+            return self.namespace
+        parts = [vector_db.__class__.__name__]
+        for attribute in _NAMESPACE_ATTRIBUTES:
+            value = getattr(vector_db, attribute, None)
+            if isinstance(value, (str, Path)):
+                parts.append(f"{attribute}={value}")
+        return ":".join(parts)
+
+    def cache_key(self, vector_db: VectorDb, query: str, limit: int, filters: Optional[Dict[str, Any]] = None) -> str:
+        search_type = getattr(vector_db, "search_type", None)
+        key = json.dumps(
+            [self.get_namespace(vector_db), query, limit, filters, getattr(search_type, "value", search_type)],
+            sort_keys=True,
+            default=str,
+        )
+        return md5(key.encode()).hexdigest()
+
+    def generation(self, vector_db: VectorDb) -> int:
+        """Current generation of the vector db in the store, bumped first if it was written to in this process.
+
+        Read it before searching and pass it to `set`, so results of a search that ran during a write are
+        cached under the generation they were read from.
+        """
+        namespace = self.get_namespace(vector_db)
+        seen_key = (namespace, id(vector_db))
+        with self._lock, self._connection:
+            if self._seen_generations.get(seen_key, 0) != vector_db.generation:
+                logger.debug(f"Invalidating cached search results of {namespace}")
+                self._connection.execute(
+                    "INSERT INTO search_cache_generations (namespace, generation) VALUES (?, 1) "
+                    "ON CONFLICT (namespace) DO UPDATE SET generation = generation + 1",
+                    (namespace,),
+                )
+                self.invalidations += 1
+            self._seen_generations[seen_key] = vector_db.generation
+            row = self._connection.execute(
+                "SELECT generation FROM search_cache_generations WHERE namespace = ?", (namespace,)
+            ).fetchone()
+        return row[0] if row is not None else 0
+
+    def sync(self, vector_db: VectorDb) -> None:
+        """Publish writes made to the vector db by this process, so other processes stop using older results"""
+        self.generation(vector_db)
+
+    def get(self, key: str, generation: int) -> Optional[List[Document]]:
+        """Returns the cached documents of a search key, or None if they are missing, expired or invalidated"""
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT documents FROM search_cache WHERE key = ? AND generation = ? "
+                "AND (expires_at IS NULL OR expires_at > ?)",
+                (key, generation, now),
+            ).fetchone()
+            if row is not None:
+                self._connection.execute("UPDATE search_cache SET last_used = ? WHERE key = ?", (now, key))
+                self.hits += 1
+            else:
+                self.misses += 1
+        if row is None:
+            return None
+        return [Document(**document) for document in json.loads(row[0])]
+
+    def set(self, vector_db: VectorDb, key: str, generation: int, documents: List[Document]) -> None:
+        """Cache the documents of a search key and evict expired, invalidated and least recently used entries.
+
+        Embeddings are not cached, the documents are returned without them.
+        """
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl is not None else None
+        namespace = self.get_namespace(vector_db)
+        serialized = json.dumps(
+            [
+                {
+                    "content": document.content,
+                    "id": document.id,
+                    "name": document.name,
+                    "meta_data": document.meta_data,
+                    "usage": document.usage,
+                    "reranking_score": document.reranking_score,
+                }
+                for document in documents
+            ],
+            default=str,
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO search_cache (key, namespace, generation, documents, expires_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, namespace, generation, serialized, expires_at, now),
+            )
+            self._connection.execute(
+                "DELETE FROM search_cache WHERE expires_at <= ? OR (namespace = ? AND generation < ?)",
+                (now, namespace, generation),
+            )
+            count = self._connection.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+            if count > self.max_entries:
+                logger.debug(f"Evicting {count - self.max_entries} search results from the cache")
+                self._connection.execute(
+                    "DELETE FROM search_cache WHERE key IN "
+                    "(SELECT key FROM search_cache ORDER BY last_used ASC LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+    def cache_info(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the number of cached search results"""
+        with self._lock:
+            size = self._connection.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total > 0 else 0.0,
+            "invalidations": self.invalidations,
+            "size": size,
+            "max_entries": self.max_entries,
+        }
+
+    def clear(self) -> None:
+        """Remove every cached search result and reset the counters"""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM search_cache")
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __deepcopy__(self, memo):
+        # The cache is shared by design, so copies of an agent or knowledge base keep using the same store
+        memo[id(self)] = self
+        return self
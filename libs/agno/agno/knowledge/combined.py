@@ -1,4 +1,4 @@
-from typing import Iterator, List
+from typing import Callable, Iterator, List
 
 from agno.document import Document
 from agno.knowledge.agent import AgentKnowledge
@@ -9,14 +9,14 @@ class CombinedKnowledgeBase(AgentKnowledge):
     sources: List[AgentKnowledge] = []
 
     @property
-    def document_lists(self) -> Iterator[List[Document]]:
-        """Iterate over knowledge bases and yield lists of documents.
-        Each object yielded by the iterator is a list of documents.
+    def document_sources(self) -> Iterator[Callable[[], List[Document]]]:
+        """Iterate over knowledge bases and yield a function reading each list of documents.
+        Each function returns a list of documents.
 
         Returns:
-            Iterator[List[Document]]: Iterator yielding list of documents
+            Iterator[Callable[[], List[Document]]]: Iterator yielding functions that read lists of documents
         """
 
         for kb in self.sources:
             logger.debug(f"Loading documents from {kb.__class__.__name__}")
-            yield from kb.document_lists
+            yield from kb.document_sources
@@ -1,5 +1,6 @@
+from functools import partial
 from pathlib import Path
-from typing import Iterator, List, Union
+from typing import Callable, Iterator, List, Union
 
 from agno.document import Document
 from agno.document.reader.csv_reader import CSVReader
@@ -11,18 +12,20 @@ class CSVKnowledgeBase(AgentKnowledge):
     reader: CSVReader = CSVReader()
 
     @property
-    def document_lists(self) -> Iterator[List[Document]]:
-        """Iterate over CSVs and yield lists of documents.
-        Each object yielded by the iterator is a list of documents.
+    def source_files(self) -> Iterator[Path]:
+        """Iterate over the CSVs of the knowledge base.
 
         Returns:
-            Iterator[List[Document]]: Iterator yielding list of documents
+            Iterator[Path]: Iterator yielding the path of each file
         """
 
         _csv_path: Path = Path(self.path) if isinstance(self.path, str) else self.path
 
         if _csv_path.exists() and _csv_path.is_dir():
-            for _csv in _csv_path.glob("**/*.csv"):
-                yield self.reader.read(file=_csv)
+            yield from _csv_path.glob("**/*.csv")
         elif _csv_path.exists() and _csv_path.is_file() and _csv_path.suffix == ".csv":
-            yield self.reader.read(file=_csv_path)
+            yield _csv_path
+
+    def file_source(self, file: Path) -> Callable[[], List[Document]]:
+        """Returns a function reading the documents of a file"""
+        return partial(self.reader.read, file=file)
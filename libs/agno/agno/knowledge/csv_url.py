@@ -1,4 +1,5 @@
-from typing import Iterator, List
+from functools import partial
+from typing import Callable, Iterator, List
 
 from agno.document import Document
 from agno.document.reader.csv_reader import CSVUrlReader
@@ -11,9 +12,9 @@ class CSVUrlKnowledgeBase(AgentKnowledge):
     reader: CSVUrlReader = CSVUrlReader()
 
     @property
-    def document_lists(self) -> Iterator[List[Document]]:
+    def document_sources(self) -> Iterator[Callable[[], List[Document]]]:
         for url in self.urls:
             if url.endswith(".csv"):
-                yield self.reader.read(url=url)
+                yield partial(self.reader.read, url=url)
             else:
                 logger.error(f"Unsupported URL: {url}")
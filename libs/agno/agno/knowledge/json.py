@@ -1,5 +1,6 @@
+from functools import partial
 from pathlib import Path
-from typing import Iterator, List, Union
+from typing import Callable, Iterator, List, Union
 
 from agno.document import Document
 from agno.document.reader.json_reader import JSONReader
@@ -11,18 +12,20 @@ class JSONKnowledgeBase(AgentKnowledge):
     reader: JSONReader = JSONReader()
 
     @property
-    def document_lists(self) -> Iterator[List[Document]]:
-        """Iterate over Json files and yield lists of documents.
-        Each object yielded by the iterator is a list of documents.
+    def source_files(self) -> Iterator[Path]:
+        """Iterate over the Json files of the knowledge base.
 
         Returns:
-            Iterator[List[Document]]: Iterator yielding list of documents
+            Iterator[Path]: Iterator yielding the path of each file
         """
 
         _json_path: Path = Path(self.path) if isinstance(self.path, str) else self.path
 
         if _json_path.exists() and _json_path.is_dir():
-            for _pdf in _json_path.glob("*.json"):
-                yield self.reader.read(path=_pdf)
+            yield from _json_path.glob("*.json")
         elif _json_path.exists() and _json_path.is_file() and _json_path.suffix == ".json":
-            yield self.reader.read(path=_json_path)
+            yield _json_path
+
+    def file_source(self, file: Path) -> Callable[[], List[Document]]:
+        """Returns a function reading the documents of a file"""
+        return partial(self.reader.read, path=file)
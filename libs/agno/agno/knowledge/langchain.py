@@ -13,13 +13,9 @@ class LangChainKnowledgeBase(AgentKnowledge):
 
     retriever: Optional[Any] = None
 
-    def search(
-        self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
-    ) -> List[Document]:
-        """Returns relevant documents matching the query"""
-
+    def get_retriever(self, filters: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """Returns the retriever, creating it from the vectorstore if needed"""
         try:
-            from langchain_core.documents import Document as LangChainDocument
             from langchain_core.retrievers import BaseRetriever
         except ImportError:
             raise ImportError(
@@ -36,14 +32,38 @@ class LangChainKnowledgeBase(AgentKnowledge):
 
         if self.retriever is None:
             logger.error("No retriever provided")
-            return []
+            return None
 
         if not isinstance(self.retriever, BaseRetriever):
             raise ValueError(f"Retriever is not of type BaseRetriever: {self.retriever}")
+        return self.retriever
+
+    def search(
+        self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Returns relevant documents matching the query"""
+        retriever = self.get_retriever(filters=filters)
+        if retriever is None:
+            return []
+
+        _num_documents = num_documents or self.num_documents
+        logger.debug(f"Getting {_num_documents} relevant documents for query: {query}")
+        return self.convert_documents(retriever.invoke(input=query))
+
+    async def asearch(
+        self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Returns relevant documents matching the query, using the async API of the retriever"""
+        retriever = self.get_retriever(filters=filters)
+        if retriever is None:
+            return []
 
         _num_documents = num_documents or self.num_documents
         logger.debug(f"Getting {_num_documents} relevant documents for query: {query}")
-        lc_documents: List[LangChainDocument] = self.retriever.invoke(input=query)
+        return self.convert_documents(await retriever.ainvoke(input=query))
+
+    @staticmethod
+    def convert_documents(lc_documents: List[Any]) -> List[Document]:
         documents = []
         for lc_doc in lc_documents:
             documents.append(
@@ -60,6 +80,7 @@ class LangChainKnowledgeBase(AgentKnowledge):
         upsert: bool = True,
         skip_existing: bool = True,
         filters: Optional[Dict[str, Any]] = None,
+        parallel: bool = False,
     ) -> None:
         if self.loader is None:
             logger.error("No loader provided for LangChainKnowledgeBase")
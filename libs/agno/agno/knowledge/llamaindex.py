@@ -37,6 +37,32 @@ class LlamaIndexKnowledgeBase(AgentKnowledge):
             raise ValueError(f"Retriever is not of type BaseRetriever: {self.retriever}")
 
         lc_documents: List[NodeWithScore] = self.retriever.retrieve(query)
+        return self.convert_documents(lc_documents, num_documents=num_documents)
+
+    async def asearch(
+        self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """
+        Returns relevant documents matching the query, using the async API of the retriever.
+
+        Args:
+            query (str): The query string to search for.
+            num_documents (Optional[int]): The maximum number of documents to return. Defaults to None.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search. Defaults to None.
+
+        Returns:
+            List[Document]: A list of relevant documents matching the query.
+        Raises:
+            ValueError: If the retriever is not of type BaseRetriever.
+        """
+        if not isinstance(self.retriever, BaseRetriever):
+            raise ValueError(f"Retriever is not of type BaseRetriever: {self.retriever}")
+
+        lc_documents: List[NodeWithScore] = await self.retriever.aretrieve(query)
+        return self.convert_documents(lc_documents, num_documents=num_documents)
+
+    @staticmethod
+    def convert_documents(lc_documents: List[NodeWithScore], num_documents: Optional[int] = None) -> List[Document]:
         if num_documents is not None:
             lc_documents = lc_documents[:num_documents]
         documents = []
@@ -55,6 +81,7 @@ class LlamaIndexKnowledgeBase(AgentKnowledge):
         upsert: bool = True,
         skip_existing: bool = True,
         filters: Optional[Dict[str, Any]] = None,
+        parallel: bool = False,
     ) -> None:
         if self.loader is None:
             logger.error("No loader provided for LlamaIndexKnowledgeBase")
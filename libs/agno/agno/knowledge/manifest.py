@@ -0,0 +1,93 @@
+import json
+from dataclasses import asdict, dataclass, field
+from hashlib import sha256
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Union
+
+from agno.utils.log import logger
+
+
+def file_sha256(path: Path) -> str:
+    """Hash the contents of a file without loading it in memory at once"""
+    file_hash = sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+@dataclass
+class ManifestEntry:
+    """Fingerprint of a file loaded in a knowledge base, with the content hashes of the documents read from it"""
+
+    mtime_ns: int
+    size: int
+    sha256: str
+    content_hashes: List[str] = field(default_factory=list)
+
+
+@dataclass
+class KnowledgeManifest:
+    """Persistent record of the files loaded in a knowledge base, used to sync only the files that changed.
+
+    Entries are keyed by the resolved path of each file and saved as a JSON file.
+    """
+
+    path: Optional[Path] = None
+    files: Dict[str, ManifestEntry] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "KnowledgeManifest":
+        manifest_path = Path(path)
+        manifest = cls(path=manifest_path)
+        if not manifest_path.exists():
+            return manifest
+        try:
+            data = json.loads(manifest_path.read_text())
+            manifest.files = {key: ManifestEntry(**entry) for key, entry in data.get("files", {}).items()}
+        except Exception as e:
+            logger.warning(f"Could not read knowledge manifest {manifest_path}, all files will be loaded: {e}")
+        return manifest
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so an interrupted save does not corrupt the manifest
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps({"files": {key: asdict(entry) for key, entry in self.files.items()}}))
+        tmp_path.replace(self.path)
+
+    @staticmethod
+    def key(file: Path) -> str:
+        return str(file.resolve())
+
+    def is_unchanged(self, file: Path) -> bool:
+        """Returns True if the file is in the manifest with the same contents.
+
+        Files with the same modification time and size are not opened. If only the modification time changed,
+        the contents are hashed and the entry is updated when they are the same.
+        """
+        entry = self.files.get(self.key(file))
+        if entry is None:
+            return False
+        stat = file.stat()
+        if stat.st_mtime_ns == entry.mtime_ns and stat.st_size == entry.size:
+            return True
+        if stat.st_size == entry.size and file_sha256(file) == entry.sha256:
+            entry.mtime_ns = stat.st_mtime_ns
+            return True
+        return False
+
+    @staticmethod
+    def fingerprint(file: Path) -> ManifestEntry:
+        """Fingerprint a file, before it is read so a change made while reading it is picked up by the next sync"""
+        stat = file.stat()
+        return ManifestEntry(mtime_ns=stat.st_mtime_ns, size=stat.st_size, sha256=file_sha256(file))
+
+    def remove(self, key: str) -> Optional[ManifestEntry]:
+        return self.files.pop(key, None)
+
+    def referenced_hashes(self) -> Set[str]:
+        """Content hashes of the documents of every file in the manifest"""
+        return {content_hash for entry in self.files.values() for content_hash in entry.content_hashes}
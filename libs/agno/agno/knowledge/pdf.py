@@ -1,9 +1,10 @@
+from functools import partial
 from pathlib import Path
-from typing import Iterator, List, Union
+from typing import Iterator, Union
 
-from agno.document import Document
 from agno.document.reader.pdf_reader import PDFImageReader, PDFReader
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.pipeline import DocumentSource
 
 
 class PDFKnowledgeBase(AgentKnowledge):
@@ -11,18 +12,20 @@ class PDFKnowledgeBase(AgentKnowledge):
     reader: Union[PDFReader, PDFImageReader] = PDFReader()
 
     @property
-    def document_lists(self) -> Iterator[List[Document]]:
-        """Iterate over PDFs and yield lists of documents.
-        Each object yielded by the iterator is a list of documents.
+    def source_files(self) -> Iterator[Path]:
+        """Iterate over the PDFs of the knowledge base.
 
         Returns:
-            Iterator[List[Document]]: Iterator yielding list of documents
+            Iterator[Path]: Iterator yielding the path of each file
         """
 
         _pdf_path: Path = Path(self.path) if isinstance(self.path, str) else self.path
 
         if _pdf_path.exists() and _pdf_path.is_dir():
-            for _pdf in _pdf_path.glob("**/*.pdf"):
-                yield self.reader.read(pdf=_pdf)
+            yield from _pdf_path.glob("**/*.pdf")
         elif _pdf_path.exists() and _pdf_path.is_file() and _pdf_path.suffix == ".pdf":
-            yield self.reader.read(pdf=_pdf_path)
+            yield _pdf_path
+
+    def file_source(self, file: Path) -> DocumentSource:
+        """Returns a function yielding the documents of a file in batches of pages, so a large PDF is not read whole"""
+        return partial(self.reader.iter_read_batches, file)
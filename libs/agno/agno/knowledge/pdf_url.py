@@ -1,8 +1,9 @@
+from functools import partial
 from typing import Iterator, List, Union
 
-from agno.document import Document
 from agno.document.reader.pdf_reader import PDFUrlImageReader, PDFUrlReader
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.pipeline import DocumentSource
 from agno.utils.log import logger
 
 
@@ -11,16 +12,16 @@ class PDFUrlKnowledgeBase(AgentKnowledge):
     reader: Union[PDFUrlReader, PDFUrlImageReader] = PDFUrlReader()
 
     @property
-    def document_lists(self) -> Iterator[List[Document]]:
-        """Iterate over PDF urls and yield lists of documents.
-        Each object yielded by the iterator is a list of documents.
+    def document_sources(self) -> Iterator[DocumentSource]:
+        """Iterate over PDF urls and yield a function reading the documents of each one.
+        Each function yields the documents of a PDF in batches of pages.
 
         Returns:
-            Iterator[List[Document]]: Iterator yielding list of documents
+            Iterator[DocumentSource]: Iterator yielding functions that read batches of documents
         """
 
         for url in self.urls:
             if url.endswith(".pdf"):
-                yield self.reader.read(url=url)
+                yield partial(self.reader.iter_read_batches, url)
             else:
                 logger.error(f"Unsupported URL: {url}")
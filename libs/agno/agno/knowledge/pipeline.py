@@ -0,0 +1,347 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from queue import Empty, Full, Queue
+from threading import Event, Lock, Thread
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set, Union
+
+from agno.document import Document
+from agno.embedder.base import estimate_tokens
+from agno.utils.log import logger
+
+if TYPE_CHECKING:
+    from agno.knowledge.agent import AgentKnowledge
+
+# Reads the documents of one source, e.g. a file or a url, as one list or as batches of documents for large sources
+DocumentSource = Callable[[], Union[List[Document], Iterable[List[Document]]]]
+
+
+def read_document_batches(source: DocumentSource) -> Iterable[List[Document]]:
+    """Reads a source, returns the batches of documents it yields or its list of documents as a single batch"""
+    documents = source()
+    return [documents] if isinstance(documents, list) else documents
+
+
+def _read_documents(source: DocumentSource) -> List[Document]:
+    """Reads all the documents of a source in a worker process, batches can not be streamed between processes"""
+    return [document for batch in read_document_batches(source) for document in batch]
+
+
+# Put in a queue by each worker of a stage when it is done
+_DONE = object()
+
+
+class _Stopped(Exception):
+    """Raised in the stages of a run when another stage failed"""
+
+
+@dataclass
+class IngestionProgress:
+    """Progress of an ingestion run, updated while the run is going"""
+
+    sources_read: int = 0
+    documents_read: int = 0
+    # Documents that already exist in the vector db, or appear twice in the knowledge base
+    documents_skipped: int = 0
+    documents_embedded: int = 0
+    documents_written: int = 0
+    # Estimated number of tokens embedded
+    tokens_embedded: int = 0
+    # Number of items waiting between stages. A full queue means the stage after it is the bottleneck.
+    read_queue_depth: int = 0
+    embed_queue_depth: int = 0
+    write_queue_depth: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    @property
+    def documents_per_second(self) -> float:
+        return self.documents_written / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        return self.tokens_embedded / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        progress = asdict(self)
+        progress.update(
+            elapsed=self.elapsed,
+            documents_per_second=self.documents_per_second,
+            tokens_per_second=self.tokens_per_second,
+        )
+        return progress
+
+
+@dataclass
+class IngestionPipeline:
+    """Loads a knowledge base with reading, embedding and writing running at the same time.
+
+    Sources are read by a pool of readers, new documents are embedded in batches by a pool of embedders and
+    written to the vector db in batches by a single writer. The stages are connected by bounded queues, so
+    a slow stage makes the stages before it wait instead of holding the whole knowledge base in memory.
+    """
+
+    # Number of sources read at the same time
+    num_readers: int = 4
+    # Read sources in worker processes instead of threads, for CPU bound readers.
+    # The sources and the documents they return must be picklable, and a source read in batches is read whole.
+    use_processes: bool = False
+    # Number of embedding requests sent at the same time
+    num_embedders: int = 4
+    # Number of documents embedded per request, defaults to the batch_size of the embedder
+    embed_batch_size: Optional[int] = None
+    # Number of documents written to the vector db at once
+    write_batch_size: int = 500
+    # Maximum number of items waiting between two stages
+    queue_size: int = 16
+    # Called with the progress after every write to the vector db
+    on_progress: Optional[Callable[[IngestionProgress], None]] = None
+
+    def run(
+        self,
+        knowledge: "AgentKnowledge",
+        sources: Iterable[DocumentSource],
+        upsert: bool = False,
+        skip_existing: bool = True,
+        filters: Optional[Dict[str, Any]] = None,
+        on_read: Optional[Callable[[DocumentSource, List[Document]], None]] = None,
+    ) -> IngestionProgress:
+        """Read, embed and write the documents of the sources to the vector db of the knowledge base
+
+        Args:
+            knowledge (AgentKnowledge): The knowledge base to load.
+            sources (Iterable[DocumentSource]): Functions that each read a list or batches of documents.
+            upsert (bool): If True, upserts documents to the vector db. Defaults to False.
+            skip_existing (bool): If True, skips documents which already exist in the vector db when inserting.
+            filters (Optional[Dict[str, Any]]): Filters to add to each row that can be used to limit results during querying.
+            on_read (Optional[Callable]): Called with each source and each batch of documents read from it.
+
+        Returns:
+            IngestionProgress: The progress of the finished run.
+        """
+        return _IngestionRun(
+            self, knowledge, upsert=upsert, skip_existing=skip_existing, filters=filters, on_read=on_read
+        ).run(sources)
+
+
+class _IngestionRun:
+    """State of a single run of an IngestionPipeline"""
+
+    def __init__(
+        self,
+        pipeline: IngestionPipeline,
+        knowledge: "AgentKnowledge",
+        upsert: bool,
+        skip_existing: bool,
+        filters: Optional[Dict[str, Any]],
+        on_read: Optional[Callable[[DocumentSource, List[Document]], None]] = None,
+    ):
+        if knowledge.vector_db is None:
+            raise ValueError("No vector db provided")
+
+        self.pipeline = pipeline
+        self.knowledge = knowledge
+        self.vector_db = knowledge.vector_db
+        self.upsert = upsert and self.vector_db.upsert_available()
+        self.skip_existing = skip_existing and not self.upsert
+        self.filters = filters
+        self.on_read = on_read
+        self.embedder = getattr(self.vector_db, "embedder", None)
+        self.embed_batch_size = pipeline.embed_batch_size or getattr(self.embedder, "batch_size", None) or 100
+
+        self.source_queue: Queue = Queue(maxsize=pipeline.queue_size)
+        self.read_queue: Queue = Queue(maxsize=pipeline.queue_size)
+        self.embed_queue: Queue = Queue(maxsize=pipeline.queue_size)
+        self.write_queue: Queue = Queue(maxsize=pipeline.queue_size)
+
+        self.progress = IngestionProgress()
+        self.lock = Lock()
+        self.stopped = Event()
+        self.errors: List[BaseException] = []
+        # Hashes of the documents sent to be written in this run
+        self.scheduled_hashes: Set[str] = set()
+        self.executor: Optional[ProcessPoolExecutor] = None
+
+    def run(self, sources: Iterable[DocumentSource]) -> IngestionProgress:
+        if self.pipeline.use_processes:
+            self.executor = ProcessPoolExecutor(max_workers=self.pipeline.num_readers)
+
+        threads = [Thread(target=self.run_stage, args=(self.feed, sources), name="agno-ingest-feed", daemon=True)]
+        threads.extend(
+            Thread(target=self.run_stage, args=(self.read,), name=f"agno-ingest-read-{i}", daemon=True)
+            for i in range(self.pipeline.num_readers)
+        )
+        threads.append(Thread(target=self.run_stage, args=(self.filter,), name="agno-ingest-filter", daemon=True))
+        threads.extend(
+            Thread(target=self.run_stage, args=(self.embed,), name=f"agno-ingest-embed-{i}", daemon=True)
+            for i in range(self.pipeline.num_embedders)
+        )
+        for thread in threads:
+            thread.start()
+
+        try:
+            # Write in the calling thread, the vector db is only used for writes by one thread
+            self.write()
+        except _Stopped:
+            pass
+        except BaseException as e:
+            self.fail(e)
+        finally:
+            for thread in threads:
+                thread.join()
+            if self.executor is not None:
+                self.executor.shutdown()
+            self.progress.finished_at = time.perf_counter()
+
+        if len(self.errors) > 0:
+            raise self.errors[0]
+        logger.info(
+            f"Loaded {self.progress.documents_written} documents to knowledge base in {self.progress.elapsed:.2f}s "
+            f"({self.progress.documents_per_second:.1f} docs/s, {self.progress.tokens_per_second:.1f} tokens/s)"
+        )
+        return self.progress
+
+    def run_stage(self, stage: Callable[..., None], *args: Any) -> None:
+        try:
+            stage(*args)
+        except _Stopped:
+            pass
+        except BaseException as e:
+            self.fail(e)
+
+    def fail(self, error: BaseException) -> None:
+        logger.error(f"Error loading knowledge base: {error}")
+        with self.lock:
+            self.errors.append(error)
+        self.stopped.set()
+
+    def put(self, queue: Queue, item: Any) -> None:
+        """Put an item in a queue, waiting while it is full unless the run is stopped"""
+        while True:
+            try:
+                queue.put(item, timeout=0.1)
+                return
+            except Full:
+                if self.stopped.is_set():
+                    raise _Stopped()
+
+    def get(self, queue: Queue) -> Any:
+        """Get an item from a queue, waiting while it is empty unless the run is stopped"""
+        while True:
+            try:
+                return queue.get(timeout=0.1)
+            except Empty:
+                if self.stopped.is_set():
+                    raise _Stopped()
+
+    def feed(self, sources: Iterable[DocumentSource]) -> None:
+        for source in sources:
+            self.put(self.source_queue, source)
+        for _ in range(self.pipeline.num_readers):
+            self.put(self.source_queue, _DONE)
+
+    def read(self) -> None:
+        while True:
+            source = self.get(self.source_queue)
+            if source is _DONE:
+                self.put(self.read_queue, _DONE)
+                return
+            batches: Iterable[List[Document]]
+            if self.executor is not None:
+                batches = [self.executor.submit(_read_documents, source).result()]
+            else:
+                batches = read_document_batches(source)
+            # Batches are passed on as they are read, a large source is not held in memory
+            for documents in batches:
+                if self.on_read is not None:
+                    self.on_read(source, documents)
+                with self.lock:
+                    self.progress.documents_read += len(documents)
+                self.put(self.read_queue, documents)
+            with self.lock:
+                self.progress.sources_read += 1
+
+    def filter(self) -> None:
+        """Drop existing documents and group the new ones in embedding batches"""
+        batch: List[Document] = []
+        num_done = 0
+        while num_done < self.pipeline.num_readers:
+            documents = self.get(self.read_queue)
+            if documents is _DONE:
+                num_done += 1
+                continue
+
+            documents_to_load = documents
+            if self.skip_existing:
+                # Documents scheduled earlier in the run are not written yet, so a duplicate in a later source is
+                # skipped here. They are only known to the knowledge base once they are written.
+                documents_to_load = []
+                for document in self.knowledge.filter_existing_documents(documents):
+                    content_hash = self.vector_db.content_hash(document)
+                    if content_hash not in self.scheduled_hashes:
+                        self.scheduled_hashes.add(content_hash)
+                        documents_to_load.append(document)
+            with self.lock:
+                self.progress.documents_skipped += len(documents) - len(documents_to_load)
+
+            for document in documents_to_load:
+                batch.append(document)
+                if len(batch) >= self.embed_batch_size:
+                    self.put(self.embed_queue, batch)
+                    batch = []
+        if len(batch) > 0:
+            self.put(self.embed_queue, batch)
+        for _ in range(self.pipeline.num_embedders):
+            self.put(self.embed_queue, _DONE)
+
+    def embed(self) -> None:
+        while True:
+            batch = self.get(self.embed_queue)
+            if batch is _DONE:
+                self.put(self.write_queue, _DONE)
+                return
+            # Without an embedder on the vector db, documents are embedded when they are written
+            if self.embedder is not None:
+                Document.embed_batch(batch, self.embedder)
+                with self.lock:
+                    self.progress.documents_embedded += len(batch)
+                    self.progress.tokens_embedded += sum(estimate_tokens(document.content) for document in batch)
+            self.put(self.write_queue, batch)
+
+    def write(self) -> None:
+        buffer: List[Document] = []
+        num_done = 0
+        while num_done < self.pipeline.num_embedders:
+            batch = self.get(self.write_queue)
+            if batch is _DONE:
+                num_done += 1
+                continue
+            buffer.extend(batch)
+            if len(buffer) >= self.pipeline.write_batch_size:
+                self.write_batch(buffer)
+                buffer = []
+        if len(buffer) > 0:
+            self.write_batch(buffer)
+
+    def write_batch(self, documents: List[Document]) -> None:
+        if self.upsert:
+            self.vector_db.upsert(documents=documents, filters=self.filters)
+        else:
+            self.vector_db.insert(documents=documents, filters=self.filters)
+        self.knowledge.add_known_documents(documents)
+
+        with self.lock:
+            self.progress.documents_written += len(documents)
+            self.progress.read_queue_depth = self.read_queue.qsize()
+            self.progress.embed_queue_depth = self.embed_queue.qsize()
+            self.progress.write_queue_depth = self.write_queue.qsize()
+        logger.debug(
+            f"Added {len(documents)} documents to knowledge base "
+            f"({self.progress.documents_per_second:.1f} docs/s, {self.progress.tokens_per_second:.1f} tokens/s)"
+        )
+        if self.pipeline.on_progress is not None:
+            self.pipeline.on_progress(self.progress)
@@ -1,4 +1,4 @@
-from typing import Iterator, List, Optional
+from typing import Callable, Iterator, List, Optional
 
 from agno.aws.resource.s3.bucket import S3Bucket  # type: ignore
 from agno.aws.resource.s3.object import S3Object  # type: ignore
@@ -20,7 +20,7 @@ class S3KnowledgeBase(AgentKnowledge):
     prefix: Optional[str] = None
 
     @property
-    def document_lists(self) -> Iterator[List[Document]]:
+    def document_sources(self) -> Iterator[Callable[[], List[Document]]]:
         raise NotImplementedError
 
     @property
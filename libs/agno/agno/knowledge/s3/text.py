@@ -1,4 +1,5 @@
-from typing import Iterator, List
+from functools import partial
+from typing import Callable, Iterator, List
 
 from agno.document import Document
 from agno.document.reader.s3.text_reader import S3TextReader
@@ -10,14 +11,14 @@ class S3TextKnowledgeBase(S3KnowledgeBase):
     reader: S3TextReader = S3TextReader()
 
     @property
-    def document_lists(self) -> Iterator[List[Document]]:
-        """Iterate over text files in a s3 bucket and yield lists of documents.
-        Each object yielded by the iterator is a list of documents.
+    def document_sources(self) -> Iterator[Callable[[], List[Document]]]:
+        """Iterate over text files in a s3 bucket and yield a function reading the documents of each one.
+        Each function returns a list of documents.
 
         Returns:
-            Iterator[List[Document]]: Iterator yielding list of documents
+            Iterator[Callable[[], List[Document]]]: Iterator yielding functions that read lists of documents
         """
 
         for s3_object in self.s3_objects:
             if s3_object.name.endswith(tuple(self.formats)):
-                yield self.reader.read(s3_object=s3_object)
+                yield partial(self.reader.read, s3_object=s3_object)
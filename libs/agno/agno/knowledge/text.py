@@ -1,5 +1,6 @@
+from functools import partial
 from pathlib import Path
-from typing import Iterator, List, Union
+from typing import Callable, Iterator, List, Union
 
 from agno.document import Document
 from agno.document.reader.text_reader import TextReader
@@ -12,12 +13,11 @@ class TextKnowledgeBase(AgentKnowledge):
     reader: TextReader = TextReader()
 
     @property
-    def document_lists(self) -> Iterator[List[Document]]:
-        """Iterate over text files and yield lists of documents.
-        Each object yielded by the iterator is a list of documents.
+    def source_files(self) -> Iterator[Path]:
+        """Iterate over the text files of the knowledge base.
 
         Returns:
-            Iterator[List[Document]]: Iterator yielding list of documents
+            Iterator[Path]: Iterator yielding the path of each file
         """
 
         _file_path: Path = Path(self.path) if isinstance(self.path, str) else self.path
@@ -25,6 +25,10 @@ class TextKnowledgeBase(AgentKnowledge):
         if _file_path.exists() and _file_path.is_dir():
             for _file in _file_path.glob("**/*"):
                 if _file.suffix in self.formats:
-                    yield self.reader.read(file=_file)
+                    yield _file
         elif _file_path.exists() and _file_path.is_file() and _file_path.suffix in self.formats:
-            yield self.reader.read(file=_file_path)
+            yield _file_path
+
+    def file_source(self, file: Path) -> Callable[[], List[Document]]:
+        """Returns a function reading the documents of a file"""
+        return partial(self.reader.read, file=file)
@@ -1,10 +1,14 @@
-from typing import Any, Dict, Iterator, List, Optional
+import asyncio
+from dataclasses import replace
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 from pydantic import model_validator
 
 from agno.document import Document
 from agno.document.reader.website_reader import WebsiteReader
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.pipeline import IngestionPipeline
 from agno.utils.log import logger
 
 
@@ -23,16 +27,16 @@ class WebsiteKnowledgeBase(AgentKnowledge):
         return self
 
     @property
-    def document_lists(self) -> Iterator[List[Document]]:
-        """Iterate over urls and yield lists of documents.
-        Each object yielded by the iterator is a list of documents.
+    def document_sources(self) -> Iterator[Callable[[], List[Document]]]:
+        """Iterate over urls and yield a function reading the documents of each one.
+        Each function returns a list of documents.
 
         Returns:
-            Iterator[List[Document]]: Iterator yielding list of documents
+            Iterator[Callable[[], List[Document]]]: Iterator yielding functions that read lists of documents
         """
         if self.reader is not None:
             for _url in self.urls:
-                yield self.reader.read(url=_url)
+                yield partial(self.reader.read, url=_url)
 
     def load(
         self,
@@ -40,6 +44,7 @@ class WebsiteKnowledgeBase(AgentKnowledge):
         upsert: bool = True,
         skip_existing: bool = True,
         filters: Optional[Dict[str, Any]] = None,
+        parallel: bool = False,
     ) -> None:
         """Load the website contents to the vector db"""
 
@@ -54,6 +59,7 @@ class WebsiteKnowledgeBase(AgentKnowledge):
         if recreate:
             logger.debug("Dropping collection")
             self.vector_db.drop()
+            self._known_hashes.clear()
 
         logger.debug("Creating collection")
         self.vector_db.create()
@@ -71,17 +77,104 @@ class WebsiteKnowledgeBase(AgentKnowledge):
                     logger.debug(f"Skipping {url} as it exists in the vector db")
                     urls_to_read.remove(url)
 
-        for url in urls_to_read:
-            document_list = self.reader.read(url=url)
-            # Filter out documents which already exist in the vector db
-            if not recreate:
-                document_list = [document for document in document_list if not self.vector_db.doc_exists(document)]
-            if upsert and self.vector_db.upsert_available():
-                self.vector_db.upsert(documents=document_list, filters=filters)
-            else:
-                self.vector_db.insert(documents=document_list, filters=filters)
-            num_documents += len(document_list)
-            logger.info(f"Loaded {num_documents} documents to knowledge base")
+        if parallel:
+            # The website reader keeps the crawl state, so urls are crawled one at a time
+            pipeline = replace(self.ingestion_pipeline or IngestionPipeline(), num_readers=1, use_processes=False)
+            progress = pipeline.run(
+                self,
+                [partial(self.reader.read, url=url) for url in urls_to_read],
+                upsert=upsert,
+                skip_existing=not recreate,
+                filters=filters,
+            )
+            num_documents = progress.documents_written
+        else:
+            for url in urls_to_read:
+                document_list = self.reader.read(url=url)
+                # Filter out documents which already exist in the vector db
+                if not recreate:
+                    document_list = self.filter_existing_documents(document_list)
+                if upsert and self.vector_db.upsert_available():
+                    self.vector_db.upsert(documents=document_list, filters=filters)
+                else:
+                    self.vector_db.insert(documents=document_list, filters=filters)
+                self.add_known_documents(document_list)
+                num_documents += len(document_list)
+                logger.info(f"Loaded {num_documents} documents to knowledge base")
+
+        if self.optimize_on is not None and num_documents > self.optimize_on:
+            logger.debug("Optimizing Vector DB")
+            self.vector_db.optimize()
+
+    async def aload(
+        self,
+        recreate: bool = False,
+        upsert: bool = True,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Crawl the websites with concurrent async requests, writing the documents of each page as it is fetched
+
+        Args:
+            recreate (bool): If True, recreates the collection in the vector db. Defaults to False.
+            upsert (bool): If True, upserts documents to the vector db. Defaults to True.
+            filters (Optional[Dict[str, Any]]): Filters to add to each row that can be used to limit results during querying. Defaults to None.
+        """
+
+        if self.vector_db is None:
+            logger.warning("No vector db provided")
+            return
+
+        if self.reader is None:
+            logger.warning("No reader provided")
+            return
+
+        if recreate:
+            logger.debug("Dropping collection")
+            self.vector_db.drop()
+            self._known_hashes.clear()
+
+        logger.debug("Creating collection")
+        self.vector_db.create()
+
+        logger.info("Loading knowledge base")
+        num_documents = 0
+        # Pages are written in a thread, one at a time, while the crawl goes on
+        write: Optional["asyncio.Task[int]"] = None
+
+        async def write_page(documents: List[Document]) -> None:
+            nonlocal num_documents, write
+            if write is not None:
+                num_documents += await write
+            write = asyncio.create_task(
+                asyncio.to_thread(
+                    self._load_document_list, documents, upsert=upsert, skip_existing=not recreate, filters=filters
+                )
+            )
+
+        try:
+            for url in self.urls:
+                if not recreate and self.vector_db.name_exists(name=url):
+                    logger.debug(f"Skipping {url} as it exists in the vector db")
+                    continue
+
+                page_documents: List[Document] = []
+                page_id: Optional[str] = None
+                async for document in self.reader.aiter_read(url):
+                    # Chunks of a page are yielded together, write them once the next page starts
+                    if page_documents and document.meta_data.get("url") != page_id:
+                        await write_page(page_documents)
+                        page_documents = []
+                    page_id = document.meta_data.get("url")
+                    page_documents.append(document)
+                if page_documents:
+                    await write_page(page_documents)
+            if write is not None:
+                num_documents += await write
+        finally:
+            # Let a write still running finish before the search cache is synced
+            if write is not None and not write.done():
+                await asyncio.wait([write])
+            self.sync_search_cache()
 
         if self.optimize_on is not None and num_documents > self.optimize_on:
             logger.debug("Optimizing Vector DB")
@@ -1,4 +1,5 @@
-from typing import Iterator, List
+from functools import partial
+from typing import Callable, Iterator, List
 
 from agno.document import Document
 from agno.document.reader.youtube_reader import YouTubeReader
@@ -10,13 +11,13 @@ class YouTubeKnowledgeBase(AgentKnowledge):
     reader: YouTubeReader = YouTubeReader()
 
     @property
-    def document_lists(self) -> Iterator[List[Document]]:
-        """Iterate over YouTube URLs and yield lists of documents.
-        Each object yielded by the iterator is a list of documents.
+    def document_sources(self) -> Iterator[Callable[[], List[Document]]]:
+        """Iterate over YouTube URLs and yield a function reading the documents of each one.
+        Each function returns a list of documents.
 
         Returns:
-                Iterator[List[Document]]: Iterator yielding list of documents
+                Iterator[Callable[[], List[Document]]]: Iterator yielding functions that read lists of documents
         """
 
         for url in self.urls:
-            yield self.reader.read(video_url=url)
+            yield partial(self.reader.read, video_url=url)
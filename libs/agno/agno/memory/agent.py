@@ -33,6 +33,8 @@ class MemoryRetrieval(str, Enum):
 class AgentMemory(BaseModel):
     # Runs between the user and agent
     runs: List[AgentRun] = []
+    # Number of earlier runs in the session that were not loaded from storage
+    runs_offset: int = 0
     # List of messages sent to the model
     messages: List[Message] = []
     update_system_message_on_change: bool = False
@@ -81,6 +83,8 @@ class AgentMemory(BaseModel):
                 "num_memories",
             },
         )
+        if self.runs_offset > 0:
+            _memory_dict["runs_offset"] = self.runs_offset
         # Add summary if it exists
         if self.summary is not None:
             _memory_dict["summary"] = self.summary.to_dict()
@@ -365,10 +369,31 @@ class AgentMemory(BaseModel):
         """Clear the AgentMemory"""
 
         self.runs = []
+        self.runs_offset = 0
         self.messages = []
         self.summary = None
         self.memories = None
 
+    def clone_for_request(self) -> "AgentMemory":
+        """Copy the memory configuration for serving a single request, without the runs, messages, summary and memories.
+
+        The db and the model clients are shared. The manager, classifier and summarizer keep per-request state (the
+        user_id, the existing memories and tools bound to the manager), so each copy gets its own.
+        """
+        return self.model_copy(
+            update={
+                "runs": [],
+                "runs_offset": 0,
+                "messages": [],
+                "summary": None,
+                "memories": None,
+                "classifier": _copy_helper(self.classifier, existing_memories=None),
+                "manager": _copy_helper(self.manager),
+                "summarizer": _copy_helper(self.summarizer),
+                "updating_memory": False,
+            }
+        )
+
     def deep_copy(self) -> "AgentMemory":
         from copy import deepcopy
 
@@ -390,3 +415,18 @@ class AgentMemory(BaseModel):
         copied_obj.summarizer = self.summarizer
 
         return copied_obj
+
+
+def _copy_helper(helper: Optional[BaseModel], **update: Any) -> Any:
+    """Copy a memory helper with a copy of its model, sharing the client but not the tools and metrics"""
+    from copy import copy
+
+    if helper is None:
+        return None
+    model = getattr(helper, "model", None)
+    if model is not None:
+        model = copy(model)
+        model.clear()
+        model.tools = None
+        update["model"] = model
+    return helper.model_copy(update=update)
@@ -0,0 +1,219 @@
+import asyncio
+import atexit
+import queue
+import time
+from dataclasses import dataclass, field
+from threading import Condition, Lock, Thread
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from agno.utils.log import logger
+
+SessionKey = Tuple[Optional[str], Optional[str]]
+
+
+@dataclass
+class PendingMemoryUpdate:
+    """Memory work for one session that has not been processed yet.
+
+    The memory and the session are snapshots taken when the update was submitted, so the agent can move on to
+    another session, or clear its memory, while the update waits or runs.
+    """
+
+    agent: Any
+    memory: Any
+    session: Any = None
+    inputs: List[str] = field(default_factory=list)
+    update_summary: bool = False
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class MemoryUpdateQueue:
+    """Runs user memory updates and session summaries in background threads after a run has returned.
+
+    Updates for the same session are coalesced while they wait: their inputs are classified in a single
+    memory update and the session summary is generated once. Updates work on a snapshot of the session taken
+    when they are submitted and save it to storage themselves, so the agent is free to start a new session. The
+    queue is bounded, when it is full the update runs inline on the caller's thread, or in a thread with `asubmit`,
+    so memory work is never dropped.
+    """
+
+    def __init__(self, max_size: int = 1000, num_workers: int = 1):
+        self.max_size = max_size
+        self.num_workers = num_workers
+
+        self._queue: "queue.Queue[Optional[SessionKey]]" = queue.Queue(maxsize=max_size)
+        self._pending: Dict[SessionKey, PendingMemoryUpdate] = {}
+        self._in_progress: Set[SessionKey] = set()
+        self._lock = Lock()
+        self._idle = Condition(self._lock)
+        self._workers: List[Thread] = []
+
+        # Metrics
+        self.processed: int = 0
+        self.coalesced: int = 0
+        self.ran_inline: int = 0
+        self.failed: int = 0
+        self.last_lag: float = 0.0
+        self.max_lag: float = 0.0
+
+    @staticmethod
+    def session_key(agent: Any) -> SessionKey:
+        return (agent.agent_id, agent.session_id)
+
+    def submit(self, agent: Any, inputs: Optional[List[str]] = None, update_summary: bool = False) -> None:
+        """Queue memory work for the agent's current session"""
+        key = self._enqueue(agent, inputs or [], update_summary)
+        if key is not None:
+            self._process_session(key)
+
+    async def asubmit(self, agent: Any, inputs: Optional[List[str]] = None, update_summary: bool = False) -> None:
+        """Queue memory work for the agent's current session, without blocking the event loop when the queue is full"""
+        key = self._enqueue(agent, inputs or [], update_summary)
+        if key is not None:
+            await asyncio.to_thread(self._process_session, key)
+
+    def _enqueue(self, agent: Any, inputs: List[str], update_summary: bool) -> Optional[SessionKey]:
+        """Add the update to the pending work of its session. Returns the session key if it must be processed inline."""
+        if agent.memory is None or (len(inputs) == 0 and not update_summary):
+            return None
+
+        key = self.session_key(agent)
+        memory, session = self.snapshot(agent)
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                # Coalesce with the update already waiting for this session, the latest snapshot includes its runs
+                pending.agent = agent
+                pending.memory = memory
+                pending.session = session
+                pending.inputs.extend(inputs)
+                pending.update_summary = pending.update_summary or update_summary
+                self.coalesced += 1
+                return None
+            self._pending[key] = PendingMemoryUpdate(
+                agent=agent, memory=memory, session=session, inputs=list(inputs), update_summary=update_summary
+            )
+            # A worker is already processing this session and will pick the new update up when it is done
+            if key in self._in_progress:
+                return None
+            self._in_progress.add(key)
+
+        self._start_workers()
+        try:
+            self._queue.put_nowait(key)
+        except queue.Full:
+            logger.warning("Memory update queue is full, updating memory inline")
+            self.ran_inline += 1
+            return key
+        return None
+
+    @staticmethod
+    def snapshot(agent: Any) -> Tuple[Any, Any]:
+        """Returns a copy of the agent's memory that the update can change, and its session to save to storage"""
+        memory = agent.memory.model_copy(
+            update={"runs": list(agent.memory.runs), "messages": list(agent.memory.messages)}
+        )
+        session = agent.get_agent_session() if agent.storage is not None else None
+        return memory, session
+
+    def wait_for_session(self, agent: Any, timeout: Optional[float] = None) -> bool:
+        """Block until there is no pending memory work for the agent's session. Returns False on timeout."""
+        key = self.session_key(agent)
+        with self._idle:
+            return self._idle.wait_for(lambda: key not in self._in_progress, timeout=timeout)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until all queued memory work is done. Returns False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(lambda: len(self._in_progress) == 0, timeout=timeout)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            queue_depth = len(self._pending)
+            in_progress = len(self._in_progress)
+            oldest = min((p.enqueued_at for p in self._pending.values()), default=None)
+        return {
+            "queue_depth": queue_depth,
+            "in_progress": in_progress,
+            "processed": self.processed,
+            "coalesced": self.coalesced,
+            "ran_inline": self.ran_inline,
+            "failed": self.failed,
+            "current_lag": time.monotonic() - oldest if oldest is not None else 0.0,
+            "last_lag": self.last_lag,
+            "max_lag": self.max_lag,
+        }
+
+    def _start_workers(self) -> None:
+        with self._lock:
+            if len(self._workers) > 0:
+                return
+            for i in range(self.num_workers):
+                worker = Thread(target=self._worker, name=f"agno-memory-{i}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def _worker(self) -> None:
+        while True:
+            key = self._queue.get()
+            try:
+                if key is None:
+                    return
+                self._process_session(key)
+            finally:
+                self._queue.task_done()
+
+    def _process_session(self, key: SessionKey) -> None:
+        """Process every update for a session, including those coalesced while it was running"""
+        while True:
+            with self._lock:
+                update = self._pending.pop(key, None)
+                if update is None:
+                    self._in_progress.discard(key)
+                    self._idle.notify_all()
+                    return
+
+            lag = time.monotonic() - update.enqueued_at
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            logger.debug(f"Processing memory update for session {key[1]} (lag: {lag:.4f}s)")
+            try:
+                self._run_update(key, update)
+                self.processed += 1
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Error updating memory in the background: {e}")
+
+    def _run_update(self, key: SessionKey, update: PendingMemoryUpdate) -> None:
+        memory = update.memory
+        if len(update.inputs) > 0:
+            # Classify all inputs for the session with a single memory update
+            memory.update_memory(input="\n\n".join(update.inputs))
+        if update.update_summary:
+            memory.update_summary()
+
+        agent = update.agent
+        if update.session is not None and agent.storage is not None:
+            # Save the session the update was submitted for, whichever session the agent is on now
+            update.session.memory = memory.to_dict()
+            agent.storage.upsert(session=update.session)
+        # Without storage the agent only sees the results while it stays on the session
+        if agent.memory is not None and self.session_key(agent) == key:
+            agent.memory.summary = memory.summary
+            agent.memory.memories = memory.memories
+
+
+_memory_update_queue: Optional[MemoryUpdateQueue] = None
+_memory_update_queue_lock = Lock()
+
+
+def get_memory_update_queue() -> MemoryUpdateQueue:
+    """Returns the process-wide memory update queue, flushed when the interpreter exits"""
+    global _memory_update_queue
+
+    if _memory_update_queue is None:
+        with _memory_update_queue_lock:
+            if _memory_update_queue is None:
+                _memory_update_queue = MemoryUpdateQueue()
+                atexit.register(_memory_update_queue.flush)
+    return _memory_update_queue
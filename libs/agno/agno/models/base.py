@@ -1,6 +1,7 @@
 import asyncio
 import collections.abc
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from types import GeneratorType
@@ -107,6 +108,9 @@ class Model(ABC):
 
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # Maximum number of tool calls run concurrently in threads by the synchronous run_function_calls.
+    # None or 1 runs the tool calls one at a time.
+    tool_call_concurrency: Optional[int] = None
 
     # -*- Functions available to the Model to call -*-
     # Functions extracted from the tools.
@@ -356,6 +360,15 @@ class Model(ABC):
         # Additional messages from function calls that will be added to the function call results
         additional_messages: List[Message] = []
 
+        # Run function calls in a thread pool if concurrency is enabled
+        if self.tool_call_concurrency is not None and self.tool_call_concurrency > 1 and len(function_calls) > 1:
+            yield from self._run_function_calls_in_threads(
+                function_calls, function_call_results, additional_messages, tool_role
+            )
+            if additional_messages:
+                function_call_results.extend(additional_messages)
+            return
+
         for fc in function_calls:
             # Start function call
             function_call_timer = Timer()
@@ -441,6 +454,113 @@ class Model(ABC):
         if additional_messages:
             function_call_results.extend(additional_messages)
 
+    def _run_function_call(self, function_call: FunctionCall) -> Tuple[Union[bool, AgentRunException], Timer]:
+        """Run a single function call in a worker thread and return its success status and timer."""
+        function_call_timer = Timer()
+        function_call_timer.start()
+        success: Union[bool, AgentRunException] = False
+        try:
+            success = function_call.execute()
+        except AgentRunException as e:
+            success = e  # Pass the exception through to be handled by caller
+        except Exception as e:
+            logger.error(f"Error executing function {function_call.function.name}: {e}")
+            raise e
+        finally:
+            function_call_timer.stop()
+        return success, function_call_timer
+
+    def _run_function_calls_in_threads(
+        self,
+        function_calls: List[FunctionCall],
+        function_call_results: List[Message],
+        additional_messages: List[Message],
+        tool_role: str = "tool",
+    ) -> Iterator[ModelResponse]:
+        """Run function calls concurrently in a thread pool, yielding events and results in the original order."""
+        if self._function_call_stack is None:
+            self._function_call_stack = []
+
+        # Only start the calls that fit within the tool call limit, the sequential path stops at the same point
+        if self.tool_call_limit:
+            remaining_calls = max(self.tool_call_limit - len(self._function_call_stack), 1)
+            function_calls = function_calls[:remaining_calls]
+
+        # Yield tool_call_started events for all function calls
+        for fc in function_calls:
+            yield ModelResponse(
+                content=fc.get_call_str(),
+                tool_calls=[
+                    {
+                        "role": tool_role,
+                        "tool_call_id": fc.call_id,
+                        "tool_name": fc.function.name,
+                        "tool_args": fc.arguments,
+                    }
+                ],
+                event=ModelResponseEvent.tool_call_started.value,
+            )
+
+        max_workers = min(self.tool_call_concurrency or 1, len(function_calls))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agno-tool") as executor:
+            futures = [executor.submit(self._run_function_call, fc) for fc in function_calls]
+
+            # Process results in the order the model requested them
+            for fc, future in zip(function_calls, futures):
+                function_call_success, function_call_timer = future.result()
+
+                # Handle AgentRunException
+                if isinstance(function_call_success, AgentRunException):
+                    a_exc = function_call_success
+                    # Update additional messages from function call
+                    self._handle_agent_exception(a_exc, additional_messages)
+                    # Set function call success to False if an exception occurred
+                    function_call_success = False
+
+                # Process function call output
+                function_call_output: Optional[Union[List[Any], str]] = ""
+                if isinstance(fc.result, (GeneratorType, collections.abc.Iterator)):
+                    for item in fc.result:
+                        function_call_output += item
+                        if fc.function.show_result:
+                            yield ModelResponse(content=item)
+                else:
+                    function_call_output = fc.result
+                    if fc.function.show_result:
+                        yield ModelResponse(content=function_call_output)
+
+                # Create and yield function call result
+                function_call_result = self._create_function_call_result(
+                    fc, function_call_success, function_call_output, function_call_timer, tool_role
+                )
+                yield ModelResponse(
+                    content=f"{fc.get_call_str()} completed in {function_call_timer.elapsed:.4f}s.",
+                    tool_calls=[
+                        function_call_result.model_dump(
+                            include={
+                                "content",
+                                "tool_call_id",
+                                "tool_name",
+                                "tool_args",
+                                "tool_call_error",
+                                "metrics",
+                                "created_at",
+                            }
+                        )
+                    ],
+                    event=ModelResponseEvent.tool_call_completed.value,
+                )
+
+                # Update metrics and function call results
+                self._update_metrics(fc.function.name, function_call_timer.elapsed)
+                function_call_results.append(function_call_result)
+                self._function_call_stack.append(fc)
+
+                # Check function call limit
+                if self.tool_call_limit and len(self._function_call_stack) >= self.tool_call_limit:
+                    self.tool_choice = "none"
+                    break
+
     async def _arun_function_call(
         self, function_call: FunctionCall
     ) -> tuple[Union[bool, AgentRunException], Timer, FunctionCall]:
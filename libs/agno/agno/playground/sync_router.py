@@ -3,7 +3,7 @@ from dataclasses import asdict
 from io import BytesIO
 from typing import Generator, List, Optional, cast
 
-from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
+from fastapi import APIRouter, File, Form, HTTPException, Query, Response, UploadFile
 from fastapi.responses import JSONResponse, StreamingResponse
 
 from agno.agent.agent import Agent, RunResponse
@@ -11,7 +11,6 @@ from agno.media import Image
 from agno.playground.operator import (
     format_tools,
     get_agent_by_id,
-    get_session_title,
     get_session_title_from_workflow_session,
     get_workflow_by_id,
 )
@@ -124,7 +123,7 @@ def get_sync_playground_router(
             logger.debug("Creating new session")
 
         # Create a new instance of this agent
-        new_agent_instance = agent.deep_copy(update={"session_id": session_id})
+        new_agent_instance = agent.session_view(session_id=session_id)
         new_agent_instance.session_name = None
 
         if user_id is not None:
@@ -197,7 +196,13 @@ def get_sync_playground_router(
             return run_response
 
     @playground_router.get("/agents/{agent_id}/sessions")
-    def get_user_agent_sessions(agent_id: str, user_id: str = Query(..., min_length=1)):
+    def get_user_agent_sessions(
+        agent_id: str,
+        response: Response,
+        user_id: str = Query(..., min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        cursor: Optional[str] = None,
+    ):
         logger.debug(f"AgentSessionsRequest: {agent_id} {user_id}")
         agent = get_agent_by_id(agent_id, agents)
         if agent is None:
@@ -206,16 +211,21 @@ def get_sync_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
+        # Only the session name and title are read, not the memory of every session
+        session_summaries, next_cursor = agent.storage.list_session_summaries(
+            user_id=user_id, limit=limit, cursor=cursor
+        )
+        if next_cursor is not None:
+            response.headers["X-Next-Cursor"] = next_cursor
+
         agent_sessions: List[AgentSessionsResponse] = []
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=user_id)
-        for session in all_agent_sessions:
-            title = get_session_title(session)
+        for session_summary in session_summaries:
             agent_sessions.append(
                 AgentSessionsResponse(
-                    title=title,
-                    session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
-                    created_at=session.created_at,
+                    title=session_summary.title or "Unnamed session",
+                    session_id=session_summary.session_id,
+                    session_name=session_summary.session_name,
+                    created_at=session_summary.created_at,
                 )
             )
         return agent_sessions
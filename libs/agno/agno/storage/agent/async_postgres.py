@@ -0,0 +1,198 @@
+import asyncio
+from typing import List, Optional, Tuple
+
+try:
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+except ImportError:
+    raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
+
+from agno.storage.agent.postgres import PostgresAgentStorage
+from agno.storage.agent.session import AgentSession, AgentSessionSummary
+from agno.utils.log import logger
+
+
+class AsyncPostgresAgentStorage(PostgresAgentStorage):
+    def __init__(
+        self,
+        table_name: str,
+        schema: Optional[str] = "ai",
+        db_url: Optional[str] = None,
+        db_engine: Optional[Engine] = None,
+        async_db_engine: Optional[AsyncEngine] = None,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        schema_version: int = 1,
+        auto_upgrade_schema: bool = False,
+    ):
+        """
+        This class provides agent storage using a PostgreSQL table, with async methods that do not block the event
+        loop. The async methods use a pooled async engine on the same database as the sync methods.
+
+        The async engine is created from the URL of the sync engine unless `async_db_engine` is provided.
+        psycopg (v3) URLs are used as is, other drivers are replaced with asyncpg.
+
+        Args:
+            table_name (str): Name of the table to store Agent sessions.
+            schema (Optional[str]): The schema to use for the table. Defaults to "ai".
+            db_url (Optional[str]): The database URL to connect to.
+            db_engine (Optional[Engine]): The SQLAlchemy database engine to use.
+            async_db_engine (Optional[AsyncEngine]): The SQLAlchemy async database engine to use.
+            pool_size (int): Number of connections kept open by the async engine. Defaults to 5.
+            max_overflow (int): Number of connections the async engine can open above pool_size. Defaults to 10.
+            schema_version (int): Version of the schema. Defaults to 1.
+            auto_upgrade_schema (bool): Whether to automatically upgrade the schema.
+
+        Raises:
+            ValueError: If neither db_url nor db_engine is provided.
+        """
+        super().__init__(
+            table_name=table_name,
+            schema=schema,
+            db_url=db_url,
+            db_engine=db_engine,
+            schema_version=schema_version,
+            auto_upgrade_schema=auto_upgrade_schema,
+        )
+
+        _async_engine: Optional[AsyncEngine] = async_db_engine
+        if _async_engine is None:
+            async_url = self.db_engine.url
+            if async_url.drivername != "postgresql+psycopg":
+                try:
+                    import asyncpg  # noqa: F401
+                except ImportError:
+                    raise ImportError("`asyncpg` not installed. Please install it using `pip install asyncpg`")
+                async_url = async_url.set(drivername="postgresql+asyncpg")
+            _async_engine = create_async_engine(async_url, pool_size=pool_size, max_overflow=max_overflow)
+
+        self.async_db_engine: AsyncEngine = _async_engine
+        # Async database session
+        self.AsyncSession: async_sessionmaker[AsyncSession] = async_sessionmaker(
+            bind=self.async_db_engine, expire_on_commit=False
+        )
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
+        """
+        Read an AgentSession from the database without blocking the event loop.
+
+        Args:
+            session_id (str): ID of the session to read.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+
+        Returns:
+            Optional[AgentSession]: AgentSession object if found, None otherwise.
+        """
+        return await self.aread_last_runs(session_id=session_id, user_id=user_id)
+
+    async def aread_last_runs(
+        self,
+        session_id: str,
+        user_id: Optional[str] = None,
+        num_runs: Optional[int] = None,
+        create_and_retry: bool = True,
+    ) -> Optional[AgentSession]:
+        """
+        Read an AgentSession from the database without blocking the event loop,
+        loading only the last `num_runs` runs with schema version 2.
+
+        Args:
+            session_id (str): ID of the session to read.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+            num_runs (Optional[int]): Number of runs to load, all runs are loaded if None.
+            create_and_retry (bool): Retry the read if the tables do not exist.
+
+        Returns:
+            Optional[AgentSession]: AgentSession object if found, None otherwise.
+        """
+        try:
+            async with self.AsyncSession() as sess:
+                return await sess.run_sync(self.read_session, session_id, user_id, num_runs)
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            if create_and_retry and not await asyncio.to_thread(self.table_exists):
+                logger.debug("Creating tables and retrying read")
+                await asyncio.to_thread(self.create)
+                return await self.aread_last_runs(
+                    session_id=session_id, user_id=user_id, num_runs=num_runs, create_and_retry=False
+                )
+        return None
+
+    async def aget_all_sessions(
+        self, user_id: Optional[str] = None, agent_id: Optional[str] = None
+    ) -> List[AgentSession]:
+        """
+        Get all sessions without blocking the event loop, optionally filtered by user_id and/or agent_id.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            agent_id (Optional[str]): The ID of the agent to filter by.
+
+        Returns:
+            List[AgentSession]: List of AgentSession objects matching the criteria.
+        """
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                return await sess.run_sync(self.read_sessions, user_id, agent_id)
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            await asyncio.to_thread(self.create)
+        return []
+
+    async def alist_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[AgentSessionSummary], Optional[str]]:
+        """
+        List sessions newest first without blocking the event loop, with only their id, name, title and creation time.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            agent_id (Optional[str]): The ID of the agent to filter by.
+            limit (Optional[int]): Maximum number of sessions to return, all sessions are returned if None.
+            cursor (Optional[str]): Cursor returned with the previous page.
+
+        Returns:
+            The page of session summaries and the cursor for the next page, which is None on the last page.
+        """
+        if self.schema_version == 1:
+            return await super().alist_session_summaries(user_id=user_id, agent_id=agent_id, limit=limit, cursor=cursor)
+
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                return await sess.run_sync(self.read_session_summaries, user_id, agent_id, limit, cursor)
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            await asyncio.to_thread(self.create)
+        return [], None
+
+    async def aupsert(self, session: AgentSession, create_and_retry: bool = True) -> Optional[AgentSession]:
+        """
+        Insert or update an AgentSession in the database without blocking the event loop.
+
+        Args:
+            session (AgentSession): The session data to upsert.
+            create_and_retry (bool): Retry upsert if table does not exist.
+
+        Returns:
+            Optional[AgentSession]: The upserted AgentSession, or None if operation failed.
+        """
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                await sess.run_sync(self.write_session, session)
+        except Exception as e:
+            logger.debug(f"Exception upserting into table: {e}")
+            if create_and_retry and not await asyncio.to_thread(self.table_exists):
+                logger.debug(f"Table does not exist: {self.table.name}")
+                logger.debug("Creating table and retrying upsert")
+                await asyncio.to_thread(self.create)
+                return await self.aupsert(session, create_and_retry=False)
+            return None
+        return session
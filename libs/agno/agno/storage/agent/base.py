@@ -1,7 +1,8 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from agno.storage.agent.session import AgentSession
+from agno.storage.agent.session import AgentSession, AgentSessionSummary, paginate_session_summaries
 
 
 class AgentStorage(ABC):
@@ -13,6 +14,15 @@ class AgentStorage(ABC):
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
         raise NotImplementedError
 
+    def read_last_runs(
+        self, session_id: str, user_id: Optional[str] = None, num_runs: Optional[int] = None
+    ) -> Optional[AgentSession]:
+        """Read an AgentSession, loading only its last `num_runs` runs if the storage supports it.
+
+        The default implementation loads every run, storages that keep runs in their own table override it.
+        """
+        return self.read(session_id=session_id, user_id=user_id)
+
     @abstractmethod
     def get_all_session_ids(self, user_id: Optional[str] = None, agent_id: Optional[str] = None) -> List[str]:
         raise NotImplementedError
@@ -21,6 +31,29 @@ class AgentStorage(ABC):
     def get_all_sessions(self, user_id: Optional[str] = None, agent_id: Optional[str] = None) -> List[AgentSession]:
         raise NotImplementedError
 
+    def list_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[AgentSessionSummary], Optional[str]]:
+        """List sessions newest first, with only their id, name, title and creation time.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            agent_id (Optional[str]): The ID of the agent to filter by.
+            limit (Optional[int]): Maximum number of sessions to return, all sessions are returned if None.
+            cursor (Optional[str]): Cursor returned with the previous page.
+
+        Returns:
+            The page of session summaries and the cursor for the next page, which is None on the last page.
+
+        The default implementation reads every session, storages that store the title override it.
+        """
+        sessions = self.get_all_sessions(user_id=user_id, agent_id=agent_id)
+        return paginate_session_summaries([session.get_summary() for session in sessions], limit=limit, cursor=cursor)
+
     @abstractmethod
     def upsert(self, session: AgentSession) -> Optional[AgentSession]:
         raise NotImplementedError
@@ -36,3 +69,33 @@ class AgentStorage(ABC):
     @abstractmethod
     def upgrade_schema(self) -> None:
         raise NotImplementedError
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
+        """Async version of `read`. The default implementation runs `read` in a thread."""
+        return await asyncio.to_thread(self.read, session_id, user_id)
+
+    async def aread_last_runs(
+        self, session_id: str, user_id: Optional[str] = None, num_runs: Optional[int] = None
+    ) -> Optional[AgentSession]:
+        """Async version of `read_last_runs`. The default implementation runs `read_last_runs` in a thread."""
+        return await asyncio.to_thread(self.read_last_runs, session_id, user_id, num_runs)
+
+    async def aget_all_sessions(
+        self, user_id: Optional[str] = None, agent_id: Optional[str] = None
+    ) -> List[AgentSession]:
+        """Async version of `get_all_sessions`. The default implementation runs `get_all_sessions` in a thread."""
+        return await asyncio.to_thread(self.get_all_sessions, user_id, agent_id)
+
+    async def alist_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[AgentSessionSummary], Optional[str]]:
+        """Async version of `list_session_summaries`. The default implementation runs it in a thread."""
+        return await asyncio.to_thread(self.list_session_summaries, user_id, agent_id, limit, cursor)
+
+    async def aupsert(self, session: AgentSession) -> Optional[AgentSession]:
+        """Async version of `upsert`. The default implementation runs `upsert` in a thread."""
+        return await asyncio.to_thread(self.upsert, session)
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 try:
@@ -11,7 +11,7 @@ except ImportError:
     raise ImportError("`pymongo` not installed. Please install it with `pip install pymongo`")
 
 from agno.storage.agent.base import AgentStorage
-from agno.storage.agent.session import AgentSession
+from agno.storage.agent.session import AgentSession, AgentSessionSummary, parse_session_cursor
 from agno.utils.log import logger
 
 
@@ -131,6 +131,66 @@ class MongoDbAgentStorage(AgentStorage):
             logger.error(f"Error getting sessions: {e}")
             return []
 
+    def list_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[AgentSessionSummary], Optional[str]]:
+        """List sessions newest first, with only their id, name, title and creation time
+        Args:
+            user_id: ID of the user to read
+            agent_id: ID of the agent to read
+            limit: Maximum number of sessions to return, all sessions are returned if None
+            cursor: Cursor returned with the previous page
+        Returns:
+            The page of session summaries and the cursor for the next page, which is None on the last page
+        """
+        try:
+            query: Dict[str, Any] = {}
+            if user_id is not None:
+                query["user_id"] = user_id
+            if agent_id is not None:
+                query["agent_id"] = agent_id
+            if cursor is not None:
+                cursor_created_at, cursor_session_id = parse_session_cursor(cursor)
+                query["$or"] = [
+                    {"created_at": {"$lt": cursor_created_at}},
+                    {"created_at": cursor_created_at, "session_id": {"$lt": cursor_session_id}},
+                ]
+
+            projection = {"_id": 0, "session_id": 1, "session_name": 1, "title": 1, "created_at": 1}
+            docs = self.collection.find(query, projection).sort([("created_at", -1), ("session_id", -1)])
+            if limit is not None:
+                # Read one more document to know if there is a next page
+                docs = docs.limit(limit + 1)
+            summaries = [
+                AgentSessionSummary(
+                    session_id=str(doc["session_id"]),
+                    session_name=doc.get("session_name"),
+                    title=doc.get("title"),
+                    created_at=doc.get("created_at"),
+                )
+                for doc in docs
+            ]
+
+            # Sessions written before titles were stored need their memory to compute the title
+            untitled = {summary.session_id: summary for summary in summaries if summary.title is None}
+            if len(untitled) > 0:
+                for doc in self.collection.find({"session_id": {"$in": list(untitled.keys())}}):
+                    doc.pop("_id", None)
+                    _agent_session = AgentSession.from_dict(doc)
+                    if _agent_session is not None:
+                        untitled[_agent_session.session_id].title = _agent_session.get_title()
+
+            if limit is not None and len(summaries) > limit:
+                return summaries[:limit], summaries[limit - 1].cursor
+            return summaries, None
+        except PyMongoError as e:
+            logger.error(f"Error listing sessions: {e}")
+            return [], None
+
     def upsert(self, session: AgentSession, create_and_retry: bool = True) -> Optional[AgentSession]:
         """Upsert an agent session
         Args:
@@ -156,6 +216,13 @@ class MongoDbAgentStorage(AgentStorage):
                 session_dict["_version"] += 1
 
             update_data = {**session_dict, "updated_at": timestamp}
+            # Store the name and title so sessions can be listed without reading their memory
+            session_name = session.get_session_name()
+            if session_name is not None:
+                update_data["session_name"] = session_name
+            title = session.get_title()
+            if title is not None:
+                update_data["title"] = title
 
             # For new documents, set created_at
             query = {"session_id": session_dict["session_id"]}
@@ -1,19 +1,20 @@
 import time
-from typing import List, Optional
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from sqlalchemy.dialects import postgresql
     from sqlalchemy.engine import Engine, create_engine
     from sqlalchemy.inspection import inspect
-    from sqlalchemy.orm import scoped_session, sessionmaker
+    from sqlalchemy.orm import Session, scoped_session, sessionmaker
     from sqlalchemy.schema import Column, Index, MetaData, Table
-    from sqlalchemy.sql.expression import select, text
-    from sqlalchemy.types import BigInteger, String
+    from sqlalchemy.sql.expression import and_, func, or_, select, text
+    from sqlalchemy.types import BigInteger, Integer, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
 from agno.storage.agent.base import AgentStorage
-from agno.storage.agent.session import AgentSession
+from agno.storage.agent.session import AgentSession, AgentSessionSummary, parse_session_cursor
 from agno.utils.log import logger
 
 
@@ -40,7 +41,8 @@ class PostgresAgentStorage(AgentStorage):
             schema (Optional[str]): The schema to use for the table. Defaults to "ai".
             db_url (Optional[str]): The database URL to connect to.
             db_engine (Optional[Engine]): The SQLAlchemy database engine to use.
-            schema_version (int): Version of the schema. Defaults to 1.
+            schema_version (int): Version of the schema. Defaults to 1. Version 2 stores runs and messages in
+                append-only tables next to the session table, so each run only writes its new rows.
             auto_upgrade_schema (bool): Whether to automatically upgrade the schema.
 
         Raises:
@@ -70,6 +72,9 @@ class PostgresAgentStorage(AgentStorage):
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
         # Database table for storage
         self.table: Table = self.get_table()
+        # Append-only tables for runs and messages, used from schema version 2
+        self.runs_table: Table = self.get_runs_table()
+        self.messages_table: Table = self.get_messages_table()
         logger.debug(f"Created PostgresAgentStorage: '{self.schema}.{self.table_name}'")
 
     def get_table_v1(self) -> Table:
@@ -110,6 +115,92 @@ class PostgresAgentStorage(AgentStorage):
 
         return table
 
+    def get_table_v2(self) -> Table:
+        """
+        Define the table schema for version 2.
+        The memory column no longer holds runs and messages, and the session name and title are stored as columns
+        so sessions can be listed without reading their memory.
+
+        Returns:
+            Table: SQLAlchemy Table object representing the schema.
+        """
+        table = Table(
+            self.table_name,
+            self.metadata,
+            # Session UUID: Primary Key
+            Column("session_id", String, primary_key=True),
+            # ID of the agent that this session is associated with
+            Column("agent_id", String),
+            # ID of the user interacting with this agent
+            Column("user_id", String),
+            # Agent Memory
+            Column("memory", postgresql.JSONB),
+            # Agent Data
+            Column("agent_data", postgresql.JSONB),
+            # Session Data
+            Column("session_data", postgresql.JSONB),
+            # Name of the session, also stored in session_data
+            Column("session_name", String),
+            # Title used when listing sessions: the session name or the first user message
+            Column("title", String),
+            # Extra Data stored with this agent
+            Column("extra_data", postgresql.JSONB),
+            # The Unix timestamp of when this session was created.
+            Column("created_at", BigInteger, server_default=text("(extract(epoch from now()))::bigint")),
+            # The Unix timestamp of when this session was last updated.
+            Column("updated_at", BigInteger, server_onupdate=text("(extract(epoch from now()))::bigint")),
+            extend_existing=True,
+        )
+
+        # Add indexes
+        Index(f"idx_{self.table_name}_session_id", table.c.session_id)
+        Index(f"idx_{self.table_name}_agent_id", table.c.agent_id)
+        Index(f"idx_{self.table_name}_user_id", table.c.user_id)
+
+        return table
+
+    def get_runs_table(self) -> Table:
+        """
+        Define the append-only table for the runs of each session.
+
+        Returns:
+            Table: SQLAlchemy Table object representing the schema.
+        """
+        return Table(
+            f"{self.table_name}_runs",
+            self.metadata,
+            # Session UUID
+            Column("session_id", String, primary_key=True),
+            # Position of the run in the session
+            Column("run_index", Integer, primary_key=True),
+            # AgentRun
+            Column("run", postgresql.JSONB),
+            # The Unix timestamp of when this run was stored.
+            Column("created_at", BigInteger, server_default=text("(extract(epoch from now()))::bigint")),
+            extend_existing=True,
+        )
+
+    def get_messages_table(self) -> Table:
+        """
+        Define the append-only table for the messages of each session.
+
+        Returns:
+            Table: SQLAlchemy Table object representing the schema.
+        """
+        return Table(
+            f"{self.table_name}_messages",
+            self.metadata,
+            # Session UUID
+            Column("session_id", String, primary_key=True),
+            # Position of the message in the session
+            Column("message_index", Integer, primary_key=True),
+            # Message
+            Column("message", postgresql.JSONB),
+            # The Unix timestamp of when this message was stored.
+            Column("created_at", BigInteger, server_default=text("(extract(epoch from now()))::bigint")),
+            extend_existing=True,
+        )
+
     def get_table(self) -> Table:
         """
         Get the table schema based on the schema version.
@@ -122,6 +213,8 @@ class PostgresAgentStorage(AgentStorage):
         """
         if self.schema_version == 1:
             return self.get_table_v1()
+        elif self.schema_version == 2:
+            return self.get_table_v2()
         else:
             raise ValueError(f"Unsupported schema version: {self.schema_version}")
 
@@ -134,11 +227,45 @@ class PostgresAgentStorage(AgentStorage):
         """
         logger.debug(f"Checking if table exists: {self.table.name}")
         try:
+            if self.schema_version == 2:
+                return (
+                    all(
+                        self.inspector.has_table(table.name, schema=self.schema)
+                        for table in (self.table, self.runs_table, self.messages_table)
+                    )
+                    and len(self.get_missing_columns()) == 0
+                )
             return self.inspector.has_table(self.table.name, schema=self.schema)
         except Exception as e:
             logger.error(f"Error checking if table exists: {e}")
             return False
 
+    def get_missing_columns(self) -> List[Column]:
+        """
+        Get the columns of the session table that do not exist in the database, e.g. after upgrading from version 1.
+
+        Returns:
+            List[Column]: The missing columns.
+        """
+        # Use a new inspector, the one of the storage caches the columns
+        existing_columns = {
+            column["name"] for column in inspect(self.db_engine).get_columns(self.table.name, schema=self.schema)
+        }
+        return [column for column in self.table.columns if column.name not in existing_columns]
+
+    def add_missing_columns(self) -> None:
+        """
+        Add the columns of the session table that do not exist in the database.
+        """
+        missing_columns = self.get_missing_columns()
+        if len(missing_columns) == 0:
+            return
+        with self.Session() as sess, sess.begin():
+            for column in missing_columns:
+                logger.debug(f"Adding column {column.name} to table: {self.table.fullname}")
+                column_type = column.type.compile(dialect=self.db_engine.dialect)
+                sess.execute(text(f"ALTER TABLE {self.table.fullname} ADD COLUMN {column.name} {column_type}"))
+
     def create(self) -> None:
         """
         Create the table if it does not exist.
@@ -151,6 +278,10 @@ class PostgresAgentStorage(AgentStorage):
                         sess.execute(text(f"CREATE SCHEMA IF NOT EXISTS {self.schema};"))
                 logger.debug(f"Creating table: {self.table_name}")
                 self.table.create(self.db_engine, checkfirst=True)
+                if self.schema_version == 2:
+                    self.runs_table.create(self.db_engine, checkfirst=True)
+                    self.messages_table.create(self.db_engine, checkfirst=True)
+                    self.add_missing_columns()
             except Exception as e:
                 logger.error(f"Could not create table: '{self.table.fullname}': {e}")
 
@@ -165,13 +296,12 @@ class PostgresAgentStorage(AgentStorage):
         Returns:
             Optional[AgentSession]: AgentSession object if found, None otherwise.
         """
+        if self.schema_version == 2:
+            return self.read_last_runs(session_id=session_id, user_id=user_id)
+
         try:
             with self.Session() as sess:
-                stmt = select(self.table).where(self.table.c.session_id == session_id)
-                if user_id:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                result = sess.execute(stmt).fetchone()
-                return AgentSession.from_dict(result._mapping) if result is not None else None
+                return self.read_session(sess, session_id=session_id, user_id=user_id)
         except Exception as e:
             logger.debug(f"Exception reading from table: {e}")
             logger.debug(f"Table does not exist: {self.table.name}")
@@ -179,6 +309,287 @@ class PostgresAgentStorage(AgentStorage):
             self.create()
         return None
 
+    def read_last_runs(
+        self,
+        session_id: str,
+        user_id: Optional[str] = None,
+        num_runs: Optional[int] = None,
+        create_and_retry: bool = True,
+    ) -> Optional[AgentSession]:
+        """
+        Read an AgentSession from the database, loading only the last `num_runs` runs with schema version 2.
+
+        Args:
+            session_id (str): ID of the session to read.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+            num_runs (Optional[int]): Number of runs to load, all runs are loaded if None.
+            create_and_retry (bool): Retry the read if the tables do not exist.
+
+        Returns:
+            Optional[AgentSession]: AgentSession object if found, None otherwise.
+        """
+        if self.schema_version == 1:
+            return self.read(session_id=session_id, user_id=user_id)
+
+        try:
+            with self.Session() as sess:
+                return self.read_session(sess, session_id=session_id, user_id=user_id, num_runs=num_runs)
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            # Tables are missing, e.g. when a version 1 table is opened with version 2 for the first time
+            if create_and_retry and not self.table_exists():
+                logger.debug("Creating tables and retrying read")
+                self.create()
+                return self.read_last_runs(
+                    session_id=session_id, user_id=user_id, num_runs=num_runs, create_and_retry=False
+                )
+        return None
+
+    def read_session(
+        self, sess: Session, session_id: str, user_id: Optional[str] = None, num_runs: Optional[int] = None
+    ) -> Optional[AgentSession]:
+        """
+        Read an AgentSession using the given database session.
+
+        Args:
+            sess (Session): The database session to use.
+            session_id (str): ID of the session to read.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+            num_runs (Optional[int]): Number of runs to load with schema version 2, all runs are loaded if None.
+
+        Returns:
+            Optional[AgentSession]: AgentSession object if found, None otherwise.
+        """
+        stmt = select(self.table).where(self.table.c.session_id == session_id)
+        if user_id:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        result = sess.execute(stmt).fetchone()
+        if result is None:
+            return None
+        session = AgentSession.from_dict(result._mapping)  # type: ignore
+        if session is not None and self.schema_version == 2:
+            self.load_history(sess, [session], num_runs=num_runs)
+        return session
+
+    def read_sessions(
+        self, sess: Session, user_id: Optional[str] = None, agent_id: Optional[str] = None
+    ) -> List[AgentSession]:
+        """
+        Read all sessions using the given database session, optionally filtered by user_id and/or agent_id.
+
+        Args:
+            sess (Session): The database session to use.
+            user_id (Optional[str]): The ID of the user to filter by.
+            agent_id (Optional[str]): The ID of the agent to filter by.
+
+        Returns:
+            List[AgentSession]: List of AgentSession objects matching the criteria.
+        """
+        stmt = select(self.table)
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if agent_id is not None:
+            stmt = stmt.where(self.table.c.agent_id == agent_id)
+        # order by created_at desc
+        stmt = stmt.order_by(self.table.c.created_at.desc())
+        rows = sess.execute(stmt).fetchall()
+        sessions = [AgentSession.from_dict(row._mapping) for row in rows] if rows is not None else []  # type: ignore
+        sessions = [session for session in sessions if session is not None]
+        if self.schema_version == 2:
+            self.load_history(sess, sessions)  # type: ignore
+        return sessions  # type: ignore
+
+    def write_session(self, sess: Session, session: AgentSession) -> None:
+        """
+        Insert or update an AgentSession using the given database session.
+        Sets created_at and updated_at on the session, so it does not need to be read back.
+
+        Args:
+            sess (Session): The database session to use.
+            session (AgentSession): The session data to upsert.
+        """
+        memory = session.memory
+        if self.schema_version == 2:
+            # Runs and messages are appended to their own tables, the session row only keeps the rest of the memory
+            memory, runs, runs_offset, messages = session.split_memory()
+
+        values: Dict[str, Any] = dict(
+            session_id=session.session_id,
+            agent_id=session.agent_id,
+            user_id=session.user_id,
+            memory=memory,
+            agent_data=session.agent_data,
+            session_data=session.session_data,
+            extra_data=session.extra_data,
+        )
+        if self.schema_version == 2:
+            values.update(session_name=session.get_session_name(), title=session.get_title())
+
+        # Create an insert statement
+        stmt = postgresql.insert(self.table).values(**values)
+        update_values: Dict[str, Any] = dict(
+            agent_id=session.agent_id,
+            user_id=session.user_id,
+            memory=memory,
+            agent_data=session.agent_data,
+            session_data=session.session_data,
+            extra_data=session.extra_data,
+            updated_at=int(time.time()),
+        )
+        if self.schema_version == 2:
+            # Keep the stored title if it cannot be computed, e.g. when the first run of the session is not loaded
+            update_values.update(
+                session_name=stmt.excluded.session_name,
+                title=func.coalesce(stmt.excluded.title, self.table.c.title),
+            )
+
+        # Define the upsert if the session_id already exists
+        # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["session_id"],
+            set_=update_values,  # The updated value for each column
+        )
+
+        sess.execute(stmt)
+
+        if self.schema_version == 2:
+            self.append_history(
+                sess,
+                session_id=session.session_id,
+                runs=runs,
+                runs_offset=runs_offset,
+                messages=messages,
+                update_system_message=bool(memory and memory.get("update_system_message_on_change")),
+            )
+
+        now = int(time.time())
+        if session.created_at is None:
+            session.created_at = now
+        session.updated_at = now
+
+    def load_history(self, sess: Session, sessions: List[AgentSession], num_runs: Optional[int] = None) -> None:
+        """
+        Load runs and messages from the append-only tables into the memory of each session.
+
+        Args:
+            sess (Session): The database session to use.
+            sessions (List[AgentSession]): Sessions read from the session table.
+            num_runs (Optional[int]): Number of runs to load per session, all runs are loaded if None.
+        """
+        # Sessions written before the upgrade to version 2 still hold their runs and messages on the session row
+        sessions = [session for session in sessions if session.memory is None or "runs" not in session.memory]
+        if len(sessions) == 0:
+            return
+
+        runs: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        runs_offset: Dict[str, int] = {}
+        messages: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        session_ids = [session.session_id for session in sessions]
+        if num_runs is None:
+            runs_stmt = (
+                select(self.runs_table.c.session_id, self.runs_table.c.run)
+                .where(self.runs_table.c.session_id.in_(session_ids))
+                .order_by(self.runs_table.c.session_id, self.runs_table.c.run_index)
+            )
+            for row in sess.execute(runs_stmt).fetchall():
+                runs[row[0]].append(row[1])
+        else:
+            for session_id in session_ids:
+                last_runs_stmt = (
+                    select(self.runs_table.c.run_index, self.runs_table.c.run)
+                    .where(self.runs_table.c.session_id == session_id)
+                    .order_by(self.runs_table.c.run_index.desc())
+                    .limit(num_runs)
+                )
+                rows = sess.execute(last_runs_stmt).fetchall()[::-1]
+                runs[session_id] = [row[1] for row in rows]
+                runs_offset[session_id] = (
+                    rows[0][0] if len(rows) > 0 else self.count_rows(sess, self.runs_table, session_id)
+                )
+
+        messages_stmt = (
+            select(self.messages_table.c.session_id, self.messages_table.c.message)
+            .where(self.messages_table.c.session_id.in_(session_ids))
+            .order_by(self.messages_table.c.session_id, self.messages_table.c.message_index)
+        )
+        for row in sess.execute(messages_stmt).fetchall():
+            messages[row[0]].append(row[1])
+
+        for session in sessions:
+            memory = dict(session.memory or {})
+            memory["runs"] = runs.get(session.session_id, [])
+            if runs_offset.get(session.session_id, 0) > 0:
+                memory["runs_offset"] = runs_offset[session.session_id]
+            memory["messages"] = messages.get(session.session_id, [])
+            session.memory = memory
+
+    def count_rows(self, sess: Session, table: Table, session_id: str) -> int:
+        """Count the rows stored for a session in one of the append-only tables"""
+        stmt = select(func.count()).select_from(table).where(table.c.session_id == session_id)
+        return sess.execute(stmt).scalar() or 0
+
+    def append_history(
+        self,
+        sess: Session,
+        session_id: str,
+        runs: List[Dict[str, Any]],
+        runs_offset: int,
+        messages: List[Dict[str, Any]],
+        update_system_message: bool = False,
+    ) -> None:
+        """
+        Append the runs and messages that are not stored yet to the append-only tables.
+
+        When the memory ends before the stored history, e.g. after `AgentMemory.clear()` in the same session, the
+        history is truncated at the start of the memory and rewritten from it, as schema version 1 overwrites it.
+
+        Args:
+            sess (Session): The database session to use.
+            session_id (str): ID of the session.
+            runs (List[Dict[str, Any]]): Runs in memory, starting at position `runs_offset` in the session.
+            runs_offset (int): Position of the first run in the session.
+            messages (List[Dict[str, Any]]): All messages of the session.
+            update_system_message (bool): Also rewrite the first message, which is updated in place when the
+                system message changes.
+        """
+        num_stored_runs = self.count_rows(sess, self.runs_table, session_id)
+        num_stored_messages = self.count_rows(sess, self.messages_table, session_id)
+        if runs_offset + len(runs) < num_stored_runs or len(messages) < num_stored_messages:
+            logger.debug(f"History of session {session_id} is shorter than the stored history, rewriting it")
+            sess.execute(
+                self.runs_table.delete().where(
+                    and_(self.runs_table.c.session_id == session_id, self.runs_table.c.run_index >= runs_offset)
+                )
+            )
+            sess.execute(self.messages_table.delete().where(self.messages_table.c.session_id == session_id))
+            num_stored_runs = runs_offset
+            num_stored_messages = 0
+
+        new_runs = [
+            {"session_id": session_id, "run_index": runs_offset + i, "run": run}
+            for i, run in enumerate(runs)
+            if runs_offset + i >= num_stored_runs
+        ]
+        if len(new_runs) > 0:
+            runs_stmt = postgresql.insert(self.runs_table).on_conflict_do_nothing(
+                index_elements=["session_id", "run_index"]
+            )
+            sess.execute(runs_stmt, new_runs)
+
+        new_messages = [
+            {"session_id": session_id, "message_index": i, "message": message}
+            for i, message in enumerate(messages)
+            if i >= num_stored_messages or (i == 0 and update_system_message)
+        ]
+        if len(new_messages) > 0:
+            messages_stmt = postgresql.insert(self.messages_table)
+            messages_stmt = messages_stmt.on_conflict_do_update(
+                index_elements=["session_id", "message_index"],
+                set_=dict(message=messages_stmt.excluded.message),
+            )
+            sess.execute(messages_stmt, new_messages)
+        logger.debug(f"Appended {len(new_runs)} runs and {len(new_messages)} messages to session {session_id}")
+
     def get_all_session_ids(self, user_id: Optional[str] = None, agent_id: Optional[str] = None) -> List[str]:
         """
         Get all session IDs, optionally filtered by user_id and/or agent_id.
@@ -223,17 +634,7 @@ class PostgresAgentStorage(AgentStorage):
         """
         try:
             with self.Session() as sess, sess.begin():
-                # get all sessions
-                stmt = select(self.table)
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                if agent_id is not None:
-                    stmt = stmt.where(self.table.c.agent_id == agent_id)
-                # order by created_at desc
-                stmt = stmt.order_by(self.table.c.created_at.desc())
-                # execute query
-                rows = sess.execute(stmt).fetchall()
-                return [AgentSession.from_dict(row._mapping) for row in rows] if rows is not None else []  # type: ignore
+                return self.read_sessions(sess, user_id=user_id, agent_id=agent_id)
         except Exception as e:
             logger.debug(f"Exception reading from table: {e}")
             logger.debug(f"Table does not exist: {self.table.name}")
@@ -241,6 +642,87 @@ class PostgresAgentStorage(AgentStorage):
             self.create()
         return []
 
+    def list_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[AgentSessionSummary], Optional[str]]:
+        """
+        List sessions newest first, with only their id, name, title and creation time.
+        Version 1 tables do not store the title, so it is computed from the memory of every session.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            agent_id (Optional[str]): The ID of the agent to filter by.
+            limit (Optional[int]): Maximum number of sessions to return, all sessions are returned if None.
+            cursor (Optional[str]): Cursor returned with the previous page.
+
+        Returns:
+            The page of session summaries and the cursor for the next page, which is None on the last page.
+        """
+        if self.schema_version == 1:
+            return super().list_session_summaries(user_id=user_id, agent_id=agent_id, limit=limit, cursor=cursor)
+
+        try:
+            with self.Session() as sess:
+                return self.read_session_summaries(sess, user_id=user_id, agent_id=agent_id, limit=limit, cursor=cursor)
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            self.create()
+        return [], None
+
+    def read_session_summaries(
+        self,
+        sess: Session,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[AgentSessionSummary], Optional[str]]:
+        """
+        Read a page of session summaries from the version 2 session table using the given database session.
+
+        Args:
+            sess (Session): The database session to use.
+            user_id (Optional[str]): The ID of the user to filter by.
+            agent_id (Optional[str]): The ID of the agent to filter by.
+            limit (Optional[int]): Maximum number of sessions to return, all sessions are returned if None.
+            cursor (Optional[str]): Cursor returned with the previous page.
+
+        Returns:
+            The page of session summaries and the cursor for the next page, which is None on the last page.
+        """
+        created_at = func.coalesce(self.table.c.created_at, 0)
+        stmt = select(self.table.c.session_id, self.table.c.session_name, self.table.c.title, self.table.c.created_at)
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if agent_id is not None:
+            stmt = stmt.where(self.table.c.agent_id == agent_id)
+        if cursor is not None:
+            cursor_created_at, cursor_session_id = parse_session_cursor(cursor)
+            stmt = stmt.where(
+                or_(
+                    created_at < cursor_created_at,
+                    and_(created_at == cursor_created_at, self.table.c.session_id < cursor_session_id),
+                )
+            )
+        stmt = stmt.order_by(created_at.desc(), self.table.c.session_id.desc())
+        if limit is not None:
+            # Read one more row to know if there is a next page
+            stmt = stmt.limit(limit + 1)
+
+        summaries = [
+            AgentSessionSummary(session_id=row[0], session_name=row[1], title=row[2], created_at=row[3])
+            for row in sess.execute(stmt).fetchall()
+        ]
+        if limit is not None and len(summaries) > limit:
+            return summaries[:limit], summaries[limit - 1].cursor
+        return summaries, None
+
     def upsert(self, session: AgentSession, create_and_retry: bool = True) -> Optional[AgentSession]:
         """
         Insert or update an AgentSession in the database.
@@ -254,33 +736,7 @@ class PostgresAgentStorage(AgentStorage):
         """
         try:
             with self.Session() as sess, sess.begin():
-                # Create an insert statement
-                stmt = postgresql.insert(self.table).values(
-                    session_id=session.session_id,
-                    agent_id=session.agent_id,
-                    user_id=session.user_id,
-                    memory=session.memory,
-                    agent_data=session.agent_data,
-                    session_data=session.session_data,
-                    extra_data=session.extra_data,
-                )
-
-                # Define the upsert if the session_id already exists
-                # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["session_id"],
-                    set_=dict(
-                        agent_id=session.agent_id,
-                        user_id=session.user_id,
-                        memory=session.memory,
-                        agent_data=session.agent_data,
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                        updated_at=int(time.time()),
-                    ),  # The updated value for each column
-                )
-
-                sess.execute(stmt)
+                self.write_session(sess, session)
         except Exception as e:
             logger.debug(f"Exception upserting into table: {e}")
             if create_and_retry and not self.table_exists():
@@ -289,7 +745,8 @@ class PostgresAgentStorage(AgentStorage):
                 self.create()
                 return self.upsert(session, create_and_retry=False)
             return None
-        return self.read(session_id=session.session_id)
+        # Return the session that was written instead of reading it back
+        return session
 
     def delete_session(self, session_id: Optional[str] = None):
         """
@@ -310,6 +767,9 @@ class PostgresAgentStorage(AgentStorage):
                 # Delete the session with the given session_id
                 delete_stmt = self.table.delete().where(self.table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
+                if self.schema_version == 2:
+                    sess.execute(self.runs_table.delete().where(self.runs_table.c.session_id == session_id))
+                    sess.execute(self.messages_table.delete().where(self.messages_table.c.session_id == session_id))
                 if result.rowcount == 0:
                     logger.debug(f"No session found with session_id: {session_id}")
                 else:
@@ -324,13 +784,51 @@ class PostgresAgentStorage(AgentStorage):
         if self.table_exists():
             logger.debug(f"Deleting table: {self.table_name}")
             self.table.drop(self.db_engine)
+        if self.schema_version == 2:
+            self.runs_table.drop(self.db_engine, checkfirst=True)
+            self.messages_table.drop(self.db_engine, checkfirst=True)
 
     def upgrade_schema(self) -> None:
         """
         Upgrade the schema to the latest version.
-        This method is currently a placeholder and does not perform any actions.
+
+        For schema version 2, adds the session_name and title columns and moves the runs and messages of sessions
+        written with version 1 from the memory column to the append-only tables. Sessions that are not migrated here
+        are migrated the next time they are written.
         """
-        pass
+        if self.schema_version != 2:
+            return
+
+        self.create()
+        with self.Session() as sess:
+            # Sessions that still hold their runs on the session row, or were written before titles were stored
+            stmt = select(self.table.c.session_id).where(
+                or_(self.table.c.memory.has_key("runs"), self.table.c.title.is_(None))
+            )
+            session_ids = [row[0] for row in sess.execute(stmt).fetchall()]
+
+        for session_id in session_ids:
+            with self.Session() as sess, sess.begin():
+                row = sess.execute(
+                    select(self.table.c.memory).where(self.table.c.session_id == session_id).with_for_update()
+                ).fetchone()
+                session = self.read_session(sess, session_id=session_id)
+                if row is None or session is None:
+                    continue
+                # Keep updated_at, the session itself did not change
+                values: Dict[str, Any] = dict(
+                    session_name=session.get_session_name(),
+                    title=session.get_title(),
+                    updated_at=self.table.c.updated_at,
+                )
+                if row[0] is not None and "runs" in row[0]:
+                    memory, runs, runs_offset, messages = session.split_memory()
+                    self.append_history(
+                        sess, session_id=session_id, runs=runs, runs_offset=runs_offset, messages=messages
+                    )
+                    values["memory"] = memory
+                sess.execute(self.table.update().where(self.table.c.session_id == session_id).values(**values))
+        logger.debug(f"Migrated {len(session_ids)} sessions to schema version 2")
 
     def __deepcopy__(self, memo):
         """
@@ -351,10 +849,10 @@ class PostgresAgentStorage(AgentStorage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"metadata", "table", "inspector"}:
+            if k in {"metadata", "table", "runs_table", "messages_table", "inspector"}:
                 continue
-            # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "Session"}:
+            # Reuse the engines and session factories without copying
+            elif k in {"db_engine", "Session", "async_db_engine", "AsyncSession"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
@@ -363,5 +861,7 @@ class PostgresAgentStorage(AgentStorage):
         copied_obj.metadata = MetaData(schema=copied_obj.schema)
         copied_obj.inspector = inspect(copied_obj.db_engine)
         copied_obj.table = copied_obj.get_table()
+        copied_obj.runs_table = copied_obj.get_runs_table()
+        copied_obj.messages_table = copied_obj.get_messages_table()
 
         return copied_obj
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass
-from typing import Any, Dict, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from agno.utils.log import logger
 
@@ -32,6 +32,55 @@ class AgentSession:
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
+    def split_memory(self) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]], int, List[Dict[str, Any]]]:
+        """Split the memory into the part stored on the session row and the runs and messages stored as their own rows.
+
+        Returns:
+            The session memory, the runs, the index of the first run in the session and the messages.
+        """
+        if self.memory is None:
+            return None, [], 0, []
+        memory = dict(self.memory)
+        runs = memory.pop("runs", None) or []
+        runs_offset = memory.pop("runs_offset", 0)
+        messages = memory.pop("messages", None) or []
+        return memory, runs, runs_offset, messages
+
+    def get_session_name(self) -> Optional[str]:
+        return self.session_data.get("session_name") if self.session_data is not None else None
+
+    def get_title(self) -> Optional[str]:
+        """Returns the title used when listing sessions: the session name, or the first user message of the session.
+
+        Returns None if neither is known, e.g. when the first run of the session is not loaded.
+        """
+        session_name = self.get_session_name()
+        if session_name is not None:
+            return session_name
+        if self.memory is None or self.memory.get("runs_offset", 0) > 0:
+            return None
+
+        from agno.models.message import Message
+
+        runs = self.memory.get("runs") or self.memory.get("chats")
+        if isinstance(runs, list):
+            for _run in runs:
+                try:
+                    message = _run.get("message")
+                    if message is not None and message.get("role") == "user":
+                        return Message.model_validate(message).get_content_string() or "No title"
+                except Exception as e:
+                    logger.error(f"Error parsing run: {e}")
+        return None
+
+    def get_summary(self) -> AgentSessionSummary:
+        return AgentSessionSummary(
+            session_id=self.session_id,
+            session_name=self.get_session_name(),
+            title=self.get_title(),
+            created_at=self.created_at,
+        )
+
     def monitoring_data(self) -> Dict[str, Any]:
         # Google Gemini adds a "parts" field to the messages, which is not serializable
         # If the provider is Google, remove the "parts" from the messages
@@ -77,3 +126,44 @@ class AgentSession:
             created_at=data.get("created_at"),
             updated_at=data.get("updated_at"),
         )
+
+
+@dataclass
+class AgentSessionSummary:
+    """Lightweight view of an AgentSession used for listing sessions"""
+
+    session_id: str
+    session_name: Optional[str] = None
+    # Session name or the first user message of the session
+    title: Optional[str] = None
+    created_at: Optional[int] = None
+
+    @property
+    def cursor(self) -> str:
+        """Opaque cursor pointing after this session when listing sessions"""
+        return f"{self.created_at or 0}:{self.session_id}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def parse_session_cursor(cursor: str) -> Tuple[int, str]:
+    """Returns the created_at and session_id encoded in a cursor from `AgentSessionSummary.cursor`"""
+    created_at, _, session_id = cursor.partition(":")
+    try:
+        return int(created_at), session_id
+    except ValueError:
+        raise ValueError(f"Invalid session cursor: {cursor}")
+
+
+def paginate_session_summaries(
+    summaries: List[AgentSessionSummary], limit: Optional[int] = None, cursor: Optional[str] = None
+) -> Tuple[List[AgentSessionSummary], Optional[str]]:
+    """Sort session summaries newest first and return the page after `cursor`, with the cursor for the next page"""
+    summaries = sorted(summaries, key=lambda summary: (summary.created_at or 0, summary.session_id), reverse=True)
+    if cursor is not None:
+        after = parse_session_cursor(cursor)
+        summaries = [summary for summary in summaries if (summary.created_at or 0, summary.session_id) < after]
+    if limit is None or len(summaries) <= limit:
+        return summaries, None
+    return summaries[:limit], summaries[limit - 1].cursor
@@ -1,4 +1,8 @@
-from typing import Any, Callable, Dict, Optional, Type, TypeVar, get_type_hints
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
+from types import MethodType
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Type, TypeVar, get_type_hints
 
 from docstring_parser import parse
 from pydantic import BaseModel, Field, validate_call
@@ -28,6 +32,124 @@ def get_entrypoint_docstring(entrypoint: Callable) -> str:
     return "\n".join(lines)
 
 
+def get_entrypoint_parameters(c: Callable, strict: bool = False, name: Optional[str] = None) -> Dict[str, Any]:
+    """Build the JSON schema for the parameters of a callable from its signature, type hints and docstring."""
+    from inspect import getdoc, signature
+
+    from agno.utils.json_schema import get_json_schema
+
+    parameters: Dict[str, Any] = {"type": "object", "properties": {}, "required": []}
+    try:
+        sig = signature(c)
+        type_hints = get_type_hints(c)
+
+        # If function has an the agent argument, remove the agent parameter from the type hints
+        if "agent" in sig.parameters:
+            del type_hints["agent"]
+
+        # Filter out return type and only process parameters
+        param_type_hints = {
+            name: type_hints.get(name) for name in sig.parameters if name != "return" and name != "agent"
+        }
+
+        # Parse docstring for parameters
+        param_descriptions = {}
+        if docstring := getdoc(c):
+            parsed_doc = parse(docstring)
+            param_docs = parsed_doc.params
+
+            if param_docs is not None:
+                for param in param_docs:
+                    param_name = param.arg_name
+                    param_type = param.type_name
+
+                    # TODO: We should use type hints first, then map param types in docs to json schema types.
+                    # This is temporary to not lose information
+                    param_descriptions[param_name] = f"({param_type}) {param.description}"
+
+        # Get JSON schema for parameters only
+        parameters = get_json_schema(type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict)
+
+        # If strict=True mark all fields as required
+        # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
+        if strict:
+            parameters["required"] = [name for name in parameters["properties"] if name != "agent"]
+        else:
+            # Mark a field as required if it has no default value
+            parameters["required"] = [
+                name
+                for name, param in sig.parameters.items()
+                if param.default == param.empty and name != "self" and name != "agent"
+            ]
+    except Exception as e:
+        logger.warning(f"Could not parse args for {name or getattr(c, '__name__', c)}: {e}", exc_info=True)
+
+    return parameters
+
+
+class CompiledFunction(NamedTuple):
+    description: str
+    parameters: Dict[str, Any]
+    # Entrypoint wrapped with pydantic's validate_call. For methods this wraps the underlying function.
+    entrypoint: Callable
+
+
+# Compiled schemas of plain functions, so every Agent copy reuses the same introspection and validate_call wrapper.
+# Closures are not cached: the wrapper references the closure and everything it captures, such as the member agents
+# of a team, and closures are usually created per request. Entries are evicted least recently used first, so
+# functions defined at runtime without a closure do not accumulate either.
+_MAX_COMPILED_FUNCTIONS = 1024
+_compiled_functions: "OrderedDict[Tuple[Callable, bool, bool], CompiledFunction]" = OrderedDict()
+_compiled_functions_lock = Lock()
+
+
+def get_compiled_function(
+    c: Callable, strict: bool = False, name: Optional[str] = None
+) -> Tuple[str, Dict[str, Any], Callable]:
+    """Returns the description, parameters schema and validated entrypoint for a callable.
+
+    Results of plain functions are cached per function and strict flag. Bound methods share the entry of their
+    function and are re-bound to their instance, and an already validated entrypoint is not wrapped again.
+    """
+    is_method = isinstance(c, MethodType)
+    target: Callable = c.__func__ if is_method else c  # type: ignore
+    # An entrypoint already wrapped by validate_call keeps the function it wraps
+    raw_function: Optional[Callable] = getattr(target, "raw_function", None)
+    function = raw_function if raw_function is not None else target
+    key = (function, strict, is_method)
+    cacheable = getattr(function, "__closure__", None) is None
+
+    compiled: Optional[CompiledFunction] = None
+    if cacheable:
+        try:
+            with _compiled_functions_lock:
+                compiled = _compiled_functions.get(key)
+                if compiled is not None:
+                    _compiled_functions.move_to_end(key)
+        except TypeError:
+            # Unhashable callables are not cached
+            cacheable = False
+
+    if compiled is None:
+        compiled = CompiledFunction(
+            description=get_entrypoint_docstring(entrypoint=c),
+            parameters=get_entrypoint_parameters(c, strict=strict, name=name),
+            entrypoint=target
+            if raw_function is not None
+            else validate_call(target, config=dict(arbitrary_types_allowed=True)),  # type: ignore
+        )
+        if cacheable:
+            with _compiled_functions_lock:
+                _compiled_functions[key] = compiled
+                if len(_compiled_functions) > _MAX_COMPILED_FUNCTIONS:
+                    _compiled_functions.popitem(last=False)
+
+    entrypoint = compiled.entrypoint
+    if is_method:
+        entrypoint = MethodType(entrypoint, c.__self__)  # type: ignore
+    return compiled.description, deepcopy(compiled.parameters), entrypoint
+
+
 class Function(BaseModel):
     """Model for storing functions that can be called by an agent."""
 
@@ -68,137 +190,30 @@ class Function(BaseModel):
 
     @classmethod
     def from_callable(cls, c: Callable, strict: bool = False) -> "Function":
-        from inspect import getdoc, signature
-
-        from agno.utils.json_schema import get_json_schema
-
-        function_name = c.__name__
-        parameters = {"type": "object", "properties": {}, "required": []}
-        try:
-            sig = signature(c)
-            type_hints = get_type_hints(c)
-
-            # If function has an the agent argument, remove the agent parameter from the type hints
-            if "agent" in sig.parameters:
-                del type_hints["agent"]
-            # logger.info(f"Type hints for {function_name}: {type_hints}")
-
-            # Filter out return type and only process parameters
-            param_type_hints = {
-                name: type_hints.get(name) for name in sig.parameters if name != "return" and name != "agent"
-            }
-
-            # Parse docstring for parameters
-            param_descriptions = {}
-            if docstring := getdoc(c):
-                parsed_doc = parse(docstring)
-                param_docs = parsed_doc.params
-
-                if param_docs is not None:
-                    for param in param_docs:
-                        param_name = param.arg_name
-                        param_type = param.type_name
-
-                        param_descriptions[param_name] = f"({param_type}) {param.description}"
-
-            # Get JSON schema for parameters only
-            parameters = get_json_schema(
-                type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict
-            )
-
-            # If strict=True mark all fields as required
-            # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
-            if strict:
-                parameters["required"] = [name for name in parameters["properties"] if name != "agent"]
-            else:
-                # Mark a field as required if it has no default value
-                parameters["required"] = [
-                    name
-                    for name, param in sig.parameters.items()
-                    if param.default == param.empty and name != "self" and name != "agent"
-                ]
-
-            # logger.debug(f"JSON schema for {function_name}: {parameters}")
-        except Exception as e:
-            logger.warning(f"Could not parse args for {function_name}: {e}", exc_info=True)
-
+        description, parameters, entrypoint = get_compiled_function(c, strict=strict)
         return cls(
-            name=function_name,
-            description=get_entrypoint_docstring(entrypoint=c),
+            name=c.__name__,
+            description=description,
             parameters=parameters,
-            entrypoint=validate_call(c, config=dict(arbitrary_types_allowed=True)),  # type: ignore
+            entrypoint=entrypoint,
         )
 
     def process_entrypoint(self, strict: bool = False):
         """Process the entrypoint and make it ready for use by an agent."""
-        from inspect import getdoc, signature
-
-        from agno.utils.json_schema import get_json_schema
-
         if self.entrypoint is None:
             return
 
-        parameters = {"type": "object", "properties": {}, "required": []}
-
         params_set_by_user = False
         # If the user set the parameters (i.e. they are different from the default), we should keep them
-        if self.parameters != parameters:
+        if self.parameters != {"type": "object", "properties": {}, "required": []}:
             params_set_by_user = True
 
-        try:
-            sig = signature(self.entrypoint)
-            type_hints = get_type_hints(self.entrypoint)
-
-            # If function has an the agent argument, remove the agent parameter from the type hints
-            if "agent" in sig.parameters:
-                del type_hints["agent"]
-            # logger.info(f"Type hints for {self.name}: {type_hints}")
-
-            # Filter out return type and only process parameters
-            param_type_hints = {
-                name: type_hints.get(name) for name in sig.parameters if name != "return" and name != "agent"
-            }
-
-            # Parse docstring for parameters
-            param_descriptions = {}
-            if docstring := getdoc(self.entrypoint):
-                parsed_doc = parse(docstring)
-                param_docs = parsed_doc.params
-
-                if param_docs is not None:
-                    for param in param_docs:
-                        param_name = param.arg_name
-                        param_type = param.type_name
-
-                        # TODO: We should use type hints first, then map param types in docs to json schema types.
-                        # This is temporary to not lose information
-                        param_descriptions[param_name] = f"({param_type}) {param.description}"
-
-            # Get JSON schema for parameters only
-            parameters = get_json_schema(
-                type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict
-            )
-
-            # If strict=True mark all fields as required
-            # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
-            if strict:
-                parameters["required"] = [name for name in parameters["properties"] if name != "agent"]
-            else:
-                # Mark a field as required if it has no default value
-                parameters["required"] = [
-                    name
-                    for name, param in sig.parameters.items()
-                    if param.default == param.empty and name != "self" and name != "agent"
-                ]
-
-            # logger.debug(f"JSON schema for {self.name}: {parameters}")
-        except Exception as e:
-            logger.warning(f"Could not parse args for {self.name}: {e}", exc_info=True)
-
-        self.description = self.description or get_entrypoint_docstring(self.entrypoint)
+        description, parameters, entrypoint = get_compiled_function(self.entrypoint, strict=strict, name=self.name)
+
+        self.description = self.description or description
         if not params_set_by_user:
             self.parameters = parameters
-        self.entrypoint = validate_call(self.entrypoint, config=dict(arbitrary_types_allowed=True))  # type: ignore
+        self.entrypoint = entrypoint
 
     def get_type_name(self, t: Type[T]):
         name = str(t)
@@ -1,6 +1,136 @@
 """Módulo para contagem de tokens."""
 
-import tiktoken
+from threading import Lock
+from typing import Any, Dict, List, Sequence
+
+from agno.utils.log import logger
+
+
+class TokenEncoder:
+    """Interface comum aos tokenizadores usados para contar e dividir tokens."""
+
+    def encode(self, text: str) -> List[int]:
+        raise NotImplementedError
+
+    def encode_batch(self, texts: Sequence[str]) -> List[List[int]]:
+        return [self.encode(text) for text in texts]
+
+    def token_offsets(self, text: str) -> List[int]:
+        """
+        Retorna a posição, em caracteres, do início de cada token do texto.
+
+        Args:
+            text: Texto a ser tokenizado
+
+        Returns:
+            Posição no texto do início de cada token
+        """
+        raise NotImplementedError
+
+
+class TiktokenEncoder(TokenEncoder):
+    """Tokenizador tiktoken, usado pelos modelos da OpenAI."""
+
+    def __init__(self, encoding: Any):
+        self.encoding = encoding
+
+    def encode(self, text: str) -> List[int]:
+        # Tokens especiais no texto são contados como texto comum
+        return self.encoding.encode(text, disallowed_special=())
+
+    def encode_batch(self, texts: Sequence[str]) -> List[List[int]]:
+        return self.encoding.encode_batch(list(texts), disallowed_special=())
+
+    def token_offsets(self, text: str) -> List[int]:
+        _, offsets = self.encoding.decode_with_offsets(self.encode(text))
+        return offsets
+
+
+class HuggingFaceEncoder(TokenEncoder):
+    """Tokenizador da biblioteca tokenizers, da Hugging Face."""
+
+    def __init__(self, tokenizer: Any):
+        self.tokenizer = tokenizer
+
+    def encode(self, text: str) -> List[int]:
+        return self.tokenizer.encode(text, add_special_tokens=False).ids
+
+    def encode_batch(self, texts: Sequence[str]) -> List[List[int]]:
+        return [encoding.ids for encoding in self.tokenizer.encode_batch(list(texts), add_special_tokens=False)]
+
+    def token_offsets(self, text: str) -> List[int]:
+        return [start for start, _ in self.tokenizer.encode(text, add_special_tokens=False).offsets]
+
+
+# Tokenizadores já carregados, compartilhados por todo o processo
+_encoders: Dict[str, TokenEncoder] = {}
+_encoders_lock = Lock()
+
+
+def register_encoder(model: str, encoder: TokenEncoder) -> None:
+    """
+    Registra o tokenizador de um modelo, usado no lugar do tiktoken ou da Hugging Face.
+
+    Args:
+        model: Nome do modelo
+        encoder: Tokenizador do modelo
+    """
+    with _encoders_lock:
+        _encoders[model] = encoder
+
+
+def get_encoder(model: str = "gpt-3.5-turbo") -> TokenEncoder:
+    """
+    Retorna o tokenizador de um modelo, carregado uma única vez por processo.
+
+    Modelos da OpenAI e nomes de encodings usam o tiktoken, modelos do Hugging Face Hub ("organizacao/modelo")
+    usam a biblioteca tokenizers. Outros modelos usam o encoding cl100k_base.
+
+    Args:
+        model: Nome do modelo
+
+    Returns:
+        Tokenizador do modelo
+    """
+    encoder = _encoders.get(model)
+    if encoder is None:
+        with _encoders_lock:
+            encoder = _encoders.get(model)
+            if encoder is None:
+                encoder = _load_encoder(model)
+                _encoders[model] = encoder
+    return encoder
+
+
+def _load_encoder(model: str) -> TokenEncoder:
+    try:
+        import tiktoken
+    except ImportError:
+        tiktoken = None
+
+    if tiktoken is not None:
+        try:
+            return TiktokenEncoder(tiktoken.encoding_for_model(model))
+        except KeyError:
+            pass
+        if model in tiktoken.list_encoding_names():
+            return TiktokenEncoder(tiktoken.get_encoding(model))
+
+    if "/" in model:
+        try:
+            from tokenizers import Tokenizer
+
+            return HuggingFaceEncoder(Tokenizer.from_pretrained(model))
+        except Exception as e:
+            if tiktoken is None:
+                raise ImportError(
+                    f"Could not load the tokenizer of {model}. Please install tokenizers via `pip install tokenizers`."
+                ) from e
+            logger.warning(f"Could not load the tokenizer of {model}, counting tokens with cl100k_base: {e}")
+
+    if tiktoken is None:
+        raise ImportError("`tiktoken` not installed. Please install it via `pip install tiktoken`.")
+    return TiktokenEncoder(tiktoken.get_encoding("cl100k_base"))
 
 
 def count_tokens(text: str, model: str = "gpt-3.5-turbo") -> int:
@@ -14,9 +144,18 @@ def count_tokens(text: str, model: str = "gpt-3.5-turbo") -> int:
     Returns:
         Número de tokens no texto
     """
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        encoding = tiktoken.get_encoding("cl100k_base")
+    return len(get_encoder(model).encode(text))
+
 
-    return len(encoding.encode(text))
+def count_tokens_batch(texts: Sequence[str], model: str = "gpt-3.5-turbo") -> List[int]:
+    """
+    Conta o número de tokens de vários textos de uma vez.
+
+    Args:
+        texts: Textos para contar tokens
+        model: Nome do modelo para usar o encoding apropriado
+
+    Returns:
+        Número de tokens de cada texto
+    """
+    return [len(tokens) for tokens in get_encoder(model).encode_batch(texts)]
@@ -1,12 +1,43 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from functools import wraps
+from hashlib import md5
+from typing import Any, Callable, Dict, List, Optional, Set
 
 from agno.document import Document
 
+# Methods that change the contents of a vector db, wrapped in every subclass to bump its generation
+_WRITE_METHODS = ("insert", "upsert", "delete", "delete_hashes", "drop")
+
+
+def _bumps_generation(method: Callable) -> Callable:
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            # Bumped even if the write failed, it may have been applied partially
+            self._generation = getattr(self, "_generation", 0) + 1
+
+    wrapper._bumps_generation = True  # type: ignore
+    return wrapper
+
 
 class VectorDb(ABC):
     """Base class for Vector Databases"""
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in _WRITE_METHODS:
+            method = cls.__dict__.get(name)
+            if method is not None and not getattr(method, "_bumps_generation", False):
+                setattr(cls, name, _bumps_generation(method))
+
+    @property
+    def generation(self) -> int:
+        """Number of writes made to the vector db by this process, used to invalidate cached search results"""
+        return getattr(self, "_generation", 0)
+
     @abstractmethod
     def create(self) -> None:
         raise NotImplementedError
@@ -22,6 +53,19 @@ class VectorDb(ABC):
     def id_exists(self, id: str) -> bool:
         raise NotImplementedError
 
+    def content_hash(self, document: Document) -> str:
+        """Hash of the document content, as stored by the vector db to identify documents"""
+        cleaned_content = document.content.replace("\x00", "\ufffd")
+        return md5(cleaned_content.encode()).hexdigest()
+
+    def existing_hashes(self, hashes: List[str]) -> Set[str]:
+        """Returns the content hashes that already exist in the vector db, checked with bulk queries"""
+        raise NotImplementedError
+
+    def delete_hashes(self, hashes: List[str]) -> None:
+        """Deletes the documents with the given content hashes"""
+        raise NotImplementedError
+
     @abstractmethod
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         raise NotImplementedError
@@ -37,6 +81,20 @@ class VectorDb(ABC):
     def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         raise NotImplementedError
 
+    def search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """Search for several queries, returning the results of each query in the order of the queries.
+
+        Vector dbs that can embed the queries in one batch and search them in a single request override this,
+        the default searches one query at a time.
+        """
+        return [self.search(query=query, limit=limit, filters=filters) for query in queries]
+
+    async def asearch(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """Async variant of `search`. Vector dbs without an async client run the search in a worker thread."""
+        return await asyncio.to_thread(self.search, query, limit, filters)
+
     def vector_search(self, query: str, limit: int = 5) -> List[Document]:
         raise NotImplementedError
 
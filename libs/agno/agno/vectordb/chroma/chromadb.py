@@ -1,5 +1,6 @@
+import asyncio
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from chromadb import Client as ChromaDbClient
@@ -101,6 +102,34 @@ class ChromaDb(VectorDb):
                 logger.error(f"Document does not exist: {e}")
         return False
 
+    def existing_hashes(self, hashes: List[str]) -> Set[str]:
+        """Get the content hashes that already exist in the collection.
+        Args:
+            hashes (List[str]): Content hashes to check.
+        Returns:
+            Set[str]: Content hashes that exist in the collection.
+        """
+        existing: Set[str] = set()
+        if self.client:
+            try:
+                collection: Collection = self.client.get_collection(name=self.collection)
+                for i in range(0, len(hashes), 1000):
+                    collection_data: GetResult = collection.get(ids=hashes[i : i + 1000], include=[])
+                    existing.update(collection_data.get("ids", []))
+            except Exception as e:
+                logger.error(f"Error checking if documents exist: {e}")
+        return existing
+
+    def delete_hashes(self, hashes: List[str]) -> None:
+        """Delete the documents with the given content hashes.
+        Args:
+            hashes (List[str]): Content hashes to delete.
+        """
+        if self.client:
+            collection: Collection = self.client.get_collection(name=self.collection)
+            for i in range(0, len(hashes), 1000):
+                collection.delete(ids=hashes[i : i + 1000])
+
     def name_exists(self, name: str) -> bool:
         """Check if a document with a given name exists in the collection.
         Args:
@@ -129,8 +158,8 @@ class ChromaDb(VectorDb):
         docs: List = []
         docs_embeddings: List = []
 
+        Document.embed_batch(documents, self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             docs_embeddings.append(document.embedding)
@@ -160,8 +189,8 @@ class ChromaDb(VectorDb):
         docs: List = []
         docs_embeddings: List = []
 
+        Document.embed_batch(documents, self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             docs_embeddings.append(document.embedding)
@@ -190,23 +219,63 @@ class ChromaDb(VectorDb):
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
+        return self._query([query], [query_embedding], limit=limit)[0]
+
+    async def asearch(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """Search the collection for a query without blocking the event loop.
+
+        The query is embedded with the async embedder. The collection is queried in a worker thread,
+        as the Chroma clients used here run in-process and the async Chroma client requires a server.
+
+        Args:
+            query (str): Query to search for.
+            limit (int): Number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply while searching.
+        Returns:
+            List[Document]: List of search results.
+        """
+        query_embedding = await self.embedder.aget_embedding(query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+        return (await asyncio.to_thread(self._query, [query], [query_embedding], limit))[0]
+
+    def search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """Search the collection for several queries, embedded in one batch and sent in a single query.
+
+        Args:
+            queries (List[str]): Queries to search for.
+            limit (int): Number of results to return for each query.
+            filters (Optional[Dict[str, Any]]): Filters to apply while searching.
+        Returns:
+            List[List[Document]]: Search results of each query, in the order of the queries.
+        """
+        if len(queries) == 0:
+            return []
+        query_embeddings, _ = self.embedder.get_embeddings_batch(queries)
+        return self._query(queries, query_embeddings, limit=limit)
 
+    def _query(self, queries: List[str], query_embeddings: List[List[float]], limit: int = 5) -> List[List[Document]]:
         if not self._collection:
             self._collection = self.client.get_collection(name=self.collection)
 
         result: QueryResult = self._collection.query(
-            query_embeddings=query_embedding,
+            query_embeddings=query_embeddings,  # type: ignore
             n_results=limit,
         )
+        return [self._build_search_results(query, result, index) for index, query in enumerate(queries)]
 
-        # Build search results
+    def _build_search_results(self, query: str, result: QueryResult, index: int = 0) -> List[Document]:
+        """Build the search results of the query at `index` in a query result"""
         search_results: List[Document] = []
 
-        ids = result.get("ids", [[]])[0]
-        metadata = result.get("metadatas", [[]])[0]  # type: ignore
-        documents = result.get("documents", [[]])[0]  # type: ignore
+        ids = result.get("ids", [[]])[index]
+        metadata = result.get("metadatas", [[]])[index]  # type: ignore
+        documents = result.get("documents", [[]])[index]  # type: ignore
         embeddings = result.get("embeddings")
-        distances = result.get("distances", [[]])[0]  # type: ignore
+        distances = result.get("distances", [[]])[index]  # type: ignore
         uris = result.get("uris")
         data = result.get("data")
         metadata["distances"] = distances  # type: ignore
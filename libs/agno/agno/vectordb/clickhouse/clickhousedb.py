@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from agno.vectordb.clickhouse.index import HNSW
 
@@ -142,6 +142,39 @@ class Clickhouse(VectorDb):
         )
         return bool(result.result_rows)
 
+    def existing_hashes(self, hashes: List[str]) -> Set[str]:
+        """
+        Get the content hashes that already exist in the table
+
+        Args:
+            hashes (List[str]): Content hashes to check
+        """
+        existing: Set[str] = set()
+        for i in range(0, len(hashes), 1000):
+            parameters = self._get_base_parameters()
+            parameters["content_hashes"] = hashes[i : i + 1000]
+            result = self.client.query(
+                "SELECT content_hash FROM {database_name:Identifier}.{table_name:Identifier} WHERE content_hash IN {content_hashes:Array(String)}",
+                parameters=parameters,
+            )
+            existing.update(row[0] for row in result.result_rows)
+        return existing
+
+    def delete_hashes(self, hashes: List[str]) -> None:
+        """
+        Delete the rows with the given content hashes
+
+        Args:
+            hashes (List[str]): Content hashes to delete
+        """
+        for i in range(0, len(hashes), 1000):
+            parameters = self._get_base_parameters()
+            parameters["content_hashes"] = hashes[i : i + 1000]
+            self.client.command(
+                "DELETE FROM {database_name:Identifier}.{table_name:Identifier} WHERE content_hash IN {content_hashes:Array(String)}",
+                parameters=parameters,
+            )
+
     def name_exists(self, name: str) -> bool:
         """
         Validate if a row with this name exists or not
@@ -180,8 +213,8 @@ class Clickhouse(VectorDb):
         filters: Optional[Dict[str, Any]] = None,
     ) -> None:
         rows: List[List[Any]] = []
+        Document.embed_batch(documents, self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             content_hash = md5(cleaned_content.encode()).hexdigest()
             _id = document.id or content_hash
@@ -1,6 +1,7 @@
 import json
+from datetime import timedelta
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     import lancedb
@@ -50,7 +51,10 @@ class LanceDb(VectorDb):
 
         # LanceDB connection details
         self.uri: lancedb.URI = uri
+        self.api_key: Optional[str] = api_key
         self.connection: lancedb.LanceDBConnection = connection or lancedb.connect(uri=self.uri, api_key=api_key)
+        # Async table used by `asearch`, opened on first use
+        self._async_table: Optional[lancedb.table.AsyncTable] = None
 
         self.table: Optional[lancedb.db.LanceTable] = table
         self.table_name: Optional[str] = table_name
@@ -101,6 +105,7 @@ class LanceDb(VectorDb):
         """Create the table if it does not exist."""
         if not self.exists():
             self.connection = self._init_table()  # Connection update is needed
+            self._async_table = None
 
     def _init_table(self) -> lancedb.db.LanceTable:
         schema = pa.schema(
@@ -135,6 +140,42 @@ class LanceDb(VectorDb):
             return len(result) > 0
         return False
 
+    def existing_hashes(self, hashes: List[str]) -> Set[str]:
+        """
+        Get the content hashes that already exist in the table
+
+        Args:
+            hashes (List[str]): Content hashes to check
+        """
+        existing: Set[str] = set()
+        if self.table is None:
+            return existing
+        for i in range(0, len(hashes), 1000):
+            batch_hashes = hashes[i : i + 1000]
+            ids = ", ".join(f"'{doc_id}'" for doc_id in batch_hashes)
+            result = (
+                self.table.search()
+                .where(f"{self._id} IN ({ids})")
+                .select([self._id])
+                .limit(len(batch_hashes))
+                .to_arrow()
+            )
+            existing.update(result[self._id].to_pylist())
+        return existing
+
+    def delete_hashes(self, hashes: List[str]) -> None:
+        """
+        Delete the documents with the given content hashes
+
+        Args:
+            hashes (List[str]): Content hashes to delete
+        """
+        if self.table is None:
+            return
+        for i in range(0, len(hashes), 1000):
+            ids = ", ".join(f"'{doc_id}'" for doc_id in hashes[i : i + 1000])
+            self.table.delete(f"{self._id} IN ({ids})")
+
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """
         Insert documents into the database.
@@ -149,8 +190,8 @@ class LanceDb(VectorDb):
             logger.debug("No documents to insert")
             return
 
+        Document.embed_batch(documents, self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
@@ -226,6 +267,47 @@ class LanceDb(VectorDb):
 
         return search_results
 
+    async def asearch(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """Search without blocking the event loop.
+
+        Vector search uses the async LanceDB API. Keyword and hybrid search need the full-text index
+        of the sync table and run in a worker thread.
+        """
+        if self.search_type != SearchType.vector:
+            return await super().asearch(query=query, limit=limit, filters=filters)
+
+        query_embedding = await self.embedder.aget_embedding(query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        if self.table is None:
+            logger.error("Table not initialized. Please create the table first")
+            return []
+
+        table = await self.get_async_table()
+        results = table.vector_search(query_embedding).column(self._vector_col).limit(limit)
+        if self.nprobes:
+            results = results.nprobes(self.nprobes)
+
+        search_results = self._build_search_results(await results.to_pandas())
+
+        if self.reranker:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+
+        return search_results
+
+    async def get_async_table(self) -> "lancedb.table.AsyncTable":
+        if self._async_table is None:
+            # Check for a newer version of the table on every read, so writes made through the sync table are seen
+            async_connection = await lancedb.connect_async(
+                uri=getattr(self.connection, "uri", self.uri),
+                api_key=self.api_key,
+                read_consistency_interval=timedelta(0),
+            )
+            self._async_table = await async_connection.open_table(self.table_name)
+        return self._async_table
+
     def hybrid_search(self, query: str, limit: int = 5) -> List[Document]:
         query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
@@ -307,6 +389,7 @@ class LanceDb(VectorDb):
         if self.exists():
             logger.debug(f"Deleting collection: {self.table_name}")
             self.connection.drop_table(self.table_name)
+            self._async_table = None
 
     def exists(self) -> bool:
         if self.connection:
@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from pymilvus import MilvusClient  # type: ignore
@@ -102,6 +102,35 @@ class Milvus(VectorDb):
             return len(collection_points) > 0
         return False
 
+    def existing_hashes(self, hashes: List[str]) -> Set[str]:
+        """
+        Get the content hashes that already exist in the collection
+
+        Args:
+            hashes (List[str]): Content hashes to check
+        """
+        existing: Set[str] = set()
+        if self.client:
+            for i in range(0, len(hashes), 1000):
+                collection_points = self.client.get(
+                    collection_name=self.collection,
+                    ids=hashes[i : i + 1000],
+                    output_fields=["id"],
+                )
+                existing.update(point["id"] for point in collection_points)
+        return existing
+
+    def delete_hashes(self, hashes: List[str]) -> None:
+        """
+        Delete the documents with the given content hashes
+
+        Args:
+            hashes (List[str]): Content hashes to delete
+        """
+        if self.client:
+            for i in range(0, len(hashes), 1000):
+                self.client.delete(collection_name=self.collection, ids=hashes[i : i + 1000])
+
     def name_exists(self, name: str) -> bool:
         """
         Validates if a document with the given name exists in the collection.
@@ -141,8 +170,8 @@ class Milvus(VectorDb):
             batch_size (int): Batch size for inserting documents
         """
         logger.debug(f"Inserting {len(documents)} documents")
+        Document.embed_batch(documents, self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
@@ -177,8 +206,8 @@ class Milvus(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply while upserting
         """
         logger.debug(f"Upserting {len(documents)} documents")
+        Document.embed_batch(documents, self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
@@ -1,5 +1,5 @@
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from agno.document import Document
 from agno.embedder import Embedder
@@ -181,6 +181,23 @@ class MongoDb(VectorDb):
             logger.error(f"Error checking document existence: {e}")
             return False
 
+    def existing_hashes(self, hashes: List[str]) -> Set[str]:
+        """Get the content hashes that already exist in the MongoDB collection."""
+        try:
+            existing: Set[str] = set()
+            for i in range(0, len(hashes), 1000):
+                cursor = self._collection.find({"_id": {"$in": hashes[i : i + 1000]}}, {"_id": 1})
+                existing.update(str(doc["_id"]) for doc in cursor)
+            return existing
+        except Exception as e:
+            logger.error(f"Error checking document existence: {e}")
+            return set()
+
+    def delete_hashes(self, hashes: List[str]) -> None:
+        """Delete the documents with the given content hashes from the MongoDB collection."""
+        for i in range(0, len(hashes), 1000):
+            self._collection.delete_many({"_id": {"$in": hashes[i : i + 1000]}})
+
     def name_exists(self, name: str) -> bool:
         """Check if a document with a given name exists in the collection."""
         try:
@@ -206,6 +223,7 @@ class MongoDb(VectorDb):
         logger.info(f"Inserting {len(documents)} documents")
 
         prepared_docs = []
+        Document.embed_batch(documents, self.embedder)
         for document in documents:
             try:
                 doc_data = self.prepare_doc(document)
@@ -230,6 +248,7 @@ class MongoDb(VectorDb):
         """Upsert documents into the MongoDB collection."""
         logger.info(f"Upserting {len(documents)} documents")
 
+        Document.embed_batch(documents, self.embedder)
         for document in documents:
             try:
                 doc_data = self.prepare_doc(document)
@@ -360,7 +379,8 @@ class MongoDb(VectorDb):
 
     def prepare_doc(self, document: Document) -> Dict[str, Any]:
         """Prepare a document for insertion or upsertion into MongoDB."""
-        document.embed(embedder=self.embedder)
+        if document.embedding is None:
+            document.embed(embedder=self.embedder)
         if document.embedding is None:
             raise ValueError(f"Failed to generate embedding for document: {document.id}")
 
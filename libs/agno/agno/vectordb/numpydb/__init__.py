@@ -0,0 +1,2 @@
+from agno.vectordb.distance import Distance
+from agno.vectordb.numpydb.numpydb import NumpyDb
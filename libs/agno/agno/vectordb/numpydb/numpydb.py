@@ -0,0 +1,821 @@
+import json
+import sqlite3
+from dataclasses import dataclass
+from hashlib import md5
+from pathlib import Path
+from threading import RLock
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("`numpy` not installed. Please install using `pip install numpy`")
+
+from agno.document import Document
+from agno.embedder import Embedder
+from agno.reranker.base import Reranker
+from agno.utils.log import logger
+from agno.vectordb.base import VectorDb
+from agno.vectordb.distance import Distance
+
+# SQLite limits the number of bound parameters per statement, so bulk lookups are chunked
+_SQLITE_MAX_PARAMS = 500
+# Number of rows scored at once, bounds the memory used to convert stored rows to float32
+_CHUNK_ROWS = 65_536
+# Maximum number of rows sampled to train the IVF centroids and PQ codebooks
+_TRAINING_SAMPLE = 50_000
+_KMEANS_ITERATIONS = 10
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the k highest finite scores, best first"""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top], kind="stable")]
+    return top[np.isfinite(scores[top])]
+
+
+def _nearest(data: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Index of the nearest centroid by l2 distance for each row of data"""
+    nearest = np.empty(len(data), dtype=np.int64)
+    centroid_norms = np.einsum("ij,ij->i", centroids, centroids)
+    for start in range(0, len(data), _CHUNK_ROWS):
+        block = data[start : start + _CHUNK_ROWS]
+        nearest[start : start + len(block)] = np.argmax(2 * block @ centroids.T - centroid_norms, axis=1)
+    return nearest
+
+
+def _kmeans(data: np.ndarray, k: int, seed: int = 0) -> np.ndarray:
+    """Train k centroids on the rows of data with Lloyd's algorithm"""
+    rng = np.random.default_rng(seed)
+    centroids = data[rng.choice(len(data), size=k, replace=False)].copy()
+    for _ in range(_KMEANS_ITERATIONS):
+        assignments = _nearest(data, centroids)
+        # Sum the rows of each cluster in one pass over the rows sorted by cluster
+        order = np.argsort(assignments, kind="stable")
+        counts = np.bincount(assignments, minlength=k)
+        filled = np.flatnonzero(counts)
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])[filled]
+        # Empty clusters keep their previous centroid
+        centroids[filled] = np.add.reduceat(data[order], starts, axis=0) / counts[filled, None]
+    return centroids
+
+
+@dataclass
+class _Snapshot:
+    """Arrays searched by a query, taken under the lock so concurrent writes do not change them mid-search"""
+
+    generation: int
+    matrix: np.ndarray
+    live: np.ndarray
+    rows: Optional[np.ndarray]
+    centroids: Optional[np.ndarray]
+    lists: Optional[np.ndarray]
+    codebooks: Optional[np.ndarray]
+    codes: Optional[np.ndarray]
+
+
+class NumpyDb(VectorDb):
+    """
+    In-process vector db storing embeddings in a memory-mapped matrix, for single-node deployments.
+
+    Embeddings are appended to a float32 or float16 matrix file and searched with a vectorized brute-force
+    top-k. Documents, filters and deletions are kept in a SQLite file next to the matrix. Writes only append
+    to the matrix: replaced and deleted documents are marked as deleted and their rows are reclaimed by
+    `optimize()`. Opening a collection maps the matrix instead of reading it.
+
+    For larger collections, `optimize()` can also build an index:
+    - With `ivf_lists`, rows are partitioned with k-means and a search only scores the rows of the
+      `ivf_probes` partitions nearest to the query.
+    - With `pq_subvectors`, rows are product quantized to one byte per sub-vector. A search ranks the
+      candidates on their codes and rescores the best `limit * pq_rerank` on the stored embeddings.
+
+    Only one process should write to a collection at a time.
+    """
+
+    def __init__(
+        self,
+        collection: str = "documents",
+        path: Union[str, Path] = "tmp/numpydb",
+        embedder: Optional[Embedder] = None,
+        distance: Distance = Distance.cosine,
+        dtype: str = "float32",
+        ivf_lists: Optional[int] = None,
+        ivf_probes: int = 8,
+        pq_subvectors: Optional[int] = None,
+        pq_rerank: int = 10,
+        reranker: Optional[Reranker] = None,
+    ):
+        # Collection attributes
+        self.collection: str = collection
+        self.path: Path = Path(path)
+
+        # Embedder for embedding the document contents
+        if embedder is None:
+            from agno.embedder.openai import OpenAIEmbedder
+
+            embedder = OpenAIEmbedder()
+        self.embedder: Embedder = embedder
+        if self.embedder.dimensions is None:
+            raise ValueError("Embedder.dimensions must be set.")
+        self.dimensions: int = self.embedder.dimensions
+
+        # Distance metric. Embeddings are stored normalized for cosine distance.
+        self.distance: Distance = distance
+
+        # Type of the stored embeddings, float16 halves the size of the matrix
+        if dtype not in ("float32", "float16"):
+            raise ValueError(f"Unsupported dtype: {dtype}, use float32 or float16")
+        self.dtype: str = dtype
+
+        # Index built by optimize()
+        if pq_subvectors is not None and self.dimensions % pq_subvectors != 0:
+            raise ValueError(f"pq_subvectors must divide the embedding dimensions ({self.dimensions})")
+        self.ivf_lists: Optional[int] = ivf_lists
+        self.ivf_probes: int = ivf_probes
+        self.pq_subvectors: Optional[int] = pq_subvectors
+        self.pq_rerank: int = pq_rerank
+
+        # Reranker instance
+        self.reranker: Optional[Reranker] = reranker
+
+        self._lock = RLock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._loaded: bool = False
+        self._num_rows: int = 0
+        self._live: np.ndarray = np.zeros(0, dtype=bool)
+        self._matrix: Optional[np.ndarray] = None
+        self._vectors_generation: int = 0
+        self._index_generation: Optional[int] = None
+        self._centroids: Optional[np.ndarray] = None
+        self._codebooks: Optional[np.ndarray] = None
+        self._lists: Optional[np.ndarray] = None
+        self._codes: Optional[np.ndarray] = None
+
+    @property
+    def db_file(self) -> Path:
+        return self.path / f"{self.collection}.db"
+
+    def _vectors_file(self, generation: int) -> Path:
+        return self.path / f"{self.collection}.{generation}.vectors"
+
+    def _index_file(self, generation: int) -> Path:
+        return self.path / f"{self.collection}.{generation}.index.npz"
+
+    def _lists_file(self, generation: int) -> Path:
+        return self.path / f"{self.collection}.{generation}.lists"
+
+    def _codes_file(self, generation: int) -> Path:
+        return self.path / f"{self.collection}.{generation}.codes"
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(str(self.db_file), check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        return self._connection
+
+    @property
+    def row_bytes(self) -> int:
+        return self.dimensions * np.dtype(self.dtype).itemsize
+
+    def create(self) -> None:
+        """Create the collection files, or open them if they exist."""
+        with self._lock:
+            logger.debug(f"Creating collection: {self.collection}")
+            self.path.mkdir(parents=True, exist_ok=True)
+            with self.connection as connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS documents (row INTEGER PRIMARY KEY, id TEXT NOT NULL, name TEXT, "
+                    "content_hash TEXT NOT NULL, content TEXT, meta_data TEXT, filters TEXT, usage TEXT, "
+                    "deleted INTEGER NOT NULL DEFAULT 0)"
+                )
+                connection.execute("CREATE INDEX IF NOT EXISTS idx_documents_id ON documents (id)")
+                connection.execute("CREATE INDEX IF NOT EXISTS idx_documents_name ON documents (name)")
+                connection.execute("CREATE INDEX IF NOT EXISTS idx_documents_content_hash ON documents (content_hash)")
+                connection.execute("CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+                connection.executemany(
+                    "INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)",
+                    [
+                        ("dimensions", str(self.dimensions)),
+                        ("dtype", self.dtype),
+                        ("distance", self.distance.value),
+                        ("vectors_generation", "0"),
+                    ],
+                )
+            self._loaded = False
+            self._load()
+
+    def exists(self) -> bool:
+        """Check if the collection exists."""
+        return self.db_file.exists()
+
+    def _ensure_loaded(self) -> bool:
+        """Open the collection if it exists, returns False if it does not"""
+        if self._loaded:
+            return True
+        with self._lock:
+            if not self._loaded:
+                if not self.exists():
+                    return False
+                self._load()
+        return True
+
+    def _load(self) -> None:
+        """Map the collection files and drop anything written by a write that was not committed"""
+        settings = dict(self.connection.execute("SELECT key, value FROM settings").fetchall())
+        for key, value in (
+            ("dimensions", str(self.dimensions)),
+            ("dtype", self.dtype),
+            ("distance", self.distance.value),
+        ):
+            if settings.get(key) != value:
+                raise ValueError(
+                    f"Collection {self.collection} was created with {key}={settings.get(key)}, got {key}={value}"
+                )
+        self._vectors_generation = int(settings["vectors_generation"])
+        self._index_generation = int(settings["index_generation"]) if "index_generation" in settings else None
+
+        max_row = self.connection.execute("SELECT MAX(row) FROM documents").fetchone()[0]
+        self._num_rows = 0 if max_row is None else max_row + 1
+        vectors_file = self._vectors_file(self._vectors_generation)
+        vectors_file.touch(exist_ok=True)
+        # Vectors are appended before their documents are committed, so extra rows belong to a failed write
+        if vectors_file.stat().st_size > self._num_rows * self.row_bytes:
+            with vectors_file.open("r+b") as f:
+                f.truncate(self._num_rows * self.row_bytes)
+        self._matrix = None
+
+        self._live = np.ones(self._num_rows, dtype=bool)
+        deleted = [row for (row,) in self.connection.execute("SELECT row FROM documents WHERE deleted = 1")]
+        self._live[deleted] = False
+
+        self._load_index()
+        self._loaded = True
+
+    def _load_index(self) -> None:
+        self._centroids = self._codebooks = self._lists = self._codes = None
+        if self._index_generation is None:
+            return
+
+        with np.load(self._index_file(self._index_generation)) as index:
+            self._centroids = index["centroids"] if "centroids" in index else None
+            self._codebooks = index["codebooks"] if "codebooks" in index else None
+
+        # Rows written after the index was built are assigned when they are appended. The index files are
+        # appended after the vectors, so rows missing after a failed write are assigned again here.
+        if self._centroids is not None:
+            lists_file = self._lists_file(self._index_generation)
+            num_assigned = self._repair_index_file(lists_file, 4)
+            if num_assigned < self._num_rows:
+                missing = self._read_rows(np.arange(num_assigned, self._num_rows))
+                with lists_file.open("ab") as f:
+                    f.write(_nearest(missing, self._centroids).astype(np.int32).tobytes())
+            self._lists = self._map(lists_file, np.int32, (self._num_rows,))
+        if self._codebooks is not None:
+            codes_file = self._codes_file(self._index_generation)
+            num_subvectors = len(self._codebooks)
+            num_encoded = self._repair_index_file(codes_file, num_subvectors)
+            if num_encoded < self._num_rows:
+                missing = self._read_rows(np.arange(num_encoded, self._num_rows))
+                with codes_file.open("ab") as f:
+                    f.write(self._encode(missing, self._codebooks).tobytes())
+            self._codes = self._map(codes_file, np.uint8, (self._num_rows, num_subvectors))
+
+    def _repair_index_file(self, file: Path, row_bytes: int) -> int:
+        """Truncate an index file to the number of rows, returns the number of rows it holds"""
+        file.touch(exist_ok=True)
+        num_rows = file.stat().st_size // row_bytes
+        if num_rows > self._num_rows:
+            with file.open("r+b") as f:
+                f.truncate(self._num_rows * row_bytes)
+        return min(num_rows, self._num_rows)
+
+    @staticmethod
+    def _map(file: Path, dtype: Any, shape: Tuple[int, ...]) -> np.ndarray:
+        if shape[0] == 0:
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(file, dtype=dtype, mode="r", shape=shape)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Memory-mapped embeddings, one row per document written"""
+        if self._matrix is None or len(self._matrix) != self._num_rows:
+            self._matrix = self._map(
+                self._vectors_file(self._vectors_generation), self.dtype, (self._num_rows, self.dimensions)
+            )
+        return self._matrix
+
+    def _read_rows(self, rows: np.ndarray) -> np.ndarray:
+        return np.asarray(self.matrix[rows], dtype=np.float32)
+
+    def _prepare(self, vectors: np.ndarray) -> np.ndarray:
+        """Normalize embeddings for cosine distance, so it is scored with a dot product"""
+        if self.distance != Distance.cosine:
+            return vectors
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms > 0, norms, 1)
+
+    def _score(self, vectors: np.ndarray, queries: np.ndarray) -> np.ndarray:
+        """Scores of each vector (rows) for each query (columns), higher is closer"""
+        scores = vectors @ queries.T
+        if self.distance == Distance.l2:
+            # Negative squared l2 distance, without the norm of the query which does not change the ranking
+            scores = 2 * scores - np.einsum("ij,ij->i", vectors, vectors)[:, None]
+        return scores
+
+    @staticmethod
+    def _encode(vectors: np.ndarray, codebooks: np.ndarray) -> np.ndarray:
+        """Product quantize vectors to the nearest centroid of each sub-vector codebook"""
+        codes = np.empty((len(vectors), len(codebooks)), dtype=np.uint8)
+        for i, subvectors in enumerate(np.split(vectors, len(codebooks), axis=1)):
+            codes[:, i] = _nearest(subvectors, codebooks[i])
+        return codes
+
+    def _rows_where(self, condition: str, values: List[Any]) -> List[int]:
+        """Rows of the documents matching a condition with an IN (...) placeholder, for many values"""
+        rows: List[int] = []
+        for i in range(0, len(values), _SQLITE_MAX_PARAMS):
+            batch = values[i : i + _SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            rows.extend(
+                row
+                for (row,) in self.connection.execute(
+                    f"SELECT row FROM documents WHERE deleted = 0 AND {condition.format(placeholders)}", batch
+                )
+            )
+        return rows
+
+    def _delete_rows(self, rows: List[int]) -> None:
+        """Mark rows as deleted, in the transaction of the caller"""
+        self.connection.executemany("UPDATE documents SET deleted = 1 WHERE row = ?", [(row,) for row in rows])
+
+    def doc_exists(self, document: Document) -> bool:
+        """Check if a document exists in the collection."""
+        cleaned_content = document.content.replace("\x00", "\ufffd")
+        content_hash = md5(cleaned_content.encode()).hexdigest()
+        return len(self.existing_hashes([content_hash])) > 0
+
+    def name_exists(self, name: str) -> bool:
+        """Check if a document with the given name exists in the collection."""
+        if not self._ensure_loaded():
+            return False
+        with self._lock:
+            return len(self._rows_where("name IN ({})", [name])) > 0
+
+    def id_exists(self, id: str) -> bool:
+        """Check if a document with the given ID exists in the collection."""
+        if not self._ensure_loaded():
+            return False
+        with self._lock:
+            return len(self._rows_where("id IN ({})", [id])) > 0
+
+    def existing_hashes(self, hashes: List[str]) -> Set[str]:
+        """Get the content hashes that already exist in the collection."""
+        if len(hashes) == 0 or not self._ensure_loaded():
+            return set()
+        found: Set[str] = set()
+        with self._lock:
+            for i in range(0, len(hashes), _SQLITE_MAX_PARAMS):
+                batch = hashes[i : i + _SQLITE_MAX_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                found.update(
+                    content_hash
+                    for (content_hash,) in self.connection.execute(
+                        f"SELECT DISTINCT content_hash FROM documents WHERE deleted = 0 AND content_hash IN ({placeholders})",
+                        batch,
+                    )
+                )
+        return found
+
+    def delete_hashes(self, hashes: List[str]) -> None:
+        """Delete the documents with the given content hashes."""
+        if len(hashes) == 0 or not self._ensure_loaded():
+            return
+        with self._lock:
+            with self.connection:
+                rows = self._rows_where("content_hash IN ({})", list(hashes))
+                self._delete_rows(rows)
+            self._live[rows] = False
+        logger.debug(f"Deleted {len(rows)} documents from collection: {self.collection}")
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Insert documents into the collection. A document with the id of an existing document replaces it.
+
+        Args:
+            documents (List[Document]): List of documents to insert.
+            filters (Optional[Dict[str, Any]]): Filters to add to each document, used to limit search results.
+        """
+        self._write(documents, filters)
+
+    def upsert_available(self) -> bool:
+        return True
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Upsert documents into the collection, replacing the documents with the same id.
+
+        Args:
+            documents (List[Document]): List of documents to upsert.
+            filters (Optional[Dict[str, Any]]): Filters to add to each document, used to limit search results.
+        """
+        self._write(documents, filters)
+
+    def _write(self, documents: List[Document], filters: Optional[Dict[str, Any]]) -> None:
+        Document.embed_batch(documents, self.embedder)
+
+        # The last document with an id wins, as if the documents were written one by one
+        records: Dict[str, Tuple[Any, ...]] = {}
+        embeddings: Dict[str, List[float]] = {}
+        for document in documents:
+            if document.embedding is None or len(document.embedding) != self.dimensions:
+                logger.error(f"Skipping document without a valid embedding: {document.name}")
+                continue
+            cleaned_content = document.content.replace("\x00", "\ufffd")
+            content_hash = md5(cleaned_content.encode()).hexdigest()
+            _id = document.id or content_hash
+            records.pop(_id, None)
+            embeddings.pop(_id, None)
+            records[_id] = (
+                _id,
+                document.name,
+                content_hash,
+                cleaned_content,
+                json.dumps(document.meta_data),
+                json.dumps(filters) if filters else None,
+                json.dumps(document.usage) if document.usage else None,
+            )
+            embeddings[_id] = document.embedding
+        if len(records) == 0:
+            return
+
+        vectors = self._prepare(np.asarray(list(embeddings.values()), dtype=np.float32))
+        with self._lock:
+            if not self.exists():
+                self.create()
+            self._ensure_loaded()
+
+            start = self._num_rows
+            vectors_file = self._vectors_file(self._vectors_generation)
+            with vectors_file.open("ab") as f:
+                f.write(vectors.astype(self.dtype).tobytes())
+            try:
+                with self.connection:
+                    replaced = self._rows_where("id IN ({})", list(records.keys()))
+                    self._delete_rows(replaced)
+                    self.connection.executemany(
+                        "INSERT INTO documents (row, id, name, content_hash, content, meta_data, filters, usage) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        [(start + i, *record) for i, record in enumerate(records.values())],
+                    )
+            except Exception:
+                with vectors_file.open("r+b") as f:
+                    f.truncate(start * self.row_bytes)
+                raise
+
+            self._num_rows += len(records)
+            self._live = np.concatenate([self._live, np.ones(len(records), dtype=bool)])
+            self._live[replaced] = False
+            self._append_index(vectors)
+        logger.debug(f"Wrote {len(records)} documents to collection: {self.collection}")
+
+    def _append_index(self, vectors: np.ndarray) -> None:
+        """Assign appended rows to the index, so they are searchable before the next optimize()"""
+        if self._index_generation is None:
+            return
+        if self._centroids is not None:
+            with self._lists_file(self._index_generation).open("ab") as f:
+                f.write(_nearest(vectors, self._centroids).astype(np.int32).tobytes())
+            self._lists = self._map(self._lists_file(self._index_generation), np.int32, (self._num_rows,))
+        if self._codebooks is not None:
+            with self._codes_file(self._index_generation).open("ab") as f:
+                f.write(self._encode(vectors, self._codebooks).tobytes())
+            self._codes = self._map(
+                self._codes_file(self._index_generation), np.uint8, (self._num_rows, len(self._codebooks))
+            )
+
+    def _filtered_rows(self, filters: Dict[str, Any]) -> np.ndarray:
+        """Rows of the documents whose filters contain every key and value of the given filters"""
+        conditions = []
+        params: List[Any] = []
+        for key, value in filters.items():
+            params.append(f'$."{key}"')
+            if isinstance(value, (dict, list)):
+                conditions.append("json_extract(filters, ?) = json(?)")
+                params.append(json.dumps(value))
+            else:
+                conditions.append("json_extract(filters, ?) = ?")
+                params.append(int(value) if isinstance(value, bool) else value)
+        query = f"SELECT row FROM documents WHERE deleted = 0 AND {' AND '.join(conditions)} ORDER BY row"
+        return np.fromiter((row for (row,) in self.connection.execute(query, params)), dtype=np.int64)
+
+    def _snapshot(self, filters: Optional[Dict[str, Any]]) -> _Snapshot:
+        with self._lock:
+            return _Snapshot(
+                generation=self._vectors_generation,
+                matrix=self.matrix,
+                live=self._live,
+                rows=self._filtered_rows(filters) if filters else None,
+                centroids=self._centroids,
+                lists=self._lists,
+                codebooks=self._codebooks,
+                codes=self._codes,
+            )
+
+    def _exact_top_rows(
+        self, snapshot: _Snapshot, queries: np.ndarray, rows: Optional[np.ndarray], limit: int
+    ) -> List[np.ndarray]:
+        """Brute-force top rows for each query, over the given rows or every live row"""
+        num_rows = len(snapshot.matrix) if rows is None else len(rows)
+        if num_rows == 0:
+            return [np.empty(0, dtype=np.int64) for _ in queries]
+
+        scores = np.empty((num_rows, len(queries)), dtype=np.float32)
+        for start in range(0, num_rows, _CHUNK_ROWS):
+            stop = min(start + _CHUNK_ROWS, num_rows)
+            block = snapshot.matrix[start:stop] if rows is None else snapshot.matrix[rows[start:stop]]
+            scores[start:stop] = self._score(np.asarray(block, dtype=np.float32), queries)
+        if rows is None:
+            scores[~snapshot.live[:num_rows]] = -np.inf
+            return [_top_k(scores[:, i], limit) for i in range(len(queries))]
+        return [rows[_top_k(scores[:, i], limit)] for i in range(len(queries))]
+
+    def _candidate_rows(self, snapshot: _Snapshot, query: np.ndarray, limit: int) -> Optional[np.ndarray]:
+        """Narrow the rows searched for a query with the index"""
+        rows = snapshot.rows
+        if snapshot.centroids is not None and snapshot.lists is not None:
+            probes = _top_k(self._score(snapshot.centroids, query[None, :])[:, 0], self.ivf_probes)
+            in_probes = np.isin(snapshot.lists, probes)
+            rows = (
+                np.flatnonzero(in_probes & snapshot.live[: len(in_probes)]) if rows is None else rows[in_probes[rows]]
+            )
+
+        if snapshot.codebooks is not None and snapshot.codes is not None:
+            # Score the candidates on their codes with one lookup table per sub-vector
+            subqueries = np.stack(np.split(query, len(snapshot.codebooks)))
+            if self.distance == Distance.l2:
+                tables = -((snapshot.codebooks - subqueries[:, None, :]) ** 2).sum(axis=2)
+            else:
+                tables = np.einsum("ksd,kd->ks", snapshot.codebooks, subqueries)
+            subvector_index = np.arange(len(snapshot.codebooks))
+            num_rows = len(snapshot.codes) if rows is None else len(rows)
+            approx = np.empty(num_rows, dtype=np.float32)
+            for start in range(0, num_rows, _CHUNK_ROWS):
+                stop = min(start + _CHUNK_ROWS, num_rows)
+                codes = snapshot.codes[start:stop] if rows is None else snapshot.codes[rows[start:stop]]
+                approx[start:stop] = tables[subvector_index, codes].sum(axis=1)
+            if rows is None:
+                approx[~snapshot.live[:num_rows]] = -np.inf
+                rows = np.arange(num_rows)
+            rows = np.sort(rows[_top_k(approx, limit * self.pq_rerank)])
+        return rows
+
+    def _search_embeddings(
+        self, queries: List[str], query_embeddings: List[List[float]], limit: int, filters: Optional[Dict[str, Any]]
+    ) -> List[List[Document]]:
+        if not self._ensure_loaded():
+            logger.error(f"Collection {self.collection} does not exist")
+            return [[] for _ in queries]
+
+        query_matrix = self._prepare(np.asarray(query_embeddings, dtype=np.float32).reshape(len(queries), -1))
+        while True:
+            snapshot = self._snapshot(filters)
+            if snapshot.centroids is None and snapshot.codebooks is None:
+                top_rows = self._exact_top_rows(snapshot, query_matrix, snapshot.rows, limit)
+            else:
+                top_rows = [
+                    self._exact_top_rows(snapshot, query[None, :], self._candidate_rows(snapshot, query, limit), limit)[
+                        0
+                    ]
+                    for query in query_matrix
+                ]
+            with self._lock:
+                # optimize() renumbers the rows, search again if it ran in the meantime
+                if snapshot.generation == self._vectors_generation:
+                    documents = self._get_documents(snapshot, top_rows)
+                    break
+
+        results: List[List[Document]] = []
+        for query, query_documents in zip(queries, documents):
+            if self.reranker:
+                query_documents = self.reranker.rerank(query=query, documents=query_documents)
+            results.append(query_documents)
+        return results
+
+    def _get_documents(self, snapshot: _Snapshot, top_rows: List[np.ndarray]) -> List[List[Document]]:
+        """Load the documents of the top rows of each query, keeping the order of the rows"""
+        rows = sorted({int(row) for query_rows in top_rows for row in query_rows})
+        by_row: Dict[int, Document] = {}
+        for i in range(0, len(rows), _SQLITE_MAX_PARAMS):
+            batch = rows[i : i + _SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            for row, _id, name, content, meta_data, usage in self.connection.execute(
+                "SELECT row, id, name, content, meta_data, usage FROM documents "
+                f"WHERE deleted = 0 AND row IN ({placeholders})",
+                batch,
+            ):
+                by_row[row] = Document(
+                    id=_id,
+                    name=name,
+                    meta_data=json.loads(meta_data) if meta_data else {},
+                    content=content,
+                    embedder=self.embedder,
+                    embedding=np.asarray(snapshot.matrix[row], dtype=np.float32).tolist(),
+                    usage=json.loads(usage) if usage else None,
+                )
+        return [[by_row[int(row)] for row in query_rows if int(row) in by_row] for query_rows in top_rows]
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """
+        Search for documents similar to the query.
+
+        Args:
+            query (str): Query to search for.
+            limit (int): Number of documents to return.
+            filters (Optional[Dict[str, Any]]): Filters the documents must match.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        query_embedding = self.embedder.get_embedding(query)
+        if query_embedding is None or len(query_embedding) == 0:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+        return self._search_embeddings([query], [query_embedding], limit, filters)[0]
+
+    def search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """
+        Search for the documents similar to each query, scoring the matrix once for all queries.
+
+        Args:
+            queries (List[str]): Queries to search for.
+            limit (int): Number of documents to return per query.
+            filters (Optional[Dict[str, Any]]): Filters the documents must match.
+
+        Returns:
+            List[List[Document]]: Matching documents for each query, in the order of the queries.
+        """
+        if len(queries) == 0:
+            return []
+        query_embeddings, _ = self.embedder.get_embeddings_batch(queries)
+        valid = [i for i, embedding in enumerate(query_embeddings) if embedding and len(embedding) == self.dimensions]
+        for i in set(range(len(queries))) - set(valid):
+            logger.error(f"Error getting embedding for Query: {queries[i]}")
+
+        results: List[List[Document]] = [[] for _ in queries]
+        if len(valid) > 0:
+            found = self._search_embeddings(
+                [queries[i] for i in valid], [query_embeddings[i] for i in valid], limit, filters
+            )
+            for i, documents in zip(valid, found):
+                results[i] = documents
+        return results
+
+    def get_count(self) -> int:
+        """Get the number of documents in the collection."""
+        if not self._ensure_loaded():
+            return 0
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM documents WHERE deleted = 0").fetchone()[0]
+
+    def _collection_files(self) -> Iterable[Path]:
+        # Files of other collections can share the prefix, e.g. "docs.v2" and "docs", so match the generation
+        prefix = f"{self.collection}."
+        return [file for file in self.path.glob(f"{prefix}*") if file.name[len(prefix) :].split(".")[0].isdigit()]
+
+    def drop(self) -> None:
+        """Delete the collection files."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+            self._matrix = self._lists = self._codes = None
+            self._loaded = False
+            if not self.path.exists():
+                return
+            logger.debug(f"Deleting collection: {self.collection}")
+            for file in [*self._collection_files(), self.db_file]:
+                for path in (file, file.with_name(f"{file.name}-wal"), file.with_name(f"{file.name}-shm")):
+                    path.unlink(missing_ok=True)
+
+    def delete(self) -> bool:
+        """Delete every document, keeping the collection."""
+        if not self._ensure_loaded():
+            return True
+        with self._lock:
+            with self.connection:
+                self.connection.execute("DELETE FROM documents")
+                self.connection.execute("DELETE FROM settings WHERE key = 'index_generation'")
+            self._remove_old_files()
+            self._loaded = False
+            self._load()
+        return True
+
+    def _remove_old_files(self) -> None:
+        """Remove the files of previous generations and anything past the committed rows"""
+        current = {self._vectors_file(self._vectors_generation)}
+        settings = dict(self.connection.execute("SELECT key, value FROM settings").fetchall())
+        if "index_generation" in settings:
+            generation = int(settings["index_generation"])
+            current.update({self._index_file(generation), self._lists_file(generation), self._codes_file(generation)})
+        self._matrix = self._lists = self._codes = None
+        for file in self._collection_files():
+            if file in current:
+                continue
+            try:
+                file.unlink()
+            except OSError as e:
+                logger.warning(f"Could not remove {file}: {e}")
+        vectors_file = self._vectors_file(self._vectors_generation)
+        if vectors_file.exists():
+            max_row = self.connection.execute("SELECT MAX(row) FROM documents").fetchone()[0]
+            with vectors_file.open("r+b") as f:
+                f.truncate(0 if max_row is None else (max_row + 1) * self.row_bytes)
+
+    def _next_generation(self) -> int:
+        return max(self._vectors_generation, self._index_generation or 0) + 1
+
+    def optimize(self) -> None:
+        """
+        Reclaim the rows of replaced and deleted documents, and build the IVF/PQ index if configured.
+
+        Both steps write new files and switch to them in a single SQLite transaction, so an interrupted
+        optimize() leaves the collection as it was.
+        """
+        if not self._ensure_loaded():
+            return
+        with self._lock:
+            self._compact()
+            if self.ivf_lists is not None or self.pq_subvectors is not None:
+                self._build_index()
+
+    def _compact(self) -> None:
+        live_rows = np.flatnonzero(self._live)
+        if len(live_rows) == self._num_rows:
+            return
+
+        logger.debug(f"Compacting collection {self.collection}: {self._num_rows - len(live_rows)} deleted rows")
+        generation = self._next_generation()
+        with self._vectors_file(generation).open("wb") as f:
+            for start in range(0, len(live_rows), _CHUNK_ROWS):
+                f.write(np.asarray(self.matrix[live_rows[start : start + _CHUNK_ROWS]]).tobytes())
+        with self.connection:
+            self.connection.execute("DELETE FROM documents WHERE deleted = 1")
+            # Rows only move down and are renumbered in ascending order, so a new row number is always free
+            self.connection.executemany(
+                "UPDATE documents SET row = ? WHERE row = ?",
+                [(new, int(old)) for new, old in enumerate(live_rows) if new != old],
+            )
+            self.connection.execute(
+                "UPDATE settings SET value = ? WHERE key = 'vectors_generation'", (str(generation),)
+            )
+            # The index refers to the old row numbers
+            self.connection.execute("DELETE FROM settings WHERE key = 'index_generation'")
+        self._vectors_generation = generation
+        self._remove_old_files()
+        self._load()
+
+    def _build_index(self) -> None:
+        live_rows = np.flatnonzero(self._live)
+        if self.ivf_lists is not None and len(live_rows) < self.ivf_lists:
+            logger.warning(f"Not enough documents to build {self.ivf_lists} IVF lists: {len(live_rows)}")
+            return
+        if len(live_rows) == 0:
+            return
+
+        logger.debug(f"Building index for collection {self.collection} on {len(live_rows)} rows")
+        rng = np.random.default_rng(0)
+        sample_rows = np.sort(rng.choice(live_rows, size=min(len(live_rows), _TRAINING_SAMPLE), replace=False))
+        sample = self._read_rows(sample_rows)
+
+        index: Dict[str, np.ndarray] = {}
+        if self.ivf_lists is not None:
+            index["centroids"] = _kmeans(sample, self.ivf_lists)
+        if self.pq_subvectors is not None:
+            num_centroids = min(256, len(sample))
+            index["codebooks"] = np.stack(
+                [_kmeans(subvectors, num_centroids) for subvectors in np.split(sample, self.pq_subvectors, axis=1)]
+            )
+
+        # Deleted rows are assigned too, so the index files stay aligned with the matrix
+        generation = self._next_generation()
+        np.savez(self._index_file(generation), **index)  # type: ignore
+        with self._lists_file(generation).open("wb") as lists, self._codes_file(generation).open("wb") as codes:
+            for start in range(0, self._num_rows, _CHUNK_ROWS):
+                vectors = self._read_rows(np.arange(start, min(start + _CHUNK_ROWS, self._num_rows)))
+                if "centroids" in index:
+                    lists.write(_nearest(vectors, index["centroids"]).astype(np.int32).tobytes())
+                if "codebooks" in index:
+                    codes.write(self._encode(vectors, index["codebooks"]).tobytes())
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO settings (key, value) VALUES ('index_generation', ?)", (str(generation),)
+            )
+        self._index_generation = generation
+        self._remove_old_files()
+        self._load_index()
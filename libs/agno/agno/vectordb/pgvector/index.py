@@ -8,6 +8,9 @@ class Ivfflat(BaseModel):
     lists: int = 100
     probes: int = 10
     dynamic_lists: bool = True
+    # With dynamic_lists, optimize() rebuilds the index when the number of lists suited to the row count differs
+    # from the number it was built with by this factor. None to never rebuild.
+    retune_factor: Optional[float] = 2.0
     configuration: Dict[str, Any] = {
         "maintenance_work_mem": "2GB",
     }
@@ -1,14 +1,27 @@
+import asyncio
+import weakref
 from hashlib import md5
 from math import sqrt
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
 
 try:
     from sqlalchemy.dialects import postgresql
     from sqlalchemy.engine import Engine, create_engine
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
     from sqlalchemy.inspection import inspect
-    from sqlalchemy.orm import Session, scoped_session, sessionmaker
-    from sqlalchemy.schema import Column, Index, MetaData, Table
-    from sqlalchemy.sql.expression import bindparam, desc, func, select, text
+    from sqlalchemy.orm import scoped_session, sessionmaker
+    from sqlalchemy.schema import Column, Computed, CreateIndex, Index, MetaData, Table
+    from sqlalchemy.sql.expression import (
+        bindparam,
+        desc,
+        func,
+        literal,
+        literal_column,
+        select,
+        text,
+        true,
+        union_all,
+    )
     from sqlalchemy.types import DateTime, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install using `pip install sqlalchemy psycopg`")
@@ -25,7 +38,7 @@ from agno.utils.log import logger
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
 from agno.vectordb.pgvector.index import HNSW, Ivfflat
-from agno.vectordb.search import SearchType
+from agno.vectordb.search import HybridFusion, SearchType
 
 
 class PgVector(VectorDb):
@@ -52,6 +65,10 @@ class PgVector(VectorDb):
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
         reranker: Optional[Reranker] = None,
+        async_db_engine: Optional[AsyncEngine] = None,
+        hybrid_fusion: Optional[HybridFusion] = None,
+        hybrid_candidates: int = 100,
+        rrf_k: int = 60,
     ):
         """
         Initialize the PgVector instance.
@@ -70,6 +87,12 @@ class PgVector(VectorDb):
             content_language (str): Language for full-text search.
             schema_version (int): Version of the database schema.
             auto_upgrade_schema (bool): Automatically upgrade schema if True.
+            reranker (Optional[Reranker]): Reranker for the results of vector search.
+            async_db_engine (Optional[AsyncEngine]): SQLAlchemy async database engine, used by `asearch`.
+            hybrid_fusion (Optional[HybridFusion]): Fuse candidates from the vector index and the full-text index
+                in hybrid search, instead of scoring every row of the table. Use with schema version 2.
+            hybrid_candidates (int): Number of candidates taken from each index when hybrid_fusion is set.
+            rrf_k (int): Constant of reciprocal rank fusion, higher values flatten the weight of the top ranks.
         """
         if not table_name:
             raise ValueError("Table name must be provided.")
@@ -91,6 +114,7 @@ class PgVector(VectorDb):
         self.schema: str = schema
         self.db_url: Optional[str] = db_url
         self.db_engine: Engine = db_engine
+        self.async_db_engine: Optional[AsyncEngine] = async_db_engine
         self.metadata: MetaData = MetaData(schema=self.schema)
 
         # Embedder for embedding the document contents
@@ -116,6 +140,10 @@ class PgVector(VectorDb):
         self.vector_score_weight: float = vector_score_weight
         # Content language for full-text search
         self.content_language: str = content_language
+        # Hybrid search with candidate pools from the vector and full-text indexes
+        self.hybrid_fusion: Optional[HybridFusion] = hybrid_fusion
+        self.hybrid_candidates: int = hybrid_candidates
+        self.rrf_k: int = rrf_k
 
         # Table schema version
         self.schema_version: int = schema_version
@@ -127,6 +155,9 @@ class PgVector(VectorDb):
 
         # Database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
+        # Async database session, created on first use, with a weak reference to the event loop of its engine when the
+        # engine is created by PgVector
+        self._async_session: Optional[Tuple[Any, async_sessionmaker[AsyncSession]]] = None
         # Database table
         self.table: Table = self.get_table()
         logger.debug(f"Initialized PgVector with table '{self.schema}.{self.table_name}'")
@@ -160,7 +191,32 @@ class PgVector(VectorDb):
         Index(f"idx_{self.table_name}_id", table.c.id)
         Index(f"idx_{self.table_name}_name", table.c.name)
         Index(f"idx_{self.table_name}_content_hash", table.c.content_hash)
+        # Searches filter with filters @> :filters, which jsonb_path_ops supports with a smaller index
+        Index(
+            f"idx_{self.table_name}_filters",
+            table.c.filters,
+            postgresql_using="gin",
+            postgresql_ops={"filters": "jsonb_path_ops"},
+        )
+
+        return table
+
+    def get_table_v2(self) -> Table:
+        """
+        Get the SQLAlchemy Table object for schema version 2.
+
+        Schema version 2 stores the text search vector of the content in a generated column with a GIN index,
+        so keyword and hybrid search do not compute it for every row.
 
+        Returns:
+            Table: SQLAlchemy Table object representing the database table.
+        """
+        table = self.get_table_v1()
+        table.append_column(
+            Column("content_tsv", postgresql.TSVECTOR, Computed(self._content_tsv_expression(), persisted=True)),
+            replace_existing=True,
+        )
+        Index(f"idx_{self.table_name}_content_tsv", table.c.content_tsv, postgresql_using="gin")
         return table
 
     def get_table(self) -> Table:
@@ -172,6 +228,8 @@ class PgVector(VectorDb):
         """
         if self.schema_version == 1:
             return self.get_table_v1()
+        elif self.schema_version == 2:
+            return self.get_table_v2()
         else:
             raise NotImplementedError(f"Unsupported schema version: {self.schema_version}")
 
@@ -202,6 +260,35 @@ class PgVector(VectorDb):
                     sess.execute(text(f"CREATE SCHEMA IF NOT EXISTS {self.schema};"))
             logger.debug(f"Creating table: {self.table_name}")
             self.table.create(self.db_engine)
+        else:
+            if self.auto_upgrade_schema:
+                self.upgrade_schema()
+            self.ensure_indexes()
+
+    def upgrade_schema(self) -> None:
+        """
+        Upgrade an existing table to the current schema version.
+
+        For schema version 2, adds the generated text search column and its GIN index. Postgres computes the
+        column for the existing rows when it is added.
+        """
+        if self.schema_version != 2:
+            return
+
+        with self.Session() as sess, sess.begin():
+            logger.info(f"Upgrading table '{self.table.fullname}' to schema version 2")
+            sess.execute(
+                text(
+                    f"ALTER TABLE {self.table.fullname} ADD COLUMN IF NOT EXISTS content_tsv tsvector "
+                    f"GENERATED ALWAYS AS ({self._content_tsv_expression()}) STORED;"
+                )
+            )
+            sess.execute(
+                text(
+                    f'CREATE INDEX IF NOT EXISTS "idx_{self.table_name}_content_tsv" ON {self.table.fullname} '
+                    f"USING GIN (content_tsv);"
+                )
+            )
 
     def _record_exists(self, column, value) -> bool:
         """
@@ -237,6 +324,41 @@ class PgVector(VectorDb):
         content_hash = md5(cleaned_content.encode()).hexdigest()
         return self._record_exists(self.table.c.content_hash, content_hash)
 
+    def existing_hashes(self, hashes: List[str]) -> Set[str]:
+        """
+        Get the content hashes that already exist in the table.
+
+        Args:
+            hashes (List[str]): The content hashes to check.
+
+        Returns:
+            Set[str]: The content hashes that exist in the table.
+        """
+        existing: Set[str] = set()
+        try:
+            with self.Session() as sess, sess.begin():
+                for i in range(0, len(hashes), 1000):
+                    batch_hashes = hashes[i : i + 1000]
+                    stmt = select(self.table.c.content_hash).where(self.table.c.content_hash.in_(batch_hashes))
+                    existing.update(row[0] for row in sess.execute(stmt))
+        except Exception as e:
+            logger.error(f"Error checking if records exist: {e}")
+        return existing
+
+    def delete_hashes(self, hashes: List[str]) -> None:
+        """
+        Delete the records with the given content hashes.
+
+        Args:
+            hashes (List[str]): The content hashes to delete.
+        """
+        from sqlalchemy import delete
+
+        with self.Session() as sess, sess.begin():
+            for i in range(0, len(hashes), 1000):
+                sess.execute(delete(self.table).where(self.table.c.content_hash.in_(hashes[i : i + 1000])))
+        logger.debug(f"Deleted {len(hashes)} content hashes from table '{self.table.fullname}'")
+
     def name_exists(self, name: str) -> bool:
         """
         Check if a document with the given name exists in the table.
@@ -293,11 +415,13 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     logger.debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed the whole batch in as few embedder requests as possible
+                        Document.embed_batch(batch_docs, self.embedder)
+
                         # Prepare documents for insertion
                         batch_records = []
                         for doc in batch_docs:
                             try:
-                                doc.embed(embedder=self.embedder)
                                 cleaned_content = self._clean_content(doc.content)
                                 content_hash = md5(cleaned_content.encode()).hexdigest()
                                 _id = doc.id or content_hash
@@ -357,11 +481,13 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     logger.debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed the whole batch in as few embedder requests as possible
+                        Document.embed_batch(batch_docs, self.embedder)
+
                         # Prepare documents for upserting
                         batch_records = []
                         for doc in batch_docs:
                             try:
-                                doc.embed(embedder=self.embedder)
                                 cleaned_content = self._clean_content(doc.content)
                                 content_hash = md5(cleaned_content.encode()).hexdigest()
                                 _id = doc.id or content_hash
@@ -426,6 +552,415 @@ class PgVector(VectorDb):
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
 
+    def search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """
+        Search for several queries, with the query embeddings computed in one batch.
+
+        Vector search runs all queries in a single statement, joining each query to its nearest rows with a
+        LATERAL subquery that uses the vector index. Keyword and hybrid queries run in a single transaction.
+
+        Args:
+            queries (List[str]): The search queries.
+            limit (int): Maximum number of results to return for each query.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[List[Document]]: Matching documents of each query, in the order of the queries.
+        """
+        if len(queries) == 0:
+            return []
+        try:
+            query_embeddings: List[List[float]] = []
+            if self.search_type in (SearchType.vector, SearchType.hybrid):
+                query_embeddings, _ = self.embedder.get_embeddings_batch(queries)
+
+            search_results: List[List[Document]] = []
+            with self.Session() as sess, sess.begin():
+                if self.search_type != SearchType.keyword:
+                    index_settings = self._index_search_settings()
+                    if index_settings is not None:
+                        sess.execute(index_settings)
+
+                if self.search_type == SearchType.vector:
+                    stmt = self._vector_search_many_stmt(query_embeddings, limit=limit, filters=filters)
+                    if stmt is None:
+                        return [[] for _ in queries]
+                    logger.debug(f"Vector search query: {stmt}")
+                    rows_by_query: List[List[Any]] = [[] for _ in queries]
+                    for row in sess.execute(stmt).fetchall():
+                        rows_by_query[row.query_index].append(row)
+                    search_results = [self._to_documents(rows) for rows in rows_by_query]
+                else:
+                    for index, query in enumerate(queries):
+                        if self.search_type == SearchType.keyword:
+                            stmt = self._keyword_search_stmt(query, limit=limit, filters=filters)
+                        else:
+                            stmt = self._hybrid_search_stmt(
+                                query, query_embeddings[index], limit=limit, filters=filters
+                            )
+                        search_results.append(
+                            self._to_documents(sess.execute(stmt).fetchall()) if stmt is not None else []
+                        )
+
+            if self.reranker and self.search_type == SearchType.vector:
+                search_results = [
+                    self.reranker.rerank(query=query, documents=documents)
+                    for query, documents in zip(queries, search_results)
+                ]
+            return search_results
+        except Exception as e:
+            logger.error(f"Error during search of {len(queries)} queries: {e}")
+            return [[] for _ in queries]
+
+    async def asearch(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """
+        Perform a search based on the configured search type, without blocking the event loop.
+
+        The query is embedded with the async embedder and run on the async engine.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        try:
+            query_embedding: Optional[List[float]] = None
+            if self.search_type in (SearchType.vector, SearchType.hybrid):
+                query_embedding = await self.embedder.aget_embedding(query)
+                if query_embedding is None:
+                    logger.error(f"Error getting embedding for Query: {query}")
+                    return []
+
+            if self.search_type == SearchType.vector:
+                stmt = self._vector_search_stmt(cast(List[float], query_embedding), limit=limit, filters=filters)
+            elif self.search_type == SearchType.keyword:
+                stmt = self._keyword_search_stmt(query, limit=limit, filters=filters)
+            elif self.search_type == SearchType.hybrid:
+                stmt = self._hybrid_search_stmt(query, cast(List[float], query_embedding), limit=limit, filters=filters)
+            else:
+                logger.error(f"Invalid search type '{self.search_type}'.")
+                return []
+            if stmt is None:
+                return []
+
+            logger.debug(f"Async {self.search_type.value} search query: {stmt}")
+            try:
+                async with self.async_session() as sess, sess.begin():
+                    if self.search_type != SearchType.keyword:
+                        index_settings = self._index_search_settings()
+                        if index_settings is not None:
+                            await sess.execute(index_settings)
+                    results = (await sess.execute(stmt)).fetchall()
+            except Exception as e:
+                logger.error(f"Error performing async {self.search_type.value} search: {e}")
+                return []
+
+            search_results = self._to_documents(results)
+            if self.reranker and self.search_type == SearchType.vector:
+                search_results = self.reranker.rerank(query=query, documents=search_results)
+            return search_results
+        except Exception as e:
+            logger.error(f"Error during async search: {e}")
+            return []
+
+    @property
+    def async_session(self) -> "async_sessionmaker[AsyncSession]":
+        """
+        Session factory of the async engine, created on first use.
+
+        The async engine is created from the URL of the sync engine unless `async_db_engine` is provided.
+        psycopg (v3) URLs are used as is, other drivers are replaced with asyncpg. The connection pool of an async
+        engine is bound to an event loop, so the engine created by PgVector is replaced when it is used from
+        another event loop.
+        """
+        if self.async_db_engine is not None:
+            if self._async_session is None:
+                self._async_session = (None, async_sessionmaker(bind=self.async_db_engine, expire_on_commit=False))
+            return self._async_session[1]
+
+        loop = asyncio.get_running_loop()
+        if self._async_session is None or self._async_session[0] is None or self._async_session[0]() is not loop:
+            async_url = self.db_engine.url
+            if async_url.drivername != "postgresql+psycopg":
+                try:
+                    import asyncpg  # noqa: F401
+                except ImportError:
+                    raise ImportError("`asyncpg` not installed. Please install it using `pip install asyncpg`")
+                async_url = async_url.set(drivername="postgresql+asyncpg")
+            async_engine = create_async_engine(async_url)
+            self._async_session = (weakref.ref(loop), async_sessionmaker(bind=async_engine, expire_on_commit=False))
+        return self._async_session[1]
+
+    def _search_columns(self) -> List[Column]:
+        return [
+            self.table.c.id,
+            self.table.c.name,
+            self.table.c.meta_data,
+            self.table.c.content,
+            self.table.c.embedding,
+            self.table.c.usage,
+        ]
+
+    def _index_search_settings(self):
+        """Statement setting the search parameters of the vector index for the current transaction"""
+        if isinstance(self.vector_index, Ivfflat):
+            return text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}")
+        elif isinstance(self.vector_index, HNSW):
+            # An HNSW scan returns at most ef_search rows, so it must cover the candidate pool of hybrid search
+            ef_search = self.vector_index.ef_search
+            if self.search_type == SearchType.hybrid and self.hybrid_fusion is not None:
+                ef_search = max(ef_search, self.hybrid_candidates)
+            return text(f"SET LOCAL hnsw.ef_search = {ef_search}")
+        return None
+
+    def _content_language_config(self):
+        """Text search configuration as a literal, so queries match the expression of the GIN index"""
+        content_language = self.content_language.replace("'", "''")
+        return literal_column(f"'{content_language}'::regconfig")
+
+    def _content_tsv_expression(self) -> str:
+        """Expression of the generated text search column of schema version 2"""
+        content_language = self.content_language.replace("'", "''")
+        return f"to_tsvector('{content_language}'::regconfig, coalesce(content, ''))"
+
+    def _ts_vector(self):
+        """Text search vector of the content, read from the stored column from schema version 2"""
+        if self.schema_version >= 2:
+            return self.table.c.content_tsv
+        return func.to_tsvector(self._content_language_config(), self.table.c.content)
+
+    def _ts_query(self, query: str):
+        # Create the ts_query using websearch_to_tsquery with parameter binding
+        processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
+        return func.websearch_to_tsquery(self._content_language_config(), bindparam("query", value=processed_query))
+
+    def _vector_distance(self, query_embedding: Any):
+        """Distance to the query embedding, ordering by it ascending can use the vector index"""
+        if self.distance == Distance.l2:
+            return self.table.c.embedding.l2_distance(query_embedding)
+        elif self.distance == Distance.cosine:
+            return self.table.c.embedding.cosine_distance(query_embedding)
+        elif self.distance == Distance.max_inner_product:
+            return self.table.c.embedding.max_inner_product(query_embedding)
+        logger.error(f"Unknown distance metric: {self.distance}")
+        return None
+
+    def _to_documents(self, results) -> List[Document]:
+        """Convert the rows of a search query to Document objects"""
+        return [
+            Document(
+                id=result.id,
+                name=result.name,
+                meta_data=result.meta_data,
+                content=result.content,
+                embedder=self.embedder,
+                embedding=result.embedding,
+                usage=result.usage,
+            )
+            for result in results
+        ]
+
+    def _vector_search_stmt(
+        self, query_embedding: List[float], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ):
+        """Build the vector similarity search query, returns None for an unknown distance metric"""
+        # Build the base statement
+        stmt = select(*self._search_columns())
+
+        # Apply filters if provided
+        if filters is not None:
+            stmt = stmt.where(self.table.c.filters.contains(filters))
+
+        # Order the results based on the distance metric
+        vector_distance = self._vector_distance(query_embedding)
+        if vector_distance is None:
+            return None
+        stmt = stmt.order_by(vector_distance)
+
+        # Limit the number of results
+        return stmt.limit(limit)
+
+    def _vector_search_many_stmt(
+        self, query_embeddings: List[List[float]], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ):
+        """Build one query returning the nearest rows of each query embedding, labelled with the query index"""
+        # One row per query, with the embedding cast to a vector
+        query_rows = [
+            select(
+                literal(index).label("query_index"),
+                literal(query_embedding, Vector(self.dimensions))
+                .cast(Vector(self.dimensions))
+                .label("query_embedding"),
+            )
+            for index, query_embedding in enumerate(query_embeddings)
+        ]
+        queries = (union_all(*query_rows) if len(query_rows) > 1 else query_rows[0]).subquery("queries")
+
+        # The nearest rows of each query, ordered by distance so the vector index is used
+        vector_distance = self._vector_distance(queries.c.query_embedding)
+        if vector_distance is None:
+            return None
+        nearest_stmt = select(*self._search_columns(), vector_distance.label("distance"))
+        if filters is not None:
+            nearest_stmt = nearest_stmt.where(self.table.c.filters.contains(filters))
+        nearest = nearest_stmt.order_by(vector_distance).limit(limit).lateral("nearest")
+
+        return (
+            select(queries.c.query_index, *[nearest.c[column.name] for column in self._search_columns()])
+            .select_from(queries.join(nearest, true()))
+            .order_by(queries.c.query_index, nearest.c.distance)
+        )
+
+    def _keyword_search_stmt(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None):
+        """Build the full-text search query on the 'content' column"""
+        # Build the base statement
+        stmt = select(*self._search_columns())
+
+        # Build the text search vector and query
+        ts_vector = self._ts_vector()
+        ts_query = self._ts_query(query)
+        # Compute the text rank
+        text_rank = func.ts_rank_cd(ts_vector, ts_query)
+
+        # Apply filters if provided
+        if filters is not None:
+            # Use the contains() method for JSONB columns to check if the filters column contains the specified filters
+            stmt = stmt.where(self.table.c.filters.contains(filters))
+
+        # Order by the relevance rank
+        stmt = stmt.order_by(text_rank.desc())
+
+        # Limit the number of results
+        return stmt.limit(limit)
+
+    def _hybrid_search_stmt(
+        self, query: str, query_embedding: List[float], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ):
+        """Build the query combining vector similarity and full-text rank, returns None for an unknown distance metric"""
+        if self.hybrid_fusion is not None:
+            return self._fused_hybrid_search_stmt(query, query_embedding, limit=limit, filters=filters)
+
+        # Compute the weighted hybrid score
+        hybrid_score = self._weighted_hybrid_score(query, query_embedding)
+        if hybrid_score is None:
+            return None
+
+        # Build the base statement, including the hybrid score
+        stmt = select(*self._search_columns(), hybrid_score.label("hybrid_score"))
+
+        # Add the full-text search condition
+        # stmt = stmt.where(ts_vector.op("@@")(ts_query))
+
+        # Apply filters if provided
+        if filters is not None:
+            stmt = stmt.where(self.table.c.filters.contains(filters))
+
+        # Order the results by the hybrid score in descending order
+        stmt = stmt.order_by(desc("hybrid_score"))
+
+        # Limit the number of results
+        return stmt.limit(limit)
+
+    def _weighted_hybrid_score(self, query: str, query_embedding: List[float]):
+        """Weighted sum of the vector similarity and text rank of a row, returns None for an unknown distance metric"""
+        # Compute the text rank
+        text_rank = func.ts_rank_cd(self._ts_vector(), self._ts_query(query))
+
+        # Compute the vector similarity score
+        vector_distance = self._vector_distance(query_embedding)
+        if vector_distance is None:
+            return None
+        if self.distance == Distance.max_inner_product:
+            # For inner product, higher values are better
+            # Assume embeddings are normalized, so inner product ranges from -1 to 1
+            # Normalize to range [0, 1]
+            vector_score = (vector_distance + 1) / 2
+        else:
+            # For L2 and cosine distance, smaller distances are better
+            # Invert and normalize the distance to get a similarity score between 0 and 1
+            vector_score = 1 / (1 + vector_distance)
+
+        # Apply weights to control the influence of each score
+        # Validate the vector_weight parameter
+        if not 0 <= self.vector_score_weight <= 1:
+            raise ValueError("vector_score_weight must be between 0 and 1")
+        text_rank_weight = 1 - self.vector_score_weight  # weight for text rank
+
+        # Combine the scores into a hybrid score
+        return (self.vector_score_weight * vector_score) + (text_rank_weight * text_rank)
+
+    def _fused_hybrid_search_stmt(
+        self, query: str, query_embedding: List[float], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Build a hybrid search query that only scores candidates from the vector index and the full-text index.
+
+        The top `hybrid_candidates` rows by vector distance and by text rank are each taken with an index scan,
+        then the union of both candidate lists is scored with reciprocal rank fusion or the weighted hybrid score.
+        """
+        if not 0 <= self.vector_score_weight <= 1:
+            raise ValueError("vector_score_weight must be between 0 and 1")
+        num_candidates = max(self.hybrid_candidates, limit)
+
+        # Candidates from the vector index, ordered by distance
+        vector_distance = self._vector_distance(query_embedding)
+        if vector_distance is None:
+            return None
+        vector_stmt = select(self.table.c.id, vector_distance.label("distance"))
+        if filters is not None:
+            vector_stmt = vector_stmt.where(self.table.c.filters.contains(filters))
+        vector_nearest = vector_stmt.order_by(vector_distance).limit(num_candidates).subquery("vector_nearest")
+        vector_candidates = select(
+            vector_nearest.c.id,
+            func.row_number().over(order_by=vector_nearest.c.distance).label("vector_rank"),
+        ).subquery("vector_candidates")
+
+        # Candidates from the full-text index, ordered by text rank
+        ts_vector = self._ts_vector()
+        ts_query = self._ts_query(query)
+        text_rank = func.ts_rank_cd(ts_vector, ts_query)
+        text_stmt = select(self.table.c.id, text_rank.label("text_rank")).where(ts_vector.op("@@")(ts_query))
+        if filters is not None:
+            text_stmt = text_stmt.where(self.table.c.filters.contains(filters))
+        text_matches = text_stmt.order_by(text_rank.desc()).limit(num_candidates).subquery("text_matches")
+        text_candidates = select(
+            text_matches.c.id,
+            func.row_number().over(order_by=text_matches.c.text_rank.desc()).label("text_rank"),
+        ).subquery("text_candidates")
+
+        # Union of both candidate lists with the rank of each candidate in each list
+        candidates = (
+            select(
+                func.coalesce(vector_candidates.c.id, text_candidates.c.id).label("id"),
+                vector_candidates.c.vector_rank,
+                text_candidates.c.text_rank,
+            )
+            .select_from(
+                vector_candidates.join(text_candidates, vector_candidates.c.id == text_candidates.c.id, full=True)
+            )
+            .subquery("candidates")
+        )
+
+        if self.hybrid_fusion == HybridFusion.rrf:
+            # A candidate missing from one list gets no score from that list
+            hybrid_score = self.vector_score_weight * func.coalesce(
+                1.0 / (self.rrf_k + candidates.c.vector_rank), 0.0
+            ) + (1 - self.vector_score_weight) * func.coalesce(1.0 / (self.rrf_k + candidates.c.text_rank), 0.0)
+        else:
+            hybrid_score = self._weighted_hybrid_score(query, query_embedding)
+
+        return (
+            select(*self._search_columns(), hybrid_score.label("hybrid_score"))
+            .select_from(self.table.join(candidates, self.table.c.id == candidates.c.id))
+            .order_by(desc("hybrid_score"))
+            .limit(limit)
+        )
+
     def vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
         Perform a vector similarity search.
@@ -445,48 +980,19 @@ class PgVector(VectorDb):
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the base statement
-            stmt = select(*columns)
-
-            # Apply filters if provided
-            if filters is not None:
-                stmt = stmt.where(self.table.c.filters.contains(filters))
-
-            # Order the results based on the distance metric
-            if self.distance == Distance.l2:
-                stmt = stmt.order_by(self.table.c.embedding.l2_distance(query_embedding))
-            elif self.distance == Distance.cosine:
-                stmt = stmt.order_by(self.table.c.embedding.cosine_distance(query_embedding))
-            elif self.distance == Distance.max_inner_product:
-                stmt = stmt.order_by(self.table.c.embedding.max_inner_product(query_embedding))
-            else:
-                logger.error(f"Unknown distance metric: {self.distance}")
+            stmt = self._vector_search_stmt(query_embedding, limit=limit, filters=filters)
+            if stmt is None:
                 return []
 
-            # Limit the number of results
-            stmt = stmt.limit(limit)
-
             # Log the query for debugging
             logger.debug(f"Vector search query: {stmt}")
 
             # Execute the query
             try:
                 with self.Session() as sess, sess.begin():
-                    if self.vector_index is not None:
-                        if isinstance(self.vector_index, Ivfflat):
-                            sess.execute(text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}"))
-                        elif isinstance(self.vector_index, HNSW):
-                            sess.execute(text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}"))
+                    index_settings = self._index_search_settings()
+                    if index_settings is not None:
+                        sess.execute(index_settings)
                     results = sess.execute(stmt).fetchall()
             except Exception as e:
                 logger.error(f"Error performing semantic search: {e}")
@@ -495,19 +1001,7 @@ class PgVector(VectorDb):
                 return []
 
             # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
+            search_results = self._to_documents(results)
 
             if self.reranker:
                 search_results = self.reranker.rerank(query=query, documents=search_results)
@@ -545,37 +1039,7 @@ class PgVector(VectorDb):
             List[Document]: List of matching documents.
         """
         try:
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the base statement
-            stmt = select(*columns)
-
-            # Build the text search vector
-            ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
-            # Create the ts_query using websearch_to_tsquery with parameter binding
-            processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
-            ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
-            # Compute the text rank
-            text_rank = func.ts_rank_cd(ts_vector, ts_query)
-
-            # Apply filters if provided
-            if filters is not None:
-                # Use the contains() method for JSONB columns to check if the filters column contains the specified filters
-                stmt = stmt.where(self.table.c.filters.contains(filters))
-
-            # Order by the relevance rank
-            stmt = stmt.order_by(text_rank.desc())
-
-            # Limit the number of results
-            stmt = stmt.limit(limit)
+            stmt = self._keyword_search_stmt(query, limit=limit, filters=filters)
 
             # Log the query for debugging
             logger.debug(f"Keyword search query: {stmt}")
@@ -591,21 +1055,7 @@ class PgVector(VectorDb):
                 return []
 
             # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
-
-            return search_results
+            return self._to_documents(results)
         except Exception as e:
             logger.error(f"Error during keyword search: {e}")
             return []
@@ -634,101 +1084,26 @@ class PgVector(VectorDb):
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the text search vector
-            ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
-            # Create the ts_query using websearch_to_tsquery with parameter binding
-            processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
-            ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
-            # Compute the text rank
-            text_rank = func.ts_rank_cd(ts_vector, ts_query)
-
-            # Compute the vector similarity score
-            if self.distance == Distance.l2:
-                # For L2 distance, smaller distances are better
-                vector_distance = self.table.c.embedding.l2_distance(query_embedding)
-                # Invert and normalize the distance to get a similarity score between 0 and 1
-                vector_score = 1 / (1 + vector_distance)
-            elif self.distance == Distance.cosine:
-                # For cosine distance, smaller distances are better
-                vector_distance = self.table.c.embedding.cosine_distance(query_embedding)
-                vector_score = 1 / (1 + vector_distance)
-            elif self.distance == Distance.max_inner_product:
-                # For inner product, higher values are better
-                # Assume embeddings are normalized, so inner product ranges from -1 to 1
-                raw_vector_score = self.table.c.embedding.max_inner_product(query_embedding)
-                # Normalize to range [0, 1]
-                vector_score = (raw_vector_score + 1) / 2
-            else:
-                logger.error(f"Unknown distance metric: {self.distance}")
+            stmt = self._hybrid_search_stmt(query, query_embedding, limit=limit, filters=filters)
+            if stmt is None:
                 return []
 
-            # Apply weights to control the influence of each score
-            # Validate the vector_weight parameter
-            if not 0 <= self.vector_score_weight <= 1:
-                raise ValueError("vector_score_weight must be between 0 and 1")
-            text_rank_weight = 1 - self.vector_score_weight  # weight for text rank
-
-            # Combine the scores into a hybrid score
-            hybrid_score = (self.vector_score_weight * vector_score) + (text_rank_weight * text_rank)
-
-            # Build the base statement, including the hybrid score
-            stmt = select(*columns, hybrid_score.label("hybrid_score"))
-
-            # Add the full-text search condition
-            # stmt = stmt.where(ts_vector.op("@@")(ts_query))
-
-            # Apply filters if provided
-            if filters is not None:
-                stmt = stmt.where(self.table.c.filters.contains(filters))
-
-            # Order the results by the hybrid score in descending order
-            stmt = stmt.order_by(desc("hybrid_score"))
-
-            # Limit the number of results
-            stmt = stmt.limit(limit)
-
             # Log the query for debugging
             logger.debug(f"Hybrid search query: {stmt}")
 
             # Execute the query
             try:
                 with self.Session() as sess, sess.begin():
-                    if self.vector_index is not None:
-                        if isinstance(self.vector_index, Ivfflat):
-                            sess.execute(text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}"))
-                        elif isinstance(self.vector_index, HNSW):
-                            sess.execute(text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}"))
+                    index_settings = self._index_search_settings()
+                    if index_settings is not None:
+                        sess.execute(index_settings)
                     results = sess.execute(stmt).fetchall()
             except Exception as e:
                 logger.error(f"Error performing hybrid search: {e}")
                 return []
 
             # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
-
-            return search_results
+            return self._to_documents(results)
         except Exception as e:
             logger.error(f"Error during hybrid search: {e}")
             return []
@@ -773,18 +1148,44 @@ class PgVector(VectorDb):
             logger.error(f"Error getting count from table '{self.table.fullname}': {e}")
             return 0
 
-    def optimize(self, force_recreate: bool = False) -> None:
+    def optimize(self, force_recreate: bool = False, concurrently: bool = False) -> None:
         """
         Optimize the vector database by creating or recreating necessary indexes.
 
+        An existing IVFFlat index with `dynamic_lists` is rebuilt online when the number of lists it was built with
+        is off by `retune_factor` from the number of lists suited to the current row count.
+
         Args:
             force_recreate (bool): If True, existing indexes will be dropped and recreated.
+            concurrently (bool): If True, indexes are built with CREATE INDEX CONCURRENTLY, so writes to the table are
+                not blocked. Recreated indexes are built next to the existing ones and swapped in when ready.
         """
         logger.debug("==== Optimizing Vector DB ====")
-        self._create_vector_index(force_recreate=force_recreate)
-        self._create_gin_index(force_recreate=force_recreate)
+        self.ensure_indexes()
+        self._create_vector_index(force_recreate=force_recreate, concurrently=concurrently)
+        self._create_gin_index(force_recreate=force_recreate, concurrently=concurrently)
         logger.debug("==== Optimized Vector DB ====")
 
+    def _index_states(self) -> Dict[str, bool]:
+        """
+        Get the indexes of the table with whether they are valid.
+
+        An index is left invalid by a CREATE INDEX CONCURRENTLY that failed or was interrupted.
+
+        Returns:
+            Dict[str, bool]: Validity of each index of the table, by index name.
+        """
+        stmt = text(
+            "SELECT c.relname, i.indisvalid FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "JOIN pg_class t ON t.oid = i.indrelid "
+            "JOIN pg_namespace n ON n.oid = t.relnamespace "
+            "WHERE n.nspname = :schema AND t.relname = :table_name"
+        )
+        with self.Session() as sess:
+            rows = sess.execute(stmt, {"schema": self.schema, "table_name": self.table_name}).fetchall()
+        return {name: valid for name, valid in rows}
+
     def _index_exists(self, index_name: str) -> bool:
         """
         Check if an index with the given name exists.
@@ -799,27 +1200,231 @@ class PgVector(VectorDb):
         indexes = inspector.get_indexes(self.table.name, schema=self.schema)
         return any(idx["name"] == index_name for idx in indexes)
 
-    def _drop_index(self, index_name: str) -> None:
+    def _drop_index(self, index_name: str, concurrently: bool = False) -> None:
         """
         Drop the index with the given name.
 
         Args:
             index_name (str): The name of the index to drop.
+            concurrently (bool): If True, drops the index without blocking reads and writes of the table.
         """
+        drop_index_sql = (
+            f'DROP INDEX {"CONCURRENTLY " if concurrently else ""}IF EXISTS "{self.schema}"."{index_name}";'
+        )
         try:
-            with self.Session() as sess, sess.begin():
-                drop_index_sql = f'DROP INDEX IF EXISTS "{self.schema}"."{index_name}";'
-                sess.execute(text(drop_index_sql))
+            if concurrently:
+                with self.db_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                    conn.execute(text(drop_index_sql))
+            else:
+                with self.Session() as sess, sess.begin():
+                    sess.execute(text(drop_index_sql))
         except Exception as e:
             logger.error(f"Error dropping index '{index_name}': {e}")
             raise
 
-    def _create_vector_index(self, force_recreate: bool = False) -> None:
+    def _build_index(
+        self,
+        index_name: str,
+        definition: str,
+        configuration: Optional[Dict[str, Any]] = None,
+        concurrently: bool = False,
+        replace: bool = False,
+    ) -> None:
+        """
+        Create an index on the table.
+
+        Args:
+            index_name (str): The name of the index.
+            definition (str): The index definition following the table name, e.g. "USING GIN (filters)".
+            configuration (Optional[Dict[str, Any]]): Settings applied before building the index.
+            concurrently (bool): If True, builds the index with CREATE INDEX CONCURRENTLY.
+            replace (bool): If True, replaces the existing index with the same name. When building concurrently,
+                the new index is built under a temporary name and swapped with the existing one in a short transaction.
+        """
+        if replace and not concurrently:
+            self._drop_index(index_name)
+        build_name = f"{index_name}_new" if replace and concurrently else index_name
+
+        try:
+            if concurrently:
+                # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+                with self.db_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                    for key, value in (configuration or {}).items():
+                        conn.execute(text(f"SET {key} = :value;"), {"value": value})
+                    # Leftover of an interrupted rebuild, invalid indexes are not replaced by IF NOT EXISTS
+                    conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{self.schema}"."{build_name}";'))
+                    conn.execute(
+                        text(f'CREATE INDEX CONCURRENTLY "{build_name}" ON {self.table.fullname} {definition};')
+                    )
+            else:
+                with self.Session() as sess, sess.begin():
+                    for key, value in (configuration or {}).items():
+                        sess.execute(text(f"SET {key} = :value;"), {"value": value})
+                    sess.execute(text(f'CREATE INDEX "{index_name}" ON {self.table.fullname} {definition};'))
+        except Exception as e:
+            logger.error(f"Error creating index '{build_name}': {e}")
+            raise
+
+        if build_name != index_name:
+            with self.Session() as sess, sess.begin():
+                sess.execute(text(f'DROP INDEX IF EXISTS "{self.schema}"."{index_name}";'))
+                sess.execute(text(f'ALTER INDEX "{self.schema}"."{build_name}" RENAME TO "{index_name}";'))
+            logger.info(f"Swapped in rebuilt index '{index_name}'")
+
+    def _index_statements(self, columns: Set[str]) -> Dict[str, str]:
+        """
+        Get the CREATE INDEX CONCURRENTLY statements of the indexes of the schema version that an existing table with
+        the given columns can have. An index on a column the table does not have, e.g. the text search column of
+        schema version 2 on a table that was not upgraded, is left out.
+
+        Args:
+            columns (Set[str]): The columns of the existing table.
+
+        Returns:
+            Dict[str, str]: The statement creating each index, by index name.
+        """
+        # Indexes of a copy of the table are built concurrently, self.table still creates them with the table
+        table = self.table.to_metadata(MetaData())
+        statements: Dict[str, str] = {}
+        for index in sorted(table.indexes, key=lambda index: str(index.name)):
+            missing_columns = [column.name for column in index.columns if column.name not in columns]
+            if len(missing_columns) > 0:
+                logger.debug(f"Skipping index '{index.name}', the table has no column {', '.join(missing_columns)}")
+                continue
+            index.dialect_options["postgresql"]["concurrently"] = True
+            statements[str(index.name)] = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+        return statements
+
+    def ensure_indexes(self) -> None:
+        """
+        Create the indexes of the table definition missing from an existing table, e.g. a table created by an earlier
+        version. They are built with CREATE INDEX CONCURRENTLY, so writes to the table are not blocked.
+        Invalid indexes left by an interrupted build are rebuilt.
+        """
+        index_states = self._index_states()
+        columns = {
+            column["name"] for column in inspect(self.db_engine).get_columns(self.table_name, schema=self.schema)
+        }
+        for index_name, create_index_sql in self._index_statements(columns).items():
+            if index_states.get(index_name) is True:
+                continue
+            logger.info(f"Creating missing index '{index_name}' on table '{self.table.fullname}'")
+            try:
+                if index_name in index_states:
+                    self._drop_index(index_name, concurrently=True)
+                # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+                with self.db_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                    conn.execute(text(create_index_sql))
+            except Exception as e:
+                logger.warning(f"Could not create index '{index_name}': {e}")
+
+    def rebuild_index(self, index_name: str) -> None:
+        """
+        Rebuild an index with REINDEX CONCURRENTLY (Postgres 12+), without blocking reads and writes of the table.
+
+        Args:
+            index_name (str): The name of the index to rebuild.
+        """
+        logger.info(f"Rebuilding index '{index_name}'")
+        with self.db_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text(f'REINDEX INDEX CONCURRENTLY "{self.schema}"."{index_name}";'))
+
+    def index_report(self) -> List[Dict[str, Any]]:
+        """
+        Report the indexes of the table with their size and usage, largest first.
+
+        Usage counters are cumulative since the statistics of the database were last reset.
+
+        Returns:
+            List[Dict[str, Any]]: For each index, its name, access method, size, number of scans, number of
+                index entries read and table rows fetched, whether it is valid, its options and its definition.
+        """
+        stmt = text(
+            "SELECT s.indexrelname AS name, am.amname AS method, pg_relation_size(s.indexrelid) AS size_bytes, "
+            "pg_size_pretty(pg_relation_size(s.indexrelid)) AS size, s.idx_scan AS scans, "
+            "s.idx_tup_read AS tuples_read, s.idx_tup_fetch AS tuples_fetched, i.indisvalid AS valid, "
+            "c.reloptions AS options, pg_get_indexdef(s.indexrelid) AS definition "
+            "FROM pg_stat_user_indexes s "
+            "JOIN pg_index i ON i.indexrelid = s.indexrelid "
+            "JOIN pg_class c ON c.oid = s.indexrelid "
+            "JOIN pg_am am ON am.oid = c.relam "
+            "WHERE s.schemaname = :schema AND s.relname = :table_name "
+            "ORDER BY pg_relation_size(s.indexrelid) DESC"
+        )
+        with self.Session() as sess:
+            rows = sess.execute(stmt, {"schema": self.schema, "table_name": self.table_name}).mappings().all()
+        report = [dict(row) for row in rows]
+        for index in report:
+            logger.debug(
+                f"Index '{index['name']}' ({index['method']}): {index['size']}, {index['scans']} scans"
+                f"{'' if index['valid'] else ', INVALID'}"
+            )
+        return report
+
+    def _ivfflat_lists(self) -> int:
+        """
+        Number of lists for an IVFFlat index on the table, rows / 1000 up to 1M rows and sqrt(rows) above.
+
+        Returns:
+            int: The number of lists.
+        """
+        self.vector_index = cast(Ivfflat, self.vector_index)
+        if not self.vector_index.dynamic_lists:
+            return self.vector_index.lists
+        total_records = self.get_count()
+        logger.debug(f"Number of records: {total_records}")
+        if total_records < 1000000:
+            return max(int(total_records / 1000), 1)  # Ensure at least one list
+        return max(int(sqrt(total_records)), 1)
+
+    def _index_options(self, index_name: str) -> Dict[str, str]:
+        """
+        Get the storage options an index was built with, e.g. the lists of an IVFFlat index.
+
+        Args:
+            index_name (str): The name of the index.
+
+        Returns:
+            Dict[str, str]: The options of the index.
+        """
+        stmt = text(
+            "SELECT c.reloptions FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = :schema AND c.relname = :index_name"
+        )
+        with self.Session() as sess:
+            options = sess.execute(stmt, {"schema": self.schema, "index_name": index_name}).scalar()
+        return dict(option.split("=", 1) for option in options or [])
+
+    def _ivfflat_needs_retune(self) -> bool:
+        """
+        Check if the IVFFlat index was built with a number of lists that no longer suits the row count.
+
+        Returns:
+            bool: True if the index should be rebuilt.
+        """
+        if not isinstance(self.vector_index, Ivfflat) or not self.vector_index.dynamic_lists:
+            return False
+        if self.vector_index.retune_factor is None or self.vector_index.name is None:
+            return False
+        current_lists = int(self._index_options(self.vector_index.name).get("lists", 0))
+        if current_lists <= 0:
+            return False
+        ideal_lists = self._ivfflat_lists()
+        ratio = max(current_lists, ideal_lists) / min(current_lists, ideal_lists)
+        if ratio < self.vector_index.retune_factor:
+            return False
+        logger.info(
+            f"Vector index '{self.vector_index.name}' has {current_lists} lists, {ideal_lists} suit the current row count."
+        )
+        return True
+
+    def _create_vector_index(self, force_recreate: bool = False, concurrently: bool = False) -> None:
         """
         Create or recreate the vector index.
 
         Args:
             force_recreate (bool): If True, existing index will be dropped and recreated.
+            concurrently (bool): If True, the index is built without blocking writes to the table.
         """
         if self.vector_index is None:
             logger.debug("No vector index specified, skipping vector index optimization.")
@@ -837,113 +1442,65 @@ class PgVector(VectorDb):
             Distance.cosine: "vector_cosine_ops",
         }.get(self.distance, "vector_cosine_ops")
 
-        # Get the fully qualified table name
-        table_fullname = self.table.fullname  # includes schema if any
-
         # Check if vector index already exists
         vector_index_exists = self._index_exists(self.vector_index.name)
 
         if vector_index_exists:
             logger.info(f"Vector index '{self.vector_index.name}' already exists.")
             if force_recreate:
-                logger.info(f"Force recreating vector index '{self.vector_index.name}'. Dropping existing index.")
-                self._drop_index(self.vector_index.name)
+                logger.info(f"Force recreating vector index '{self.vector_index.name}'.")
+            elif self._ivfflat_needs_retune():
+                # Re-tuning runs as the row count grows, so it never blocks writes
+                logger.info(f"Rebuilding vector index '{self.vector_index.name}' with re-tuned lists.")
+                concurrently = True
             else:
                 logger.info(f"Skipping vector index creation as index '{self.vector_index.name}' already exists.")
                 return
 
-        # Proceed to create the vector index
-        try:
-            with self.Session() as sess, sess.begin():
-                # Set configuration parameters
-                if self.vector_index.configuration:
-                    logger.debug(f"Setting configuration: {self.vector_index.configuration}")
-                    for key, value in self.vector_index.configuration.items():
-                        sess.execute(text(f"SET {key} = :value;"), {"value": value})
-
-                if isinstance(self.vector_index, Ivfflat):
-                    self._create_ivfflat_index(sess, table_fullname, index_distance)
-                elif isinstance(self.vector_index, HNSW):
-                    self._create_hnsw_index(sess, table_fullname, index_distance)
-                else:
-                    logger.error(f"Unknown index type: {type(self.vector_index)}")
-                    return
-        except Exception as e:
-            logger.error(f"Error creating vector index '{self.vector_index.name}': {e}")
-            raise
-
-    def _create_ivfflat_index(self, sess: Session, table_fullname: str, index_distance: str) -> None:
-        """
-        Create an IVFFlat index.
-
-        Args:
-            sess (Session): SQLAlchemy session.
-            table_fullname (str): Fully qualified table name.
-            index_distance (str): Distance metric for the index.
-        """
-        # Cast index to Ivfflat for type hinting
-        self.vector_index = cast(Ivfflat, self.vector_index)
-
-        # Determine number of lists
-        num_lists = self.vector_index.lists
-        if self.vector_index.dynamic_lists:
-            total_records = self.get_count()
-            logger.debug(f"Number of records: {total_records}")
-            if total_records < 1000000:
-                num_lists = max(int(total_records / 1000), 1)  # Ensure at least one list
-            else:
-                num_lists = max(int(sqrt(total_records)), 1)
-
-        # Set ivfflat.probes
-        sess.execute(text("SET ivfflat.probes = :probes;"), {"probes": self.vector_index.probes})
-
-        logger.debug(
-            f"Creating Ivfflat index '{self.vector_index.name}' on table '{table_fullname}' with "
-            f"lists: {num_lists}, probes: {self.vector_index.probes}, "
-            f"and distance metric: {index_distance}"
-        )
-
-        # Create index
-        create_index_sql = text(
-            f'CREATE INDEX "{self.vector_index.name}" ON {table_fullname} '
-            f"USING ivfflat (embedding {index_distance}) "
-            f"WITH (lists = :num_lists);"
-        )
-        sess.execute(create_index_sql, {"num_lists": num_lists})
-
-    def _create_hnsw_index(self, sess: Session, table_fullname: str, index_distance: str) -> None:
-        """
-        Create an HNSW index.
-
-        Args:
-            sess (Session): SQLAlchemy session.
-            table_fullname (str): Fully qualified table name.
-            index_distance (str): Distance metric for the index.
-        """
-        # Cast index to HNSW for type hinting
-        self.vector_index = cast(HNSW, self.vector_index)
-
-        logger.debug(
-            f"Creating HNSW index '{self.vector_index.name}' on table '{table_fullname}' with "
-            f"m: {self.vector_index.m}, ef_construction: {self.vector_index.ef_construction}, "
-            f"and distance metric: {index_distance}"
-        )
+        if isinstance(self.vector_index, Ivfflat):
+            num_lists = self._ivfflat_lists()
+            logger.debug(
+                f"Creating Ivfflat index '{self.vector_index.name}' on table '{self.table.fullname}' with "
+                f"lists: {num_lists}, probes: {self.vector_index.probes}, "
+                f"and distance metric: {index_distance}"
+            )
+            definition = f"USING ivfflat (embedding {index_distance}) WITH (lists = {int(num_lists)})"
+        elif isinstance(self.vector_index, HNSW):
+            logger.debug(
+                f"Creating HNSW index '{self.vector_index.name}' on table '{self.table.fullname}' with "
+                f"m: {self.vector_index.m}, ef_construction: {self.vector_index.ef_construction}, "
+                f"and distance metric: {index_distance}"
+            )
+            definition = (
+                f"USING hnsw (embedding {index_distance}) "
+                f"WITH (m = {int(self.vector_index.m)}, ef_construction = {int(self.vector_index.ef_construction)})"
+            )
+        else:
+            logger.error(f"Unknown index type: {type(self.vector_index)}")
+            return
 
-        # Create index
-        create_index_sql = text(
-            f'CREATE INDEX "{self.vector_index.name}" ON {table_fullname} '
-            f"USING hnsw (embedding {index_distance}) "
-            f"WITH (m = :m, ef_construction = :ef_construction);"
+        if self.vector_index.configuration:
+            logger.debug(f"Setting configuration: {self.vector_index.configuration}")
+        self._build_index(
+            self.vector_index.name,
+            definition,
+            configuration=self.vector_index.configuration,
+            concurrently=concurrently,
+            replace=vector_index_exists,
         )
-        sess.execute(create_index_sql, {"m": self.vector_index.m, "ef_construction": self.vector_index.ef_construction})
 
-    def _create_gin_index(self, force_recreate: bool = False) -> None:
+    def _create_gin_index(self, force_recreate: bool = False, concurrently: bool = False) -> None:
         """
         Create or recreate the GIN index for full-text search.
 
         Args:
             force_recreate (bool): If True, existing index will be dropped and recreated.
+            concurrently (bool): If True, the index is built without blocking writes to the table.
         """
+        if self.schema_version >= 2:
+            logger.debug("Skipping GIN index creation, schema version 2 indexes the stored text search column.")
+            return
+
         gin_index_name = f"{self.table_name}_content_gin_index"
 
         gin_index_exists = self._index_exists(gin_index_name)
@@ -951,25 +1508,19 @@ class PgVector(VectorDb):
         if gin_index_exists:
             logger.info(f"GIN index '{gin_index_name}' already exists.")
             if force_recreate:
-                logger.info(f"Force recreating GIN index '{gin_index_name}'. Dropping existing index.")
-                self._drop_index(gin_index_name)
+                logger.info(f"Force recreating GIN index '{gin_index_name}'.")
             else:
                 logger.info(f"Skipping GIN index creation as index '{gin_index_name}' already exists.")
                 return
 
-        # Proceed to create GIN index
-        try:
-            with self.Session() as sess, sess.begin():
-                logger.debug(f"Creating GIN index '{gin_index_name}' on table '{self.table.fullname}'.")
-                # Create index
-                create_gin_index_sql = text(
-                    f'CREATE INDEX "{gin_index_name}" ON {self.table.fullname} '
-                    f"USING GIN (to_tsvector({self.content_language}, content));"
-                )
-                sess.execute(create_gin_index_sql)
-        except Exception as e:
-            logger.error(f"Error creating GIN index '{gin_index_name}': {e}")
-            raise
+        logger.debug(f"Creating GIN index '{gin_index_name}' on table '{self.table.fullname}'.")
+        content_language = self.content_language.replace("'", "''")
+        self._build_index(
+            gin_index_name,
+            f"USING GIN (to_tsvector('{content_language}'::regconfig, content))",
+            concurrently=concurrently,
+            replace=gin_index_exists,
+        )
 
     def delete(self) -> bool:
         """
@@ -1013,7 +1564,7 @@ class PgVector(VectorDb):
             if k in {"metadata", "table"}:
                 continue
             # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "Session", "embedder"}:
+            elif k in {"db_engine", "Session", "async_db_engine", "_async_session", "embedder"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
@@ -218,8 +218,8 @@ class PineconeDb(VectorDb):
         """
 
         vectors = []
+        Document.embed_batch(documents, self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             document.meta_data["text"] = document.content
             data_to_upsert = {
                 "id": document.id,
@@ -1,8 +1,8 @@
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
-    from qdrant_client import QdrantClient  # noqa: F401
+    from qdrant_client import AsyncQdrantClient, QdrantClient  # noqa: F401
     from qdrant_client.http import models
 except ImportError:
     raise ImportError(
@@ -51,8 +51,9 @@ class Qdrant(VectorDb):
         # Distance metric
         self.distance: Distance = distance
 
-        # Qdrant client instance
+        # Qdrant client instances
         self._client: Optional[QdrantClient] = None
+        self._async_client: Optional[AsyncQdrantClient] = None
 
         # Qdrant client arguments
         self.location: Optional[str] = location
@@ -93,6 +94,31 @@ class Qdrant(VectorDb):
             )
         return self._client
 
+    @property
+    def async_client(self) -> AsyncQdrantClient:
+        if self._async_client is None:
+            logger.debug("Creating Async Qdrant Client")
+            self._async_client = AsyncQdrantClient(
+                location=self.location,
+                url=self.url,
+                port=self.port,
+                grpc_port=self.grpc_port,
+                prefer_grpc=self.prefer_grpc,
+                https=self.https,
+                api_key=self.api_key,
+                prefix=self.prefix,
+                timeout=int(self.timeout) if self.timeout is not None else None,
+                host=self.host,
+                path=self.path,
+                **self.kwargs,
+            )
+        return self._async_client
+
+    @property
+    def is_local(self) -> bool:
+        """True for an in-memory or on-disk collection, which is only visible to the client that opened it"""
+        return self.location == ":memory:" or self.path is not None
+
     def create(self) -> None:
         # Collection distance
         _distance = models.Distance.COSINE
@@ -125,6 +151,40 @@ class Qdrant(VectorDb):
             return len(collection_points) > 0
         return False
 
+    def existing_hashes(self, hashes: List[str]) -> Set[str]:
+        """
+        Get the content hashes that already exist in the collection
+
+        Args:
+            hashes (List[str]): Content hashes to check
+        """
+        existing: Set[str] = set()
+        if self.client:
+            for i in range(0, len(hashes), 1000):
+                collection_points = self.client.retrieve(
+                    collection_name=self.collection,
+                    ids=hashes[i : i + 1000],
+                    with_payload=False,
+                    with_vectors=False,
+                )
+                # Qdrant returns the md5 ids formatted as UUIDs
+                existing.update(str(point.id).replace("-", "") for point in collection_points)
+        return existing
+
+    def delete_hashes(self, hashes: List[str]) -> None:
+        """
+        Delete the points with the given content hashes
+
+        Args:
+            hashes (List[str]): Content hashes to delete
+        """
+        if self.client:
+            for i in range(0, len(hashes), 1000):
+                self.client.delete(
+                    collection_name=self.collection,
+                    points_selector=models.PointIdsList(points=hashes[i : i + 1000]),
+                )
+
     def name_exists(self, name: str) -> bool:
         """
         Validates if a document with the given name exists in the collection.
@@ -157,8 +217,8 @@ class Qdrant(VectorDb):
         """
         logger.debug(f"Inserting {len(documents)} documents")
         points = []
+        Document.embed_batch(documents, self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             points.append(
@@ -210,7 +270,60 @@ class Qdrant(VectorDb):
             with_payload=True,
             limit=limit,
         )
+        return self._build_search_results(query, results)
+
+    async def asearch(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """
+        Search for documents in the database without blocking the event loop.
+
+        Args:
+            query (str): Query to search for
+            limit (int): Number of search results to return
+            filters (Optional[Dict[str, Any]]): Filters to apply while searching
+        """
+        # A local collection is not shared with a second client, so search it with the sync client in a thread
+        if self.is_local:
+            return await super().asearch(query=query, limit=limit, filters=filters)
+
+        query_embedding = await self.embedder.aget_embedding(query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        results = await self.async_client.search(
+            collection_name=self.collection,
+            query_vector=query_embedding,
+            with_vectors=True,
+            with_payload=True,
+            limit=limit,
+        )
+        return self._build_search_results(query, results)
+
+    def search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """
+        Search for several queries, embedded in one batch and sent in a single search_batch request.
+
+        Args:
+            queries (List[str]): Queries to search for
+            limit (int): Number of search results to return for each query
+            filters (Optional[Dict[str, Any]]): Filters to apply while searching
+        """
+        if len(queries) == 0:
+            return []
+        query_embeddings, _ = self.embedder.get_embeddings_batch(queries)
+
+        batch_results = self.client.search_batch(
+            collection_name=self.collection,
+            requests=[
+                models.SearchRequest(vector=query_embedding, limit=limit, with_vector=True, with_payload=True)
+                for query_embedding in query_embeddings
+            ],
+        )
+        return [self._build_search_results(query, results) for query, results in zip(queries, batch_results)]
 
+    def _build_search_results(self, query: str, results: List[models.ScoredPoint]) -> List[Document]:
         # Build search results
         search_results: List[Document] = []
         for result in results:
@@ -5,3 +5,10 @@ class SearchType(str, Enum):
     vector = "vector"
     keyword = "keyword"
     hybrid = "hybrid"
+
+
+class HybridFusion(str, Enum):
+    # Reciprocal rank fusion of the ranks in each candidate list
+    rrf = "rrf"
+    # Weighted sum of the vector similarity and text rank of each candidate
+    weighted = "weighted"
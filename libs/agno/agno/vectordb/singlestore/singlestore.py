@@ -1,6 +1,6 @@
 import json
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from sqlalchemy.dialects import mysql
@@ -144,6 +144,34 @@ class SingleStore(VectorDb):
             result = sess.execute(stmt).first()
             return result is not None
 
+    def existing_hashes(self, hashes: List[str]) -> Set[str]:
+        """
+        Get the content hashes that already exist in the table
+
+        Args:
+            hashes (List[str]): Content hashes to check
+        """
+        existing: Set[str] = set()
+        with self.Session.begin() as sess:
+            for i in range(0, len(hashes), 1000):
+                batch_hashes = hashes[i : i + 1000]
+                stmt = select(self.table.c.content_hash).where(self.table.c.content_hash.in_(batch_hashes))
+                existing.update(row[0] for row in sess.execute(stmt))
+        return existing
+
+    def delete_hashes(self, hashes: List[str]) -> None:
+        """
+        Delete the rows with the given content hashes
+
+        Args:
+            hashes (List[str]): Content hashes to delete
+        """
+        from sqlalchemy import delete
+
+        with self.Session.begin() as sess:
+            for i in range(0, len(hashes), 1000):
+                sess.execute(delete(self.table).where(self.table.c.content_hash.in_(hashes[i : i + 1000])))
+
     def name_exists(self, name: str) -> bool:
         """
         Validate if a row with this name exists or not
@@ -179,8 +207,8 @@ class SingleStore(VectorDb):
         """
         with self.Session.begin() as sess:
             counter = 0
+            Document.embed_batch(documents, self.embedder)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -218,8 +246,8 @@ class SingleStore(VectorDb):
         """
         with self.Session.begin() as sess:
             counter = 0
+            Document.embed_batch(documents, self.embedder)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -0,0 +1,67 @@
+import asyncio
+from inspect import iscoroutinefunction
+from typing import Any, Dict, List, Optional
+
+from agno.agent import Agent
+from agno.document import Document
+from agno.knowledge.agent import AgentKnowledge
+from agno.run.response import RunResponse
+from agno.tools.function import Function
+from agno.vectordb.base import VectorDb
+
+
+class AsyncOnlyVectorDb(VectorDb):
+    def create(self) -> None:
+        pass
+
+    def doc_exists(self, document: Document) -> bool:
+        return False
+
+    def name_exists(self, name: str) -> bool:
+        return False
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    def drop(self) -> None:
+        pass
+
+    def exists(self) -> bool:
+        return True
+
+    def delete(self) -> bool:
+        return True
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        raise AssertionError("search should not be called by async runs")
+
+    async def asearch(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        await asyncio.sleep(0)
+        return [Document(content=f"{query} {i}") for i in range(limit)]
+
+
+def test_async_references_and_search_tool_use_the_async_search():
+    agent = Agent(knowledge=AgentKnowledge(vector_db=AsyncOnlyVectorDb(), num_documents=2), add_references=True)
+    agent.run_response = RunResponse()
+
+    async def run():
+        references = await agent.aget_references_from_knowledge(message="agno")
+        tool_result = await agent.asearch_knowledge_base(query="tools")
+        return references, tool_result
+
+    references, tool_result = asyncio.run(run())
+    assert references is not None
+    assert [reference["content"] for reference in references.references] == ["agno 0", "agno 1"]
+    assert "tools 1" in tool_result
+    assert len(agent.run_response.extra_data.references) == 2
+
+    # The prefetched references are used for the user message without searching again
+    user_message = agent.get_user_message(message="agno", references=references)
+    assert "agno 1" in user_message.content
+
+    search_tools = [tool for tool in agent.get_tools(async_mode=True) if isinstance(tool, Function)]
+    assert [tool.name for tool in search_tools] == ["search_knowledge_base"]
+    assert iscoroutinefunction(search_tools[0].entrypoint)
@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+from typing import Any, Iterator, List
+
+from agno.agent import Agent
+from agno.memory.agent import AgentMemory
+from agno.memory.classifier import MemoryClassifier
+from agno.memory.manager import MemoryManager
+from agno.memory.summarizer import MemorySummarizer
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from agno.run.response import RunResponse
+
+
+@dataclass
+class StubModel(Model):
+    id: str = "stub"
+
+    def invoke(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    def invoke_stream(self, *args, **kwargs) -> Iterator[Any]:
+        raise NotImplementedError
+
+    async def ainvoke_stream(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    def response(self, messages: List[Message]) -> ModelResponse:
+        raise NotImplementedError
+
+    async def aresponse(self, messages: List[Message]) -> ModelResponse:
+        raise NotImplementedError
+
+    def response_stream(self, messages: List[Message]) -> Iterator[ModelResponse]:
+        raise NotImplementedError
+
+    async def aresponse_stream(self, messages: List[Message]) -> Any:
+        raise NotImplementedError
+
+
+def get_memory() -> AgentMemory:
+    return AgentMemory(
+        create_user_memories=True,
+        manager=MemoryManager(model=StubModel(), user_id="owner"),
+        classifier=MemoryClassifier(model=StubModel()),
+        summarizer=MemorySummarizer(model=StubModel()),
+    )
+
+
+def test_clone_for_request_clones_team_members():
+    member = Agent(name="member", memory=AgentMemory())
+    member.memory.add_message(message=Message(role="user", content="from another request"))
+    leader = Agent(name="leader", team=[member])
+
+    clone = leader.clone_for_request()
+    assert clone.team is not None
+    assert clone.team[0] is not member
+    assert clone.team[0].name == "member"
+    assert clone.team[0].memory is not member.memory
+    assert clone.team[0].memory.messages == []
+    assert leader.team == [member]
+
+
+def test_clones_do_not_share_memory_helpers():
+    agent = Agent(memory=get_memory())
+    agent.memory.manager.update_model()  # type: ignore
+
+    first = agent.clone_for_request(update={"user_id": "first"})
+    second = agent.clone_for_request(update={"user_id": "second"})
+    for helper in ("manager", "classifier", "summarizer"):
+        first_helper = getattr(first.memory, helper)
+        second_helper = getattr(second.memory, helper)
+        assert first_helper is not second_helper
+        assert first_helper is not getattr(agent.memory, helper)
+        assert first_helper.model is not second_helper.model
+
+    # The tools of the manager model are bound to the manager they were added by
+    assert first.memory.manager.model.tools is None
+    first.memory.manager.user_id = "first"
+    assert second.memory.manager.user_id == "owner"
+    first.memory.classifier.existing_memories = []
+    assert second.memory.classifier.existing_memories is None
+
+
+def test_session_views_have_isolated_run_state():
+    agent = Agent(memory=get_memory(), session_state={"cart": []}, user_id="owner")
+    agent.run_response = RunResponse(content="response of an earlier request")
+    first = agent.session_view(session_id="first", user_id="alice")
+    second = agent.session_view(session_id="second", user_id="bob")
+
+    assert (first.session_id, first.user_id) == ("first", "alice")
+    assert (second.session_id, second.user_id) == ("second", "bob")
+    assert first.memory is not second.memory
+    for helper in ("manager", "classifier", "summarizer"):
+        assert getattr(first.memory, helper) is not getattr(second.memory, helper)
+
+    first.memory.add_message(message=Message(role="user", content="only in the first session"))  # type: ignore
+    first.session_state["cart"].append("apple")  # type: ignore
+    first.run_response = RunResponse(content="first response")
+    assert second.memory.messages == []  # type: ignore
+    assert agent.memory.messages == []  # type: ignore
+    assert second.session_state == {"cart": []}
+    assert agent.session_state == {"cart": []}
+    assert second.run_response is None
+    assert agent.run_response.content == "response of an earlier request"
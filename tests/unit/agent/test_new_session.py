@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+from typing import Any, Iterator, List
+
+import pytest
+
+from agno.agent import Agent
+from agno.memory.agent import AgentMemory
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+
+pytest.importorskip("sqlalchemy")
+
+from agno.storage.agent.sqlite import SqliteAgentStorage  # noqa: E402
+
+
+@dataclass
+class EchoModel(Model):
+    id: str = "echo"
+
+    def invoke(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    def invoke_stream(self, *args, **kwargs) -> Iterator[Any]:
+        raise NotImplementedError
+
+    async def ainvoke_stream(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    def response(self, messages: List[Message]) -> ModelResponse:
+        content = f"echo: {messages[-1].content}"
+        messages.append(Message(role="assistant", content=content))
+        return ModelResponse(content=content)
+
+    async def aresponse(self, messages: List[Message]) -> ModelResponse:
+        return self.response(messages)
+
+    def response_stream(self, messages: List[Message]) -> Iterator[ModelResponse]:
+        yield self.response(messages)
+
+    async def aresponse_stream(self, messages: List[Message]) -> Any:
+        yield self.response(messages)
+
+
+def test_new_session_starts_without_the_runs_offset_of_the_previous_session(tmp_path):
+    storage = SqliteAgentStorage(table_name="sessions", db_file=str(tmp_path / "agent.db"), schema_version=2)
+    agent = Agent(
+        model=EchoModel(),
+        memory=AgentMemory(),
+        storage=storage,
+        session_id="old",
+        introduction="Hello!",
+        add_history_to_messages=True,
+        num_history_responses=1,
+    )
+    for i in range(3):
+        agent.run(f"message {i}")
+    assert agent.memory is not None
+    # Only the last run of the session is loaded
+    assert agent.memory.runs_offset > 0
+
+    agent.new_session()
+    assert agent.memory.runs_offset == 0
+    agent.run("first message of the new session")
+
+    new_session = storage.read(agent.session_id)  # type: ignore
+    assert new_session is not None and new_session.memory is not None
+    assert [run["response"]["content"] for run in new_session.memory["runs"]] == [
+        "Hello!",
+        "echo: first message of the new session",
+    ]
+    assert "runs_offset" not in new_session.memory
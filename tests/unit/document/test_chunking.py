@@ -0,0 +1,106 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from agno.document import Document
+from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.chunking.parallel import ParallelChunker
+from agno.document.chunking.recursive import RecursiveChunking
+from agno.document.chunking.semantic import SemanticChunking
+from agno.document.chunking.token import TokenChunking
+from agno.embedder.base import Embedder
+from agno.utils.token_counter import TokenEncoder, count_tokens_batch, get_encoder, register_encoder
+
+
+class WordEncoder(TokenEncoder):
+    """One token per word, with the space before it"""
+
+    def encode(self, text: str) -> List[int]:
+        return [len(word) for word in re.findall(r" ?\S+| +$", text)]
+
+    def token_offsets(self, text: str) -> List[int]:
+        return [match.start() for match in re.finditer(r" ?\S+| +$", text)]
+
+
+@dataclass
+class VowelEmbedder(Embedder):
+    """Embeds a text with its number of each vowel, picklable for the worker processes"""
+
+    dimensions: int = 5
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return [float(text.count(vowel) + 1) for vowel in "aeiou"], None
+
+
+def test_clean_text_collapses_whitespace_in_one_pass():
+    chunker = FixedSizeChunking()
+    for text in ["", " ", "\n\na\t\tb\r\n c\x0b\x0bd\xa0e ", "word"]:
+        assert chunker.clean_text(text) == re.sub(r"\s+", " ", text)
+
+
+def test_chunks_are_spans_of_the_cleaned_text():
+    document = Document(content="alpha beta.\n\ngamma delta. " * 50, id="doc", meta_data={"source": "test"})
+    content = FixedSizeChunking().clean_text(document.content)
+
+    chunks = FixedSizeChunking(chunk_size=40, overlap=5).chunk(document)
+    assert all(len(chunk.content) <= 40 and chunk.content in content for chunk in chunks)
+    assert chunks[0].content == "alpha beta. gamma delta. alpha beta."
+    assert chunks[1].content.startswith("beta.")
+    assert chunks[1].id == "doc_2"
+    assert chunks[1].meta_data == {"source": "test", "chunk": 2, "chunk_size": len(chunks[1].content)}
+    assert document.meta_data == {"source": "test"}
+
+    recursive_chunks = RecursiveChunking(chunk_size=40).chunk(document)
+    assert "".join(chunk.content for chunk in recursive_chunks) == content
+    assert all(chunk.content.endswith(".") for chunk in recursive_chunks[:-1])
+
+
+def test_overlap_always_moves_forward():
+    # The first whitespace is within the overlap of the chunk start
+    document = Document(content="a " + "b" * 30, name="doc")
+    assert len(FixedSizeChunking(chunk_size=10, overlap=5).chunk(document)) < 10
+    assert len(RecursiveChunking(chunk_size=10, overlap=5).chunk(Document(content="a." + "b" * 30))) < 10
+
+
+def test_token_chunking_slices_the_tokens_of_the_document():
+    register_encoder("word-model", WordEncoder())
+    assert get_encoder("word-model") is get_encoder("word-model")
+    assert count_tokens_batch(["one two three", "", "four"], model="word-model") == [3, 0, 1]
+
+    document = Document(content="w1 w2\nw3   w4 w5 w6 w7", id="doc")
+    chunks = TokenChunking(chunk_size=3, overlap=1, model="word-model").chunk(document)
+    assert [chunk.content for chunk in chunks] == ["w1 w2 w3", " w3 w4 w5", " w5 w6 w7"]
+    assert [chunk.id for chunk in chunks] == ["doc_1", "doc_2", "doc_3"]
+
+
+def test_parallel_chunker_keeps_the_order_of_documents():
+    documents = [Document(content=f"document {i} " * 40, id=f"doc{i}", meta_data={"i": i}) for i in range(10)]
+    strategy = FixedSizeChunking(chunk_size=50)
+
+    chunker = ParallelChunker(strategy, max_workers=2, min_parallel_chars=0)
+    try:
+        chunks = chunker.chunk_batch(documents)
+        assert chunker._executor is not None
+    finally:
+        chunker.close()
+    expected = strategy.chunk_batch(documents)
+    assert [(c.id, c.content, c.meta_data) for c in chunks] == [(c.id, c.content, c.meta_data) for c in expected]
+
+    # Small batches are chunked in the calling process
+    in_process = ParallelChunker(strategy, max_workers=2)
+    assert len(in_process.chunk_batch(documents)) == len(expected)
+    assert in_process._executor is None
+
+
+def test_parallel_chunker_keeps_the_embeddings_of_the_chunks():
+    documents = [Document(content=f"Sentence {i} of a doc. Another one here. " * 20, id=f"doc{i}") for i in range(4)]
+    strategy = SemanticChunking(embedder=VowelEmbedder(), chunk_size=200, embed_sentences=True)
+
+    chunker = ParallelChunker(strategy, max_workers=2, min_parallel_chars=0)
+    try:
+        chunks = chunker.chunk_batch(documents)
+    finally:
+        chunker.close()
+    expected = strategy.chunk_batch(documents)
+    assert all(chunk.embedding is not None for chunk in expected)
+    assert [(c.id, c.embedding) for c in chunks] == [(c.id, c.embedding) for c in expected]
@@ -0,0 +1,127 @@
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+pytest.importorskip("pypdf")
+pytest.importorskip("PIL")
+
+from agno.document.reader import pdf_reader  # noqa: E402
+from agno.document.reader.pdf_reader import PDFImageReader, PDFReader  # noqa: E402
+from agno.knowledge.pdf import PDFKnowledgeBase  # noqa: E402
+
+
+def write_pdf(path: Path, pages: List[Tuple[str, List[int]]]) -> Path:
+    """Writes a PDF with a line of text on each page and a gray image of one pixel high for each width"""
+    objects: List[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+    for text, widths in pages:
+        images = []
+        for width in widths:
+            objects.append(
+                b"<< /Type /XObject /Subtype /Image /Width %d /Height 1 /ColorSpace /DeviceGray /BitsPerComponent 8 "
+                b"/Length %d >>\nstream\n%s\nendstream" % (width, width, bytes(range(width)))
+            )
+            images.append(len(objects))
+        content = b"BT /F1 12 Tf 72 720 Td (%s) Tj ET\n" % text.encode()
+        content += b"".join(b"q 10 0 0 1 0 %d cm /Im%d Do Q\n" % (10 * i, i) for i in range(len(images)))
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        xobjects = b" ".join(b"/Im%d %d 0 R" % (i, image_id) for i, image_id in enumerate(images))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents %d 0 R "
+            b"/Resources << /Font << /F1 3 0 R >> /XObject << %s >> >> >>" % (len(objects), xobjects)
+        )
+        page_ids.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for object_id, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (object_id, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(pdf)
+    return path
+
+
+recognized_widths: List[int] = []
+
+
+def fake_ocr_image(image_data: bytes) -> List[str]:
+    """Recognizes the width of the PNG image extracted by pypdf, wider images take longer"""
+    width = int.from_bytes(image_data[16:20], "big")
+    recognized_widths.append(width)
+    time.sleep(width / 100)
+    return [f"{width}px image"]
+
+
+@pytest.fixture
+def fake_ocr(monkeypatch):
+    recognized_widths.clear()
+    monkeypatch.setattr(pdf_reader, "_get_ocr_engine", lambda: None)
+    monkeypatch.setattr(pdf_reader, "_ocr_image", fake_ocr_image)
+    monkeypatch.setattr(pdf_reader, "find_spec", lambda name: True)
+
+
+@pytest.fixture
+def report(tmp_path) -> Path:
+    # The logo is repeated on every page, the chart of the first page takes longest to recognize
+    return write_pdf(
+        tmp_path / "report.pdf",
+        [("Summary", [3, 30]), ("Results", [3, 5]), ("Appendix", [3])],
+    )
+
+
+def page_contents(reader: PDFImageReader, pdf: Path) -> List[str]:
+    return [" ".join(document.content.split()) for document in reader.iter_read(pdf)]
+
+
+EXPECTED_PAGES = ["Summary 3px image 30px image", "Results 3px image 5px image", "Appendix 3px image"]
+
+
+def test_repeated_images_are_recognized_once(fake_ocr, report):
+    reader = PDFImageReader(chunk=False)
+    assert page_contents(reader, report) == EXPECTED_PAGES
+    assert recognized_widths == [3, 30, 5]
+
+
+def test_ocr_results_are_read_from_the_cache(fake_ocr, report, tmp_path):
+    reader = PDFImageReader(chunk=False, ocr_cache_file=tmp_path / "ocr.db")
+    assert page_contents(reader, report) == EXPECTED_PAGES
+    recognized_widths.clear()
+
+    # Images recognized while reading an earlier PDF are not recognized again
+    assert page_contents(reader, report) == EXPECTED_PAGES
+    assert recognized_widths == []
+
+
+def test_pages_read_ahead_by_ocr_workers_are_yielded_in_order(fake_ocr, report):
+    reader = PDFImageReader(chunk=False, ocr_workers=2, ocr_read_ahead=2)
+    try:
+        # The OCR of the first page finishes last, its page is still yielded first
+        assert page_contents(reader, report) == EXPECTED_PAGES
+    finally:
+        reader.close()
+    assert reader._executor is None
+
+
+def test_pdf_is_read_in_batches_of_pages(tmp_path):
+    pdf = write_pdf(tmp_path / "book.pdf", [(f"Page {i}", []) for i in range(1, 6)])
+    reader = PDFReader(read_batch_size=2)
+
+    batches = list(reader.iter_read_batches(pdf))
+    assert [[document.meta_data["page"] for document in batch] for batch in batches] == [[1, 2], [3, 4], [5]]
+    assert [document.content for document in reader.read(pdf)] == [f"Page {i}" for i in range(1, 6)]
+
+    # A knowledge base loads a PDF one batch of pages at a time
+    knowledge_base = PDFKnowledgeBase(path=tmp_path, reader=reader)
+    assert [len(document_list) for document_list in knowledge_base.document_lists] == [2, 2, 1]
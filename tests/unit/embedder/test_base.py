@@ -0,0 +1,36 @@
+from typing import Dict, List, Optional, Tuple
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+
+
+class LengthEmbedder(Embedder):
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return [float(len(text))], {"total_tokens": 1}
+
+
+def test_iter_batches_respects_batch_size():
+    embedder = LengthEmbedder(batch_size=2)
+    batches = list(embedder.iter_batches(["a", "b", "c", "d", "e"]))
+    assert batches == [["a", "b"], ["c", "d"], ["e"]]
+
+
+def test_iter_batches_respects_token_limit():
+    embedder = LengthEmbedder(batch_size=10, batch_token_limit=3)
+    batches = list(embedder.iter_batches(["x" * 4, "y" * 4, "z"]))
+    assert batches == [["x" * 4], ["y" * 4, "z"]]
+
+
+def test_get_embeddings_batch_preserves_order_and_merges_usage():
+    embedder = LengthEmbedder(batch_size=2)
+    embeddings, usage = embedder.get_embeddings_batch(["a", "bb", "ccc"])
+    assert embeddings == [[1.0], [2.0], [3.0]]
+    assert usage == {"total_tokens": 3}
+
+
+def test_embed_batch_skips_documents_with_embeddings():
+    embedder = LengthEmbedder()
+    documents = [Document(content="abc"), Document(content="de", embedding=[9.0])]
+    Document.embed_batch(documents, embedder)
+    assert documents[0].embedding == [3.0]
+    assert documents[1].embedding == [9.0]
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from agno.embedder.base import Embedder
+from agno.embedder.cached import CachedEmbedder
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    id: str = "counting"
+
+    def __post_init__(self):
+        self.calls: List[str] = []
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.calls.append(text)
+        return [float(len(text)), 1.0], None
+
+
+def test_batch_only_embeds_misses(tmp_path):
+    inner = CountingEmbedder(dimensions=2)
+    embedder = CachedEmbedder(embedder=inner, db_file=tmp_path / "cache.db")
+
+    assert embedder.get_embeddings_batch(["a", "bb"])[0] == [[1.0, 1.0], [2.0, 1.0]]
+    assert embedder.get_embeddings_batch(["bb", "ccc", "ccc"])[0] == [[2.0, 1.0], [3.0, 1.0], [3.0, 1.0]]
+    assert inner.calls == ["a", "bb", "ccc"]
+    assert embedder.get_embedding("a") == [1.0, 1.0]
+    assert embedder.cache_info()["hits"] == 2
+
+
+def test_cache_persists_and_evicts_least_recently_used(tmp_path):
+    db_file = tmp_path / "cache.db"
+    embedder = CachedEmbedder(embedder=CountingEmbedder(dimensions=2), db_file=db_file, max_entries=2)
+    embedder.get_embedding("a")
+    embedder.get_embedding("b")
+    embedder.get_embedding("a")
+    embedder.get_embedding("c")
+
+    inner = CountingEmbedder(dimensions=2)
+    reopened = CachedEmbedder(embedder=inner, db_file=db_file, max_entries=2)
+    reopened.get_embeddings_batch(["a", "b", "c"])
+    assert inner.calls == ["b"]
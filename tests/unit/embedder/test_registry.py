@@ -0,0 +1,96 @@
+import time
+from copy import deepcopy
+from dataclasses import dataclass
+from threading import Barrier, Thread
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.agent import Agent
+from agno.embedder.base import Embedder
+from agno.embedder.registry import clear_models, get_model, get_model_lock
+from agno.knowledge.agent import AgentKnowledge
+
+loaded_ids: List[str] = []
+
+
+class LocalModel:
+    def __init__(self, model_id: str):
+        # Loading a local model is slow, so concurrent first uses overlap
+        time.sleep(0.05)
+        loaded_ids.append(model_id)
+        self.model_id = model_id
+
+    def encode(self, text: str) -> List[float]:
+        return [float(len(text))]
+
+
+@dataclass
+class LocalEmbedder(Embedder):
+    """Loads its model through the registry, like the sentence-transformers and fastembed embedders"""
+
+    id: str = "local-mini"
+
+    @property
+    def model(self) -> LocalModel:
+        return get_model(("local", self.id), lambda: LocalModel(self.id))
+
+    def warm_up(self) -> None:
+        _ = self.model
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        model = self.model
+        with get_model_lock(("local", self.id)):
+            return model.encode(text), None
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    loaded_ids.clear()
+    clear_models()
+    yield
+    clear_models()
+
+
+def test_embedders_with_the_same_model_id_share_one_model():
+    embedder = LocalEmbedder()
+
+    assert LocalEmbedder().model is embedder.model
+    assert deepcopy(embedder).model is embedder.model
+    assert LocalEmbedder(id="local-large").model is not embedder.model
+    assert loaded_ids == ["local-mini", "local-large"]
+    assert embedder.get_embedding_and_usage("four") == ([4.0], None)
+
+
+def test_model_is_loaded_once_under_concurrent_first_use():
+    barrier = Barrier(8)
+    models: List[Any] = []
+
+    def embed() -> None:
+        embedder = LocalEmbedder()
+        barrier.wait()
+        models.append(embedder.model)
+
+    threads = [Thread(target=embed) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loaded_ids == ["local-mini"]
+    assert len(models) == 8 and all(model is models[0] for model in models)
+
+
+def test_agent_warms_up_the_embedder_of_its_knowledge(tmp_path):
+    pytest.importorskip("numpy")
+    from agno.vectordb.numpydb import NumpyDb
+
+    knowledge = AgentKnowledge(vector_db=NumpyDb(path=tmp_path, embedder=LocalEmbedder()))
+
+    Agent(knowledge=knowledge)
+    assert loaded_ids == []
+    Agent(knowledge=knowledge, warm_up_embedder=True)
+    assert loaded_ids == ["local-mini"]
+    # Another agent with the same model finds it loaded
+    Agent(knowledge=knowledge, warm_up_embedder=True).warm_up_knowledge_embedder()
+    assert loaded_ids == ["local-mini"]
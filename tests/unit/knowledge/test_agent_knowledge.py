@@ -0,0 +1,338 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple
+from unittest.mock import patch
+
+import pytest
+
+from agno.document import Document
+from agno.document.chunking.semantic import SemanticChunking
+from agno.embedder.base import Embedder
+from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.cache import KnowledgeSearchCache
+from agno.knowledge.document import DocumentKnowledgeBase
+from agno.knowledge.pipeline import IngestionPipeline, IngestionProgress
+from agno.knowledge.text import TextKnowledgeBase
+from agno.vectordb.base import VectorDb
+
+
+class InMemoryVectorDb(VectorDb):
+    def __init__(self):
+        self.documents: Dict[str, Document] = {}
+        self.existing_hashes_calls = 0
+
+    def create(self) -> None:
+        pass
+
+    def doc_exists(self, document: Document) -> bool:
+        raise AssertionError("doc_exists should not be called when existing_hashes is available")
+
+    def existing_hashes(self, hashes: List[str]) -> Set[str]:
+        self.existing_hashes_calls += 1
+        return {content_hash for content_hash in hashes if content_hash in self.documents}
+
+    def delete_hashes(self, hashes: List[str]) -> None:
+        for content_hash in hashes:
+            self.documents.pop(content_hash, None)
+
+    def name_exists(self, name: str) -> bool:
+        return False
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        for document in documents:
+            content_hash = self.content_hash(document)
+            assert content_hash not in self.documents
+            self.documents[content_hash] = document
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.insert(documents, filters)
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        return []
+
+    def drop(self) -> None:
+        self.documents.clear()
+
+    def exists(self) -> bool:
+        return True
+
+    def delete(self) -> bool:
+        self.documents.clear()
+        return True
+
+
+def test_load_skips_existing_documents_with_bulk_lookups():
+    vector_db = InMemoryVectorDb()
+    vector_db.insert([Document(content="b")])
+    documents = [Document(content=content) for content in ["a", "b", "a", "c"]]
+    knowledge_base = DocumentKnowledgeBase(documents=documents, vector_db=vector_db)
+
+    knowledge_base.load_documents(documents)
+    assert sorted(vector_db.documents) == sorted(vector_db.content_hash(Document(content=c)) for c in "abc")
+    assert vector_db.existing_hashes_calls == 1
+
+    # Documents known to exist are skipped without querying the vector db
+    knowledge_base.load_documents(documents)
+    knowledge_base.load_text("a")
+    assert vector_db.existing_hashes_calls == 1
+
+    knowledge_base.delete()
+    knowledge_base.load_documents(documents)
+    assert len(vector_db.documents) == 3
+    assert vector_db.existing_hashes_calls == 2
+
+
+def test_known_documents_are_looked_up_again_after_other_writes_to_the_vector_db():
+    vector_db = InMemoryVectorDb()
+    documents = [Document(content=content) for content in "abc"]
+    knowledge_base = DocumentKnowledgeBase(documents=documents, vector_db=vector_db)
+    knowledge_base.load_documents(documents)
+
+    # Deleted without the knowledge base, the documents it knows about are stale
+    vector_db.delete()
+    knowledge_base.load_documents(documents)
+    assert len(vector_db.documents) == 3
+    assert vector_db.existing_hashes_calls == 2
+
+
+def test_known_hashes_are_bounded(monkeypatch):
+    monkeypatch.setattr("agno.knowledge.agent._MAX_KNOWN_HASHES", 2)
+    vector_db = InMemoryVectorDb()
+    documents = [Document(content=content) for content in "abc"]
+    knowledge_base = DocumentKnowledgeBase(documents=documents, vector_db=vector_db)
+
+    knowledge_base.load_documents(documents)
+    assert len(knowledge_base._known_hashes) <= 2
+    knowledge_base.load_documents(documents)
+    assert len(vector_db.documents) == 3
+    assert vector_db.existing_hashes_calls == 2
+
+
+class CountingEmbedder(Embedder):
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return [float(len(text))], None
+
+
+def test_parallel_load_embeds_and_writes_new_documents():
+    vector_db = InMemoryVectorDb()
+    vector_db.embedder = CountingEmbedder(batch_size=3)
+    vector_db.insert([Document(content="doc 0", embedding=[5.0])])
+    documents = [Document(content=f"doc {i % 10}") for i in range(20)]
+    progress: List[IngestionProgress] = []
+    knowledge_base = DocumentKnowledgeBase(
+        documents=documents,
+        vector_db=vector_db,
+        ingestion_pipeline=IngestionPipeline(
+            num_readers=2, num_embedders=2, write_batch_size=4, queue_size=2, on_progress=progress.append
+        ),
+    )
+
+    knowledge_base.load(parallel=True)
+    assert len(vector_db.documents) == 10
+    assert all(document.embedding is not None for document in vector_db.documents.values())
+    assert progress[-1].documents_read == 20
+    assert progress[-1].documents_written == 9
+    assert progress[-1].documents_skipped == 11
+
+
+def test_parallel_load_only_knows_documents_once_they_are_written():
+    class FailingVectorDb(InMemoryVectorDb):
+        def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+            raise ConnectionError("vector db is down")
+
+    vector_db = FailingVectorDb()
+    documents = [Document(content=f"doc {i}") for i in range(4)]
+    knowledge_base = DocumentKnowledgeBase(documents=documents, vector_db=vector_db)
+
+    with pytest.raises(ConnectionError):
+        knowledge_base.load(parallel=True)
+    # Nothing was written, so a retry must not skip the documents
+    assert knowledge_base.filter_existing_documents(documents) == documents
+
+
+def test_parallel_load_passes_on_the_batches_of_a_source_as_they_are_read():
+    vector_db = InMemoryVectorDb()
+    knowledge_base = DocumentKnowledgeBase(documents=[], vector_db=vector_db)
+    events: List[str] = []
+
+    def read_in_batches():
+        for i in range(3):
+            events.append(f"read batch {i}")
+            yield [Document(content=f"batch {i} doc {j}") for j in range(2)]
+
+    progress = IngestionPipeline(num_readers=1).run(
+        knowledge_base, [read_in_batches], on_read=lambda source, documents: events.append(f"{len(documents)} read")
+    )
+    # Each batch is passed on before the next one is read
+    assert events == ["read batch 0", "2 read", "read batch 1", "2 read", "read batch 2", "2 read"]
+    assert progress.sources_read == 1
+    assert progress.documents_written == 6
+    assert len(vector_db.documents) == 6
+
+
+def test_sync_loads_changed_files_and_deletes_removed_ones(tmp_path):
+    source_dir = tmp_path / "docs"
+    source_dir.mkdir()
+    for name in ["a", "b", "c"]:
+        (source_dir / f"{name}.txt").write_text(f"contents of {name}")
+
+    vector_db = InMemoryVectorDb()
+    knowledge_base = TextKnowledgeBase(path=source_dir, vector_db=vector_db, manifest_file=tmp_path / "manifest.json")
+    knowledge_base.load(sync=True)
+    assert sorted(document.content for document in vector_db.documents.values()) == [
+        "contents of a",
+        "contents of b",
+        "contents of c",
+    ]
+
+    read_files: List[str] = []
+    file_source = TextKnowledgeBase.file_source
+
+    def counting_file_source(self, file):
+        read_files.append(file.name)
+        return file_source(self, file)
+
+    (source_dir / "b.txt").write_text("new contents of b")
+    (source_dir / "c.txt").unlink()
+    (source_dir / "d.txt").write_text("contents of d")
+    knowledge_base = TextKnowledgeBase(path=source_dir, vector_db=vector_db, manifest_file=tmp_path / "manifest.json")
+    with patch.object(TextKnowledgeBase, "file_source", counting_file_source):
+        knowledge_base.load(sync=True)
+
+    assert sorted(read_files) == ["b.txt", "d.txt"]
+    assert sorted(document.content for document in vector_db.documents.values()) == [
+        "contents of a",
+        "contents of d",
+        "new contents of b",
+    ]
+
+
+def test_search_many_returns_each_document_for_the_first_query_only():
+    class SearchManyVectorDb(InMemoryVectorDb):
+        def search_many(
+            self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        ) -> List[List[Document]]:
+            return [[Document(content=word) for word in query.split()][:limit] for query in queries]
+
+    knowledge = AgentKnowledge(vector_db=SearchManyVectorDb(), num_documents=2)
+
+    results = knowledge.search_many(["a b c", "b d", "e"])
+    assert [[document.content for document in documents] for documents in results] == [["a", "b"], ["d"], ["e"]]
+
+    results = knowledge.search_many(["a b c", "b d"], deduplicate=False)
+    assert [[document.content for document in documents] for documents in results] == [["a", "b"], ["b", "d"]]
+
+
+class SearchCountingVectorDb(InMemoryVectorDb):
+    def __init__(self, documents: Dict[str, Document]):
+        super().__init__()
+        self.documents = documents
+        self.search_calls = 0
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        self.search_calls += 1
+        return [document for document in self.documents.values() if query in document.content][:limit]
+
+
+def test_search_cache_is_invalidated_by_writes_of_any_process(tmp_path):
+    # Two processes, each with its own vector db object and cache, sharing the vector db contents and cache file
+    documents: Dict[str, Document] = {}
+    vector_db_1, vector_db_2 = SearchCountingVectorDb(documents), SearchCountingVectorDb(documents)
+    knowledge_1 = AgentKnowledge(vector_db=vector_db_1, search_cache=KnowledgeSearchCache(db_file=tmp_path / "c.db"))
+    knowledge_2 = AgentKnowledge(vector_db=vector_db_2, search_cache=KnowledgeSearchCache(db_file=tmp_path / "c.db"))
+
+    knowledge_1.load_documents([Document(content="apples")])
+    assert [document.content for document in knowledge_1.search("apple")] == ["apples"]
+    assert [document.content for document in knowledge_2.search("apple")] == ["apples"]
+    assert vector_db_1.search_calls + vector_db_2.search_calls == 1
+    assert knowledge_2.search_cache.cache_info()["hit_rate"] == 1.0  # type: ignore
+
+    knowledge_2.load_documents([Document(content="apple pie")])
+    assert len(knowledge_1.search("apple")) == 2
+    assert vector_db_1.search_calls == 2
+
+    # Writes made to the vector db directly invalidate the results cached by the same process
+    vector_db_1.delete()
+    assert knowledge_1.search("apple") == []
+
+
+class TopicEmbedder(Embedder):
+    def __init__(self):
+        super().__init__(dimensions=2)
+        self.texts: List[str] = []
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.texts.append(text)
+        return ([1.0, 0.0] if "cat" in text else [0.0, 2.0]), None
+
+
+def test_semantic_chunks_reuse_the_sentence_embeddings_of_the_vector_db_embedder():
+    vector_db = InMemoryVectorDb()
+    vector_db.embedder = TopicEmbedder()
+    knowledge_base = AgentKnowledge(vector_db=vector_db, chunking_strategy=SemanticChunking(embed_sentences=True))
+    assert knowledge_base.chunking_strategy.embedder is vector_db.embedder
+
+    document = Document(content="A cat sat. The cat slept.\n\nA dog ran. A dog barked! A cat purrs.", id="doc")
+    chunks = knowledge_base.chunking_strategy.chunk(document)
+    assert [chunk.content for chunk in chunks] == [
+        "A cat sat. The cat slept. ",
+        "A dog ran. A dog barked! ",
+        "A cat purrs.",
+    ]
+    assert [chunk.embedding for chunk in chunks] == [[1.0, 0.0], [0.0, 1.0], [1.0, 0.0]]
+    assert len(vector_db.embedder.texts) == 5
+
+    # Chunks already carry an embedding, so they are not embedded again when written
+    Document.embed_batch(chunks, vector_db.embedder)
+    assert len(vector_db.embedder.texts) == 5
+
+
+def test_semantic_chunks_are_not_pooled_with_another_embedder():
+    vector_db = InMemoryVectorDb()
+    vector_db.embedder = TopicEmbedder()
+    chunking_embedder = TopicEmbedder()
+    knowledge_base = AgentKnowledge(
+        vector_db=vector_db, chunking_strategy=SemanticChunking(embedder=chunking_embedder, embed_sentences=True)
+    )
+
+    chunks = knowledge_base.chunking_strategy.chunk(Document(content="A cat sat. A dog ran.", id="doc"))
+    assert [chunk.content for chunk in chunks] == ["A cat sat. ", "A dog ran."]
+    # The chunks are embedded by the vector db embedder when they are written
+    assert all(chunk.embedding is None for chunk in chunks)
+    Document.embed_batch(chunks, vector_db.embedder)
+    assert vector_db.embedder.texts == ["A cat sat. ", "A dog ran."]
+
+
+def test_website_aload_writes_pages_off_the_event_loop():
+    from threading import get_ident
+
+    from agno.document.reader.website_reader import WebsiteReader
+    from agno.knowledge.website import WebsiteKnowledgeBase
+
+    class PagesReader(WebsiteReader):
+        async def aiter_read(self, url: str):
+            for page in range(3):
+                for chunk in range(2):
+                    yield Document(content=f"{url} page {page} chunk {chunk}", meta_data={"url": f"{url}/{page}"})
+
+    class ThreadRecordingVectorDb(InMemoryVectorDb):
+        def __init__(self):
+            super().__init__()
+            self.insert_threads: Set[int] = set()
+
+        def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+            self.insert_threads.add(get_ident())
+            super().insert(documents, filters)
+
+    vector_db = ThreadRecordingVectorDb()
+    knowledge_base = WebsiteKnowledgeBase(urls=["https://agno.com"], reader=PagesReader(), vector_db=vector_db)
+    asyncio.run(knowledge_base.aload(upsert=False))
+
+    assert len(vector_db.documents) == 6
+    assert get_ident() not in vector_db.insert_threads
+
+    # Crawling asynchronously from the sync read would need a second event loop
+    async def read_in_loop():
+        return WebsiteReader(async_crawl=True).read("https://agno.com")
+
+    with pytest.raises(RuntimeError, match="aread"):
+        asyncio.run(read_in_loop())
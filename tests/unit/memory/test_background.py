@@ -0,0 +1,80 @@
+from threading import Event
+from typing import List, Optional
+
+import pytest
+from agno.agent import Agent
+from agno.memory.agent import AgentMemory, AgentRun
+from agno.memory.background import MemoryUpdateQueue
+from agno.memory.summary import SessionSummary
+from agno.run.response import RunResponse
+
+
+class SlowMemory(AgentMemory):
+    release: Optional[Event] = None
+    inputs: List[str] = []
+    summaries: int = 0
+
+    def update_memory(self, input: str, force: bool = False) -> Optional[str]:
+        assert self.release is not None
+        self.release.wait(timeout=5)
+        self.inputs.append(input)
+        return None
+
+    def update_summary(self) -> Optional[SessionSummary]:
+        self.summaries += 1
+        self.summary = SessionSummary(summary=f"{len(self.runs)} runs")
+        return self.summary
+
+
+def test_updates_for_the_same_session_are_coalesced():
+    release = Event()
+    agent = Agent(agent_id="agent", session_id="session", memory=SlowMemory(release=release))
+    update_queue = MemoryUpdateQueue()
+
+    update_queue.submit(agent, inputs=["first"], update_summary=True)
+    update_queue.submit(agent, inputs=["second"], update_summary=True)
+    update_queue.submit(agent, inputs=["third"], update_summary=False)
+    release.set()
+
+    assert update_queue.flush(timeout=5)
+    metrics = update_queue.get_metrics()
+    assert metrics["queue_depth"] == 0
+    assert metrics["processed"] + metrics["coalesced"] == 3
+    # Updates run on a copy of the memory, the agent still on the session sees the summary made in the background
+    assert isinstance(agent.memory, SlowMemory)
+    assert "".join(agent.memory.inputs).count("third") == 1
+    assert agent.memory.summary is not None
+
+
+def test_update_is_saved_to_its_session_after_new_session(tmp_path):
+    pytest.importorskip("sqlalchemy")
+    from agno.storage.agent.sqlite import SqliteAgentStorage
+
+    release = Event()
+    storage = SqliteAgentStorage(table_name="sessions", db_file=str(tmp_path / "agent.db"))
+    agent = Agent(
+        agent_id="agent",
+        session_id="old",
+        memory=SlowMemory(release=release),
+        storage=storage,
+    )
+    assert agent.memory is not None
+    agent.memory.add_run(AgentRun(response=RunResponse(content="old run")))
+    agent.write_to_storage()
+
+    update_queue = MemoryUpdateQueue()
+    update_queue.submit(agent, inputs=["about the old session"], update_summary=True)
+    # The agent moves on while the update waits
+    agent.new_session()
+    release.set()
+    assert update_queue.flush(timeout=5)
+
+    old_session = storage.read("old")
+    assert old_session is not None and old_session.memory is not None
+    assert old_session.memory["summary"]["summary"] == "1 runs"
+    assert [run["response"]["content"] for run in old_session.memory["runs"]] == ["old run"]
+
+    new_session = storage.read(agent.session_id)  # type: ignore
+    assert new_session is not None
+    assert "summary" not in (new_session.memory or {})
+    assert agent.memory.summary is None
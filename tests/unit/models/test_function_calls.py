@@ -0,0 +1,133 @@
+import time
+from dataclasses import dataclass
+from threading import get_ident
+from typing import Any, Iterator, List, Optional, Set
+
+import pytest
+
+from agno.exceptions import RetryAgentRun
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.response import ModelResponse, ModelResponseEvent
+from agno.tools.function import Function, FunctionCall
+
+
+@dataclass
+class StubModel(Model):
+    id: str = "stub"
+
+    def invoke(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    def invoke_stream(self, *args, **kwargs) -> Iterator[Any]:
+        raise NotImplementedError
+
+    async def ainvoke_stream(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    def response(self, messages: List[Message]) -> ModelResponse:
+        raise NotImplementedError
+
+    async def aresponse(self, messages: List[Message]) -> ModelResponse:
+        raise NotImplementedError
+
+    def response_stream(self, messages: List[Message]) -> Iterator[ModelResponse]:
+        raise NotImplementedError
+
+    async def aresponse_stream(self, messages: List[Message]) -> Any:
+        raise NotImplementedError
+
+
+threads: Set[int] = set()
+
+
+def sleep_for(seconds: float) -> str:
+    """Sleeps, then returns how long it slept"""
+    threads.add(get_ident())
+    time.sleep(seconds)
+    return f"slept {seconds}"
+
+
+def retry() -> str:
+    """Asks the model to try again"""
+    raise RetryAgentRun("try again", user_message="Try a shorter sleep")
+
+
+def get_calls(*durations: float) -> List[FunctionCall]:
+    function = Function.from_callable(sleep_for)
+    return [
+        FunctionCall(function=function, arguments={"seconds": seconds}, call_id=f"call_{i}")
+        for i, seconds in enumerate(durations)
+    ]
+
+
+def run_calls(model: Model, function_calls: List[FunctionCall], function_call_results: List[Message]):
+    return list(model.run_function_calls(function_calls, function_call_results))
+
+
+def test_concurrent_calls_keep_the_order_of_the_model():
+    threads.clear()
+    model = StubModel(tool_call_concurrency=3)
+    function_call_results: List[Message] = []
+
+    # The first call finishes last, each call runs in its own thread
+    responses = run_calls(model, get_calls(0.3, 0.1, 0.2), function_call_results)
+    assert len(threads) == 3
+
+    events = [response.event for response in responses]
+    # Every call is started before the first result is reported
+    assert events[:3] == [ModelResponseEvent.tool_call_started.value] * 3
+    assert events[3:] == [ModelResponseEvent.tool_call_completed.value] * 3
+    assert [response.tool_calls[0]["tool_call_id"] for response in responses[:3]] == ["call_0", "call_1", "call_2"]
+    assert [message.tool_call_id for message in function_call_results] == ["call_0", "call_1", "call_2"]
+    assert [message.content for message in function_call_results] == ["slept 0.3", "slept 0.1", "slept 0.2"]
+
+
+def test_concurrent_calls_stop_at_the_tool_call_limit():
+    model = StubModel(tool_call_concurrency=4, tool_call_limit=2)
+    function_call_results: List[Message] = []
+
+    responses = run_calls(model, get_calls(0.01, 0.01, 0.01, 0.01), function_call_results)
+    # Calls over the limit are not started
+    started = [response for response in responses if response.event == ModelResponseEvent.tool_call_started.value]
+    assert len(started) == 2
+    assert [message.tool_call_id for message in function_call_results] == ["call_0", "call_1"]
+    assert model.tool_choice == "none"
+
+
+def test_concurrent_call_errors_are_reported_in_order():
+    model = StubModel(tool_call_concurrency=2)
+    function_call_results: List[Message] = []
+    function_calls = get_calls(0.05) + [FunctionCall(function=Function.from_callable(retry), call_id="retry")]
+
+    run_calls(model, function_calls, function_call_results)
+    # The tool error is a failed result, its user message is added after the results
+    assert [message.tool_call_id for message in function_call_results[:2]] == ["call_0", "retry"]
+    assert [message.tool_call_error for message in function_call_results[:2]] == [False, True]
+    assert function_call_results[2].role == "user"
+    assert function_call_results[2].content == "Try a shorter sleep"
+
+
+class BrokenFunctionCall(FunctionCall):
+    def execute(self) -> bool:
+        raise RuntimeError("broken function call")
+
+
+def test_concurrent_call_exceptions_propagate():
+    model = StubModel(tool_call_concurrency=2)
+    function_calls = get_calls(0.01) + [BrokenFunctionCall(function=Function.from_callable(retry), call_id="broken")]
+
+    with pytest.raises(RuntimeError, match="broken function call"):
+        run_calls(model, function_calls, [])
+
+
+def test_sequential_and_concurrent_calls_report_the_same_results():
+    results: List[Optional[List[str]]] = []
+    for tool_call_concurrency in (None, 3):
+        function_call_results: List[Message] = []
+        run_calls(StubModel(tool_call_concurrency=tool_call_concurrency), get_calls(0.02, 0.01), function_call_results)
+        results.append([str(message.content) for message in function_call_results])
+    assert results[0] == results[1]
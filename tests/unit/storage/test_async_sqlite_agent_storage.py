@@ -0,0 +1,28 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from agno.storage.agent.async_sqlite import AsyncSqliteAgentStorage  # noqa: E402
+from agno.storage.agent.session import AgentSession  # noqa: E402
+
+
+@pytest.mark.parametrize("schema_version", [1, 2])
+def test_async_methods_share_the_database_with_sync_methods(tmp_path, schema_version):
+    storage = AsyncSqliteAgentStorage(
+        table_name="sessions", db_file=str(tmp_path / "agent.db"), schema_version=schema_version
+    )
+    memory = {"runs": [{"response": {"content": f"run {i}"}} for i in range(3)], "messages": []}
+
+    async def run():
+        written = await storage.aupsert(AgentSession(session_id="session", user_id="user", memory=memory))
+        assert written is not None and written.updated_at is not None
+
+        session = await storage.aread("session")
+        assert session is not None and len(session.memory["runs"]) == 3
+        assert [s.session_id for s in await storage.aget_all_sessions(user_id="user")] == ["session"]
+
+    asyncio.run(run())
+    assert storage.read("session").user_id == "user"
@@ -0,0 +1,113 @@
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from agno.storage.agent.session import AgentSession  # noqa: E402
+from agno.storage.agent.sqlite import SqliteAgentStorage  # noqa: E402
+
+
+def get_memory(num_runs: int, runs_offset: int = 0):
+    memory = {
+        "runs": [{"response": {"content": f"run {i}"}} for i in range(runs_offset, num_runs)],
+        "messages": [{"role": "user", "content": f"message {i}"} for i in range(num_runs)],
+    }
+    if runs_offset > 0:
+        memory["runs_offset"] = runs_offset
+    return memory
+
+
+def get_contents(session: AgentSession):
+    return [run["response"]["content"] for run in session.memory["runs"]]
+
+
+def test_v2_appends_runs_and_loads_last_runs(tmp_path):
+    storage = SqliteAgentStorage(table_name="sessions", db_file=str(tmp_path / "agent.db"), schema_version=2)
+    storage.create()
+
+    written = storage.upsert(AgentSession(session_id="session", memory=get_memory(3)))
+    assert written is not None and written.created_at is not None
+
+    last_runs = storage.read_last_runs("session", num_runs=2)
+    assert get_contents(last_runs) == ["run 1", "run 2"]
+    assert last_runs.memory["runs_offset"] == 1
+
+    # Only the new run is appended when the memory holds the last runs of the session
+    storage.upsert(AgentSession(session_id="session", memory=get_memory(4, runs_offset=1)))
+    session = storage.read("session")
+    assert get_contents(session) == ["run 0", "run 1", "run 2", "run 3"]
+    assert len(session.memory["messages"]) == 4
+    assert storage.read_last_runs("session", num_runs=0).memory["runs_offset"] == 4
+
+
+def test_upgrade_schema_from_v1(tmp_path):
+    db_file = str(tmp_path / "agent.db")
+    v1_storage = SqliteAgentStorage(table_name="sessions", db_file=db_file)
+    v1_storage.create()
+    v1_storage.upsert(AgentSession(session_id="session", memory=get_memory(3)))
+
+    v2_storage = SqliteAgentStorage(table_name="sessions", db_file=db_file, schema_version=2)
+    # Sessions that are not migrated yet are read from the session row
+    assert get_contents(v2_storage.read("session")) == ["run 0", "run 1", "run 2"]
+
+    v2_storage.upgrade_schema()
+    assert v1_storage.read("session").memory == {}
+    assert get_contents(v2_storage.read_last_runs("session", num_runs=1)) == ["run 2"]
+
+
+def get_user_memory(content: str):
+    return {"runs": [{"message": {"role": "user", "content": content}, "response": {"content": "response"}}]}
+
+
+def test_list_session_summaries_pages_newest_first(tmp_path):
+    storage = SqliteAgentStorage(table_name="sessions", db_file=str(tmp_path / "agent.db"), schema_version=2)
+    storage.create()
+    for i in range(5):
+        storage.upsert(AgentSession(session_id=f"session-{i}", user_id="user", memory=get_user_memory(f"hello {i}")))
+    storage.upsert(
+        AgentSession(session_id="session-2", user_id="user", session_data={"session_name": "Renamed"}, memory={})
+    )
+
+    summaries, cursor = storage.list_session_summaries(user_id="user", limit=2)
+    assert [s.session_id for s in summaries] == ["session-4", "session-3"]
+    assert cursor is not None
+
+    summaries, cursor = storage.list_session_summaries(user_id="user", limit=2, cursor=cursor)
+    assert [(s.session_id, s.title) for s in summaries] == [("session-2", "Renamed"), ("session-1", "hello 1")]
+
+    summaries, cursor = storage.list_session_summaries(user_id="user", limit=2, cursor=cursor)
+    assert [s.session_id for s in summaries] == ["session-0"]
+    assert cursor is None
+
+    # The stored title is kept when the first run is not loaded
+    storage.upsert(AgentSession(session_id="session-0", user_id="user", memory={"runs_offset": 1}))
+    assert storage.list_session_summaries(user_id="user", limit=None)[0][-1].title == "hello 0"
+
+
+def test_upgrade_schema_stores_titles(tmp_path):
+    db_file = str(tmp_path / "agent.db")
+    v1_storage = SqliteAgentStorage(table_name="sessions", db_file=db_file)
+    v1_storage.create()
+    v1_storage.upsert(AgentSession(session_id="session", memory=get_user_memory("hello")))
+
+    v2_storage = SqliteAgentStorage(table_name="sessions", db_file=db_file, schema_version=2)
+    v2_storage.upgrade_schema()
+    summaries, _ = v2_storage.list_session_summaries()
+    assert [(s.session_id, s.title) for s in summaries] == [("session", "hello")]
+
+
+def test_v2_rewrites_history_that_is_shorter_than_the_stored_one(tmp_path):
+    storage = SqliteAgentStorage(table_name="sessions", db_file=str(tmp_path / "agent.db"), schema_version=2)
+    storage.create()
+    storage.upsert(AgentSession(session_id="session", memory=get_memory(2)))
+
+    # The memory was cleared in the same session, then a new run was added
+    memory = {"runs": [{"response": {"content": "new run"}}], "messages": [{"role": "user", "content": "new message"}]}
+    storage.upsert(AgentSession(session_id="session", memory=memory))
+    session = storage.read("session")
+    assert get_contents(session) == ["new run"]
+    assert [message["content"] for message in session.memory["messages"]] == ["new message"]
+
+    # Appending after the rewrite continues from the new history
+    memory["runs"].append({"response": {"content": "next run"}})
+    storage.upsert(AgentSession(session_id="session", memory=memory))
+    assert get_contents(storage.read("session")) == ["new run", "next run"]
@@ -0,0 +1,82 @@
+import gc
+import weakref
+
+from agno.tools import function as function_module
+from agno.tools.function import Function
+
+
+def add(a: int, b: int = 2) -> int:
+    """Add two numbers.
+
+    Args:
+        a: The first number.
+        b: The second number.
+    """
+    return a + b
+
+
+class Greeter:
+    def greet(self, name: str) -> str:
+        return f"Hello {name}"
+
+
+def test_from_callable_reuses_compiled_entrypoint():
+    first = Function.from_callable(add)
+    second = Function.from_callable(add)
+
+    assert first.entrypoint is second.entrypoint
+    assert first.parameters == second.parameters
+    assert first.parameters["required"] == ["a"]
+    assert first.description == "Add two numbers."
+
+    # Parameters are copied so callers can modify them
+    first.parameters["required"].append("b")
+    assert Function.from_callable(add).parameters["required"] == ["a"]
+
+
+def test_process_entrypoint_does_not_wrap_twice():
+    func = Function.from_callable(add)
+    processed = Function(name="add", entrypoint=func.entrypoint)
+    processed.process_entrypoint()
+
+    assert processed.entrypoint is func.entrypoint
+    assert processed.entrypoint("3") == 5
+
+
+def test_process_entrypoint_rebinds_methods():
+    first, second = Greeter(), Greeter()
+    first_func = Function(name="greet", entrypoint=first.greet)
+    second_func = Function(name="greet", entrypoint=second.greet)
+    first_func.process_entrypoint()
+    second_func.process_entrypoint()
+
+    assert first_func.entrypoint.__self__ is first
+    assert second_func.entrypoint.__self__ is second
+    assert first_func.entrypoint.__func__ is second_func.entrypoint.__func__
+    assert second_func.entrypoint("agno") == "Hello agno"
+    assert first_func.parameters["required"] == ["name"]
+
+
+def test_closures_are_released_after_compiling():
+    class Member:
+        pass
+
+    def make_transfer(member: Member):
+        def transfer(task: str) -> str:
+            """Transfer a task."""
+            return f"{member} {task}"
+
+        return transfer
+
+    member = Member()
+    member_ref = weakref.ref(member)
+    func = Function.from_callable(make_transfer(member))
+    processed = Function(name="transfer", entrypoint=func.entrypoint)
+    processed.process_entrypoint()
+    assert processed.entrypoint is func.entrypoint
+
+    num_cached = len(function_module._compiled_functions)
+    del member, func, processed
+    gc.collect()
+    assert member_ref() is None
+    assert len(function_module._compiled_functions) == num_cached
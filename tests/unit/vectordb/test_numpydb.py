@@ -0,0 +1,71 @@
+import random
+from dataclasses import dataclass
+from hashlib import md5
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+
+pytest.importorskip("numpy")
+
+from agno.vectordb.numpydb import NumpyDb  # noqa: E402
+
+
+@dataclass
+class HashEmbedder(Embedder):
+    dimensions: int = 16
+
+    def get_embedding(self, text: str) -> List[float]:
+        rng = random.Random(md5(text.encode()).hexdigest())
+        return [rng.uniform(-1, 1) for _ in range(self.dimensions)]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+def test_search_filters_upserts_and_reopen(tmp_path):
+    vector_db = NumpyDb(path=tmp_path, embedder=HashEmbedder(), dtype="float16")
+    vector_db.create()
+    vector_db.insert([Document(content=f"doc {i}", id=f"id{i}") for i in range(50)], filters={"group": "a"})
+    vector_db.insert([Document(content=f"other {i}") for i in range(50)], filters={"group": "b"})
+
+    assert [document.content for document in vector_db.search("doc 7", limit=3)][0] == "doc 7"
+    assert all(document.content.startswith("other") for document in vector_db.search("doc 7", filters={"group": "b"}))
+    assert [[d.content for d in result][0] for result in vector_db.search_many(["doc 3", "other 4"])] == [
+        "doc 3",
+        "other 4",
+    ]
+
+    vector_db.upsert([Document(content="replaced", id="id7")])
+    vector_db.delete_hashes([md5(b"doc 3").hexdigest()])
+    assert vector_db.get_count() == 99
+    assert "doc 7" not in [document.content for document in vector_db.search("doc 7", limit=100)]
+    assert vector_db.search("replaced", limit=1)[0].id == "id7"
+
+    reopened = NumpyDb(path=tmp_path, embedder=HashEmbedder(), dtype="float16")
+    assert reopened.get_count() == 99
+    assert reopened.search("other 9", limit=1)[0].content == "other 9"
+    assert reopened.existing_hashes([md5(b"doc 3").hexdigest(), md5(b"doc 4").hexdigest()]) == {
+        md5(b"doc 4").hexdigest()
+    }
+
+
+def test_optimize_compacts_and_builds_index(tmp_path):
+    vector_db = NumpyDb(path=tmp_path, embedder=HashEmbedder(), ivf_lists=4, ivf_probes=4, pq_subvectors=4)
+    vector_db.insert([Document(content=f"doc {i}") for i in range(200)])
+    vector_db.delete_hashes([md5(f"doc {i}".encode()).hexdigest() for i in range(0, 200, 2)])
+    vector_db.optimize()
+
+    assert vector_db.matrix.shape == (100, 16)
+    assert vector_db.search("doc 11", limit=1)[0].content == "doc 11"
+
+    # Documents written after optimize() are assigned to the existing index
+    vector_db.insert([Document(content="late")])
+    assert vector_db.search("late", limit=1)[0].content == "late"
+    assert NumpyDb(path=tmp_path, embedder=HashEmbedder()).search("doc 51", limit=1)[0].content == "doc 51"
+
+    vector_db.drop()
+    assert not vector_db.exists()
+    assert list(tmp_path.iterdir()) == []
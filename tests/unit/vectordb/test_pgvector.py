@@ -0,0 +1,141 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.embedder.base import Embedder
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("pgvector")
+
+from sqlalchemy import create_mock_engine  # noqa: E402
+from sqlalchemy.dialects import postgresql  # noqa: E402
+
+from agno.vectordb.pgvector import PgVector  # noqa: E402
+from agno.vectordb.search import HybridFusion, SearchType  # noqa: E402
+
+# Columns of a table created with schema version 1
+V1_COLUMNS = {
+    "id",
+    "name",
+    "meta_data",
+    "filters",
+    "content",
+    "embedding",
+    "usage",
+    "created_at",
+    "updated_at",
+    "content_hash",
+}
+
+
+@dataclass
+class StubEmbedder(Embedder):
+    dimensions: int = 3
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [1.0, 0.0, 0.0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+def get_vector_db(schema_version: int, **kwargs: Any) -> PgVector:
+    engine = create_mock_engine("postgresql://", executor=lambda sql, *args, **kwargs: None)
+    return PgVector(
+        table_name="docs", db_engine=engine, embedder=StubEmbedder(), schema_version=schema_version, **kwargs
+    )
+
+
+def compile_stmt(stmt) -> Tuple[str, Dict[str, Any]]:
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.params
+
+
+def get_hybrid_stmt(hybrid_fusion: HybridFusion, limit: int = 5, filters: Optional[Dict[str, Any]] = None):
+    vector_db = get_vector_db(
+        schema_version=2, search_type=SearchType.hybrid, hybrid_fusion=hybrid_fusion, hybrid_candidates=40
+    )
+    return compile_stmt(vector_db._fused_hybrid_search_stmt("cats", [1.0, 0.0, 0.0], limit=limit, filters=filters))
+
+
+def test_missing_indexes_are_created_concurrently():
+    statements = get_vector_db(schema_version=1)._index_statements(V1_COLUMNS)
+
+    assert sorted(statements) == ["idx_docs_content_hash", "idx_docs_filters", "idx_docs_id", "idx_docs_name"]
+    assert statements["idx_docs_id"] == "CREATE INDEX CONCURRENTLY idx_docs_id ON ai.docs (id)"
+    assert statements["idx_docs_filters"] == (
+        "CREATE INDEX CONCURRENTLY idx_docs_filters ON ai.docs USING gin (filters jsonb_path_ops)"
+    )
+
+
+def test_indexes_on_columns_the_table_does_not_have_are_skipped():
+    vector_db = get_vector_db(schema_version=2)
+
+    # A table created before content_tsv was added, and not upgraded
+    assert "idx_docs_content_tsv" not in vector_db._index_statements(V1_COLUMNS)
+    statements = vector_db._index_statements(V1_COLUMNS | {"content_tsv"})
+    assert statements["idx_docs_content_tsv"] == (
+        "CREATE INDEX CONCURRENTLY idx_docs_content_tsv ON ai.docs USING gin (content_tsv)"
+    )
+    # The table definition still creates its indexes with the table, in a transaction
+    assert all(not index.dialect_options["postgresql"]["concurrently"] for index in vector_db.table.indexes)
+
+
+def test_async_engine_is_created_for_each_event_loop():
+    pytest.importorskip("asyncpg")
+    from sqlalchemy import create_engine
+
+    # Engines connect on first use, no database is needed
+    engine = create_engine("postgresql+asyncpg://agno@localhost/agno")
+    vector_db = PgVector(table_name="docs", db_engine=engine, embedder=StubEmbedder())
+
+    async def get_session_factories():
+        return vector_db.async_session, vector_db.async_session
+
+    first, first_again = asyncio.run(get_session_factories())
+    assert first is first_again
+    # A new event loop cannot use the connection pool of the engine created in a closed one
+    second, _ = asyncio.run(get_session_factories())
+    assert second is not first
+    assert vector_db.async_db_engine is None
+
+
+def test_rrf_hybrid_search_fuses_the_ranks_of_candidates_from_both_indexes():
+    sql, params = get_hybrid_stmt(HybridFusion.rrf, filters={"kind": "pet"})
+    score = sql.split(" AS hybrid_score")[0]
+
+    # Each candidate list is read in the order of its index, then the lists are joined
+    assert "ORDER BY ai.docs.embedding <=> %(embedding_1)s" in sql
+    assert "WHERE (ai.docs.content_tsv @@ websearch_to_tsquery('english'::regconfig, %(query)s::VARCHAR))" in sql
+    assert "FULL OUTER JOIN" in sql
+    assert list(params.values()).count(40) == 2
+    assert params["query"] == "cats"
+    # Filters apply to both candidate lists, so filtered out rows do not take the place of candidates
+    assert sql.count("ai.docs.filters @>") == 2
+    # Only the ranks of the candidates are scored
+    assert "candidates.vector_rank" in score and "candidates.text_rank" in score
+    assert "ts_rank_cd" not in score and "<=>" not in score
+    assert "ORDER BY hybrid_score DESC" in sql
+    assert list(params.values())[-1] == 5
+
+
+def test_weighted_hybrid_search_scores_candidates_with_distance_and_text_rank():
+    sql, params = get_hybrid_stmt(HybridFusion.weighted, limit=50)
+    score = sql.split(" AS hybrid_score")[0]
+
+    assert "filters" not in sql
+    assert "ai.docs.embedding <=>" in score
+    assert "ts_rank_cd(ai.docs.content_tsv, websearch_to_tsquery('english'::regconfig, %(query)s::VARCHAR))" in score
+    assert "candidates.vector_rank" not in score
+    # A limit over the number of candidates takes more candidates from each index
+    assert list(params.values()).count(50) == 3
+
+
+def test_text_search_reads_the_stored_tsvector_from_schema_version_2():
+    ts_vector_v1, _ = compile_stmt(get_vector_db(schema_version=1)._ts_vector())
+    ts_vector_v2, _ = compile_stmt(get_vector_db(schema_version=2)._ts_vector())
+
+    assert ts_vector_v1 == "to_tsvector('english'::regconfig, ai.docs.content)"
+    assert ts_vector_v2 == "ai.docs.content_tsv"